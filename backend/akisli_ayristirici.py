@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Akışlı Feed Ayrıştırıcı
+-----------------------
+RSS 2.0, RSS 1.0 (RDF) ve Atom belgelerini parça parça (XMLPullParser) ayrıştırır ve yeterli
+sayıda yeni haber toplandığında veya veritabanında zaten bulunan bir habere ulaşıldığında durur.
+Feed'ler en yeni haberden başlayarak sıralandığı için bilinen ilk haberden sonrası da bilinir;
+yüzlerce haberlik arşiv feed'lerinde belgenin yalnızca başı okunur ve tam ağaç hiç kurulmaz.
+Haberlerin bilinip bilinmediği her okunan parçanın haberleri için tek bir toplu sorguyla denetlenir.
+Girdi bellekteki bayt dizisi veya ağdan gelen bayt parçalarının yineleyicisi olabilir; ikincisinde
+erken durulduğunda gövdenin kalanı hiç indirilmez.
+
+Haberler feedparser ile aynı alan adlarıyla FeedParserDict olarak döner (title, link, links,
+summary/description, content, media_content, media_thumbnail, published_parsed, updated_parsed),
+böylece uygulamadaki normalleştirme kodu değişmeden çalışır. Belge iyi biçimli XML değilse
+(ör. tanımsız HTML varlıkları) hoşgörülü feedparser.parse'a dönülür.
+"""
+
+import calendar
+import email.utils
+import re
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta, timezone
+
+import feedparser
+
+PARCA_BOYUTU = 64 * 1024
+VARSAYILAN_EN_FAZLA = 5
+
+ATOM = "http://www.w3.org/2005/Atom"
+MEDYA = "http://search.yahoo.com/mrss/"
+ICERIK = "http://purl.org/rss/1.0/modules/content/"
+DUBLIN_CORE = "http://purl.org/dc/elements/1.1/"
+
+HABER_ETIKETLERI = {"item", "entry"}        # RSS 2.0 / RSS 1.0 item, Atom entry
+KANAL_ETIKETLERI = {"channel", "feed"}
+YAYIN_ETIKETLERI = {"pubDate", "published", "issued"}
+GUNCELLEME_ETIKETLERI = {"updated", "modified"}
+
+_ISO_TARIH = re.compile(r"^(\d{4})-(\d{2})-(\d{2})(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.\d+)?)?)?\s*(Z|[+-]\d{2}:?\d{2})?$")
+
+
+def _ayir(etiket):
+    """'{ad alanı}yerel' etiketini (ad alanı, yerel ad) olarak ayırır"""
+    if etiket[:1] == "{":
+        ad_alani, _, yerel = etiket[1:].partition("}")
+        return ad_alani, yerel
+    return "", etiket
+
+
+def _metin(eleman):
+    """Elemanın (alt elemanları dahil) metni"""
+    if len(eleman):
+        return "".join(eleman.itertext()).strip()
+    return (eleman.text or "").strip()
+
+
+def tarih_coz(deger):
+    """RFC 822 (RSS) veya ISO 8601 (Atom, Dublin Core) tarihini UTC time.struct_time'a çevirir"""
+    if not deger:
+        return None
+    deger = deger.strip()
+    parcalar = email.utils.parsedate_tz(deger)
+    if parcalar is not None:
+        try:
+            return time.gmtime(email.utils.mktime_tz(parcalar))
+        except (OverflowError, ValueError):
+            return None
+    eslesme = _ISO_TARIH.match(deger)
+    if eslesme is None:
+        return None
+    yil, ay, gun, saat, dakika, saniye, bolge = eslesme.groups()
+    try:
+        zaman = datetime(int(yil), int(ay), int(gun), int(saat or 0), int(dakika or 0), int(saniye or 0),
+                         tzinfo=timezone.utc)
+    except ValueError:
+        return None
+    if bolge and bolge != "Z":
+        isaret = -1 if bolge[0] == "-" else 1
+        rakamlar = bolge[1:].replace(":", "")
+        zaman -= isaret * timedelta(hours=int(rakamlar[:2]), minutes=int(rakamlar[2:]))
+    return time.gmtime(calendar.timegm(zaman.timetuple()))
+
+
+def haber_olustur(oge):
+    """Bir item/entry elemanını feedparser girdisiyle aynı alanlara sahip FeedParserDict'e çevirir"""
+    girdi = feedparser.FeedParserDict()
+    baglantilar = []
+    guid = None
+    for cocuk in oge:
+        ad_alani, ad = _ayir(cocuk.tag)
+        if ad_alani == MEDYA:
+            continue  # Medya elemanları aşağıda (media:group içindekiler dahil) toplanır
+        if ad == "title" and "title" not in girdi:
+            girdi["title"] = _metin(cocuk)
+        elif ad == "link":
+            href = cocuk.get("href")
+            if href is not None:
+                # Atom: <link rel="alternate" href="..."/>
+                rel = cocuk.get("rel", "alternate")
+                baglantilar.append(feedparser.FeedParserDict(rel=rel, type=cocuk.get("type", "text/html"), href=href))
+                if rel == "alternate" and "link" not in girdi:
+                    girdi["link"] = href
+            elif _metin(cocuk) and "link" not in girdi:
+                girdi["link"] = _metin(cocuk)
+                baglantilar.append(feedparser.FeedParserDict(rel="alternate", type="text/html", href=girdi["link"]))
+        elif ad == "enclosure" and cocuk.get("url"):
+            baglantilar.append(feedparser.FeedParserDict(rel="enclosure", type=cocuk.get("type", ""),
+                                                         href=cocuk.get("url"), length=cocuk.get("length", "0")))
+        elif ad == "guid":
+            guid = (_metin(cocuk), cocuk.get("isPermaLink", "true").lower() != "false")
+            girdi["id"] = guid[0]
+        elif ad == "id" and ad_alani == ATOM:
+            girdi["id"] = _metin(cocuk)
+        elif ad in ("description", "summary") and ad_alani != ICERIK:
+            girdi["summary"] = _metin(cocuk)
+        elif (ad == "encoded" and ad_alani == ICERIK) or (ad == "content" and ad_alani == ATOM):
+            girdi.setdefault("content", []).append(feedparser.FeedParserDict(value=_metin(cocuk), type=cocuk.get("type", "text/html")))
+        elif ad in YAYIN_ETIKETLERI:
+            if "published" not in girdi:
+                girdi["published"] = _metin(cocuk)
+                girdi["published_parsed"] = tarih_coz(girdi["published"])
+        elif ad in GUNCELLEME_ETIKETLERI or (ad == "date" and ad_alani == DUBLIN_CORE):
+            # feedparser gibi: dc:date güncellenme tarihi sayılır
+            girdi["updated"] = _metin(cocuk)
+            girdi["updated_parsed"] = tarih_coz(girdi["updated"])
+
+    # feedparser gibi: link yoksa kalıcı bağlantı olan guid kullanılır
+    if "link" not in girdi and guid and guid[1] and guid[0].startswith(("http://", "https://")):
+        girdi["link"] = guid[0]
+    medya = [dict(eleman.attrib) for eleman in oge.iter(f"{{{MEDYA}}}content") if eleman.get("url")]
+    if medya:
+        girdi["media_content"] = medya
+    kucuk_resimler = [dict(eleman.attrib) for eleman in oge.iter(f"{{{MEDYA}}}thumbnail") if eleman.get("url")]
+    if kucuk_resimler:
+        girdi["media_thumbnail"] = kucuk_resimler
+    girdi["links"] = baglantilar
+    return girdi
+
+
+def _yeni_haberleri_ekle(sonuc, girdiler, en_fazla, bilinenler):
+    """Parçanın haberlerini sırayla ekler; bilinen habere veya en_fazla sınırına gelinirse True döndürür"""
+    if not girdiler:
+        return False
+    if bilinenler is not None:
+        kayitli = bilinenler([girdi["link"] for girdi in girdiler if girdi.get("link")])
+        sonuc["bilinen_urller"].update(kayitli)
+    else:
+        kayitli = ()
+    for girdi in girdiler:
+        if girdi.get("link") in kayitli:
+            return True
+        sonuc["entries"].append(girdi)
+        if len(sonuc["entries"]) >= en_fazla:
+            return True
+    return False
+
+
+def akisli_ayristir(icerik, basliklar=None, en_fazla=VARSAYILAN_EN_FAZLA, bilinenler=None, parca_boyutu=PARCA_BOYUTU):
+    """Feed'i parça parça ayrıştırır; en_fazla yeni haber bulunca veya bilinen habere gelince durur
+
+    icerik: feed gövdesi (bytes, parca_boyutu'luk parçalara bölünür) veya bayt parçaları veren yineleyici
+    (ör. requests iter_content); yineleyici erken durulunca tüketilmeden bırakılır.
+    bilinenler(urller): verilen URL'lerden veritabanında zaten bulunanların kümesini döndüren isteğe
+    bağlı fonksiyon; her okunan parça için bir kez çağrılır.
+    Dönüş feedparser.parse sonucu gibidir (feed.title, entries, bozo); ek olarak akisli (False ise
+    feedparser'a dönülmüştür), erken_durdu, okunan_bayt ve bilinen_urller (denetlenen bağlantılardan
+    bilinenler) alanları bulunur. Akışlı sonuçta entries'teki bağlantıların hepsi denetlenmiştir.
+    """
+    sonuc = feedparser.FeedParserDict(feed=feedparser.FeedParserDict(), entries=[], bozo=False,
+                                      akisli=True, erken_durdu=False, okunan_bayt=0, bilinen_urller=set())
+    ayristirici = ET.XMLPullParser(events=("start", "end"))
+    yigin = []
+    if isinstance(icerik, (bytes, bytearray, memoryview)):
+        gorunum = memoryview(icerik)
+        parcalar = (gorunum[baslangic:baslangic + parca_boyutu] for baslangic in range(0, len(gorunum), parca_boyutu))
+        okunanlar = None
+    else:
+        # Ayrıştırma hatasında feedparser'a dönebilmek için okunan parçalar saklanır; erken durulan
+        # feed'lerde bu yalnızca gövdenin okunan başıdır
+        parcalar = iter(icerik)
+        okunanlar = []
+    try:
+        for parca in parcalar:
+            if okunanlar is not None:
+                okunanlar.append(parca)
+            ayristirici.feed(parca)
+            sonuc["okunan_bayt"] += len(parca)
+            girdiler = []
+            for olay, eleman in ayristirici.read_events():
+                _, ad = _ayir(eleman.tag)
+                if olay == "start":
+                    yigin.append(ad)
+                    continue
+                yigin.pop()
+                if ad in HABER_ETIKETLERI:
+                    girdiler.append(haber_olustur(eleman))
+                    eleman.clear()  # İşlenen haberin alt ağacı bellekte tutulmaz
+                    if len(sonuc["entries"]) + len(girdiler) >= en_fazla:
+                        break  # Parçanın kalanı bu haberler bilinse de bilinmese de gerekmez
+                elif ad == "title" and yigin and yigin[-1] in KANAL_ETIKETLERI and "title" not in sonuc["feed"]:
+                    sonuc["feed"]["title"] = _metin(eleman)
+            if _yeni_haberleri_ekle(sonuc, girdiler, en_fazla, bilinenler):
+                sonuc["erken_durdu"] = True
+                return sonuc
+        ayristirici.close()
+    except ET.ParseError as e:
+        # İyi biçimli olmayan belgeler hoşgörülü ayrıştırıcıyla baştan okunur (gövdenin kalanı da indirilir)
+        govde = bytes(icerik) if okunanlar is None else b"".join(okunanlar) + b"".join(parcalar)
+        yedek = feedparser.parse(govde, response_headers=basliklar or {})
+        yedek["akisli"] = False
+        yedek["erken_durdu"] = False
+        yedek["okunan_bayt"] = len(govde)
+        yedek.setdefault("akis_hatasi", str(e))
+        return yedek
+    return sonuc
@@ -1,17 +1,46 @@
-from flask import Flask, jsonify, request, render_template
+from flask import Flask, Response, g, jsonify, request, render_template
 import feedparser
 import os
 import json
 from datetime import datetime
 import time
-from transformers import pipeline
 from dotenv import load_dotenv
 import sqlite3
 import threading
 import logging
 import sys
-import re
+import uuid
+import gc
+import hmac
+import contextlib
+import functools
 import webbrowser
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from feed_cekici import FeedCekici
+from feed_dogrulayici import FeedDogrulayiciOnbellegi, DEGISMEDI, AYNI_ICERIK
+from feed_zamanlayici import FeedZamanlayici, yayin_zamani
+from feed_sagligi import ACIK, KAPALI, YARI_ACIK, FeedSagligi
+from akisli_ayristirici import akisli_ayristir
+from toplu_ozetleyici import TopluOzetleyici, token_uzunluklari
+from parcali_ozetleyici import ParcaliOzetleyici, cumlelere_ayir
+from ozet_onbellegi import OzetOnbellegi, anahtar_olustur
+from ozet_kuyrugu import ERTELENDI, OzetKuyrugu, OzetIsciHavuzu
+from ozet_zamanlayici import OzetZamanlayici, oncelik_hesapla
+from veritabani import BaglantiHavuzu, parcala
+from haber_sorgulari import GecersizSorgu, alanlari_coz, haberleri_listele, indeksleri_olustur, limiti_coz
+from yanit_onbellegi import YanitOnbellegi
+from haber_akisi import HABER, OZET, YENIDEN_YUKLE, KALP_ATISI_SN, HaberAkisi
+from metrikler import GOSTERGE, ICERIK_TIPI, SAYAC, MetrikKaydi
+from profilleyici import DONGU, ISTEK, ORNEKLEME, OZET as OZET_PROFILI, Profilleyici
+from haber_arama import HaberAramaIndeksi
+from haber_kumeleme import HaberKumeleyici
+from haber_icerikleri import HaberIcerikleri, icerikleri_getir
+from haber_saklama import ARTIMLI as ARTIMLI_VACUUM, HaberSaklayici, kategori_gunlerini_coz
+from metin_temizleyici import MetinTemizleyici
+from model_yukleyici import FP32, INT8, ONNX, VARSAYILAN_KLASOR, is_parcacigi_ayarla, ozetleyici_olustur
+from model_kaydi import HAZIR, ModelKaydi
+from bellek_olcumu import surec_bellegi
 
 # Başlangıç mesajı
 print("="*50)
@@ -19,14 +48,6 @@ print("PRECURSOR - Haber Özet Platformu başlatılıyor...")
 print("Python sürümü:", sys.version)
 print("Çalışma dizini:", os.getcwd())
 
-# GPU kontrolü
-import torch
-device = torch.device("cuda" if torch.cuda.is_available() and os.getenv("GPU_AVAILABLE") == "1" else "cpu")
-print(f"Kullanılan cihaz: {device}")
-if device.type == "cuda":
-    print(f"GPU modeli: {torch.cuda.get_device_name(0)}")
-    print(f"Kullanılabilir GPU sayısı: {torch.cuda.device_count()}")
-    print(f"CUDA sürümü: {torch.version.cuda}")
 print("="*50)
 
 # Loglama yapılandırması
@@ -49,45 +70,94 @@ LLM_MODEL = os.getenv("LLM_MODEL", DEFAULT_MODEL)
 LLM_TYPE = os.getenv("LLM_TYPE", "transformers")
 OZET_MODU = os.getenv("OZET_MODU", "normal")  # normal veya super
 
+# Yerel model tipleri ve kullandıkları çıkarım arka ucu: transformers (fp32), quantized (dinamik int8), onnx (ONNX Runtime)
+YEREL_MODEL_TIPLERI = {"transformers": FP32, "quantized": INT8, "onnx": ONNX}
+CIKARIM_IS_PARCACIGI = int(os.getenv("CIKARIM_IS_PARCACIGI", "0"))  # 0: kütüphane varsayılanı
+MODEL_KLASORU = os.getenv("MODEL_KLASORU", VARSAYILAN_KLASOR)  # Dönüştürülmüş modellerin saklandığı klasör
+CIKARIM_ARKA_UCU = None  # Yüklenen modelin gerçekte kullandığı arka uç
+
 print(f"LLM Tipi: {LLM_TYPE}, Model: {LLM_MODEL}, Özet Modu: {OZET_MODU}")
 
+# Kullanılan cihaz (torch ilk model yüklemesinde içe aktarılır, başlangıcı yavaşlatmaz)
+device = None
+
+# Model yükleme durumu: "bekliyor", "yukleniyor", "hazir" veya "basit" (yedek özetleme)
+MODEL_DURUMU = "bekliyor"
+
+def cihazi_belirle():
+    """torch'u yükler ve kullanılacak cihazı belirler"""
+    global device
+    if device is None:
+        # GPU kontrolü
+        import torch
+        device = torch.device("cuda" if torch.cuda.is_available() and os.getenv("GPU_AVAILABLE") == "1" else "cpu")
+        logger.info(f"Kullanılan cihaz: {device}")
+        if device.type == "cuda":
+            logger.info(f"GPU modeli: {torch.cuda.get_device_name(0)}")
+            logger.info(f"Kullanılabilir GPU sayısı: {torch.cuda.device_count()}")
+            logger.info(f"CUDA sürümü: {torch.version.cuda}")
+    return device
+
+def yerel_model_yukle(model_adi):
+    """Modeli LLM_TYPE'ın çıkarım arka ucuyla yükler; int8/onnx yüklenemezse fp32'ye döner
+
+    Dönüş: (özetleyici pipeline, kullanılan arka uç)
+    """
+    # RSS tepe değeri (ve PROFIL_MODEL_BELLEGI=1 ise tracemalloc) /api/profil ile izlenir
+    with PROFILLEYICI.bellek_izle(f"model_yukleme:{model_adi}"):
+        cihazi_belirle()
+        arka_uc = YEREL_MODEL_TIPLERI.get(LLM_TYPE, FP32)
+        if arka_uc != FP32:
+            try:
+                return ozetleyici_olustur(model_adi, arka_uc, is_parcacigi=CIKARIM_IS_PARCACIGI, klasor=MODEL_KLASORU), arka_uc
+            except Exception as e:
+                logger.warning(f"{arka_uc} arka ucu yüklenemedi, fp32 kullanılacak: {e}")
+        yuklenen = ozetleyici_olustur(model_adi, FP32, cihaz=-1 if device.type == "cpu" else 0,
+                                      is_parcacigi=CIKARIM_IS_PARCACIGI)
+        return yuklenen, FP32
+
+# Isınma çıkarımı: modelin ilk çağrıdaki tek seferlik maliyetleri etkinleştirilmeden önce ödenir
+ISINMA_METNI = ("Merkez Bankası bugün faiz kararını açıkladı. Kurul, politika faizini sabit bıraktı ve "
+                "enflasyondaki düşüş eğilimi belirginleşene kadar sıkı duruşun korunacağını bildirdi.")
+
+def model_isit(model_adi, ozetleyici):
+    """Yeni yüklenen modelle kısa bir deneme özeti üretir; hata verirse model etkinleştirilmez"""
+    parametreler = dict(ozet_parametreleri(model_adi), max_length=24, min_length=4)
+    ozetleyici([ozet_girdisi(ISINMA_METNI, model_adi)], batch_size=1, truncation=True, **parametreler)
+
+def model_etkinlesti(kayit):
+    """Model kaydında etkin model değiştiğinde global model durumunu günceller"""
+    global summarizer, LLM_MODEL, CIKARIM_ARKA_UCU, MODEL_DURUMU
+    summarizer = kayit.ozetleyici
+    LLM_MODEL = kayit.ad
+    CIKARIM_ARKA_UCU = kayit.arka_uc
+    MODEL_DURUMU = "basit" if kayit.ozetleyici is basit_ozetleyici else "hazir"
+    # Süreç modunda işçiler bir sonraki işte yeni modelle yeniden fork edilir
+    surec_havuzunu_sifirla()
+    logger.info(f"Etkin model: {kayit.ad} ({kayit.arka_uc or 'basit'})")
+
 def init_llm_model():
     """LLM modelini başlatır"""
-    global summarizer
+    global MODEL_DURUMU
+    MODEL_DURUMU = "yukleniyor"
+    baslangic = time.perf_counter()
     try:
-        if LLM_TYPE == "transformers":
-            try:
-                from transformers import EncoderDecoderModel, BertTokenizer
-                # Önce tokenizer'ı yüklemeyi dene
-                tokenizer = BertTokenizer.from_pretrained(LLM_MODEL, local_files_only=True)
-                model = EncoderDecoderModel.from_pretrained(LLM_MODEL, local_files_only=True)
-                summarizer = pipeline("summarization", model=model, tokenizer=tokenizer, device=-1 if device.type == "cpu" else 0)
-                logger.info(f"Transformers modeli başarıyla yüklendi (offline mod): {LLM_MODEL}")
-            except Exception as offline_error:
-                logger.warning(f"Offline model yüklenemedi, online deneniyor: {offline_error}")
-                # Online yüklemeyi dene
-                try:
-                    model = EncoderDecoderModel.from_pretrained(LLM_MODEL)
-                    tokenizer = BertTokenizer.from_pretrained(LLM_MODEL)
-                    summarizer = pipeline("summarization", model=model, tokenizer=tokenizer, device=-1 if device.type == "cpu" else 0)
-                    logger.info(f"Transformers modeli başarıyla yüklendi (online mod): {LLM_MODEL}")
-                except Exception as online_error:
-                    logger.error(f"Online model yükleme hatası: {online_error}")
-                    raise
+        if LLM_TYPE in YEREL_MODEL_TIPLERI:
+            MODEL_KAYDI.sec(LLM_MODEL, bekle=True)
+            logger.info(f"Model ({CIKARIM_ARKA_UCU}) {time.perf_counter() - baslangic:.1f} saniyede yüklendi: {LLM_MODEL}")
         else:
             logger.warning(f"Desteklenmeyen LLM tipi: {LLM_TYPE}, basit özetleme kullanılacak")
-            summarizer = lambda metin, **kwargs: [{"summary_text": gelismis_basit_ozet(metin)}]
+            MODEL_KAYDI.kaydet("basic", basit_ozetleyici)
     except Exception as e:
         logger.error(f"LLM model yükleme hatası: {e}")
         logger.warning("Basit özetleme moduna geçiliyor...")
-        summarizer = lambda metin, **kwargs: [{"summary_text": gelismis_basit_ozet(metin)}]
+        MODEL_KAYDI.kaydet("basic", basit_ozetleyici)
 
 def gelismis_basit_ozet(metin, super_ozet=False):
     """Basit kurallara dayalı özetleme yapar"""
     try:
-        # Noktalama işaretlerine göre cümlelere ayır
-        cumleler = re.split(r'[.!?]+', metin)
-        cumleler = [c.strip() for c in cumleler if len(c.strip()) > 10]
+        # Noktalama işaretlerine göre cümlelere ayır (parçalı özetleyiciyle aynı kurallar)
+        cumleler = [c.rstrip('.!?').strip() for c in cumlelere_ayir(metin, en_kisa=10)]
         
         if not cumleler:
             return metin if len(metin) < 200 else metin[:197] + "..."
@@ -104,9 +174,23 @@ def gelismis_basit_ozet(metin, super_ozet=False):
         logger.error(f"Basit özetleme hatası: {e}")
         return metin[:197] + "..." if len(metin) > 200 else metin
 
+def basit_ozetleyici(metin, **kwargs):
+    """Model yüklenemediğinde pipeline yerine kullanılır (tek metin veya metin listesi alır)"""
+    if isinstance(metin, list):
+        return [{"summary_text": gelismis_basit_ozet(m)} for m in metin]
+    return [{"summary_text": gelismis_basit_ozet(metin)}]
+
 # Global değişkenler
-summarizer = None
-init_llm_model()
+summarizer = None  # Model arka planda yüklenir, hazır olana kadar None kalır
+
+# Bellekteki modeller; etkin model değiştiğinde summarizer, LLM_MODEL ve CIKARIM_ARKA_UCU güncellenir
+MODEL_KAYDI = ModelKaydi(
+    yerel_model_yukle,
+    kapasite=int(os.getenv("MODEL_KAYIT_KAPASITESI", "2")),
+    bellek_butcesi_mb=float(os.getenv("MODEL_BELLEK_BUTCESI_MB", "0")),
+    isinma=model_isit,
+    etkinlestirildi=model_etkinlesti
+)
 
 app = Flask(__name__, 
             static_folder="../frontend/static",
@@ -115,7 +199,7 @@ app = Flask(__name__,
 # RSS feed'lerini yapılandırma dosyasından yükle
 def load_rss_feeds():
     """RSS feed'lerini yapılandırma dosyasından yükler"""
-    config_file = os.path.join(os.path.dirname(__file__), 'rss_feeds.json')
+    config_file = os.getenv("RSS_AYAR_DOSYASI") or os.path.join(os.path.dirname(__file__), 'rss_feeds.json')
     
     try:
         with open(config_file, 'r', encoding='utf-8') as f:
@@ -136,45 +220,183 @@ def load_rss_feeds():
 RSS_FEEDS = load_rss_feeds()
 print(f"Yüklenen RSS kategorileri: {', '.join(RSS_FEEDS.keys())}")
 
+# Sunucu portu
+PORT = int(os.getenv("PORT", "5000"))
+
 # Veritabanı bağlantısı
-DB_FILE = 'haber_ozet.db'  # Tek bir veritabanı dosyası kullanacağız
+DB_FILE = os.getenv("DB_DOSYASI", 'haber_ozet.db')  # Tek bir veritabanı dosyası kullanacağız
+
+# Tüm route'lar ve arka plan işleri aynı bağlantı havuzunu kullanır (WAL modunda)
+VERITABANI = BaglantiHavuzu(DB_FILE, boyut=int(os.getenv("DB_HAVUZ_BOYUTU", "8")))
 
 def get_db_connection():
-    conn = sqlite3.connect(DB_FILE)
-    conn.row_factory = sqlite3.Row
-    return conn
+    """Havuzdan bir bağlantı döndürür; close() bağlantıyı havuza iade eder"""
+    return VERITABANI.al()
 
-def ozet_olustur(metin):
-    """Verilen metni özetler"""
-    try:
-        # HTML etiketlerini temizle
-        temiz_metin = re.sub(r'<[^>]+>', '', metin)
-        temiz_metin = re.sub(r'\s+', ' ', temiz_metin).strip()
-        
-        if not temiz_metin:
-            return ""
-            
-        # Metin çok kısaysa direkt döndür
-        if len(temiz_metin) < 200:
-            return temiz_metin
-            
-        if LLM_TYPE == "transformers":
-            try:
-                if not summarizer:
-                    init_llm_model()
-                return summarizer(temiz_metin, max_length=150 if OZET_MODU != "super" else 75, min_length=50 if OZET_MODU != "super" else 20, do_sample=False)[0]['summary_text']
-            except Exception as e:
-                logger.error(f"Transformers özetleme hatası: {e}")
-                return gelismis_basit_ozet(temiz_metin, super_ozet=OZET_MODU == "super")
+# Haber içerikleri (ham feed HTML'i) liste alanlarından ayrı, sıkıştırılmış tabloda tutulur (zlib veya zstd)
+HABER_ICERIKLERI = HaberIcerikleri(
+    get_db_connection,
+    bicim=os.getenv("ICERIK_SIKISTIRMA", "zlib"),
+    seviye=int(os.getenv("ICERIK_SIKISTIRMA_SEVIYESI")) if os.getenv("ICERIK_SIKISTIRMA_SEVIYESI") else None
+)
+
+# Haber listesi yanıtları; haberler yazıldıkça ilgili kategori geçersiz kılınır
+YANIT_ONBELLEGI = YanitOnbellegi(kapasite=int(os.getenv("YANIT_ONBELLEK_KAYIT", "256")))
+
+# /api/akis abonelerine commit edilen yeni haberleri ve özet yükseltmelerini iletir
+HABER_AKISI = HaberAkisi(
+    gecmis_kapasitesi=int(os.getenv("AKIS_GECMIS_KAPASITESI", "1000")),
+    tampon_boyutu=int(os.getenv("AKIS_TAMPON_BOYUTU", "256")),
+    maks_abone=int(os.getenv("AKIS_MAKS_ABONE", "100"))
+)
+
+# Haber toplama hattının aşama süreleri ve sayaçları; /api/metrics ile Prometheus biçiminde sunulur
+METRIKLER = MetrikKaydi(onek="precursor_")
+ASAMA_SURESI = METRIKLER.histogram(
+    "asama_suresi_saniye", "Hat aşamalarının süresi (cekme feed başına, diğer aşamalar çağrı başına)", ("asama",))
+ASAMA_OGELERI = METRIKLER.sayac("asama_ogeleri_toplam", "Aşamalarda işlenen feed veya haber sayısı", ("asama",))
+HATALAR = METRIKLER.sayac("hatalar_toplam", "Aşamalarda oluşan hatalar", ("asama",))
+FEED_CEKIMLERI = METRIKLER.sayac("feed_cekimleri_toplam", "Feed çekimlerinin sonuçları", ("sonuc",))
+AYRISTIRMALAR = METRIKLER.sayac("feed_ayristirmalari_toplam", "Feed ayrıştırmalarında kullanılan yöntem", ("yontem",))
+YEDEK_OZETLER = METRIKLER.sayac("yedek_ozetler_toplam", "Model özeti yerine kurala dayalı özetle kalan haberler", ("neden",))
+
+# İstendiğinde sonraki döngüleri, özet batch'lerini veya istekleri profiller; raporlar PROFIL_KLASORU'na yazılır
+PROFILLEYICI = Profilleyici(
+    os.getenv("PROFIL_KLASORU", "profiller"),
+    ornekleme_araligi_sn=float(os.getenv("PROFIL_ORNEKLEME_ARALIGI_MS", "5")) / 1000,
+    model_tracemalloc=os.getenv("PROFIL_MODEL_BELLEGI", "0") == "1"
+)
+# /api/profil yalnızca PROFIL_ANAHTARI tanımlıysa ve X-Profil-Anahtari başlığı eşleşirse kullanılabilir
+PROFIL_ANAHTARI = os.getenv("PROFIL_ANAHTARI", "")
+# Açılıştan itibaren ilk N haber toplama döngüsü profillenir (0: kapalı)
+if int(os.getenv("PROFIL_DONGU", "0")) > 0:
+    PROFILLEYICI.iste(DONGU, int(os.getenv("PROFIL_DONGU")), os.getenv("PROFIL_YONTEMI", ORNEKLEME))
+
+# Feed çekme motoru (tüm kategoriler için ortak, sunucu başına bağlantı havuzu tutar)
+FEED_CEKICI = FeedCekici(
+    isci_sayisi=int(os.getenv("FEED_ISCI_SAYISI", "16")),
+    host_limiti=int(os.getenv("FEED_HOST_LIMITI", "4")),
+    zaman_asimi=(float(os.getenv("FEED_BAGLANTI_ZAMAN_ASIMI_SN", "10")), float(os.getenv("FEED_OKUMA_ZAMAN_ASIMI_SN", "30"))),
+    toplam_zaman_asimi=float(os.getenv("FEED_TOPLAM_ZAMAN_ASIMI_SN", "60"))
+)
+
+# Feed başına ETag / Last-Modified / içerik hash önbelleği (koşullu GET için)
+FEED_DOGRULAYICILARI = FeedDogrulayiciOnbellegi(get_db_connection)
+
+# Feed başına yenileme takvimi; çekim aralığı feed'in yayın hızına göre uyarlanır
+FEED_ZAMANLAYICI = FeedZamanlayici(
+    get_db_connection,
+    min_aralik_sn=float(os.getenv("FEED_MIN_ARALIK_SN", "120")),
+    maks_aralik_sn=float(os.getenv("FEED_MAKS_ARALIK_SN", "21600"))
+)
+
+# Feed başına gecikme / hata kaydı ve devre kesici; art arda hata veren feed'lere bir süre istek gönderilmez
+FEED_SAGLIGI = FeedSagligi(
+    get_db_connection,
+    hata_esigi=int(os.getenv("FEED_DEVRE_HATA_ESIGI", "3")),
+    bekleme_sn=float(os.getenv("FEED_DEVRE_BEKLEME_SN", "300"))
+)
+
+# Feed gövdesi parça parça ayrıştırılır; 5 yeni habere veya veritabanında bulunan bir habere gelince durulur
+FEED_AKISLI_AYRISTIRMA = os.getenv("FEED_AKISLI_AYRISTIRMA", "1") == "1"
+FEED_HABER_SINIRI = 5  # Her feed'den en fazla 5 haber al
+
+# Son yenileme döngüsüne ait metrikler
+SON_YENILEME_METRIKLERI = {}
+
+def feedleri_cek(kategoriler, urller=None):
+    """Verilen kategorilerdeki feed'leri (urller verilirse yalnızca onları) eşzamanlı indirir, {url: FeedYaniti} döndürür"""
+    global SON_YENILEME_METRIKLERI
+    secili = set(urller) if urller is not None else None
+    urller = list(dict.fromkeys(feed_url for kategori in kategoriler for feed_url in RSS_FEEDS.get(kategori, [])
+                                if secili is None or feed_url in secili))
+    # Devresi açık feed'lere istek gönderilmez; takvimde deneme zamanına ertelenir
+    devresi_acik = 0
+    for feed_url in list(urller):
+        deneme_zamani = FEED_SAGLIGI.bekleme_bitisi(feed_url)
+        if deneme_zamani is not None:
+            urller.remove(feed_url)
+            FEED_ZAMANLAYICI.ertele(feed_url, deneme_zamani)
+            devresi_acik += 1
+    url_basliklari = {feed_url: FEED_DOGRULAYICILARI.kosullu_basliklar(feed_url) for feed_url in urller}
+    baslangic = time.perf_counter()
+    # Akışlı ayrıştırmada gövde indirilirken ayrıştırılır; yeterli habere ulaşılınca indirme kesilir
+    yanitlar = FEED_CEKICI.hepsini_cek(urller, url_basliklari,
+                                       isleyici=feed_govdesini_ayristir if FEED_AKISLI_AYRISTIRMA else None)
+    
+    # Değişmeyen feed'leri işaretle, ayrıştırma ve özetleme tamamen atlanacak
+    metrikler = {
+        "feed_sayisi": len(yanitlar),
+        "atlanan_feed": 0,
+        "devresi_acik": devresi_acik,
+        "304_yaniti": 0,
+        "ayni_icerik": 0,
+        "indirilen_bayt": 0,
+        "kazanilan_bayt": 0,
+        "sure": 0.0
+    }
+    for feed_url, yanit in yanitlar.items():
+        metrikler["indirilen_bayt"] += yanit.okunan_bayt
+        ASAMA_SURESI.gozlemle(yanit.sure, asama="cekme")
+        durum, kazanilan_bayt = FEED_DOGRULAYICILARI.karsilastir(feed_url, yanit)
+        if durum in (DEGISMEDI, AYNI_ICERIK):
+            yanit.degismedi = True
+            metrikler["atlanan_feed"] += 1
+            metrikler["304_yaniti" if durum == DEGISMEDI else "ayni_icerik"] += 1
+            metrikler["kazanilan_bayt"] += kazanilan_bayt
+            FEED_CEKIMLERI.artir(sonuc=durum)
+        elif yanit.basarili:
+            FEED_CEKIMLERI.artir(sonuc="yeni")
         else:
-            return gelismis_basit_ozet(temiz_metin, super_ozet=OZET_MODU == "super")
-            
-    except Exception as e:
-        logger.error(f"Özetleme hatası: {e}")
-        return ""
+            FEED_CEKIMLERI.artir(sonuc="hata")
+            HATALAR.artir(asama="cekme")
+    ASAMA_OGELERI.artir(len(yanitlar), asama="cekme")
+    if devresi_acik:
+        FEED_CEKIMLERI.artir(devresi_acik, sonuc="devre_acik")
+    metrikler["sure"] = round(time.perf_counter() - baslangic, 3)
+    SON_YENILEME_METRIKLERI = metrikler
+    
+    logger.info(
+        f"{metrikler['feed_sayisi']} feed {metrikler['sure']:.2f} saniyede çekildi "
+        f"({metrikler['atlanan_feed']} değişmemiş feed atlandı, {metrikler['kazanilan_bayt']} bayt kazanıldı, "
+        f"devresi açık {devresi_acik} feed'e istek gönderilmedi)."
+    )
+    return yanitlar
+
+def feed_govdesini_ayristir(parcalar, basliklar):
+    """FeedCekici gövde işleyicisi: gövdeyi indirilirken ayrıştırır, gerekenden fazlasını indirmez"""
+    return akisli_ayristir(parcalar, basliklar, en_fazla=FEED_HABER_SINIRI, bilinenler=bilinen_urller)
+
+def feed_sonucunu_kaydet(feed_url, yanit, yayin_zamanlari=None, hata=None):
+    """Feed çekiminin sonucunu sağlık kaydına ve yenileme takvimine işler"""
+    if hata is None:
+        if FEED_SAGLIGI.basari(feed_url, yanit.sure):
+            logger.info(f"Feed yeniden çalışıyor, devre kapandı: {feed_url}")
+        FEED_ZAMANLAYICI.kaydet(feed_url, yayin_zamanlari or [])
+        return
+    if FEED_SAGLIGI.hata(feed_url, hata, yanit.sure if yanit is not None else None):
+        kayit = FEED_SAGLIGI.kayit(feed_url)
+        logger.warning(f"Feed devresi açıldı, {kayit['bekleme_sn']:.0f} sn istek gönderilmeyecek: {feed_url} - {hata}")
+    FEED_ZAMANLAYICI.kaydet(feed_url, hata=True)
 
-def haberleri_getir(kategori):
-    """Belirli bir kategorideki RSS feed'lerinden haberleri çeker"""
+def bilinen_urller(urller):
+    """Verilen URL'lerden veritabanında zaten kayıtlı olanları döndürür"""
+    if not urller:
+        return set()
+    conn = get_db_connection()
+    kayitli = set()
+    for parca in parcala(urller):
+        yer_tutucular = ",".join("?" * len(parca))
+        kayitli.update(row['url'] for row in conn.execute(f'SELECT url FROM haberler WHERE url IN ({yer_tutucular})', parca))
+    conn.close()
+    return kayitli
+
+def haberleri_getir(kategori, yanitlar=None, islenen_feedler=None):
+    """Belirli bir kategorideki RSS feed'lerinden haberleri çeker (özetler özetleme işçilerinde oluşturulur)
+
+    islenen_feedler verilirse başarıyla işlenen feed'lerin yanıtları {url: yanit} olarak eklenir;
+    doğrulayıcıları haberler veritabanına kaydedildikten sonra saklanmalıdır.
+    """
     haberler = []
     islenen_urller = set()  # İşlenen URL'leri takip etmek için set
     
@@ -182,25 +404,72 @@ def haberleri_getir(kategori):
         logger.warning(f"Geçersiz kategori: {kategori}")
         return haberler
     
+    # Önceden çekilmiş yanıt yoksa bu kategorinin feed'lerini eşzamanlı çek
+    if yanitlar is None:
+        yanitlar = feedleri_cek([kategori])
+    # Saklama süresini aşmış haberler eklenmez; silindikten sonra feed'de kaldıkları için geri gelmezler
+    saklama_siniri = HABER_SAKLAYICI.sinir_tarihi(kategori)
+    
     for feed_url in RSS_FEEDS[kategori]:
+        # Takvimle çekilen turlarda vadesi gelmemiş feed'lerin yanıtı yoktur
+        if feed_url not in yanitlar:
+            continue
+        yanit = yanitlar[feed_url]
         try:
-            logger.info(f"Feed çekiliyor: {feed_url}")
-            feed = feedparser.parse(feed_url)
+            if yanit.degismedi:
+                logger.debug(f"Feed değişmemiş, atlanıyor: {feed_url}")
+                feed_sonucunu_kaydet(feed_url, yanit)
+                continue
+            if not yanit.basarili:
+                hata = yanit.hata or f"HTTP {yanit.durum_kodu}"
+                logger.error(f"Feed çekilemedi: {feed_url} - {hata}")
+                feed_sonucunu_kaydet(feed_url, yanit, hata=hata)
+                continue
+            
+            logger.debug(f"Feed işleniyor: {feed_url} ({yanit.sure:.2f} sn)")
+            if yanit.islenmis is not None:
+                # Akışlı ayrıştırma gövde indirilirken yapıldı; süresi çekme süresine dahildir
+                feed = yanit.islenmis
+            else:
+                with ASAMA_SURESI.zamanla(asama="ayristirma"):
+                    feed = feedparser.parse(yanit.icerik, response_headers=yanit.basliklar)
+            ASAMA_OGELERI.artir(asama="ayristirma")
+            AYRISTIRMALAR.artir(yontem=("akisli" if feed.get('akisli') else "feedparser_yedek") if FEED_AKISLI_AYRISTIRMA else "feedparser")
             
             # Feed'in geçerli olup olmadığını kontrol et
             if hasattr(feed, 'bozo_exception'):
                 logger.warning(f"Feed çekilirken uyarı: {feed.bozo_exception}")
             
+            if feed.get('erken_durdu') and not feed.entries:
+                # Feed'in en yeni haberi zaten kayıtlı: yeni haber yok, feed sağlam
+                logger.debug(f"Feed'de yeni haber yok: {feed_url}")
+                feed_sonucunu_kaydet(feed_url, yanit)
+                continue
             if not hasattr(feed, 'entries') or len(feed.entries) == 0:
                 logger.warning(f"Feed'de haber bulunamadı: {feed_url}")
+                # Ayrıştırılamayan gövde (ör. RSS yerine hata sayfası) bozuk feed sayılır
+                hata = f"Ayrıştırılamadı: {feed.bozo_exception}" if getattr(feed, 'bozo', False) else None
+                if hata:
+                    HATALAR.artir(asama="ayristirma")
+                feed_sonucunu_kaydet(feed_url, yanit, hata=hata)
                 continue
                 
-            for entry in feed.entries[:5]:  # Her feed'den en fazla 5 haber al
+            adaylar = feed.entries[:FEED_HABER_SINIRI]
+            # Veritabanında zaten bulunan haberler temizlenmeden ve özetlenmeden atlanır; akışlı ayrıştırıcı
+            # döndürdüğü haberleri ayrıştırırken denetlemiştir
+            if feed.get('akisli'):
+                kayitli_urller = feed['bilinen_urller']
+            else:
+                kayitli_urller = bilinen_urller([entry.link for entry in adaylar if hasattr(entry, 'link')])
+            yayin_zamanlari = []  # Yeni haberlerin yayın zamanları; feed'in yenileme aralığını belirler
+            
+            for entry in adaylar:
                 # URL kontrolü - aynı URL'den haber varsa atla
                 haber_url = entry.link if hasattr(entry, 'link') else ''
-                if not haber_url or haber_url in islenen_urller:
+                if not haber_url or haber_url in islenen_urller or haber_url in kayitli_urller:
                     continue
                 islenen_urller.add(haber_url)
+                yayin_zamanlari.append(yayin_zamani(entry))
                 
                 # İçerik alanını belirle - bazı RSS'lerde farklı alanlar kullanılabilir
                 icerik = ""
@@ -213,7 +482,7 @@ def haberleri_getir(kategori):
                 
                 # İçerik yoksa veya çok kısaysa atla
                 if not icerik or len(icerik) < 50:
-                    logger.warning(f"Haber içeriği çok kısa veya yok: {entry.title if hasattr(entry, 'title') else 'Başlıksız'}")
+                    logger.debug(f"Haber içeriği çok kısa veya yok: {entry.title if hasattr(entry, 'title') else 'Başlıksız'}")
                     continue
                 
                 # Resim URL'sini bul
@@ -231,19 +500,14 @@ def haberleri_getir(kategori):
                     tarih = datetime.fromtimestamp(time.mktime(entry.published_parsed))
                 except:
                     tarih = datetime.now()
+                if saklama_siniri is not None and tarih < saklama_siniri:
+                    continue
                 
-                # Özet oluştur
-                try:
-                    logger.info(f"Haber özetleniyor: {entry.title if hasattr(entry, 'title') else 'Başlıksız'}")
-                    ozet = ozet_olustur(icerik)
-                except Exception as e:
-                    logger.error(f"Özet oluşturma hatası: {str(e)}")
-                    ozet = entry.title if hasattr(entry, 'title') else 'Özet oluşturulamadı'
-                
+                # Özet, kayıttan sonra özetleme kuyruğu üzerinden oluşturulur
                 haber = {
                     'baslik': entry.title if hasattr(entry, 'title') else 'Başlıksız',
                     'icerik': icerik,
-                    'ozet': ozet,
+                    'ozet': None,
                     'url': haber_url,
                     'resim_url': resim_url,
                     'kategori': kategori,
@@ -251,46 +515,200 @@ def haberleri_getir(kategori):
                     'tarih': tarih
                 }
                 haberler.append(haber)
+            
+            # Feed başarıyla işlendi; doğrulayıcılar haberler kaydedildikten sonra saklanır
+            if islenen_feedler is not None:
+                islenen_feedler[feed_url] = yanit
+            feed_sonucunu_kaydet(feed_url, yanit, yayin_zamanlari)
                 
         except Exception as e:
             logger.error(f"Feed işlenirken hata: {feed_url} - {str(e)}")
+            HATALAR.artir(asama="ayristirma")
+            feed_sonucunu_kaydet(feed_url, yanit, hata=str(e))
             continue
     
     return haberler
 
-def haberleri_veritabanina_kaydet(haberler):
-    """Haberleri veritabanına kaydeder"""
+def tum_haberleri_getir(kategoriler=None, urller=None):
+    """Tüm kategorilerin feed'lerini tek seferde eşzamanlı çeker, {kategori: (haberler, islenen_feedler)} döndürür
+
+    urller verilirse yalnızca bu feed'ler çekilir ve yalnızca onları içeren kategoriler işlenir.
+    """
+    kategoriler = list(kategoriler) if kategoriler is not None else list(RSS_FEEDS.keys())
+    if urller is not None:
+        kategoriler = [kategori for kategori in kategoriler if any(feed_url in urller for feed_url in RSS_FEEDS.get(kategori, []))]
+    yanitlar = feedleri_cek(kategoriler, urller)
+    sonuclar = {}
+    for kategori in kategoriler:
+        islenen_feedler = {}
+        sonuclar[kategori] = (haberleri_getir(kategori, yanitlar, islenen_feedler), islenen_feedler)
+    return sonuclar
+
+def haberleri_veritabanina_kaydet(haberler, ozet_durumu=None, guncelle=False):
+    """Haberleri tek bir işlemde toplu olarak veritabanına kaydeder
+
+    Aynı URL'ye sahip haberler atlanır; guncelle=True verilirse başlık, içerik veya resim
+    değişmişse güncellenir. Yeni haberler yakın tekrar kümelerine atanır. Eklenen, güncellenen
+    ve atlanan haber sayılarını, eklenen haberlerin id'lerini ve bunlardan özetlenmesi gereken
+    küme temsilcilerinin id'lerini döndürür. Kayıt başarısız olursa `kaydedildi` False olur.
+    """
+    sonuc = {"kaydedildi": True, "eklenen": 0, "guncellenen": 0, "atlanan": 0, "eklenen_idler": [], "ozetlenecek_idler": []}
     if not haberler:
-        return
-        
-    conn = get_db_connection()
-    cursor = conn.cursor()
+        return sonuc
     
+    # Aynı kayıt içinde tekrar eden URL'lerden ilki alınır
+    benzersiz = {}
     for haber in haberler:
-        try:
-            cursor.execute('''
-            INSERT INTO haberler (baslik, ozet, icerik, kategori, kaynak, url, resim_url, tarih)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                haber['baslik'],
-                haber['ozet'],
-                haber['icerik'],
-                haber['kategori'],
-                haber['kaynak'],
-                haber['url'],
-                haber['resim_url'],
-                haber['tarih']
-            ))
-        except sqlite3.IntegrityError:
-            logger.warning(f"Haber zaten mevcut: {haber['baslik']}")
-            continue
-        except Exception as e:
-            logger.error(f"Haber kaydedilirken hata: {str(e)}")
-            continue
+        benzersiz.setdefault(haber['url'], haber)
+    satirlar = [(
+        haber['baslik'],
+        haber['ozet'],
+        haber['kategori'],
+        haber['kaynak'],
+        haber['url'],
+        haber['resim_url'],
+        haber['tarih'],
+        ozet_durumu or OZET_HAZIR
+    ) for haber in benzersiz.values()]
     
-    conn.commit()
-    conn.close()
-    logger.info(f"{len(haberler)} haber veritabanına kaydedildi.")
+    if guncelle:
+        cakisma = '''ON CONFLICT(url) DO UPDATE SET
+            baslik = excluded.baslik, resim_url = excluded.resim_url
+        WHERE haberler.baslik IS NOT excluded.baslik
+           OR haberler.resim_url IS NOT excluded.resim_url'''
+    else:
+        cakisma = 'ON CONFLICT(url) DO NOTHING'
+    
+    try:
+        with ASAMA_SURESI.zamanla(asama="kaydetme"), VERITABANI.yazma_islemi() as conn:
+            urller = list(benzersiz)
+            mevcut = {}
+            for parca in parcala(urller):
+                yer_tutucular = ",".join("?" * len(parca))
+                mevcut.update((row['url'], row) for row in conn.execute(
+                    f'SELECT id, url, baslik, resim_url FROM haberler WHERE url IN ({yer_tutucular})', parca))
+            
+            onceki_degisiklik = conn.total_changes
+            # Eski şemanın içerik sütunu (NOT NULL) arka planda kaldırılana kadar boş bırakılır
+            eski_sutun = ", icerik" if ESKI_ICERIK_SUTUNU else ""
+            conn.executemany(f'''
+            INSERT INTO haberler (baslik, ozet, kategori, kaynak, url, resim_url, tarih, ozet_durumu{eski_sutun})
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?{", ''" if eski_sutun else ""})
+            {cakisma}
+            ''', satirlar)
+            degisen = conn.total_changes - onceki_degisiklik
+            
+            # Eklenen (ve guncelle=True ise mevcut) haberler aynı işlemde arama indeksine yazılır
+            indekslenecek_urller = urller if guncelle else [url for url in urller if url not in mevcut]
+            indekslenecekler = []
+            yeni_haberler = []
+            akis_olaylari = []
+            icerikler = []
+            for parca in parcala(indekslenecek_urller):
+                yer_tutucular = ",".join("?" * len(parca))
+                for row in conn.execute(f'SELECT id, url FROM haberler WHERE url IN ({yer_tutucular})', parca):
+                    haber = benzersiz[row['url']]
+                    indekslenecekler.append((row['id'], haber['baslik'], haber['ozet'], haber['icerik']))
+                    if row['url'] not in mevcut:
+                        sonuc["eklenen_idler"].append(row['id'])
+                        yeni_haberler.append((row['id'], haber['baslik'], haber['icerik']))
+                        icerikler.append((row['id'], haber['icerik']))
+                        akis_olaylari.append(akis_haberi(row['id'], haber, ozet_durumu or OZET_HAZIR))
+            HABER_ARAMA.indeksle(conn, indekslenecekler)
+            
+            # İçerikler ayrı tabloda sıkıştırılarak tutulur; guncelle=True ise değişen içerikler de yeniden yazılır
+            if guncelle:
+                eski_icerikler = icerikleri_getir(conn, [row['id'] for row in mevcut.values()])
+                for url, row in mevcut.items():
+                    haber = benzersiz[url]
+                    if eski_icerikler.get(row['id']) != haber['icerik']:
+                        icerikler.append((row['id'], haber['icerik']))
+                        # Başlığı veya resmi de değiştiyse satır yukarıda zaten güncellenmiş sayıldı
+                        if row['baslik'] == haber['baslik'] and row['resim_url'] == haber['resim_url']:
+                            degisen += 1
+            HABER_ICERIKLERI.kaydet(conn, icerikler)
+            
+            # Yeni haberler yakın tekrar kümelerine atanır; model özeti yalnızca küme temsilcisi için üretilir
+            kumeler = HABER_KUMELEYICI.kumele(conn, yeni_haberler)
+            conn.executemany('UPDATE haberler SET kume_id = ? WHERE id = ?',
+                             [(kume_id, haber_id) for haber_id, kume_id in kumeler.items()])
+            for olay in akis_olaylari:
+                olay['kume_id'] = kumeler.get(olay['id'], olay['id'])
+            sonuc["ozetlenecek_idler"] = [haber_id for haber_id, kume_id in kumeler.items() if haber_id == kume_id]
+            # Temsilcisi zaten özetlenmiş tekrarlar özeti hemen devralır
+            yayilan_ozetler = kume_ozetlerini_yay(conn, {kume_id for haber_id, kume_id in kumeler.items() if haber_id != kume_id})
+    except Exception as e:
+        logger.error(f"Haberler kaydedilirken hata: {str(e)}")
+        HATALAR.artir(asama="kaydetme")
+        sonuc["kaydedildi"] = False
+        return sonuc
+    ASAMA_OGELERI.artir(len(satirlar), asama="kaydetme")
+    
+    if degisen:
+        YANIT_ONBELLEGI.gecersiz_kil({haber['kategori'] for haber in benzersiz.values()})
+    # Olaylar commit'ten sonra yayınlanır; abone gördüğü haberi API'den de okuyabilir
+    HABER_AKISI.yayinla(HABER, akis_olaylari)
+    HABER_AKISI.yayinla(OZET, yayilan_ozetler)
+    
+    sonuc["eklenen"] = len(sonuc["eklenen_idler"])
+    sonuc["guncellenen"] = degisen - sonuc["eklenen"]
+    sonuc["atlanan"] = len(haberler) - sonuc["eklenen"] - sonuc["guncellenen"]
+    logger.info(f"{sonuc['eklenen']} haber eklendi ({sonuc['eklenen'] - len(sonuc['ozetlenecek_idler'])} tanesi mevcut bir haberin tekrarı), "
+                f"{sonuc['guncellenen']} güncellendi, {sonuc['atlanan']} zaten mevcut olduğu için atlandı.")
+    return sonuc
+
+def kume_ozetlerini_yay(conn, kume_idleri):
+    """Temsilcisinin özeti hazır olan kümelerde, özet bekleyen tekrarlara aynı özeti yazar
+    
+    Çağıranın yazma işlemi içinde çalışır; güncellenen haberlerin özet olaylarını döndürür.
+    """
+    guncellenenler = []
+    olaylar = []
+    for parca in parcala(list(kume_idleri)):
+        yer_tutucular = ",".join("?" * len(parca))
+        for row in conn.execute(f'''
+            SELECT k.id, k.kategori, t.ozet FROM haberler k JOIN haberler t ON t.id = k.kume_id
+            WHERE k.kume_id IN ({yer_tutucular}) AND k.id != k.kume_id AND k.ozet_durumu = ? AND t.ozet_durumu = ?
+        ''', parca + [OZET_BEKLEMEDE, OZET_HAZIR]):
+            guncellenenler.append((row['id'], row['ozet']))
+            olaylar.append(akis_ozeti(row['id'], row['kategori'], row['ozet']))
+    if guncellenenler:
+        conn.executemany('UPDATE haberler SET ozet = ?, ozet_durumu = ? WHERE id = ?',
+                         [(ozet, OZET_HAZIR, haber_id) for haber_id, ozet in guncellenenler])
+        HABER_ARAMA.ozetleri_guncelle(conn, guncellenenler)
+    return olaylar
+
+def yeni_temsilcileri_kuyruga_ekle(conn, haber_idleri):
+    """Kümenin yeni temsilcisi olan ve özeti hazır olmayan haberler için özetleme işi ekler
+
+    Tekrarlar kuyruğa hiç eklenmediğinden, temsilci silinince kalan üyeler aksi halde sonsuza dek
+    beklemede kalırdı. Çağıranın yazma işlemi içinde çalışır; işler boşta yükseltilmek üzere ertelenir.
+    """
+    bekleyenler = []
+    for parca in parcala(list(haber_idleri)):
+        yer_tutucular = ",".join("?" * len(parca))
+        bekleyenler.extend(row[0] for row in conn.execute(
+            f'SELECT id FROM haberler WHERE id IN ({yer_tutucular}) AND ozet_durumu != ?', parca + [OZET_HAZIR]))
+    OZET_KUYRUGU.ekle(bekleyenler, durum=ERTELENDI, conn=conn)
+
+def akis_haberi(haber_id, haber, ozet_durumu):
+    """Yeni haberin /api/akis olayı (liste görünümündeki alanlar)"""
+    return {
+        'id': haber_id,
+        'baslik': haber['baslik'],
+        'ozet': haber['ozet'],
+        'kategori': haber['kategori'],
+        'kaynak': haber['kaynak'],
+        'url': haber['url'],
+        'resim_url': haber['resim_url'],
+        'tarih': str(haber['tarih']),
+        'ozet_durumu': ozet_durumu,
+        'kume_id': haber_id,
+    }
+
+def akis_ozeti(haber_id, kategori, ozet):
+    """Özeti model özetine yükseltilen haberin /api/akis olayı"""
+    return {'id': haber_id, 'kategori': kategori, 'ozet': ozet, 'ozet_durumu': OZET_HAZIR}
 
 def temizle_veritabani():
     """Veritabanını temizler ve yeni baştan başlar"""
@@ -302,258 +720,926 @@ def temizle_veritabani():
     
     conn.commit()
     conn.close()
+    YANIT_ONBELLEGI.gecersiz_kil()
+    HABER_AKISI.yayinla(YENIDEN_YUKLE, [{}])
+    
+    # Haberler silindiği için feed'lerin tamamı yeniden çekilmeli, eski özetleme işleri de geçersiz
+    HABER_ICERIKLERI.temizle()
+    HABER_ARAMA.temizle()
+    HABER_KUMELEYICI.temizle()
+    FEED_DOGRULAYICILARI.temizle()
+    FEED_ZAMANLAYICI.hepsini_vadeye_al()
+    OZET_KUYRUGU.temizle()
     logger.info("Veritabanı temizlendi, yeni haberler yüklenecek...")
 
+def takvimli_topla(urller):
+    """Vadesi gelen feed'leri toplar; sonucu kaydedilemeyen feed'ler hatalı sayılıp ertelenir"""
+    try:
+        # rss_yonetici.py'nin açtığı veya kapattığı devreler bu turda dikkate alınsın
+        FEED_SAGLIGI.yenile()
+        return haberleri_topla(urller=urller)
+    except Exception as e:
+        logger.error(f"Haber güncellemesi başarısız: {e}")
+        return 0
+    finally:
+        FEED_ZAMANLAYICI.sonuclanmayanlari_ertele(urller)
+
 def ilk_haberleri_yukle():
-    """Uygulama başlatıldığında tüm kategorilerden haberleri yükler"""
+    """Uygulama başlatıldığında çekim zamanı gelmiş feed'lerden haberleri yükler
+
+    İlk açılışta (veya veritabanı sıfırlandığında) tüm feed'lerin zamanı gelmiştir; yeniden
+    başlatmada takvim kaldığı yerden devam eder.
+    """
     logger.info("İlk haberler yükleniyor...")
-    for kategori in RSS_FEEDS.keys():
-        logger.info(f"{kategori} kategorisi yükleniyor...")
-        haberler = haberleri_getir(kategori)
-        haberleri_veritabanina_kaydet(haberler)
-    logger.info("İlk haberler başarıyla yüklendi.")
+    urller = FEED_ZAMANLAYICI.siradakiler(zaman_asimi=0)
+    if urller:
+        takvimli_topla(urller)
+    logger.info("İlk haberler başarıyla yüklendi, özetler arka planda oluşturuluyor.")
     
     # Tarayıcıyı aç
-    logger.info("Web arayüzü açılıyor...")
-    webbrowser.open('http://localhost:5000')
+    if os.getenv("TARAYICI_AC", "1") == "1":
+        logger.info("Web arayüzü açılıyor...")
+        webbrowser.open(f'http://localhost:{PORT}')
 
-# Veritabanını oluştur
-def init_db():
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # Haberler tablosu
-    cursor.execute('''
-    CREATE TABLE IF NOT EXISTS haberler (
+# Haberler tablosu; içerik sıkıştırılmış olarak haber_icerikleri tablosunda tutulur
+HABERLER_TABLOSU = '''
+    CREATE TABLE IF NOT EXISTS {ad} (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         baslik TEXT NOT NULL,
         ozet TEXT NOT NULL,
-        icerik TEXT NOT NULL,
         kategori TEXT NOT NULL,
         kaynak TEXT NOT NULL,
         url TEXT NOT NULL UNIQUE,  -- URL'yi benzersiz yap
         resim_url TEXT,
         tarih TIMESTAMP NOT NULL,
-        olusturulma_tarihi TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        olusturulma_tarihi TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        ozet_durumu TEXT NOT NULL DEFAULT 'hazir',  -- 'beklemede': model özeti henüz hazır değil
+        kume_id INTEGER  -- Yakın tekrar kümesinin temsilcisi olan haberin id'si
     )
-    ''')
+'''
+
+# Eski şemadaki haberler.icerik sütunu arka planda kaldırılana kadar True kalır
+ESKI_ICERIK_SUTUNU = False
+
+def icerik_sutununu_tasi():
+    """Eski şemadaki haberler.icerik sütununu sıkıştırılmış içerik tablosuna taşır, tabloyu sütunsuz yeniden kurar
+
+    İçerikler parça parça, ayrı kısa yazma işlemlerinde taşınır; araya haber toplama yazmaları girebilir,
+    okuyucular beklemez. Sütun boşaldıktan sonra tablo tek işlemde sütunsuz yeniden kurulur; id'ler (ve arama
+    indeksi eşlemesi) korunur.
+    """
+    global ESKI_ICERIK_SUTUNU
+    baslangic = time.perf_counter()
+    tasinan = 0
+    son_id = 0
+    while True:
+        with VERITABANI.yazma_islemi() as conn:
+            adet, son_id = HABER_ICERIKLERI.eski_sutunu_tasi(conn, son_id)
+        if not adet:
+            break
+        tasinan += adet
     
-    conn.commit()
-    conn.close()
-    logger.info(f"Veritabanı başarıyla oluşturuldu veya mevcut veritabanı kullanıldı: {DB_FILE}")
+    with VERITABANI.yazma_islemi() as conn:
+        try:
+            conn.execute(HABERLER_TABLOSU.format(ad='haberler_yeni'))
+            sutunlar = ", ".join(row['name'] for row in conn.execute('PRAGMA table_info(haberler_yeni)'))
+            conn.execute(f'INSERT INTO haberler_yeni ({sutunlar}) SELECT {sutunlar} FROM haberler')
+            conn.execute('DROP TABLE haberler')
+            conn.execute('ALTER TABLE haberler_yeni RENAME TO haberler')
+            indeksleri_olustur(conn)
+            # Yazıcılar sütunun varlığını kendi yazma işlemleri içinde okur; bayrak commit'ten önce değişir
+            ESKI_ICERIK_SUTUNU = False
+        except Exception:
+            ESKI_ICERIK_SUTUNU = True
+            raise
+    logger.info(f"{tasinan} haberin içeriği sıkıştırılmış içerik tablosuna taşındı ({time.perf_counter() - baslangic:.1f} sn).")
 
-# Veritabanını başlat, temizle ve ilk haberleri yükle
-init_db()
-temizle_veritabani()
-ilk_haberleri_yukle()
+def arama_indeksini_tamamla():
+    """Arama indeksinde eksik kalan mevcut haberleri ayrı kısa yazma işlemlerinde parça parça indeksler
+    
+    Bu sürede gelen haberler kayıt işlemiyle indekslenir; indeks tamamlanınca arama FTS'e geçer.
+    """
+    baslangic = time.perf_counter()
+    toplam = 0
+    son_id = 0
+    while True:
+        with VERITABANI.yazma_islemi() as conn:
+            bakilan, indekslenen, son_id = HABER_ARAMA.eksikleri_indeksle(conn, son_id)
+        if not bakilan:
+            break
+        toplam += indekslenen
+    HABER_ARAMA.hazir = True
+    logger.info(f"Arama indeksi oluşturuldu: {toplam} haber indekslendi ({time.perf_counter() - baslangic:.1f} sn).")
 
-def temizle_html(html_icerik):
-    """HTML içeriğini temizler ve düz metne dönüştürür"""
-    from html import unescape
+def veritabani_bakimi():
+    """Açılışı bekletmemesi için arka planda yapılan tek seferlik veritabanı geçişleri"""
+    if ESKI_ICERIK_SUTUNU:
+        icerik_sutununu_tasi()
+    # İçerikler taşındıktan sonra indekslenir; indeks hazır olana kadar arama LIKE ile yapılır
+    if not HABER_ARAMA.hazir:
+        arama_indeksini_tamamla()
     
-    # Boş içerik kontrolü
-    if not html_icerik:
-        return ""
+    # Eski veritabanı artımlı auto_vacuum'a yalnızca tam VACUUM ile geçer; VACUUM tüm dosyayı yeniden yazarken
+    # yazma kilidini tuttuğundan canlı sunucuda yapılmaz, sunucu kapalıyken bakım komutuyla çalıştırılır
+    conn = get_db_connection()
+    try:
+        if conn.execute('PRAGMA auto_vacuum').fetchone()[0] != ARTIMLI_VACUUM:
+            logger.warning("Veritabanı artımlı auto_vacuum kipinde değil; saklama politikasının boşalttığı sayfalar "
+                           "dosyaya iade edilmez. Sunucu kapalıyken 'python rss_yonetici.py vacuum' çalıştırın.")
+    finally:
+        conn.close()
+
+# Veritabanını oluştur
+def init_db():
+    global ESKI_ICERIK_SUTUNU
+    conn = get_db_connection()
+    cursor = conn.cursor()
     
-    # HTML içeriğini string'e dönüştür
-    if not isinstance(html_icerik, str):
-        try:
-            html_icerik = str(html_icerik)
-        except:
-            return ""
+    # Haberler tablosu
+    cursor.execute(HABERLER_TABLOSU.format(ad='haberler'))
     
-    # CDATA bölümlerini temizle
-    html_icerik = re.sub(r'<!\[CDATA\[(.*?)\]\]>', r'\1', html_icerik)
+    # Eski veritabanlarına özet durumu ve küme sütunlarını ekle
+    sutunlar = {row['name'] for row in cursor.execute('PRAGMA table_info(haberler)')}
+    if 'ozet_durumu' not in sutunlar:
+        cursor.execute("ALTER TABLE haberler ADD COLUMN ozet_durumu TEXT NOT NULL DEFAULT 'hazir'")
+    if 'kume_id' not in sutunlar:
+        cursor.execute("ALTER TABLE haberler ADD COLUMN kume_id INTEGER")
+        cursor.execute("UPDATE haberler SET kume_id = id")
+    conn.commit()
     
-    # Script ve style etiketlerini tamamen kaldır
-    html_icerik = re.sub(r'<script.*?>.*?</script>', ' ', html_icerik, flags=re.DOTALL)
-    html_icerik = re.sub(r'<style.*?>.*?</style>', ' ', html_icerik, flags=re.DOTALL)
+    # Eski şemadaki içerik sütunu arka plan bakımında taşınır; açılışta yalnızca tablo oluşturulur
+    HABER_ICERIKLERI.tablo_olustur()
+    ESKI_ICERIK_SUTUNU = 'icerik' in sutunlar
     
-    # HTML yorumlarını kaldır
-    html_icerik = re.sub(r'<!--.*?-->', ' ', html_icerik, flags=re.DOTALL)
+    # Liste sorguları için (kategori, tarih) ve (tarih) indeksleri
+    indeksleri_olustur(conn)
     
-    # Diğer HTML etiketlerini kaldır
-    html_icerik = re.sub(r'<.*?>', ' ', html_icerik)
+    conn.commit()
+    conn.close()
     
-    # HTML karakter kodlarını çöz
-    temiz_metin = unescape(html_icerik)
+    # Feed doğrulayıcı tablosu (ETag / Last-Modified / içerik hash)
+    FEED_DOGRULAYICILARI.tablo_olustur()
+    # Feed yenileme takvimi; yapılandırmaya eklenen feed'ler hemen, çıkarılanlar takvimden düşer
+    FEED_ZAMANLAYICI.tablo_olustur()
+    FEED_ZAMANLAYICI.esitle(feed_url for feedler in RSS_FEEDS.values() for feed_url in feedler)
+    # Feed sağlık kayıtları ve devre kesici durumu
+    FEED_SAGLIGI.tablo_olustur()
+    FEED_SAGLIGI.esitle(feed_url for feedler in RSS_FEEDS.values() for feed_url in feedler)
+    # Özet önbelleği ve özetleme kuyruğu tabloları
+    OZET_ONBELLEGI.tablo_olustur()
+    OZET_KUYRUGU.tablo_olustur()
+    # Tam metin arama indeksi (mevcut haberler arka plan bakımında indekslenir)
+    HABER_ARAMA.tablo_olustur()
+    # Yakın tekrar kümeleme imzaları
+    HABER_KUMELEYICI.tablo_olustur()
+    logger.info(f"Veritabanı başarıyla oluşturuldu veya mevcut veritabanı kullanıldı: {DB_FILE}")
+
+# İçerik temizleyici; aynı içerik yedek özet, arama indeksi, kümeleme ve model özeti için
+# tekrar temizlenmesin diye sonuçlar bellekte tutulur.
+METIN_TEMIZLEYICI = MetinTemizleyici(kapasite=int(os.getenv("TEMIZLIK_ONBELLEK_KAYIT", "2048")))
+
+# Tam metin arama indeksi; içerik, özetleme için kullanılan temizleyiciden geçirilerek indekslenir
+HABER_ARAMA = HaberAramaIndeksi(get_db_connection, METIN_TEMIZLEYICI)
+# Farklı URL'lerle gelen aynı haberleri kümeler
+HABER_KUMELEYICI = HaberKumeleyici(
+    get_db_connection, METIN_TEMIZLEYICI,
+    esik=float(os.getenv("KUME_BENZERLIK_ESIGI", "0.5")),
+    pencere_gun=float(os.getenv("KUME_PENCERE_GUN", "3")),
+    # Temsilcisi saklama politikasıyla silinen kümelerde yeni temsilci özetlenmek üzere kuyruğa alınır
+    temsilci_kancasi=lambda conn, haber_idleri: yeni_temsilcileri_kuyruga_ekle(conn, haber_idleri)
+)
+
+# Özetleme batch boyutu (pipeline'a tek çağrıda verilecek metin sayısı)
+OZET_BATCH_BOYUTU = int(os.getenv("OZET_BATCH_BOYUTU", "8"))
+TOPLU_OZETLEYICI = TopluOzetleyici(batch_boyutu=OZET_BATCH_BOYUTU)
+# Modelin girdi sınırını aşan haberler cümle sınırlarında parçalanıp map-reduce ile özetlenir.
+# OZET_PARCA_TOKENI: parça boyutu (0: modelin girdi sınırı); OZET_MAKS_TOKEN: haber başına token bütçesi (0: sınırsız)
+PARCALI_OZETLEYICI = ParcaliOzetleyici(
+    TOPLU_OZETLEYICI,
+    parca_tokeni=int(os.getenv("OZET_PARCA_TOKENI", "0")),
+    maks_token=int(os.getenv("OZET_MAKS_TOKEN", "4096"))
+)
+
+# Temizlenmiş metin + model + özet modu + parametrelerle adreslenen kalıcı özet önbelleği
+OZET_ONBELLEGI = OzetOnbellegi(
+    get_db_connection,
+    bellek_kapasitesi=int(os.getenv("OZET_ONBELLEK_KAYIT", "2048")),
+    maks_bayt=int(float(os.getenv("OZET_ONBELLEK_MAKS_MB", "64")) * 1024 * 1024)
+)
+
+# Özetleme işçileri: "thread" (varsayılan) veya "process" (model, fork ile işçi süreçlere aktarılır)
+OZET_ISCI_MODU = os.getenv("OZET_ISCI_MODU", "thread")
+OZET_ISCI_SAYISI = int(os.getenv("OZET_ISCI_SAYISI", "1"))
+if OZET_ISCI_MODU == "process" and "fork" not in multiprocessing.get_all_start_methods():
+    logger.warning("Bu platformda fork desteklenmiyor, özetleme işçileri thread modunda çalışacak.")
+    OZET_ISCI_MODU = "thread"
+# Süreç modunda her işçinin torch iş parçacığı sayısı (0: çekirdekler işçiler arasında bölünür)
+OZET_SUREC_IS_PARCACIGI = int(os.getenv("OZET_SUREC_IS_PARCACIGI", "0")) or max(1, (os.cpu_count() or 1) // max(1, OZET_ISCI_SAYISI))
+
+_surec_havuzu = None
+_surec_havuzu_kilidi = threading.Lock()
+
+def _surec_baslat(ebeveyn_pid, is_parcacigi=0):
+    """İşçi süreç başlatıcısı: ana süreç kapanırsa işçinin de kapanmasını sağlar
+
+    Fork edilen işçiler ana sürecin dinleme soketini de devralır; ana süreç ölünce
+    geride kalırlarsa port meşgul kalır. is_parcacigi verilirse işçinin torch iş parçacığı
+    sayısı ayarlanır; böylece N işçi aynı çekirdekler için yarışmaz.
+    """
+    def ebeveyni_izle():
+        while os.getppid() == ebeveyn_pid:
+            time.sleep(1)
+        os._exit(0)
+    threading.Thread(target=ebeveyni_izle, name="ebeveyn-izleyici", daemon=True).start()
+    if is_parcacigi and "torch" in sys.modules:
+        is_parcacigi_ayarla(is_parcacigi)
+
+def _surecte_ozetle(model_adi, metinler, parametreler):
+    """İşçi süreçte çalışır; fork sırasında devralınan modeli kullanır"""
+    etkin = MODEL_KAYDI.etkin()
+    if etkin is None or etkin.ad != model_adi:
+        # Havuz model değişiminden sonra fork edildi; özetler yanlış model anahtarıyla saklanmasın
+        return [None] * len(metinler)
+    return PARCALI_OZETLEYICI.ozetle(etkin.ozetleyici, metinler, girdi=functools.partial(ozet_girdisi, model_adi=model_adi),
+                                     **parametreler)
+
+def surec_havuzu():
+    """Özetleme süreç havuzunu döndürür, yoksa mevcut modelle fork ederek oluşturur
+
+    Model ağırlıkları fork ile tüm işçilerde tek bir salt okunur kopya olarak paylaşılır
+    (copy-on-write). Fork sırasında mevcut nesneler çöp toplayıcıdan çıkarılır (gc.freeze);
+    aksi halde işçilerdeki GC taramaları nesne başlıklarına yazıp paylaşılan sayfaları kopyalatır.
+    """
+    global _surec_havuzu
+    with _surec_havuzu_kilidi:
+        if _surec_havuzu is None:
+            gc.freeze()
+            try:
+                havuz = ProcessPoolExecutor(max_workers=OZET_ISCI_SAYISI,
+                                            mp_context=multiprocessing.get_context("fork"),
+                                            initializer=_surec_baslat, initargs=(os.getpid(), OZET_SUREC_IS_PARCACIGI))
+                # fork bağlamında tüm işçiler ilk işte başlatılır; dondurma yalnızca bu ana kadar sürer
+                havuz.submit(os.getpid).result()
+            finally:
+                gc.unfreeze()
+            _surec_havuzu = havuz
+        return _surec_havuzu
+
+def surec_havuzunu_sifirla():
+    """Model değiştiğinde işçi süreçlerin yeni modelle yeniden fork edilmesini sağlar"""
+    global _surec_havuzu
+    with _surec_havuzu_kilidi:
+        if _surec_havuzu is not None:
+            _surec_havuzu.shutdown(wait=False)
+            _surec_havuzu = None
+
+def model_ile_ozetle(etkin, metinler, parametreler):
+    """Temizlenmiş metinleri seçili işçi moduna göre model kaydındaki etkin modelle özetler
+
+    Uzun metinler parçalı özetleyicide parçalanır; girdi (prompt) her parçaya ayrı uygulanır.
+    """
+    if OZET_ISCI_MODU == "process":
+        return surec_havuzu().submit(_surecte_ozetle, etkin.ad, metinler, parametreler).result()
+    return PARCALI_OZETLEYICI.ozetle(etkin.ozetleyici, metinler, girdi=functools.partial(ozet_girdisi, model_adi=etkin.ad),
+                                     **parametreler)
+
+# Haber özet durumları
+OZET_BEKLEMEDE = "beklemede"
+OZET_HAZIR = "hazir"
+
+def ozet_parametreleri(model_adi=None):
+    """Seçili (veya verilen) model ve özet moduna göre üretim parametrelerini döndürür"""
+    model_adi = (model_adi or LLM_MODEL).lower()
+    # Özet uzunluğunu ayarla
+    if OZET_MODU == "super":
+        max_length = 75  # Süper özet için daha kısa
+        min_length = 20
+    else:
+        max_length = 150  # Normal özet
+        min_length = 30
     
-    # Fazla boşlukları temizle
-    temiz_metin = re.sub(r'\s+', ' ', temiz_metin).strip()
+    parametreler = {"max_length": max_length, "min_length": min_length, "do_sample": False}
+    if "bert2bert" in model_adi:
+        # BERT2BERT modeli için özel ayarlar
+        parametreler["num_beams"] = 4
+    elif "mt5" in model_adi or "mbart" in model_adi:
+        # Çok dilli modeller için
+        parametreler["num_beams"] = 4
+        parametreler["length_penalty"] = 2.0
+    return parametreler
+
+def model_anahtari(kayit):
+    """Özet önbelleği anahtarındaki model kimliği; int8/onnx özetleri fp32 özetlerinden ayrı tutulur"""
+    if kayit.arka_uc in (None, FP32):
+        return kayit.ad
+    return f"{kayit.ad}@{kayit.arka_uc}"
+
+def ozet_girdisi(temiz_metin, model_adi=None):
+    """Temizlenmiş metni modele verilecek girdiye dönüştürür"""
+    if "falcon" in (model_adi or LLM_MODEL).lower():
+        # Falcon modeli için özel prompt
+        return f"Lütfen bu haberi {'en fazla 2 cümle ile' if OZET_MODU == 'super' else 'detaylı şekilde'} özetle:\n\n{temiz_metin}"
+    return temiz_metin
+
+def openai_ozet(temiz_metin):
+    """OpenAI API ile tek bir metni özetler"""
+    import openai
+    openai.api_key = os.getenv("OPENAI_API_KEY")
+    if not openai.api_key:
+        raise ValueError("OPENAI_API_KEY çevre değişkeni ayarlanmamış")
     
-    # URL'leri temizle
-    temiz_metin = re.sub(r'https?://\S+', '', temiz_metin)
+    prompt = f"Aşağıdaki haberi {'en fazla 2 cümle ile' if OZET_MODU == 'super' else 'detaylı şekilde'} özetle. Sadece özeti yaz, başka bir şey ekleme:\n\n{temiz_metin}"
+    response = openai.Completion.create(
+        engine="text-davinci-003",
+        prompt=prompt,
+        max_tokens=ozet_parametreleri()["max_length"],
+        temperature=0.3
+    )
+    return response.choices[0].text.strip()
+
+def toplu_ozet_olustur(metinler, basarisizlar=None):
+    """Metin listesini özetler; transformers modelinde metinler batch'ler halinde işlenir
     
-    # "Devamı için tıklayınız" gibi ifadeleri kaldır
-    temiz_metin = re.sub(r'Devamı için tıklayınız.*', '', temiz_metin)
-    temiz_metin = re.sub(r'Haberin devamı için.*', '', temiz_metin)
-    temiz_metin = re.sub(r'Detaylar için tıklayınız.*', '', temiz_metin)
-    temiz_metin = re.sub(r'Ayrıntılar için tıklayınız.*', '', temiz_metin)
-    temiz_metin = re.sub(r'Devamını oku.*', '', temiz_metin)
+    Model hata verdiği için yedek özetle dönen metinlerin indeksleri, verilmişse basarisizlar kümesine eklenir.
+    """
+    ozetler = [None] * len(metinler)
     
-    # Fazla noktalama işaretlerini temizle
-    temiz_metin = re.sub(r'\.{2,}', '.', temiz_metin)
-    temiz_metin = re.sub(r'\s+\.', '.', temiz_metin)
+    # Çok kısa metinler özetlenmez; diğerleri tek seferde temizlenir
+    uzunlar = []
+    for i, metin in enumerate(metinler):
+        if len(metin) < 100:
+            ozetler[i] = metin
+        else:
+            uzunlar.append(i)
+    with ASAMA_SURESI.zamanla(asama="temizleme"):
+        bekleyenler = list(zip(uzunlar, METIN_TEMIZLEYICI.toplu([metinler[i] for i in uzunlar])))  # (indeks, temiz_metin)
+    ASAMA_OGELERI.artir(len(uzunlar), asama="temizleme")
     
-    # Başlangıç ve sondaki boşlukları temizle
-    temiz_metin = temiz_metin.strip()
+    if not bekleyenler:
+        return ozetler
     
-    return temiz_metin
-
-def temizle_metin(metin):
-    """Metni özetleme için hazırlar"""
-    # Önce HTML temizliği
-    temiz_metin = temizle_html(metin)
-    
-    # Gereksiz boşlukları temizle
-    temiz_metin = re.sub(r'\s+', ' ', temiz_metin).strip()
-    
-    # Noktalama işaretlerini düzelt
-    temiz_metin = re.sub(r'\.{2,}', '.', temiz_metin)  # Fazla noktaları temizle
-    temiz_metin = re.sub(r'\s+\.', '.', temiz_metin)   # Nokta öncesi boşlukları temizle
-    
-    # Reklam ve yönlendirme metinlerini temizle
-    reklam_kaliplari = [
-        r'Bu haber\s+.+\s+tarafından hazırlanmıştır\.',
-        r'Kaynak:.+',
-        r'Sponsorlu İçerik',
-        r'Reklam',
-        r'İlgili Haberler:.*',
-        r'Devamı için tıklayınız.*',
-        r'Haberin devamı için.*',
-        r'Detaylar için tıklayınız.*',
-        r'Ayrıntılar için tıklayınız.*',
-        r'Devamını oku.*',
-        r'Daha fazlası için.*'
-    ]
+    # Etkin model bir kez okunur; batch ortasında model değişse de özetler doğru anahtarla saklanır
+    etkin = MODEL_KAYDI.etkin()
+    if LLM_TYPE in YEREL_MODEL_TIPLERI and etkin is not None:
+        parametreler = ozet_parametreleri(etkin.ad)
+        anahtarlar = [anahtar_olustur(temiz_metin, model_anahtari(etkin), OZET_MODU, parametreler) for _, temiz_metin in bekleyenler]
+        
+        # Önbellekte olmayan metinler modele gider; aynı metin birden fazla gelirse bir kez özetlenir
+        onbellekteki = OZET_ONBELLEGI.getir_coklu(anahtarlar)
+        eksik_metinler = {}
+        for anahtar, (_, temiz_metin) in zip(anahtarlar, bekleyenler):
+            if anahtar not in onbellekteki and anahtar not in eksik_metinler:
+                eksik_metinler[anahtar] = temiz_metin
+        
+        if eksik_metinler:
+            model_baslangic = time.perf_counter()
+            yeni_ozetler = model_ile_ozetle(etkin, list(eksik_metinler.values()), parametreler)
+            ASAMA_SURESI.gozlemle(time.perf_counter() - model_baslangic, asama="ozetleme")
+            ASAMA_OGELERI.artir(len(eksik_metinler), asama="ozetleme")
+            basarisiz = sum(1 for ozet in yeni_ozetler if ozet is None)
+            if basarisiz:
+                HATALAR.artir(basarisiz, asama="ozetleme")
+            # Zamanlayıcının maliyet tahmini yalnızca modelin başarıyla özetlediği batch'lerle güncellenir
+            if all(ozet is not None for ozet in yeni_ozetler):
+                girdiler = [ozet_girdisi(temiz_metin, etkin.ad) for temiz_metin in eksik_metinler.values()]
+                OZET_ZAMANLAYICI.gozlemle(token_uzunluklari(etkin.ozetleyici, girdiler), time.perf_counter() - model_baslangic)
+            # Sadece modelin ürettiği özetler saklanır, yedek özetler bir sonraki denemede tekrar modele gider
+            uretilenler = {anahtar: ozet for anahtar, ozet in zip(eksik_metinler, yeni_ozetler) if ozet is not None}
+            OZET_ONBELLEGI.kaydet_coklu(uretilenler)
+            onbellekteki.update(uretilenler)
+        
+        logger.debug(f"Özet önbelleği: {len(bekleyenler) - len(eksik_metinler)} isabet, {len(eksik_metinler)} metin modele gönderildi.")
+        model_ozetleri = [onbellekteki.get(anahtar) for anahtar in anahtarlar]
+        yedek_nedeni = "model_hatasi"
+    else:
+        model_ozetleri = []
+        yedek_nedeni = "model_hatasi" if LLM_TYPE == "openai" else "model_yok"
+        for _, temiz_metin in bekleyenler:
+            try:
+                if LLM_TYPE == "openai":
+                    with ASAMA_SURESI.zamanla(asama="ozetleme"):
+                        model_ozetleri.append(openai_ozet(temiz_metin))
+                    ASAMA_OGELERI.artir(asama="ozetleme")
+                else:
+                    # Bilinmeyen LLM tipi, basit özetleme kullan
+                    model_ozetleri.append(None)
+            except Exception as e:
+                logger.error(f"Özetleme hatası: {e}")
+                HATALAR.artir(asama="ozetleme")
+                model_ozetleri.append(None)
     
-    for kalip in reklam_kaliplari:
-        temiz_metin = re.sub(kalip, '', temiz_metin, flags=re.IGNORECASE)
+    for (i, temiz_metin), ozet in zip(bekleyenler, model_ozetleri):
+        # Model özet üretemediyse gelişmiş basit özetleme
+        if ozet is None:
+            YEDEK_OZETLER.artir(neden=yedek_nedeni)
+            if basarisizlar is not None and yedek_nedeni == "model_hatasi":
+                basarisizlar.add(i)
+        ozetler[i] = ozet if ozet is not None else gelismis_basit_ozet(temiz_metin, super_ozet=OZET_MODU == "super")
     
-    return temiz_metin.strip()
+    return ozetler
 
-def ozet_olustur(metin, max_length=150):
+def ozet_olustur(metin):
     """Metni özetler"""
-    if len(metin) < 100:  # Çok kısa metinleri özetleme
-        return metin
+    return toplu_ozet_olustur([metin])[0]
+
+def yedek_ozet(icerik):
+    """Model özeti hazır olana kadar gösterilecek hızlı, kurala dayalı özeti üretir"""
+    if len(icerik) < 100:
+        return icerik
+    return gelismis_basit_ozet(METIN_TEMIZLEYICI(icerik), super_ozet=OZET_MODU == "super")
+
+def ozet_islerini_isle(isler):
+    """Kuyruktan alınan işler için model özetlerini oluşturur ve haberleri günceller
     
-    # Metni temizle ve özetleme için hazırla
-    temiz_metin = temizle_metin(metin)
+    Modelin özetleyemediği haberlerin işleri bir beklemeden sonra tekrar denenmek üzere kuyruğa döndürülür
+    ve id'leri döner; bu haberler toplama sırasında kaydedilen yedek özetle beklemede kalır. Deneme sınırını
+    aşan işler de yedek özeti kalıcı yapmaz, bir sonraki döngüde yeniden kuyruğa alınır.
+    """
+    with PROFILLEYICI.profille(OZET_PROFILI, "ozet_islerini_isle"):
+        haber_idleri = [haber_id for _, haber_id in isler]
+        is_idleri = {haber_id: is_id for is_id, haber_id in isler}
+        conn = get_db_connection()
+        yer_tutucular = ",".join("?" * len(haber_idleri))
+        satirlar = conn.execute(f'SELECT id, baslik, kategori FROM haberler WHERE id IN ({yer_tutucular})', haber_idleri).fetchall()
+        icerikler = icerikleri_getir(conn, haber_idleri)
+        conn.close()
+        if not satirlar:
+            return
     
-    # Özet uzunluğunu ayarla
-    if OZET_MODU == "super":
-        max_length = 75  # Süper özet için daha kısa
-        min_length = 20
-    else:
-        max_length = 150  # Normal özet
-        min_length = 30
+        baslangic = time.perf_counter()
+        basarisizlar = set()
+        ozetler = toplu_ozet_olustur([icerikler.get(row['id'], "") for row in satirlar], basarisizlar)
+        sure = time.perf_counter() - baslangic
+        OZET_ZAMANLAYICI.islendi(haber_idleri, sure)
+        
+        # Model hatasıyla yedek özete düşen haberler yazılmaz, beklemede kalır ve işleri tekrar denenir
+        dondurulenler = [is_idleri[satirlar[i]['id']] for i in basarisizlar]
+        OZET_KUYRUGU.basarisiz(dondurulenler, "Model özet üretemedi")
+        yazilacaklar = [(row, ozet) for i, (row, ozet) in enumerate(zip(satirlar, ozetler)) if i not in basarisizlar]
+        if not yazilacaklar:
+            return dondurulenler
+        satirlar = [row for row, _ in yazilacaklar]
+        yeni_ozetler = [(row['id'], ozet if ozet is not None else row['baslik']) for row, ozet in yazilacaklar]
+        with ASAMA_SURESI.zamanla(asama="kaydetme"), VERITABANI.yazma_islemi() as conn:
+            conn.executemany('UPDATE haberler SET ozet = ?, ozet_durumu = ? WHERE id = ?',
+                             [(ozet, OZET_HAZIR, haber_id) for haber_id, ozet in yeni_ozetler])
+            HABER_ARAMA.ozetleri_guncelle(conn, yeni_ozetler)
+            # Aynı kümedeki tekrarlar temsilcinin özetini alır
+            yayilan_ozetler = kume_ozetlerini_yay(conn, [haber_id for haber_id, _ in yeni_ozetler])
+        YANIT_ONBELLEGI.gecersiz_kil({olay['kategori'] for olay in yayilan_ozetler} | {row['kategori'] for row in satirlar})
+        ozetler_sozlugu = dict(yeni_ozetler)
+        HABER_AKISI.yayinla(OZET, [akis_ozeti(row['id'], row['kategori'], ozetler_sozlugu[row['id']]) for row in satirlar]
+                            + yayilan_ozetler)
+        logger.debug(f"{len(satirlar)} haber {sure:.2f} saniyede özetlendi ({len(satirlar) / max(sure, 1e-9):.2f} haber/sn).")
+        return dondurulenler
+
+def ozet_adaylari(haber_idleri):
+    """Özetlenecek haberler için zamanlayıcıya verilecek (id, öncelik, token sayısı) üçlülerini döndürür"""
+    satirlar = []
+    conn = get_db_connection()
+    icerikler = icerikleri_getir(conn, haber_idleri)
+    for parca in parcala(haber_idleri):
+        yer_tutucular = ",".join("?" * len(parca))
+        satirlar.extend(conn.execute(f'''
+            SELECT h.id, h.tarih,
+                   (SELECT COUNT(*) FROM haberler k WHERE k.kume_id = h.kume_id) AS kume_boyutu
+            FROM haberler h WHERE h.id IN ({yer_tutucular})
+        ''', parca).fetchall())
+    conn.close()
+    
+    temiz_metinler = METIN_TEMIZLEYICI.toplu([icerikler.get(row['id'], "") for row in satirlar])
+    uzunluklar = token_uzunluklari(summarizer, [ozet_girdisi(temiz_metin) for temiz_metin in temiz_metinler])
+    adaylar = []
+    for row, uzunluk in zip(satirlar, uzunluklar):
+        try:
+            tarih_damgasi = datetime.fromisoformat(str(row['tarih'])).timestamp()
+        except ValueError:
+            tarih_damgasi = time.time()
+        adaylar.append((row['id'], oncelik_hesapla(tarih_damgasi, row['kume_boyutu']), uzunluk))
+    return adaylar
+
+def ozetleri_planla(haber_idleri):
+    """Yeni döngünün haberlerini bütçeye göre model kuyruğuna veya boşta yükseltilecekler arasına koyar"""
+    adaylar = ozet_adaylari(haber_idleri)
+    model_idleri, ertelenen_idleri = OZET_ZAMANLAYICI.planla(adaylar)
+    oncelikler = {haber_id: oncelik for haber_id, oncelik, _ in adaylar}
+    # Önceki döngüden kalan işler yeni döngünün önüne geçmez, boşta kalındığında yükseltilir
+    kalan = OZET_KUYRUGU.bekleyenleri_ertele()
+    # Deneme sınırını aşan işler de beklemedeki haberleri için boşta yeniden denenir
+    kalan += OZET_KUYRUGU.hatalilari_ertele()
+    OZET_KUYRUGU.ekle(model_idleri, oncelikler)
+    OZET_KUYRUGU.ekle(ertelenen_idleri, oncelikler, durum=ERTELENDI)
+    if ertelenen_idleri:
+        YEDEK_OZETLER.artir(len(ertelenen_idleri), neden="butce")
+    logger.info(f"Özet planı: {len(model_idleri)} haber model bütçesinde, {len(ertelenen_idleri)} haber yedek özetle "
+                f"ertelendi, önceki döngüden {kalan} iş yükseltmeye alındı.")
+
+def haberleri_topla(kategoriler=None, urller=None):
+    """Haberleri çeker, yedek özetle hemen kaydeder ve model özetlerini döngü bütçesine göre kuyruğa ekler"""
+    with PROFILLEYICI.profille(DONGU, "haberleri_topla"):
+        eklenen = 0
+        ozetlenecekler = []
+        for kategori, (haberler, islenen_feedler) in tum_haberleri_getir(kategoriler, urller).items():
+            # İçerikler burada bir kez temizlenir; yedek özet, arama indeksi ve kümeleme önbellekten okur
+            with ASAMA_SURESI.zamanla(asama="temizleme"):
+                METIN_TEMIZLEYICI.toplu([haber['icerik'] for haber in haberler])
+            ASAMA_OGELERI.artir(len(haberler), asama="temizleme")
+            for haber in haberler:
+                haber['ozet'] = yedek_ozet(haber['icerik'])
+            kayit = haberleri_veritabanina_kaydet(haberler, ozet_durumu=OZET_BEKLEMEDE)
+            # Doğrulayıcılar ancak haberler kaydedildikten sonra saklanır; kayıt başarısızsa bir sonraki
+            # turda 304 veya aynı içerik hash'i gelmez ve feed yeniden işlenir
+            if kayit["kaydedildi"]:
+                for feed_url, yanit in islenen_feedler.items():
+                    FEED_DOGRULAYICILARI.kaydet(feed_url, yanit)
+            ozetlenecekler.extend(kayit["ozetlenecek_idler"])
+            eklenen += kayit["eklenen"]
     
+        if ozetlenecekler:
+            ozetleri_planla(ozetlenecekler)
+        if eklenen:
+            OZET_ISCILERI.uyandir()
+        return eklenen
+
+def _yenileme_calistir(is_id):
+    """Yenileme işini arka planda çalıştırır"""
+    is_bilgisi = YENILEME_ISLERI[is_id]
+    is_bilgisi['durum'] = 'calisiyor'
     try:
-        if LLM_TYPE == "transformers":
-            if "falcon" in LLM_MODEL.lower():
-                # Falcon modeli için özel prompt
-                prompt = f"Lütfen bu haberi {'en fazla 2 cümle ile' if OZET_MODU == 'super' else 'detaylı şekilde'} özetle:\n\n{temiz_metin}"
-                ozet = summarizer(prompt, max_length=max_length, min_length=min_length, do_sample=False)
-            elif "bert2bert" in LLM_MODEL.lower():
-                # BERT2BERT modeli için özel ayarlar
-                ozet = summarizer(temiz_metin, max_length=max_length, min_length=min_length, do_sample=False, num_beams=4)
-            elif "mt5" in LLM_MODEL.lower() or "mbart" in LLM_MODEL.lower():
-                # Çok dilli modeller için
-                ozet = summarizer(temiz_metin, max_length=max_length, min_length=min_length, do_sample=False, num_beams=4, length_penalty=2.0)
-            else:
-                ozet = summarizer(temiz_metin, max_length=max_length, min_length=min_length, do_sample=False)
-            
-            return ozet[0]['summary_text']
-            
-        elif LLM_TYPE == "openai":
-            import openai
-            openai.api_key = os.getenv("OPENAI_API_KEY")
-            if not openai.api_key:
-                raise ValueError("OPENAI_API_KEY çevre değişkeni ayarlanmamış")
-            
-            prompt = f"Aşağıdaki haberi {'en fazla 2 cümle ile' if OZET_MODU == 'super' else 'detaylı şekilde'} özetle. Sadece özeti yaz, başka bir şey ekleme:\n\n{temiz_metin}"
-            response = openai.Completion.create(
-                engine="text-davinci-003",
-                prompt=prompt,
-                max_tokens=max_length,
-                temperature=0.3
-            )
-            return response.choices[0].text.strip()
-        else:
-            # Bilinmeyen LLM tipi, basit özetleme kullan
-            return gelismis_basit_ozet(temiz_metin, super_ozet=OZET_MODU == "super")
+        is_bilgisi['eklenen_haber'] = haberleri_topla([is_bilgisi['kategori']])
+        is_bilgisi['durum'] = 'tamamlandi'
     except Exception as e:
-        logger.error(f"Özetleme hatası: {e}")
-        # Gelişmiş basit özetleme
-        return gelismis_basit_ozet(temiz_metin, super_ozet=OZET_MODU == "super")
+        logger.error(f"Yenileme işi başarısız: {is_bilgisi['kategori']} - {e}")
+        is_bilgisi['durum'] = 'hatali'
+        is_bilgisi['hata'] = str(e)
+    is_bilgisi['bitis'] = time.time()
+
+def yenileme_baslat(kategori):
+    """Kategori için arka planda yenileme işi başlatır, iş id'sini döndürür"""
+    with YENILEME_KILIDI:
+        # Aynı kategori için bekleyen veya çalışan bir iş varsa yenisini açma
+        for is_id, is_bilgisi in YENILEME_ISLERI.items():
+            if is_bilgisi['kategori'] == kategori and is_bilgisi['durum'] in ('sirada', 'calisiyor'):
+                return is_id
+        
+        # Yalnızca son işlerin durumunu sakla
+        while len(YENILEME_ISLERI) >= 100:
+            YENILEME_ISLERI.pop(next(iter(YENILEME_ISLERI)))
+        
+        is_id = uuid.uuid4().hex
+        YENILEME_ISLERI[is_id] = {
+            'is_id': is_id,
+            'kategori': kategori,
+            'durum': 'sirada',
+            'olusturulma': time.time(),
+            'bitis': None,
+            'eklenen_haber': None,
+            'hata': None
+        }
+    YENILEME_HAVUZU.submit(_yenileme_calistir, is_id)
+    return is_id
 
 def arkaplan_haber_guncelleme():
-    """Arka planda çalışarak haberleri düzenli olarak günceller"""
+    """Arka planda çalışarak her feed'i kendi takvimine göre günceller"""
+    # İlk yükleme de bu thread'de yapılır, sunucu açılışı beklemez
+    ilk_haberleri_yukle()
     while True:
-        logger.info("Haberler güncelleniyor...")
-        for kategori in RSS_FEEDS.keys():
-            haberler = haberleri_getir(kategori)
-            haberleri_veritabanina_kaydet(haberler)
-        
-        # 30 dakikada bir güncelle
-        logger.info("Haber güncellemesi tamamlandı. 30 dakika sonra tekrar güncellenecek.")
-        time.sleep(1800)
+        # Bir sonraki feed'in çekim zamanına kadar beklenir (takvim değişirse erken uyanılır)
+        urller = FEED_ZAMANLAYICI.siradakiler()
+        logger.info(f"{len(urller)} feed'in çekim zamanı geldi, haberler güncelleniyor...")
+        takvimli_topla(urller)
 
-# Arka plan görevini başlat
+# Kalıcı özetleme kuyruğu ve onu boşaltan işçiler
+OZET_KUYRUGU = OzetKuyrugu(get_db_connection)
+# Her yenileme döngüsünde model özetlerine ayrılan süre; sığmayan haberler boşta yükseltilir
+OZET_ZAMANLAYICI = OzetZamanlayici(
+    butce_sn=float(os.getenv("OZET_DONGU_BUTCESI_SN", "600")),
+    isci_sayisi=OZET_ISCI_SAYISI,
+    # Uzun haberlerin maliyeti parçalı özetleyicinin haber başına bütçesiyle sınırlıdır
+    maks_girdi_tokeni=PARCALI_OZETLEYICI.maks_islenen_token
+)
+OZET_ISCILERI = OzetIsciHavuzu(
+    OZET_KUYRUGU,
+    ozet_islerini_isle,
+    isci_sayisi=OZET_ISCI_SAYISI,
+    batch_boyutu=OZET_BATCH_BOYUTU,
+    # Model yüklenene ve eski içerikler taşınana kadar işler kuyrukta bekler
+    hazir_mi=lambda: summarizer is not None and not ESKI_ICERIK_SUTUNU
+)
+
+# Saklama politikası: kategori başına yaş sınırı (gün) ve toplam haber sınırı (0: sınırsız). Silinen haberler
+# ARSIV_KLASORU'na aylık .ndjson.gz dosyaları olarak yazılır (boş bırakılırsa arşivlenmez)
+HABER_SAKLAYICI = HaberSaklayici(
+    VERITABANI,
+    varsayilan_gun=float(os.getenv("SAKLAMA_GUN", "0")),
+    kategori_gunleri=kategori_gunlerini_coz(os.getenv("SAKLAMA_KATEGORI_GUN", "")),
+    maks_haber=int(os.getenv("SAKLAMA_MAKS_HABER", "0")),
+    arsiv_klasoru=os.getenv("ARSIV_KLASORU", "arsiv"),
+    # Haberle birlikte silinen satırlar; kümeleme, haberler silindikten sonra kalan üyeleri yeni temsilciye taşır
+    silme_kancalari=[HABER_ICERIKLERI.sil, HABER_ARAMA.sil, HABER_KUMELEYICI.sil, OZET_KUYRUGU.sil]
+)
+SAKLAMA_ARALIGI_SN = float(os.getenv("SAKLAMA_ARALIGI_SN", "3600"))
+SAKLAMA_SILINENLER = METRIKLER.sayac("saklama_silinen_haberler_toplam", "Saklama politikasıyla silinen haberler")
+
+def arkaplan_saklama():
+    """Saklama politikasını düzenli aralıklarla uygular ve boşalan sayfaları dosyaya iade eder"""
+    while True:
+        try:
+            sonuc = HABER_SAKLAYICI.uygula()
+            if sonuc and sonuc["silinen"]:
+                SAKLAMA_SILINENLER.artir(sonuc["silinen"])
+                YANIT_ONBELLEGI.gecersiz_kil()
+        except Exception as e:
+            logger.error(f"Saklama politikası uygulanamadı: {e}")
+            HATALAR.artir(asama="saklama")
+        time.sleep(SAKLAMA_ARALIGI_SN)
+
+def arkaplan_bakim():
+    """Tek seferlik veritabanı geçişlerini yapar, saklama politikası tanımlıysa düzenli olarak uygular"""
+    try:
+        veritabani_bakimi()
+    except Exception as e:
+        logger.error(f"Veritabanı bakımı yapılamadı: {e}")
+        HATALAR.artir(asama="bakim")
+    if HABER_SAKLAYICI.etkin:
+        arkaplan_saklama()
+
+# Kendi sayaçlarını tutan bileşenler /api/metrics isteğinde okunur
+ONBELLEKLER = {"temizlik": METIN_TEMIZLEYICI, "ozet": OZET_ONBELLEGI, "yanit": YANIT_ONBELLEGI}
+METRIKLER.toplayici("onbellek_isabetleri_toplam", SAYAC, "Önbellek isabetleri", ("onbellek",),
+                    lambda: [((ad,), onbellek.isabet) for ad, onbellek in ONBELLEKLER.items()])
+METRIKLER.toplayici("onbellek_iskalamalari_toplam", SAYAC, "Önbellek ıskalamaları", ("onbellek",),
+                    lambda: [((ad,), onbellek.iskalama) for ad, onbellek in ONBELLEKLER.items()])
+METRIKLER.toplayici("ozet_kuyrugu_isleri", GOSTERGE, "Özetleme kuyruğundaki işler (duruma göre)", ("durum",),
+                    lambda: [((durum,), sayi) for durum, sayi in OZET_KUYRUGU.durum_sayilari().items()])
+METRIKLER.toplayici("akis_aboneleri", GOSTERGE, "Açık /api/akis bağlantıları", (),
+                    lambda: [((), HABER_AKISI.durum()["abone"])])
+METRIKLER.toplayici("veritabani_boyutu_bayt", GOSTERGE, "Veritabanı ve WAL dosyalarının boyutu", ("dosya",),
+                    lambda: [((ad,), os.path.getsize(DB_FILE + ek)) for ad, ek in (("db", ""), ("wal", "-wal"))
+                             if os.path.exists(DB_FILE + ek)])
+
+# /api/yenile ile başlatılan arka plan yenileme işleri
+YENILEME_ISLERI = {}
+YENILEME_KILIDI = threading.Lock()
+YENILEME_HAVUZU = ThreadPoolExecutor(max_workers=1, thread_name_prefix="yenileme")
+
+# Veritabanını başlat; mevcut haberler korunur (VERITABANI_TEMIZLE=1 ile eski davranış: her açılışta sıfırla)
+# (özetleme fonksiyonları tanımlandıktan sonra çalışmalı)
+init_db()
+if os.getenv("VERITABANI_TEMIZLE", "0") == "1":
+    temizle_veritabani()
+OZET_ISCILERI.baslat()
+
+# Model arka planda yüklenir, durum /api/model_status ile izlenebilir
+model_yukleme_thread = threading.Thread(target=init_llm_model, name="model-yukleme")
+model_yukleme_thread.daemon = True
+model_yukleme_thread.start()
+
+# Arka plan görevini başlat (ilk haber yüklemesi dahil)
 haber_guncelleme_thread = threading.Thread(target=arkaplan_haber_guncelleme)
 haber_guncelleme_thread.daemon = True
 haber_guncelleme_thread.start()
 
+# Veritabanı geçişleri arka planda yapılır; saklama politikası tanımlıysa eski haberler aynı thread'de silinir
+threading.Thread(target=arkaplan_bakim, name="bakim", daemon=True).start()
+
+@app.before_request
+def istek_profilini_baslat():
+    """Profil istenmişse isteği profillemeye başlar (akış ve profil uç noktaları hariç)"""
+    if PROFILLEYICI.bekliyor_mu(ISTEK) and not request.path.startswith(('/api/akis', '/api/profil', '/static')):
+        g.profil = contextlib.ExitStack()
+        g.profil.enter_context(PROFILLEYICI.profille(ISTEK, f"{request.method} {request.path}"))
+
+@app.teardown_request
+def istek_profilini_bitir(hata=None):
+    profil = g.pop('profil', None)
+    if profil is not None:
+        profil.close()
+
 @app.route('/')
 def index():
     """Ana sayfa"""
     return render_template('index.html')
 
+def onbellekli_yanit(anahtar, uret):
+    """Yanıtı önbellekten verir; yoksa uret() ile üretip saklar
+    
+    If-None-Match eşleşirse 304, istemci destekliyorsa gzip ile sıkıştırılmış gövde döner.
+    Yalnızca 200 yanıtları önbelleğe alınır.
+    """
+    girdi = YANIT_ONBELLEGI.getir(anahtar)
+    if girdi is None:
+        surum = YANIT_ONBELLEGI.surum(anahtar[0])
+        yanit = uret()
+        if yanit.status_code != 200:
+            return yanit
+        ek_basliklar = {ad: deger for ad, deger in yanit.headers.items() if ad.startswith('X-')}
+        girdi = YANIT_ONBELLEGI.kaydet(anahtar, surum, yanit.get_data(), ek_basliklar)
+    
+    basliklar = dict(girdi.basliklar)
+    basliklar.update({'ETag': girdi.etag, 'Cache-Control': 'no-cache', 'Vary': 'Accept-Encoding'})
+    if girdi.eslesiyor_mu(request.headers.get('If-None-Match')):
+        return Response(status=304, headers=basliklar)
+    
+    if girdi.gzip_govde is not None and 'gzip' in request.headers.get('Accept-Encoding', ''):
+        basliklar['Content-Encoding'] = 'gzip'
+        return Response(girdi.gzip_govde, mimetype='application/json', headers=basliklar)
+    return Response(girdi.govde, mimetype='application/json', headers=basliklar)
+
+def haber_listesi_yaniti(kategori, varsayilan_limit):
+    """Haber listesini ?limit, ?imlec, ?alanlar ve ?tekil parametreleriyle döndürür
+    
+    Sonraki sayfanın imleci X-Sonraki-Imlec başlığında gönderilir. tekil=1 ise aynı haberin
+    farklı kaynaklardaki tekrarlarından yalnızca biri döner.
+    """
+    try:
+        limit = limiti_coz(request.args.get('limit'), varsayilan_limit)
+        alanlar = alanlari_coz(request.args.get('alanlar'))
+    except GecersizSorgu as e:
+        return jsonify({"durum": "hata", "mesaj": str(e)}), 400
+    imlec = request.args.get('imlec')
+    tekil = request.args.get('tekil', '0') in ('1', 'true', 'evet')
+    
+    def uret():
+        conn = get_db_connection()
+        try:
+            haberler, sonraki_imlec = haberleri_listele(conn, kategori, limit, imlec, alanlar, tekil)
+        except GecersizSorgu as e:
+            yanit = jsonify({"durum": "hata", "mesaj": str(e)})
+            yanit.status_code = 400
+            return yanit
+        finally:
+            conn.close()
+        yanit = jsonify(haberler)
+        if sonraki_imlec:
+            yanit.headers['X-Sonraki-Imlec'] = sonraki_imlec
+        return yanit
+    
+    return onbellekli_yanit((kategori, limit, alanlar, imlec, tekil), uret)
+
 @app.route('/api/haberler')
 def tum_haberler():
     """Tüm haberleri döndürür"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT * FROM haberler ORDER BY tarih DESC LIMIT 50')
-    haberler = [dict(row) for row in cursor.fetchall()]
-    
-    conn.close()
-    return jsonify(haberler)
+    return haber_listesi_yaniti(None, 50)
 
 @app.route('/api/haberler/<kategori>')
 def kategori_haberleri(kategori):
     """Belirli bir kategorideki haberleri döndürür"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    return haber_listesi_yaniti(kategori, 20)
+
+@app.route('/api/ara')
+def ara():
+    """Başlık, özet ve içerikte tam metin arama yapar (?q=, ?kategori=, ?limit=, ?sayfa=)"""
+    sorgu = request.args.get('q', '').strip()
+    if not sorgu:
+        return jsonify({"durum": "hata", "mesaj": "Arama sorgusu (q) gerekli"}), 400
+    try:
+        limit = limiti_coz(request.args.get('limit'), 20)
+        sayfa = max(1, int(request.args.get('sayfa', 1)))
+    except (GecersizSorgu, ValueError):
+        return jsonify({"durum": "hata", "mesaj": "Geçersiz limit veya sayfa"}), 400
     
-    cursor.execute('SELECT * FROM haberler WHERE kategori = ? ORDER BY tarih DESC LIMIT 20', (kategori,))
-    haberler = [dict(row) for row in cursor.fetchall()]
+    try:
+        haberler, devami_var = HABER_ARAMA.ara(sorgu, request.args.get('kategori'), limit, sayfa)
+    except sqlite3.OperationalError as e:
+        logger.error(f"Arama hatası: {e}")
+        return jsonify({"durum": "hata", "mesaj": "Arama yapılamadı"}), 500
+    return jsonify({
+        "sorgu": sorgu,
+        "sayfa": sayfa,
+        "sonraki_sayfa": sayfa + 1 if devami_var else None,
+        "haberler": haberler
+    })
+
+@app.route('/api/akis')
+def haber_akisi():
+    """Yeni haberleri ve özet yükseltmelerini Server-Sent Events olarak gönderir
     
-    conn.close()
-    return jsonify(haberler)
+    ?kategori ile tek kategori izlenebilir. Yeniden bağlanan istemci Last-Event-ID başlığıyla
+    (veya ?son_id ile) kaçırdığı olayları alır.
+    """
+    kategori = request.args.get('kategori') or None
+    if kategori is not None and kategori not in RSS_FEEDS:
+        return jsonify({"durum": "hata", "mesaj": "Geçersiz kategori"}), 400
+    abone = HABER_AKISI.abone_ol(request.headers.get('Last-Event-ID') or request.args.get('son_id'), kategori)
+    if abone is None:
+        return jsonify({"durum": "hata", "mesaj": "Akış abone sınırına ulaşıldı"}), 503
+    
+    def uret():
+        try:
+            # Bağlantı koparsa tarayıcı 3 sn sonra Last-Event-ID ile yeniden bağlanır
+            yield "retry: 3000\n\n"
+            yield from abone.parcalar(KALP_ATISI_SN)
+        finally:
+            HABER_AKISI.abonelikten_cik(abone)
+    
+    return Response(uret(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@app.route('/api/metrics')
+def prometheus_metrikleri():
+    """Hattın aşama süreleri, sayaçlar ve kuyruk derinliği (Prometheus metin biçimi)"""
+    return Response(METRIKLER.metin(), content_type=ICERIK_TIPI)
+
+@app.route('/api/profil', methods=['GET', 'POST'])
+def profil():
+    """Profil durumunu döndürür (GET) veya sonraki işlerin profillenmesini ister (POST)
+    
+    POST gövdesi: {"tur": "dongu" | "ozet" | "istek", "adet": N, "yontem": "ornekleme" | "cprofile"}
+    """
+    if not PROFIL_ANAHTARI:
+        return jsonify({"durum": "hata", "mesaj": "Profil uç noktası kapalı (PROFIL_ANAHTARI tanımlı değil)"}), 404
+    if not hmac.compare_digest(request.headers.get('X-Profil-Anahtari', '').encode(), PROFIL_ANAHTARI.encode()):
+        return jsonify({"durum": "hata", "mesaj": "Yetkisiz"}), 403
+    if request.method == 'POST':
+        istek = request.get_json(silent=True) or {}
+        try:
+            PROFILLEYICI.iste(istek.get('tur', DONGU), int(istek.get('adet', 1)), istek.get('yontem', ORNEKLEME))
+        except (TypeError, ValueError) as e:
+            return jsonify({"durum": "hata", "mesaj": str(e)}), 400
+    return jsonify(PROFILLEYICI.durum())
+
+@app.route('/api/akis/durum')
+def haber_akisi_durumu():
+    """Akış abone sayısını ve yayın istatistiklerini döndürür"""
+    return jsonify(HABER_AKISI.durum())
+
+@app.route('/api/saklama')
+def saklama_durumu():
+    """Saklama politikasını, son çalıştırmasını, veritabanı boyutunu ve içerik sıkıştırma oranını döndürür"""
+    durum = HABER_SAKLAYICI.durum()
+    durum["icerikler"] = HABER_ICERIKLERI.istatistikler()
+    return jsonify(durum)
 
 @app.route('/api/kategoriler')
 def kategoriler():
     """Mevcut kategorileri döndürür"""
-    return jsonify(list(RSS_FEEDS.keys()))
+    return onbellekli_yanit(('_kategoriler',), lambda: jsonify(list(RSS_FEEDS.keys())))
 
 @app.route('/api/yenile/<kategori>')
 def kategori_yenile(kategori):
-    """Belirli bir kategorideki haberleri yeniler"""
+    """Belirli bir kategorideki haberleri arka planda yeniler, iş id'sini hemen döndürür"""
     if kategori in RSS_FEEDS:
-        haberler = haberleri_getir(kategori)
-        haberleri_veritabanina_kaydet(haberler)
-        return jsonify({"durum": "başarılı", "mesaj": f"{len(haberler)} haber güncellendi"})
+        is_id = yenileme_baslat(kategori)
+        return jsonify({"durum": "başarılı", "mesaj": "Yenileme başlatıldı", "is_id": is_id}), 202
     else:
         return jsonify({"durum": "hata", "mesaj": "Geçersiz kategori"}), 400
 
+@app.route('/api/isler/<is_id>')
+def yenileme_isi(is_id):
+    """Bir yenileme işinin durumunu döndürür"""
+    is_bilgisi = YENILEME_ISLERI.get(is_id)
+    if is_bilgisi is None:
+        return jsonify({"durum": "hata", "mesaj": "İş bulunamadı"}), 404
+    return jsonify(is_bilgisi)
+
+@app.route('/api/ozet_kuyrugu')
+def ozet_kuyrugu_durumu():
+    """Özetleme kuyruğundaki iş sayılarını döndürür"""
+    return jsonify({
+        "isler": OZET_KUYRUGU.durum_sayilari(),
+        "isci_modu": OZET_ISCI_MODU,
+        "isci_sayisi": OZET_ISCI_SAYISI,
+        "bellek": {
+            "ana_surec": surec_bellegi(),
+            # Süreç modunda işçilerin PSS değeri paylaşılan model ağırlıklarının yalnızca payını içerir
+            "isci_surecler": [dict(surec_bellegi(surec.pid) or {}, pid=surec.pid) for surec in multiprocessing.active_children()]
+        },
+        "zamanlayici": OZET_ZAMANLAYICI.metrikler()
+    })
+
+@app.route('/api/yenileme_metrikleri')
+def yenileme_metrikleri():
+    """Son feed yenileme döngüsünün metriklerini döndürür"""
+    return jsonify(SON_YENILEME_METRIKLERI)
+
+@app.route('/api/feed_takvimi')
+def feed_takvimi():
+    """Feed yenileme takviminin metriklerini döndürür (saatlik çekim, boşa çekim oranı, tazelik gecikmesi)"""
+    return jsonify(FEED_ZAMANLAYICI.metrikler())
+
+@app.route('/api/feeds/health')
+def feed_sagligi():
+    """Feed başına gecikme, hata sayıları, son başarılı çekim ve devre durumunu döndürür"""
+    kategoriler = {}
+    for kategori, feedler in RSS_FEEDS.items():
+        for feed_url in feedler:
+            kategoriler.setdefault(feed_url, []).append(kategori)
+    feedler = FEED_SAGLIGI.rapor(list(kategoriler))
+    for kayit in feedler:
+        kayit["kategoriler"] = kategoriler[kayit["url"]]
+    return jsonify({
+        "ozet": {devre: sum(1 for kayit in feedler if kayit["devre"] == devre) for devre in (KAPALI, YARI_ACIK, ACIK)},
+        "feedler": feedler
+    })
+
 @app.route('/api/model-bilgisi')
 def model_bilgisi():
     """Kullanılan LLM modeli hakkında bilgi verir"""
     return jsonify({
         "model_tipi": LLM_TYPE,
-        "model_adi": LLM_MODEL if LLM_TYPE == "transformers" else "API tabanlı model"
+        "model_adi": LLM_MODEL if LLM_TYPE in YEREL_MODEL_TIPLERI else "API tabanlı model",
+        "arka_uc": CIKARIM_ARKA_UCU
     })
 
 @app.route('/api/models')
@@ -573,9 +1659,12 @@ def get_model_status():
     global summarizer
     return jsonify({
         "ready": summarizer is not None,
+        "status": MODEL_DURUMU,
         "current_model": LLM_MODEL,
         "type": LLM_TYPE,
-        "device": str(device)
+        "backend": CIKARIM_ARKA_UCU,
+        "device": str(device) if device is not None else "bilinmiyor",
+        "registry": MODEL_KAYDI.durum()
     })
 
 @app.route('/api/change_summary_mode', methods=['POST'])
@@ -598,48 +1687,30 @@ def change_summary_mode():
 
 @app.route('/api/change_model', methods=['POST'])
 def change_model():
-    """Model değişikliği yapar"""
-    global summarizer, LLM_MODEL, LLM_TYPE
-    
+    """Model değişikliği yapar
+
+    Model bellekteyse hemen geçilir; değilse arka planda yüklenir ve o sırada özetler mevcut modelle
+    üretilmeye devam eder. Yüklemenin durumu /api/model_status ile izlenir.
+    """
     try:
         data = request.get_json()
         new_model = data.get('model')
         
         if new_model == "basic":
-            summarizer = lambda metin, **kwargs: [{"summary_text": gelismis_basit_ozet(metin)}]
-            LLM_MODEL = "basic"
+            MODEL_KAYDI.kaydet("basic", basit_ozetleyici)
             logger.info("Basit özetleme moduna geçildi")
-            return jsonify({"success": True, "message": "Basit özetleme moduna geçildi"})
+            return jsonify({"success": True, "durum": HAZIR, "message": "Basit özetleme moduna geçildi"})
             
         if new_model not in ["mrm8488/bert2bert_shared-turkish-summarization", "google/mt5-small", 
                            "facebook/mbart-large-cc25"]:
             return jsonify({"success": False, "error": "Geçersiz model"})
         
-        try:
-            if "t5" in new_model.lower():
-                from transformers import T5ForConditionalGeneration, T5Tokenizer
-                model = T5ForConditionalGeneration.from_pretrained(new_model).to(device)
-                tokenizer = T5Tokenizer.from_pretrained(new_model)
-            elif "bert2bert" in new_model.lower():
-                from transformers import EncoderDecoderModel, BertTokenizer
-                model = EncoderDecoderModel.from_pretrained(new_model).to(device)
-                tokenizer = BertTokenizer.from_pretrained(new_model)
-            elif "mbart" in new_model.lower():
-                from transformers import MBartForConditionalGeneration, MBart50TokenizerFast
-                model = MBartForConditionalGeneration.from_pretrained(new_model).to(device)
-                tokenizer = MBart50TokenizerFast.from_pretrained(new_model)
-            
-            summarizer = pipeline("summarization", model=model, tokenizer=tokenizer, 
-                               device=-1 if device.type == "cpu" else 0)
-            LLM_MODEL = new_model
+        durum = MODEL_KAYDI.sec(new_model)
+        if durum == HAZIR:
             logger.info(f"Model değiştirildi: {new_model}")
-            return jsonify({"success": True, "message": f"Model değiştirildi: {new_model}"})
-            
-        except Exception as e:
-            logger.error(f"Model değiştirme hatası: {e}")
-            summarizer = lambda metin, **kwargs: [{"summary_text": gelismis_basit_ozet(metin)}]
-            LLM_MODEL = "basic"
-            return jsonify({"success": False, "error": str(e)})
+            return jsonify({"success": True, "durum": durum, "message": f"Model değiştirildi: {new_model}"})
+        logger.info(f"Model arka planda yükleniyor: {new_model}")
+        return jsonify({"success": True, "durum": durum, "message": f"Model yükleniyor: {new_model}"}), 202
             
     except Exception as e:
         logger.error(f"Model değiştirme isteği hatası: {e}")
@@ -647,9 +1718,9 @@ def change_model():
 
 if __name__ == '__main__':
     try:
-        logger.info(f"Uygulama başlatılıyor... LLM Tipi: {LLM_TYPE}, Model: {LLM_MODEL if LLM_TYPE == 'transformers' else 'API tabanlı'}")
+        logger.info(f"Uygulama başlatılıyor... LLM Tipi: {LLM_TYPE}, Model: {LLM_MODEL if LLM_TYPE in YEREL_MODEL_TIPLERI else 'API tabanlı'}")
         # Debug modunu kapatıp host'u açıyoruz
-        app.run(host='0.0.0.0', port=5000, debug=False)
+        app.run(host='0.0.0.0', port=PORT, debug=False)
     except Exception as e:
         logger.error(f"Uygulama başlatma hatası: {e}")
         input("Devam etmek için bir tuşa basın...") 
\ No newline at end of file
@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Bellek Ölçümü
+-------------
+Süreçlerin bellek kullanımını /proc üzerinden okur (yalnızca Linux). Fork ile ağırlıkları paylaşan
+özetleme işçilerinde RSS paylaşılan sayfaları her süreçte tekrar sayar; gerçek maliyet PSS
+(paylaşılan sayfalar paylaşan süreç sayısına bölünür) ve USS (yalnızca o sürece ait sayfalar) ile görülür.
+"""
+
+import os
+
+
+def surec_bellegi(pid=None):
+    """Sürecin RSS, PSS ve USS değerleri (MB); okunamıyorsa None"""
+    pid = pid or os.getpid()
+    degerler = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as dosya:
+            for satir in dosya:
+                parcalar = satir.split()
+                if len(parcalar) >= 2 and parcalar[0].endswith(":") and parcalar[1].isdigit():
+                    degerler[parcalar[0][:-1]] = int(parcalar[1])
+    except OSError:
+        try:
+            with open(f"/proc/{pid}/status") as dosya:
+                for satir in dosya:
+                    if satir.startswith("VmRSS:"):
+                        return {"rss_mb": round(int(satir.split()[1]) / 1024, 1), "pss_mb": None, "uss_mb": None}
+        except OSError:
+            return None
+        return None
+    if "Rss" not in degerler:
+        return None
+    uss = degerler.get("Private_Clean", 0) + degerler.get("Private_Dirty", 0)
+    return {"rss_mb": round(degerler["Rss"] / 1024, 1), "pss_mb": round(degerler.get("Pss", 0) / 1024, 1),
+            "uss_mb": round(uss / 1024, 1)}
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Akışlı Ayrıştırma Benchmark'ı
+-----------------------------
+Büyük yerel feed dosyaları (binlerce haberlik RSS 2.0 arşivleri) üretir ve feedparser.parse ile
+akisli_ayristirici.akisli_ayristir'ı karşılaştırır:
+  - tam: tüm belgenin ayrıştırılması (feedparser / akışlı, sınırsız)
+  - soguk: veritabanı boş, ilk 5 yeni haberde durulur
+  - sicak: feed'in yalnızca en yeni --yeni haberi bilinmiyor, ilk bilinen haberde durulur
+Her senaryo için medyan süre, tracemalloc ile ölçülen tepe bellek ve okunan bayt oranı raporlanır.
+Akışlı sonucun ilk haberlerinin feedparser ile aynı alanları (başlık, bağlantı, özet, resim, tarih)
+verdiği de doğrulanır.
+
+Kullanım:
+    cd backend
+    python benchmarks/akisli_ayristirma_benchmark.py [--haber 500 5000] [--tekrar 3] [--yeni 2]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from email.utils import formatdate
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import feedparser  # noqa: E402
+
+from akisli_ayristirici import akisli_ayristir  # noqa: E402
+
+KARSILASTIRILAN_ALANLAR = ("title", "link", "summary", "published_parsed")
+
+
+def feed_uret(haber_sayisi):
+    """En yeni haber başta olacak şekilde büyük bir RSS 2.0 belgesi üretir"""
+    simdi = time.time()
+    satirlar = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/" '
+        'xmlns:content="http://purl.org/rss/1.0/modules/content/">',
+        "<channel><title>Büyük Arşiv Feed'i</title><link>https://arsiv.example/</link>",
+    ]
+    paragraf = ("Merkez Bankası Para Politikası Kurulu toplantısında politika faizini sabit tuttu; "
+                "kurul, enflasyon görünümündeki belirsizliklerin sürdüğünü belirtti. ") * 4
+    for i in range(haber_sayisi):
+        satirlar.append(
+            f"<item><title>Haber {i}: ekonomi gündemi</title>"
+            f"<link>https://arsiv.example/haber/{i}</link>"
+            f'<guid isPermaLink="false">haber-{i}</guid>'
+            f"<pubDate>{formatdate(simdi - i * 600)}</pubDate>"
+            f"<description><![CDATA[<p>{paragraf}</p>]]></description>"
+            f"<content:encoded><![CDATA[<p>{paragraf * 2}</p>]]></content:encoded>"
+            f'<media:content url="https://arsiv.example/resim/{i}.jpg" medium="image"/>'
+            f"</item>"
+        )
+    satirlar.append("</channel></rss>")
+    return "\n".join(satirlar).encode("utf-8")
+
+
+def olc(fonksiyon, tekrar):
+    """Medyan süre (ms) ve tepe bellek (MB); son çağrının sonucunu da döndürür"""
+    sureler = []
+    for _ in range(tekrar):
+        baslangic = time.perf_counter()
+        sonuc = fonksiyon()
+        sureler.append((time.perf_counter() - baslangic) * 1000)
+    tracemalloc.start()
+    fonksiyon()
+    _, tepe = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(sureler), tepe / 1024 / 1024, sonuc
+
+
+def dogrula(akisli, referans):
+    """Akışlı haberlerin feedparser haberleriyle aynı normalleştirilmiş alanları verdiğini kontrol eder"""
+    for girdi, beklenen in zip(akisli.entries, referans.entries):
+        for alan in KARSILASTIRILAN_ALANLAR:
+            if girdi.get(alan) != beklenen.get(alan):
+                return f"{alan} farklı: {girdi.get('link')}"
+        if girdi.media_content[0]["url"] != beklenen.media_content[0]["url"]:
+            return f"media_content farklı: {girdi.get('link')}"
+    return "aynı"
+
+
+def main():
+    ayrac = argparse.ArgumentParser(description="feedparser ve akışlı ayrıştırma karşılaştırması")
+    ayrac.add_argument("--haber", type=int, nargs="+", default=[500, 5000], help="Üretilecek feed'lerin haber sayıları")
+    ayrac.add_argument("--tekrar", type=int, default=3)
+    ayrac.add_argument("--yeni", type=int, default=2, help="Sıcak senaryoda bilinmeyen en yeni haber sayısı")
+    argumanlar = ayrac.parse_args()
+
+    with tempfile.TemporaryDirectory() as klasor:
+        for haber_sayisi in argumanlar.haber:
+            dosya_yolu = os.path.join(klasor, f"arsiv_{haber_sayisi}.xml")
+            with open(dosya_yolu, "wb") as dosya:
+                dosya.write(feed_uret(haber_sayisi))
+            with open(dosya_yolu, "rb") as dosya:
+                icerik = dosya.read()
+            bilinenler = {f"https://arsiv.example/haber/{i}" for i in range(argumanlar.yeni, haber_sayisi)}
+
+            senaryolar = [
+                ("feedparser (tam)", lambda: feedparser.parse(icerik)),
+                ("akışlı (tam)", lambda: akisli_ayristir(icerik, en_fazla=haber_sayisi + 1)),
+                ("akışlı soğuk (5 yeni)", lambda: akisli_ayristir(icerik)),
+                (f"akışlı sıcak ({argumanlar.yeni} yeni)", lambda: akisli_ayristir(icerik, bilinenler=bilinenler.intersection)),
+            ]
+            print(f"\n{haber_sayisi} haber, {len(icerik) / 1024 / 1024:.1f} MB")
+            print(f"{'senaryo':<26} {'süre (ms)':>10} {'tepe bellek (MB)':>17} {'haber':>6} {'okunan':>7}")
+            referans = None
+            for ad, fonksiyon in senaryolar:
+                sure, tepe, sonuc = olc(fonksiyon, argumanlar.tekrar)
+                okunan = sonuc.get("okunan_bayt", len(icerik)) / len(icerik)
+                print(f"{ad:<26} {sure:>10.1f} {tepe:>17.1f} {len(sonuc.entries):>6} {okunan:>7.0%}")
+                if referans is None:
+                    referans = sonuc
+                else:
+                    print(f"{'':<26} feedparser ile karşılaştırma: {dogrula(sonuc, referans)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tam Metin Arama Benchmark'ı
+---------------------------
+Rastgele Türkçe kelimelerden üretilen haberlerle FTS5 indeksini doldurur ve
+  - haber toplama sırasında 200 haberlik bir batch'i indekslemenin ek maliyetini,
+  - nadir, orta sıklıkta ve yaygın terimler için /api/ara sorgu gecikmesini
+ölçer.
+
+Kullanım:
+    cd backend
+    python benchmarks/arama_benchmark.py [--satir 1000000] [--tekrar 20]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from haber_arama import HaberAramaIndeksi, fts_sorgusu, sorgu_terimleri  # noqa: E402
+from haber_icerikleri import HaberIcerikleri  # noqa: E402
+from veritabani import BaglantiHavuzu  # noqa: E402
+
+SEMA = '''
+CREATE TABLE IF NOT EXISTS haberler (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    baslik TEXT NOT NULL,
+    ozet TEXT NOT NULL,
+    kategori TEXT NOT NULL,
+    kaynak TEXT NOT NULL,
+    url TEXT NOT NULL UNIQUE,
+    resim_url TEXT,
+    tarih TIMESTAMP NOT NULL,
+    olusturulma_tarihi TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    ozet_durumu TEXT NOT NULL DEFAULT 'hazir'
+)
+'''
+KOKLER = ["ekonomi", "İstanbul", "ışık", "güneş", "çalışma", "öğrenci", "şirket", "bakanlık", "maç",
+          "takım", "seçim", "meclis", "enflasyon", "döviz", "borsa", "yağmur", "deprem", "teknoloji",
+          "yapay", "zeka", "sağlık", "hastane", "okul", "üniversite", "trafik", "köprü", "proje", "müze"]
+EKLER = ["", "", "de", "da", "ler", "lar", "in", "ın", "e", "a", "ye", "nin", "deki", "ları"]
+KATEGORILER = ["gundem", "spor", "ekonomi", "teknoloji", "magazin", "dunya", "saglik", "kultur"]
+HARFLER = "abcdefghijklmnoprstuvyz"
+
+
+def nadir_kelime(no):
+    # İlk 5 harfi (indekslenen kök) her kelime için farklı olan yapay kelime
+    no = no * 7919 % len(HARFLER) ** 5
+    harfler = []
+    for _ in range(5):
+        no, kalan = divmod(no, len(HARFLER))
+        harfler.append(HARFLER[kalan])
+    return "".join(harfler) + "lar"
+
+
+# Her biri birkaç haberde geçen nadir kelimeler
+NADIR_KELIMELER = [nadir_kelime(i) for i in range(50000)]
+BATCH = 200
+
+
+def kelime(rastgele):
+    # Zipf benzeri dağılım: ilk kökler çok, sondakiler az geçer; ayrıca nadir sentetik kelimeler
+    if rastgele.random() < 0.02:
+        return rastgele.choice(NADIR_KELIMELER)
+    kok = KOKLER[min(len(KOKLER) - 1, int(rastgele.paretovariate(1.2)) - 1)]
+    return kok + rastgele.choice(EKLER)
+
+
+def haberler_uret(rastgele, baslangic, adet):
+    temel = datetime(2025, 1, 1)
+    for no in range(baslangic, baslangic + adet):
+        yield ({
+            "baslik": " ".join(kelime(rastgele) for _ in range(8)).capitalize(),
+            "ozet": " ".join(kelime(rastgele) for _ in range(25)),
+            "icerik": "<p>" + " ".join(kelime(rastgele) for _ in range(120)) + "</p>",
+            "kategori": KATEGORILER[no % len(KATEGORILER)],
+            "url": f"https://ornek.example/haber/{no}",
+            "tarih": (temel + timedelta(minutes=no)).strftime("%Y-%m-%d %H:%M:%S"),
+        })
+
+
+def html_temizle(icerik):
+    return icerik.replace("<p>", "").replace("</p>", "")
+
+
+def batch_yaz(havuz, icerikler, indeks, haberler):
+    with havuz.yazma_islemi() as conn:
+        satirlar = []
+        for haber in haberler:
+            imlec = conn.execute(
+                'INSERT INTO haberler (baslik, ozet, kategori, kaynak, url, tarih) VALUES (?, ?, ?, ?, ?, ?)',
+                (haber["baslik"], haber["ozet"], haber["kategori"], "Kaynak", haber["url"], haber["tarih"])
+            )
+            satirlar.append((imlec.lastrowid, haber["baslik"], haber["ozet"], haber["icerik"]))
+        icerikler.kaydet(conn, [(haber_id, icerik) for haber_id, _, _, icerik in satirlar])
+        if indeks is not None:
+            indeks.indeksle(conn, satirlar)
+
+
+def main():
+    ayrac = argparse.ArgumentParser(description="Tam metin arama benchmark'ı")
+    ayrac.add_argument("--satir", type=int, default=1000000)
+    ayrac.add_argument("--tekrar", type=int, default=20)
+    argumanlar = ayrac.parse_args()
+    rastgele = random.Random(7)
+
+    with tempfile.TemporaryDirectory() as dizin:
+        havuz = BaglantiHavuzu(os.path.join(dizin, "arama.db"))
+        conn = havuz.al()
+        conn.execute(SEMA)
+        conn.commit()
+        conn.close()
+        icerikler = HaberIcerikleri(havuz.al)
+        icerikler.tablo_olustur()
+        indeks = HaberAramaIndeksi(havuz.al, html_temizle)
+        indeks.tablo_olustur()
+
+        t0 = time.perf_counter()
+        for baslangic in range(0, argumanlar.satir, 5000):
+            batch_yaz(havuz, icerikler, indeks, list(haberler_uret(rastgele, baslangic, min(5000, argumanlar.satir - baslangic))))
+        print(f"{argumanlar.satir} haber indekslendi: {time.perf_counter() - t0:.1f} sn")
+        conn = havuz.al()
+        conn.execute("INSERT INTO haberler_fts(haberler_fts) VALUES('optimize')")
+        conn.commit()
+        conn.close()
+
+        # Tek bir toplama batch'inin indeksli ve indekssiz yazma süresi
+        sureler = {"indekssiz": [], "indeksli": []}
+        no = argumanlar.satir
+        for _ in range(5):
+            for ad, kullanilan in (("indekssiz", None), ("indeksli", indeks)):
+                haberler = list(haberler_uret(rastgele, no, BATCH))
+                no += BATCH
+                t0 = time.perf_counter()
+                batch_yaz(havuz, icerikler, kullanilan, haberler)
+                sureler[ad].append(time.perf_counter() - t0)
+        indekssiz = statistics.median(sureler["indekssiz"]) * 1000
+        indeksli = statistics.median(sureler["indeksli"]) * 1000
+        print(f"{BATCH} haberlik batch: indekssiz {indekssiz:.1f} ms, indeksli {indeksli:.1f} ms "
+              f"(haber başına +{(indeksli - indekssiz) / BATCH:.3f} ms)")
+
+        conn = havuz.al()
+        sorgular = [("nadir", NADIR_KELIMELER[0]), ("orta", "köprü"), ("orta, iki terim", "müze proje"),
+                    ("yaygın", "ekonomi"), ("yaygın + kategori", "ekonomi")]
+        for ad, sorgu in sorgular:
+            eslesen = conn.execute("SELECT COUNT(*) FROM haberler_fts WHERE haberler_fts MATCH ?",
+                                   (fts_sorgusu(sorgu_terimleri(sorgu)),)).fetchone()[0]
+            kategori = "spor" if "kategori" in ad else None
+            gecikmeler = []
+            for _ in range(argumanlar.tekrar):
+                t0 = time.perf_counter()
+                indeks.ara(sorgu, kategori=kategori, limit=20)
+                gecikmeler.append(time.perf_counter() - t0)
+            print(f"  {ad:<18} '{sorgu}' ({eslesen} eşleşme): medyan {statistics.median(gecikmeler) * 1000:.2f} ms")
+        conn.close()
+        havuz.kapat()
+
+
+if __name__ == "__main__":
+    main()
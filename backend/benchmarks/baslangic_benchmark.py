@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Başlangıç Süresi Benchmark'ı
+----------------------------
+Uygulamayı ayrı bir süreçte başlatır ve şunları ölçer:
+  - HTTP sunucusunun bağlantı kabul etmeye başlaması (port açılışı)
+  - Ana sayfa ve /api/haberler için ilk bayta kadar geçen süre (TTFB)
+  - /api/model_status'un hazır (veya basit mod) durumuna geçmesi
+  - İlk haberlerin /api/haberler'de görünmesi
+
+Feed'ler yerel RSS sunucusundan yapay gecikmeyle sunulur; veritabanı geçici bir dizinde oluşturulur.
+
+Kullanım:
+    cd backend
+    python benchmarks/baslangic_benchmark.py [--gecikme 1.0] [--tekrar 3]
+"""
+
+import argparse
+import http.client
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BACKEND_DIZINI = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIZINI)
+
+from yerel_sunucu import YerelRSSSunucusu  # noqa: E402
+
+
+def bos_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def ttfb(port, yol):
+    """Bir isteğin ilk bayta kadar geçen süresini ve gövdesini döndürür"""
+    baglanti = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+    baslangic = time.perf_counter()
+    baglanti.request("GET", yol)
+    yanit = baglanti.getresponse()
+    sure = time.perf_counter() - baslangic
+    govde = yanit.read()
+    baglanti.close()
+    return sure, govde
+
+
+def bekle(kosul, zaman_asimi, aralik=0.01):
+    """Koşul sağlanana kadar bekler, geçen süreyi döndürür (zaman aşımında None)"""
+    baslangic = time.perf_counter()
+    while time.perf_counter() - baslangic < zaman_asimi:
+        try:
+            if kosul():
+                return time.perf_counter() - baslangic
+        except (OSError, http.client.HTTPException, ValueError):
+            pass
+        time.sleep(aralik)
+    return None
+
+
+def bir_olcum(sunucu, gecikme, zaman_asimi):
+    port = bos_port()
+    with tempfile.TemporaryDirectory() as dizin:
+        feed_dosyasi = os.path.join(dizin, "rss_feeds.json")
+        with open(feed_dosyasi, "w", encoding="utf-8") as f:
+            json.dump({
+                "gundem": [sunucu.url("ornek_feed.xml", gecikme=gecikme, feed=i) for i in range(3)],
+                "spor": [sunucu.url("ornek_feed.xml", gecikme=gecikme, host="localhost", feed=i) for i in range(3)]
+            }, f)
+
+        ortam = dict(os.environ, PORT=str(port), DB_DOSYASI=os.path.join(dizin, "haber_ozet.db"),
+                     RSS_AYAR_DOSYASI=feed_dosyasi, TARAYICI_AC="0")
+        baslangic = time.perf_counter()
+        surec = subprocess.Popen([sys.executable, os.path.join(BACKEND_DIZINI, "app_anaconda.py")],
+                                 cwd=dizin, env=ortam, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            def port_acik():
+                with socket.create_connection(("127.0.0.1", port), timeout=0.1):
+                    return True
+
+            sonuc = {"port": bekle(port_acik, zaman_asimi)}
+            if sonuc["port"] is None:
+                raise RuntimeError("Sunucu zaman aşımı içinde açılmadı")
+            sonuc["port"] = time.perf_counter() - baslangic
+            sonuc["ttfb_anasayfa"], _ = ttfb(port, "/")
+            sonuc["ttfb_haberler"], _ = ttfb(port, "/api/haberler")
+
+            def model_hazir():
+                return json.loads(ttfb(port, "/api/model_status")[1])["status"] in ("hazir", "basit")
+
+            def haber_var():
+                return len(json.loads(ttfb(port, "/api/haberler")[1])) > 0
+
+            bekle(model_hazir, zaman_asimi, aralik=0.05)
+            sonuc["model_hazir"] = time.perf_counter() - baslangic
+            bekle(haber_var, zaman_asimi, aralik=0.05)
+            sonuc["ilk_haberler"] = time.perf_counter() - baslangic
+            return sonuc
+        finally:
+            surec.terminate()
+            surec.wait(timeout=10)
+
+
+def main():
+    ayrac = argparse.ArgumentParser(description="Başlangıç süresi benchmark'ı")
+    ayrac.add_argument("--gecikme", type=float, default=1.0, help="Feed başına yapay gecikme (sn)")
+    ayrac.add_argument("--tekrar", type=int, default=3)
+    ayrac.add_argument("--zaman-asimi", type=float, default=300.0)
+    argumanlar = ayrac.parse_args()
+
+    olcumler = []
+    with YerelRSSSunucusu() as sunucu:
+        for _ in range(argumanlar.tekrar):
+            olcumler.append(bir_olcum(sunucu, argumanlar.gecikme, argumanlar.zaman_asimi))
+
+    etiketler = {
+        "port": "Sunucu bağlantı kabul ediyor",
+        "ttfb_anasayfa": "TTFB /",
+        "ttfb_haberler": "TTFB /api/haberler",
+        "model_hazir": "Model durumu hazır",
+        "ilk_haberler": "İlk haberler görünür",
+    }
+    print(f"{argumanlar.tekrar} ölçüm, feed gecikmesi {argumanlar.gecikme:.1f} sn (medyan / en kötü):")
+    for anahtar, etiket in etiketler.items():
+        degerler = [o[anahtar] for o in olcumler]
+        print(f"  {etiket:<30}: {statistics.median(degerler) * 1000:8.1f} ms / {max(degerler) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
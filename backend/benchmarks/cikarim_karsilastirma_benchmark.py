@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Çıkarım Arka Ucu Karşılaştırması
+--------------------------------
+Aynı özetleme modelini fp32, int8 (dinamik nicemleme) ve onnx (ONNX Runtime) arka uçlarıyla
+yükler ve sabit Türkçe örnek kümesi (veri/ozet_ornekleri.json) üzerinde karşılaştırır:
+  - kalite: her arka ucun özetlerinin fp32 özetlerine göre ROUGE-1/2/L F1 değeri
+  - gecikme: haber başına (batch=1) özetleme süresinin p50/p95 değeri
+  - verim: TopluOzetleyici ile tüm kümenin batch'ler halinde özetlenme süresi
+  - yükleme süresi ve diskteki model boyutu
+Dönüştürülen modeller MODEL_KLASORU'na (varsayılan backend/modeller) yazılır; ilk çalıştırmada
+dönüştürme süresi yükleme süresine dahildir, sonraki çalıştırmalarda diskten yüklenir.
+
+transformers ve torch gerekir; onnx arka ucu için ayrıca optimum[onnxruntime] kurulmalıdır.
+Kurulu olmayan arka uçlar atlanır.
+
+Kullanım:
+    cd backend
+    python benchmarks/cikarim_karsilastirma_benchmark.py [--model <ad>] [--arka-uclar fp32,int8,onnx]
+        [--tekrar 3] [--is-parcacigi 4] [--ozet-modu normal] [--json sonuc.json]
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metin_temizleyici import temizle_metin  # noqa: E402
+from model_yukleyici import ARKA_UCLAR, FP32, VARSAYILAN_KLASOR, artefakt_klasoru, ozetleyici_olustur  # noqa: E402
+from toplu_ozetleyici import TopluOzetleyici  # noqa: E402
+
+VERI_DOSYASI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "veri", "ozet_ornekleri.json")
+VARSAYILAN_MODEL = "mrm8488/bert2bert_shared-turkish-summarization"
+_KELIME = re.compile(r"\w+")
+
+
+def uretim_parametreleri(model_adi, ozet_modu):
+    """app_anaconda.ozet_parametreleri ile aynı parametreler"""
+    if ozet_modu == "super":
+        parametreler = {"max_length": 75, "min_length": 20, "do_sample": False}
+    else:
+        parametreler = {"max_length": 150, "min_length": 30, "do_sample": False}
+    ad = model_adi.lower()
+    if "bert2bert" in ad:
+        parametreler["num_beams"] = 4
+    elif "mt5" in ad or "mbart" in ad:
+        parametreler["num_beams"] = 4
+        parametreler["length_penalty"] = 2.0
+    return parametreler
+
+
+def kelimeler(metin):
+    """ROUGE için Türkçe büyük/küçük harf duyarsız kelime listesi"""
+    return _KELIME.findall(metin.replace("I", "ı").replace("İ", "i").lower())
+
+
+def _ngramlar(kelime_listesi, n):
+    sayac = {}
+    for i in range(len(kelime_listesi) - n + 1):
+        ngram = tuple(kelime_listesi[i:i + n])
+        sayac[ngram] = sayac.get(ngram, 0) + 1
+    return sayac
+
+
+def _f1(ortak, aday_sayisi, referans_sayisi):
+    if not ortak or not aday_sayisi or not referans_sayisi:
+        return 0.0
+    kesinlik = ortak / aday_sayisi
+    duyarlilik = ortak / referans_sayisi
+    return 2 * kesinlik * duyarlilik / (kesinlik + duyarlilik)
+
+
+def rouge_n(aday, referans, n):
+    aday_ngram = _ngramlar(aday, n)
+    referans_ngram = _ngramlar(referans, n)
+    ortak = sum(min(adet, referans_ngram.get(ngram, 0)) for ngram, adet in aday_ngram.items())
+    return _f1(ortak, sum(aday_ngram.values()), sum(referans_ngram.values()))
+
+
+def rouge_l(aday, referans):
+    # En uzun ortak alt dizi (tek satırlık dinamik programlama)
+    onceki = [0] * (len(referans) + 1)
+    for kelime in aday:
+        simdiki = [0]
+        for j, referans_kelime in enumerate(referans):
+            simdiki.append(onceki[j] + 1 if kelime == referans_kelime else max(onceki[j + 1], simdiki[j]))
+        onceki = simdiki
+    return _f1(onceki[-1], len(aday), len(referans))
+
+
+def rouge(aday, referans):
+    """ROUGE-1, ROUGE-2 ve ROUGE-L F1 değerleri"""
+    aday, referans = kelimeler(aday), kelimeler(referans)
+    return {"rouge1": rouge_n(aday, referans, 1), "rouge2": rouge_n(aday, referans, 2), "rougeL": rouge_l(aday, referans)}
+
+
+def yuzdelik(degerler, oran):
+    sirali = sorted(degerler)
+    return sirali[min(len(sirali) - 1, max(0, math.ceil(oran * len(sirali)) - 1))]
+
+
+def klasor_boyutu_mb(klasor):
+    toplam = 0
+    for kok, _, dosyalar in os.walk(klasor):
+        toplam += sum(os.path.getsize(os.path.join(kok, dosya)) for dosya in dosyalar)
+    return toplam / 1024 / 1024
+
+
+def olc(arka_uc, argumanlar, metinler, parametreler):
+    baslangic = time.perf_counter()
+    summarizer = ozetleyici_olustur(argumanlar.model, arka_uc, is_parcacigi=argumanlar.is_parcacigi,
+                                    klasor=argumanlar.klasor)
+    yukleme = time.perf_counter() - baslangic
+
+    # Isınma: ilk çağrıdaki tek seferlik maliyetler (bellek ayırma, ORT graf hazırlığı) ölçüme girmesin
+    summarizer(metinler[0], truncation=True, **parametreler)
+
+    sureler = []
+    ozetler = []
+    for _ in range(argumanlar.tekrar):
+        ozetler = []
+        for metin in metinler:
+            baslangic = time.perf_counter()
+            cikti = summarizer(metin, truncation=True, **parametreler)
+            sureler.append(time.perf_counter() - baslangic)
+            ozetler.append(cikti[0]["summary_text"])
+
+    baslangic = time.perf_counter()
+    TopluOzetleyici(batch_boyutu=argumanlar.batch).ozetle(summarizer, metinler, **parametreler)
+    toplu = time.perf_counter() - baslangic
+
+    boyut = None
+    if arka_uc != FP32:
+        boyut = klasor_boyutu_mb(artefakt_klasoru(argumanlar.model, arka_uc, argumanlar.klasor))
+    return {
+        "arka_uc": arka_uc,
+        "yukleme_sn": yukleme,
+        "p50_sn": yuzdelik(sureler, 0.50),
+        "p95_sn": yuzdelik(sureler, 0.95),
+        "toplu_sn": toplu,
+        "boyut_mb": boyut,
+        "ozetler": ozetler,
+    }
+
+
+def main():
+    ayrac = argparse.ArgumentParser(description="fp32 / int8 / onnx özetleme kalite ve gecikme karşılaştırması")
+    ayrac.add_argument("--model", default=os.getenv("LLM_MODEL", VARSAYILAN_MODEL))
+    ayrac.add_argument("--arka-uclar", default=",".join(ARKA_UCLAR), help="Virgülle ayrılmış; fp32 referans olarak her zaman çalışır")
+    ayrac.add_argument("--tekrar", type=int, default=3, help="Gecikme ölçümünde kümenin kaç kez özetleneceği")
+    ayrac.add_argument("--batch", type=int, default=8)
+    ayrac.add_argument("--is-parcacigi", type=int, default=int(os.getenv("CIKARIM_IS_PARCACIGI", "0")))
+    ayrac.add_argument("--ozet-modu", choices=["normal", "super"], default="normal")
+    ayrac.add_argument("--klasor", default=os.getenv("MODEL_KLASORU", VARSAYILAN_KLASOR))
+    ayrac.add_argument("--json", help="Sonuçların (özetler dahil) yazılacağı dosya")
+    argumanlar = ayrac.parse_args()
+
+    with open(VERI_DOSYASI, encoding="utf-8") as dosya:
+        ornekler = json.load(dosya)
+    metinler = [temizle_metin(ornek["icerik"]) for ornek in ornekler]
+    parametreler = uretim_parametreleri(argumanlar.model, argumanlar.ozet_modu)
+
+    arka_uclar = [FP32] + [arka_uc for arka_uc in argumanlar.arka_uclar.split(",") if arka_uc and arka_uc != FP32]
+    sonuclar = []
+    for arka_uc in arka_uclar:
+        print(f"{arka_uc} ölçülüyor...", flush=True)
+        try:
+            sonuclar.append(olc(arka_uc, argumanlar, metinler, parametreler))
+        except ImportError as e:
+            print(f"  atlandı, gerekli paket kurulu değil: {e}")
+        except Exception as e:
+            if arka_uc == FP32:
+                raise
+            print(f"  atlandı, {arka_uc} arka ucu yüklenemedi: {e}")
+
+    if not sonuclar or sonuclar[0]["arka_uc"] != FP32:
+        sys.exit("fp32 referans modeli çalıştırılamadı")
+
+    referans = sonuclar[0]["ozetler"]
+    print(f"\nModel: {argumanlar.model}, {len(metinler)} haber, {argumanlar.tekrar} tekrar, "
+          f"iş parçacığı: {argumanlar.is_parcacigi or 'varsayılan'}")
+    print(f"{'arka uç':<8} {'yükleme':>9} {'p50':>8} {'p95':>8} {'toplu':>8} {'hız':>6} "
+          f"{'R-1':>6} {'R-2':>6} {'R-L':>6} {'boyut':>9}")
+    for sonuc in sonuclar:
+        puanlar = [rouge(aday, ref) for aday, ref in zip(sonuc["ozetler"], referans)]
+        for olcu in ("rouge1", "rouge2", "rougeL"):
+            sonuc[olcu] = sum(puan[olcu] for puan in puanlar) / len(puanlar)
+        sonuc["hizlanma"] = sonuclar[0]["p50_sn"] / sonuc["p50_sn"]
+        boyut = f"{sonuc['boyut_mb']:.0f} MB" if sonuc["boyut_mb"] is not None else "-"
+        print(f"{sonuc['arka_uc']:<8} {sonuc['yukleme_sn']:>8.1f}s {sonuc['p50_sn'] * 1000:>6.0f}ms "
+              f"{sonuc['p95_sn'] * 1000:>6.0f}ms {sonuc['toplu_sn']:>7.1f}s {sonuc['hizlanma']:>5.2f}x "
+              f"{sonuc['rouge1']:>6.3f} {sonuc['rouge2']:>6.3f} {sonuc['rougeL']:>6.3f} {boyut:>9}")
+
+    if argumanlar.json:
+        with open(argumanlar.json, "w", encoding="utf-8") as dosya:
+            json.dump({"model": argumanlar.model, "parametreler": parametreler,
+                       "basliklar": [ornek["baslik"] for ornek in ornekler], "sonuclar": sonuclar},
+                      dosya, ensure_ascii=False, indent=1)
+        print(f"\nSonuçlar yazıldı: {argumanlar.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Feed Çekme Benchmark'ı
+----------------------
+Eski seri yöntem (her URL için sırayla feedparser.parse(url)) ile
+eşzamanlı FeedCekici + feedparser.parse(bayt) yöntemini yerel bir RSS sunucusu
+üzerinde karşılaştırır. Sunucu her feed'e yapay gecikme ekler.
+
+Kullanım:
+    cd backend
+    python benchmarks/feed_cekme_benchmark.py [--feed 16] [--gecikme 0.2-0.6]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import feedparser  # noqa: E402
+
+from feed_cekici import FeedCekici  # noqa: E402
+from yerel_sunucu import YerelRSSSunucusu  # noqa: E402
+
+
+def feed_urlleri_olustur(sunucu, feed_sayisi, min_gecikme, max_gecikme):
+    """İki farklı host adı arasında paylaştırılmış, gecikmeli feed URL'leri üretir"""
+    rastgele = random.Random(42)
+    urller = []
+    for i in range(feed_sayisi):
+        host = "127.0.0.1" if i % 2 == 0 else "localhost"
+        gecikme = round(rastgele.uniform(min_gecikme, max_gecikme), 3)
+        urller.append(sunucu.url("ornek_feed.xml", gecikme=gecikme, host=host, feed=i))
+    return urller
+
+
+def seri_cek(urller):
+    """Uygulamanın eski davranışı: her feed sırayla indirilip ayrıştırılır"""
+    return [feedparser.parse(url) for url in urller]
+
+
+def eszamanli_cek(cekici, urller):
+    """Yeni davranış: tüm feed'ler birlikte indirilir, baytlar feedparser'a verilir"""
+    yanitlar = cekici.hepsini_cek(urller)
+    return [feedparser.parse(y.icerik, response_headers=y.basliklar) for y in yanitlar.values()]
+
+
+def main():
+    ayrac = argparse.ArgumentParser(description="Feed çekme benchmark'ı")
+    ayrac.add_argument("--feed", type=int, default=16, help="Feed sayısı")
+    ayrac.add_argument("--gecikme", default="0.2-0.6", help="Feed başına gecikme aralığı (sn), örn. 0.2-0.6")
+    ayrac.add_argument("--host-limiti", type=int, default=4)
+    ayrac.add_argument("--tekrar", type=int, default=2, help="Eşzamanlı ölçüm tekrar sayısı")
+    argumanlar = ayrac.parse_args()
+
+    min_gecikme, max_gecikme = (float(x) for x in argumanlar.gecikme.split("-"))
+
+    with YerelRSSSunucusu() as sunucu:
+        urller = feed_urlleri_olustur(sunucu, argumanlar.feed, min_gecikme, max_gecikme)
+        en_yavas = max(float(u.split("gecikme=")[1].split("&")[0]) for u in urller)
+        toplam = sum(float(u.split("gecikme=")[1].split("&")[0]) for u in urller)
+
+        baslangic = time.perf_counter()
+        seri_sonuclar = seri_cek(urller)
+        seri_sure = time.perf_counter() - baslangic
+        seri_baglanti = sunucu.sunucu.baglanti_sayisi
+
+        cekici = FeedCekici(isci_sayisi=argumanlar.feed, host_limiti=argumanlar.host_limiti)
+        sureler = []
+        for _ in range(argumanlar.tekrar):
+            sunucu.sayaclari_sifirla()
+            baslangic = time.perf_counter()
+            eszamanli_sonuclar = eszamanli_cek(cekici, urller)
+            sureler.append(time.perf_counter() - baslangic)
+        eszamanli_baglanti = sunucu.sunucu.baglanti_sayisi
+        cekici.kapat()
+
+    assert sum(len(f.entries) for f in seri_sonuclar) == sum(len(f.entries) for f in eszamanli_sonuclar)
+
+    print(f"Feed sayısı           : {argumanlar.feed} (host limiti: {argumanlar.host_limiti})")
+    print(f"Gecikmelerin toplamı  : {toplam:.2f} sn, en yavaş feed: {en_yavas:.2f} sn")
+    print(f"Seri                  : {seri_sure:.2f} sn ({seri_baglanti} bağlantı)")
+    print(f"Eşzamanlı (ilk tur)   : {sureler[0]:.2f} sn")
+    if len(sureler) > 1:
+        print(f"Eşzamanlı (sıcak)     : {min(sureler[1:]):.2f} sn "
+              f"(son turda {eszamanli_baglanti} yeni bağlantı, keep-alive ile yeniden kullanım)")
+    print(f"Hızlanma              : {seri_sure / min(sureler):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Feed Denetleme Benchmark'ı
+--------------------------
+rss_yonetici.py test-all'un eski seri yöntemi (her feed için feedparser.parse(url) ve ardından
+1 saniye bekleme) ile eşzamanlı feed_denetleyici.denetle'yi yerel bir RSS sunucusu üzerinde
+karşılaştırır. Feed'ler birkaç host adına dağıtılır; eşzamanlı denetimde aynı sunucuya aynı anda
+en fazla --host-limiti istek gider.
+
+Kullanım:
+    cd backend
+    python benchmarks/feed_denetleme_benchmark.py [--feed 24] [--gecikme 0.2] [--bekleme 1] [--host-limiti 2]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import feedparser  # noqa: E402
+
+from feed_denetleyici import OK, denetle, ozet  # noqa: E402
+from yerel_sunucu import YerelRSSSunucusu  # noqa: E402
+
+HOSTLAR = ("127.0.0.1", "localhost")
+
+
+def main():
+    ayrac = argparse.ArgumentParser(description="Seri ve eşzamanlı feed doğrulama karşılaştırması")
+    ayrac.add_argument("--feed", type=int, default=24)
+    ayrac.add_argument("--gecikme", type=float, default=0.2, help="Sunucunun feed başına yanıt gecikmesi (sn)")
+    ayrac.add_argument("--bekleme", type=float, default=1.0, help="Eski yöntemde feed'ler arası bekleme (sn)")
+    ayrac.add_argument("--host-limiti", type=int, default=2)
+    argumanlar = ayrac.parse_args()
+
+    with YerelRSSSunucusu() as sunucu:
+        urller = [sunucu.url("ornek_feed.xml", gecikme=argumanlar.gecikme, host=HOSTLAR[i % len(HOSTLAR)], feed=i)
+                  for i in range(argumanlar.feed)]
+
+        baslangic = time.perf_counter()
+        seri_gecerli = 0
+        for url in urller:
+            feed = feedparser.parse(url)
+            seri_gecerli += 1 if feed.entries else 0
+            time.sleep(argumanlar.bekleme)
+        seri_sure = time.perf_counter() - baslangic
+
+        baslangic = time.perf_counter()
+        sonuclar = [sonuc for sonuc, _ in denetle(urller, host_limiti=argumanlar.host_limiti).values()]
+        eszamanli_sure = time.perf_counter() - baslangic
+
+    sayilar = ozet(sonuclar)
+    print(f"{argumanlar.feed} feed, {len(HOSTLAR)} host, sunucu gecikmesi {argumanlar.gecikme:g} sn")
+    print(f"Seri (+{argumanlar.bekleme:g} sn bekleme)      : {seri_sure:6.2f} sn ({seri_gecerli} geçerli feed)")
+    print(f"Eşzamanlı (host başına {argumanlar.host_limiti}) : {eszamanli_sure:6.2f} sn ({sayilar[OK]} geçerli feed)")
+    print(f"Hızlanma                  : {seri_sure / eszamanli_sure:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
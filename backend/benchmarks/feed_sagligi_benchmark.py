@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Feed Sağlığı Senaryosu
+----------------------
+Yerel RSS sunucusunda sağlam feed'lerin yanına takılan, veriyi damlatan, hata kodu döndüren ve
+RSS olmayan içerik veren feed'ler koyar ve uygulamanın çekim yolunu (FeedCekici + FeedSagligi)
+birkaç tur çalıştırır. Her turda:
+  - turun süresi (zaman aşımları sayesinde takılan sunucu turu süresiz bekletmemeli)
+  - her feed'in sonucu ve devre durumu (kapali / acik / yari_acik)
+raporlanır. Art arda hata veren feed'lerin devresi açılır ve sonraki turlarda bu feed'lere istek
+gönderilmez; bekleme süresi dolunca tek bir deneme isteği yapılır.
+
+Kullanım:
+    cd backend
+    python benchmarks/feed_sagligi_benchmark.py [--tur 6] [--zaman-asimi 2] [--hata-esigi 2] [--bekleme 3]
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import feedparser  # noqa: E402
+
+from feed_cekici import FeedCekici  # noqa: E402
+from feed_sagligi import FeedSagligi  # noqa: E402
+from yerel_sunucu import YerelRSSSunucusu  # noqa: E402
+
+
+def senaryo_urlleri(sunucu, takilma_sn):
+    return {
+        "saglam": sunucu.url("ornek_feed.xml", gecikme=0.05),
+        "takilan": sunucu.url("ornek_feed.xml", gecikme=takilma_sn),
+        "damlatan": sunucu.url("ornek_feed.xml", damla=0.5),
+        "503": sunucu.url("ornek_feed.xml", durum=503),
+        "rss_degil": sunucu.url("ozet_ornekleri.json"),
+    }
+
+
+def tur_calistir(cekici, saglik, urller):
+    """Uygulamadaki gibi: devresi açık feed'ler atlanır, kalanlar çekilip sonuçları kaydedilir"""
+    sonuclar = {}
+    cekilecek = []
+    for ad, url in urller.items():
+        if saglik.bekleme_bitisi(url) is not None:
+            sonuclar[ad] = "atlandı"
+        else:
+            cekilecek.append(url)
+    yanitlar = cekici.hepsini_cek(cekilecek)
+    for ad, url in urller.items():
+        if url not in yanitlar:
+            continue
+        yanit = yanitlar[url]
+        hata = None if yanit.basarili else (yanit.hata or f"HTTP {yanit.durum_kodu}")
+        if hata is None:
+            feed = feedparser.parse(yanit.icerik, response_headers=yanit.basliklar)
+            if not feed.entries:
+                hata = "ayrıştırılamadı"
+        if hata is None:
+            saglik.basari(url, yanit.sure)
+            sonuclar[ad] = f"ok {yanit.sure:.1f}s"
+        else:
+            saglik.hata(url, hata, yanit.sure)
+            sonuclar[ad] = f"hata {yanit.sure:.1f}s"
+    return sonuclar
+
+
+def main():
+    ayrac = argparse.ArgumentParser(description="Zaman aşımı ve devre kesici senaryosu")
+    ayrac.add_argument("--tur", type=int, default=6)
+    ayrac.add_argument("--zaman-asimi", type=float, default=2.0, help="Bağlantı/okuma ve toplam süre sınırı (sn)")
+    ayrac.add_argument("--hata-esigi", type=int, default=2)
+    ayrac.add_argument("--bekleme", type=float, default=3.0, help="Devre açıldıktan sonraki ilk bekleme (sn)")
+    ayrac.add_argument("--tur-arasi", type=float, default=1.0)
+    argumanlar = ayrac.parse_args()
+
+    with tempfile.TemporaryDirectory() as klasor, YerelRSSSunucusu() as sunucu:
+        veritabani = os.path.join(klasor, "saglik.db")
+
+        def baglanti():
+            conn = sqlite3.connect(veritabani)
+            conn.row_factory = sqlite3.Row
+            return conn
+
+        saglik = FeedSagligi(baglanti, hata_esigi=argumanlar.hata_esigi, bekleme_sn=argumanlar.bekleme)
+        saglik.tablo_olustur()
+        cekici = FeedCekici(zaman_asimi=(argumanlar.zaman_asimi, argumanlar.zaman_asimi),
+                            toplam_zaman_asimi=argumanlar.zaman_asimi)
+        urller = senaryo_urlleri(sunucu, takilma_sn=argumanlar.zaman_asimi * 10)
+
+        print(f"Zaman aşımı {argumanlar.zaman_asimi:g} sn, devre {argumanlar.hata_esigi} hatada açılır, "
+              f"ilk bekleme {argumanlar.bekleme:g} sn")
+        print(f"{'tur':>3} {'süre':>6}  " + "  ".join(f"{ad:<22}" for ad in urller))
+        for tur in range(1, argumanlar.tur + 1):
+            baslangic = time.perf_counter()
+            sonuclar = tur_calistir(cekici, saglik, urller)
+            sure = time.perf_counter() - baslangic
+            devreler = {kayit["url"]: kayit["devre"] for kayit in saglik.rapor(list(urller.values()))}
+            print(f"{tur:>3} {sure:>5.1f}s  " + "  ".join(
+                f"{sonuclar[ad] + ' [' + devreler[url] + ']':<22}" for ad, url in urller.items()))
+            time.sleep(argumanlar.tur_arasi)
+        cekici.kapat()
+
+        print("\nSon durum:")
+        for kayit in saglik.rapor(list(urller.values())):
+            ad = next(ad for ad, url in urller.items() if url == kayit["url"])
+            print(f"  {ad:<10} devre={kayit['devre']:<10} hata={kayit['hata_sayisi']}/{kayit['cekim_sayisi']} "
+                  f"ort. gecikme={kayit['ortalama_gecikme_sn']} sn, son hata: {kayit['son_hata'] or '-'}")
+
+
+if __name__ == "__main__":
+    main()
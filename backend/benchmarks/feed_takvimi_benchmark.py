@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Feed Takvimi Benchmark'ı
+------------------------
+Farklı yayın hızlarındaki sahte feed'ler üzerinde (Poisson süreciyle yayın) sabit 30 dakikalık
+yenileme döngüsünü ve uyarlanan feed takvimini (FeedZamanlayici) simüle edilmiş zamanla karşılaştırır.
+Her feed'de yalnızca son DOYMA_ESIGI haber görünür; iki çekim arasında daha fazlası yayınlandıysa
+eskileri kaçırılır. Feed başına ve toplamda raporlananlar:
+  - saatlik çekim sayısı ve yeni haber getirmeyen (boşa) çekim oranı
+  - tazelik gecikmesi: yayından çekime geçen sürenin p50/p95 değeri
+  - kaçırılan haber sayısı
+
+Kullanım:
+    cd backend
+    python benchmarks/feed_takvimi_benchmark.py [--saat 48] [--hizlar 60,12,2,0.25,0.04] [--tohum 1]
+"""
+
+import argparse
+import math
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from feed_zamanlayici import DOYMA_ESIGI, VARSAYILAN_ARALIK_SN, FeedZamanlayici  # noqa: E402
+
+
+def yayinlari_uret(saatlik_hiz, sure_sn, rastgele):
+    """Poisson süreciyle yayın zamanları (simülasyon başından itibaren saniye)"""
+    zamanlar = []
+    zaman = 0.0
+    while saatlik_hiz > 0:
+        zaman += rastgele.expovariate(saatlik_hiz / 3600)
+        if zaman >= sure_sn:
+            break
+        zamanlar.append(zaman)
+    return zamanlar
+
+
+def yuzdelik(degerler, oran):
+    if not degerler:
+        return None
+    sirali = sorted(degerler)
+    return sirali[min(len(sirali) - 1, max(0, math.ceil(oran * len(sirali)) - 1))]
+
+
+def cekim(yayinlar, son_gorulen, simdi):
+    """simdi'de çekilen feed'de görünen yeni haberler ve kaçırılanlar"""
+    yeni = [zaman for zaman in yayinlar if son_gorulen < zaman <= simdi]
+    gorunen = yeni[-DOYMA_ESIGI:]
+    return gorunen, len(yeni) - len(gorunen)
+
+
+def simule_et(yayinlar, sure_sn, sonraki):
+    """sonraki(url, simdi, yeni_yayinlar) bir sonraki çekim zamanını döndürür; feed başına istatistik"""
+    sonuclar = {}
+    for url, zamanlar in yayinlar.items():
+        sonuclar[url] = {"cekim": 0, "bos": 0, "gecikmeler": [], "kacirilan": 0}
+    bekleyen = {url: 0.0 for url in yayinlar}
+    son_gorulen = {url: -1.0 for url in yayinlar}
+    # Başlangıçta feed'de zaten bulunan haberler sayılmaz
+    for url in yayinlar:
+        yayinlar[url] = [zaman for zaman in yayinlar[url] if zaman > 0]
+    while bekleyen:
+        url = min(bekleyen, key=bekleyen.get)
+        simdi = bekleyen.pop(url)
+        if simdi >= sure_sn:
+            continue
+        gorunen, kacirilan = cekim(yayinlar[url], son_gorulen[url], simdi)
+        son_gorulen[url] = simdi
+        sonuc = sonuclar[url]
+        sonuc["cekim"] += 1
+        sonuc["bos"] += 0 if gorunen else 1
+        sonuc["gecikmeler"].extend(simdi - zaman for zaman in gorunen)
+        sonuc["kacirilan"] += kacirilan
+        bekleyen[url] = sonraki(url, simdi, gorunen)
+    return sonuclar
+
+
+def satir_yaz(url, ad, sonuc, saat):
+    def dakika(deger):
+        return f"{deger / 60:.1f} dk" if deger is not None else "-"
+
+    bos_orani = sonuc["bos"] / sonuc["cekim"] if sonuc["cekim"] else 0.0
+    print(f"{url:<18} {ad:<9} {sonuc['cekim'] / saat:>8.2f} {bos_orani:>6.0%} "
+          f"{dakika(yuzdelik(sonuc['gecikmeler'], 0.5)):>12} {dakika(yuzdelik(sonuc['gecikmeler'], 0.95)):>12} "
+          f"{sonuc['kacirilan']:>9}")
+
+
+def main():
+    ayrac = argparse.ArgumentParser(description="Sabit döngü ile uyarlanan feed takvimi karşılaştırması")
+    ayrac.add_argument("--saat", type=float, default=48.0, help="Simüle edilen süre")
+    ayrac.add_argument("--hizlar", default="60,12,2,0.25,0.04", help="Feed'lerin saatlik yayın hızları")
+    ayrac.add_argument("--min-aralik", type=float, default=120.0)
+    ayrac.add_argument("--maks-aralik", type=float, default=21600.0)
+    ayrac.add_argument("--tohum", type=int, default=1)
+    argumanlar = ayrac.parse_args()
+
+    sure_sn = argumanlar.saat * 3600
+    rastgele = random.Random(argumanlar.tohum)
+    hizlar = {f"feed-{hiz}/saat": float(hiz) for hiz in argumanlar.hizlar.split(",")}
+    yayinlar = {url: yayinlari_uret(hiz, sure_sn, rastgele) for url, hiz in hizlar.items()}
+
+    sabit = simule_et({url: list(zamanlar) for url, zamanlar in yayinlar.items()}, sure_sn,
+                      lambda url, simdi, gorunen: simdi + VARSAYILAN_ARALIK_SN)
+
+    with tempfile.TemporaryDirectory() as klasor:
+        veritabani = os.path.join(klasor, "takvim.db")
+
+        def baglanti():
+            conn = sqlite3.connect(veritabani)
+            conn.row_factory = sqlite3.Row
+            return conn
+
+        zamanlayici = FeedZamanlayici(baglanti, argumanlar.min_aralik, argumanlar.maks_aralik,
+                                      rastgele=random.Random(argumanlar.tohum))
+        zamanlayici.tablo_olustur()
+        zamanlayici.esitle(hizlar)
+        # Simülasyon zamanı gerçek zamana kaydırılır; takvim yayın zamanlarını epoch olarak görür
+        t0 = 1_700_000_000.0
+
+        def sonraki(url, simdi, gorunen):
+            durum = zamanlayici.kaydet(url, [t0 + zaman for zaman in gorunen], simdi=t0 + simdi)
+            return durum["sonraki_zaman"] - t0
+
+        uyarlanan = simule_et({url: list(zamanlar) for url, zamanlar in yayinlar.items()}, sure_sn, sonraki)
+
+    print(f"{len(hizlar)} feed, {argumanlar.saat:g} saat simülasyon; feed başına en fazla {DOYMA_ESIGI} haber görünür")
+    print(f"{'feed':<18} {'takvim':<9} {'çekim/sa':>8} {'boşa':>6} {'p50 gecikme':>12} {'p95 gecikme':>12} {'kaçırılan':>9}")
+    toplamlar = {}
+    for url in hizlar:
+        for ad, sonuclar in (("sabit", sabit), ("uyarlanan", uyarlanan)):
+            sonuc = sonuclar[url]
+            toplam = toplamlar.setdefault(ad, {"cekim": 0, "bos": 0, "gecikmeler": [], "kacirilan": 0})
+            for anahtar in ("cekim", "bos", "kacirilan"):
+                toplam[anahtar] += sonuc[anahtar]
+            toplam["gecikmeler"].extend(sonuc["gecikmeler"])
+            satir_yaz(url, ad, sonuc, argumanlar.saat)
+    print("-" * 80)
+    for ad, toplam in toplamlar.items():
+        satir_yaz("toplam", ad, toplam, argumanlar.saat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Haber Listesi Sorgu Benchmark'ı
+-------------------------------
+Tablo büyüdükçe /api/haberler sorgularının gecikmesini ölçer. Tablo kademeli olarak
+(varsayılan 10 bin → 100 bin → 1 milyon satır) doldurulur ve her kademede ölçülür.
+
+  eski:    SELECT * ... ORDER BY tarih DESC LIMIT n (indekssiz, icerik dahil)
+  yeni:    haber_sorgulari.haberleri_listele (indeksli, icerik hariç)
+  derin:   50. sayfa; eski OFFSET ile, yeni imleçle
+
+Kullanım:
+    cd backend
+    python benchmarks/haber_listesi_benchmark.py [--kademeler 10000,100000,1000000] [--tekrar 20]
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from haber_sorgulari import haberleri_listele, indeksleri_olustur  # noqa: E402
+from veritabani import PRAGMALAR  # noqa: E402
+
+SEMA = '''
+CREATE TABLE IF NOT EXISTS haberler (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    baslik TEXT NOT NULL,
+    ozet TEXT NOT NULL,
+    icerik TEXT NOT NULL,
+    kategori TEXT NOT NULL,
+    kaynak TEXT NOT NULL,
+    url TEXT NOT NULL UNIQUE,
+    resim_url TEXT,
+    tarih TIMESTAMP NOT NULL,
+    olusturulma_tarihi TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    ozet_durumu TEXT NOT NULL DEFAULT 'hazir',
+    kume_id INTEGER
+)
+'''
+KATEGORILER = ["gundem", "spor", "ekonomi", "teknoloji", "magazin", "dunya", "saglik", "kultur"]
+ICERIK = "<p>" + "Örnek haber içeriği cümlesi. " * 40 + "</p>"
+SAYFA = 20
+DERIN_SAYFA = 50
+
+
+def doldur(conn, baslangic, bitis):
+    """[baslangic, bitis) aralığında rastgele tarihli haberler ekler"""
+    rastgele = random.Random(baslangic)
+    temel = datetime(2025, 1, 1)
+    for parca_baslangic in range(baslangic, bitis, 20000):
+        satirlar = []
+        for no in range(parca_baslangic, min(bitis, parca_baslangic + 20000)):
+            tarih = temel + timedelta(seconds=rastgele.randrange(365 * 24 * 3600))
+            satirlar.append((f"Başlık {no}", "Kısa özet metni.", ICERIK, KATEGORILER[no % len(KATEGORILER)],
+                             "Kaynak", f"https://ornek.example/haber/{no}", None, tarih.strftime("%Y-%m-%d %H:%M:%S")))
+        conn.executemany('INSERT INTO haberler (baslik, ozet, icerik, kategori, kaynak, url, resim_url, tarih) '
+                         'VALUES (?, ?, ?, ?, ?, ?, ?, ?)', satirlar)
+        conn.commit()
+
+
+def olc(fonksiyon, tekrar):
+    """Fonksiyonu tekrar tekrar çalıştırıp medyan süreyi (ms) döndürür"""
+    sureler = []
+    for _ in range(tekrar):
+        t0 = time.perf_counter()
+        fonksiyon()
+        sureler.append(time.perf_counter() - t0)
+    return statistics.median(sureler) * 1000
+
+
+def eski_sayfa(conn, kategori, offset=0):
+    conn.execute('SELECT * FROM haberler NOT INDEXED WHERE kategori = ? ORDER BY tarih DESC LIMIT ? OFFSET ?',
+                 (kategori, SAYFA, offset)).fetchall()
+
+
+def yeni_derin_sayfa(conn, kategori):
+    imlec = None
+    for _ in range(DERIN_SAYFA):
+        _, imlec = haberleri_listele(conn, kategori, SAYFA, imlec)
+
+
+def main():
+    ayrac = argparse.ArgumentParser(description="Haber listesi sorgu benchmark'ı")
+    ayrac.add_argument("--kademeler", default="10000,100000,1000000")
+    ayrac.add_argument("--tekrar", type=int, default=20)
+    argumanlar = ayrac.parse_args()
+    kademeler = [int(k) for k in argumanlar.kademeler.split(",")]
+
+    with tempfile.TemporaryDirectory() as dizin:
+        conn = sqlite3.connect(os.path.join(dizin, "haberler.db"))
+        conn.row_factory = sqlite3.Row
+        for pragma in PRAGMALAR:
+            conn.execute(pragma)
+        conn.execute(SEMA)
+        indeksleri_olustur(conn)
+
+        print(f"{'satır':>9} | {'eski ilk sayfa':>14} | {'yeni ilk sayfa':>14} | {'yeni tümü':>9} |"
+              f" {'eski 50. sayfa':>14} | {'yeni 50 sayfa imleçle':>21}")
+        mevcut = 0
+        for hedef in kademeler:
+            t0 = time.perf_counter()
+            doldur(conn, mevcut, hedef)
+            mevcut = hedef
+            conn.execute("ANALYZE")
+            print(f"  ({hedef} satıra dolduruldu, {time.perf_counter() - t0:.1f} sn)", file=sys.stderr)
+
+            # Eski sorgular tam tarama yaptığı için büyük tablolarda daha az tekrar edilir
+            eski_tekrar = max(3, argumanlar.tekrar // 4)
+            eski = olc(lambda: eski_sayfa(conn, "spor"), eski_tekrar)
+            yeni = olc(lambda: haberleri_listele(conn, "spor", SAYFA), argumanlar.tekrar)
+            yeni_tum = olc(lambda: haberleri_listele(conn, None, 50), argumanlar.tekrar)
+            eski_derin = olc(lambda: eski_sayfa(conn, "spor", SAYFA * (DERIN_SAYFA - 1)), eski_tekrar)
+            yeni_derin = olc(lambda: yeni_derin_sayfa(conn, "spor"), max(3, argumanlar.tekrar // 4))
+            print(f"{hedef:>9} | {eski:>11.2f} ms | {yeni:>11.3f} ms | {yeni_tum:>6.3f} ms |"
+                  f" {eski_derin:>11.2f} ms | {yeni_derin:>18.2f} ms")
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
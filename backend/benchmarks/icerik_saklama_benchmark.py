@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+İçerik Saklama Benchmark'ı
+--------------------------
+Bir yıllık sentetik haber (varsayılan günde 250 haber, ~2-5 KB feed HTML'i) üretir ve üç
+veritabanı düzenini karşılaştırır:
+  eski:     icerik sütunu haberler satırında, sıkıştırılmamış
+  yeni:     icerik haber_icerikleri tablosunda zlib ile sıkıştırılmış (uygulamanın açılıştaki
+            taşıma adımıyla dönüştürülür, ardından auto_vacuum=INCREMENTAL için VACUUM)
+  saklama:  yeni düzen + saklama politikası (varsayılan 90 gün, spor 30 gün), arşivleme ve
+            artımlı vacuum
+Her düzen için dosya boyutu ve liste sorgularının (haber_sorgulari.haberleri_listele) medyan
+gecikmesi raporlanır. Sorgular her ölçümde yeni açılan bağlantıyla çalışır (soğuk sayfa önbelleği);
+işletim sisteminin dosya önbelleği sıcaktır.
+
+Kullanım:
+    cd backend
+    python benchmarks/icerik_saklama_benchmark.py [--gunluk 250] [--tekrar 30] [--saklama-gun 90]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from haber_icerikleri import HaberIcerikleri  # noqa: E402
+from haber_saklama import HaberSaklayici  # noqa: E402
+from haber_sorgulari import haberleri_listele, indeksleri_olustur  # noqa: E402
+from veritabani import PRAGMALAR, BaglantiHavuzu  # noqa: E402
+
+SUTUNLAR = '''
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    baslik TEXT NOT NULL,
+    ozet TEXT NOT NULL,
+    {icerik}kategori TEXT NOT NULL,
+    kaynak TEXT NOT NULL,
+    url TEXT NOT NULL UNIQUE,
+    resim_url TEXT,
+    tarih TIMESTAMP NOT NULL,
+    olusturulma_tarihi TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    ozet_durumu TEXT NOT NULL DEFAULT 'hazir',
+    kume_id INTEGER
+'''
+KATEGORILER = ["gundem", "spor", "ekonomi", "teknoloji", "magazin", "dunya", "saglik", "kultur"]
+KELIMELER = ("merkez bankası faiz kararı enflasyon piyasalar borsa dolar euro meclis bakanlık açıklama "
+             "takım maç gol teknik direktör transfer deprem yağmur sıcaklık hastane aşı öğrenci okul "
+             "üniversite sınav teknoloji yapay zeka telefon şirket yatırım proje belediye ulaşım metro "
+             "köprü festival konser sergi müze film dizi seçim aday anket yüzde milyon milyar lira "
+             "istanbul ankara izmir dünya avrupa amerika görüşme zirve anlaşma kriz büyüme ihracat").split()
+SAYFA = 50
+DERIN_SAYFA = 20
+SIMDI = datetime(2025, 12, 31, 23, 59)
+
+
+def icerik_uret(rastgele, no):
+    """Feed'lerdeki gibi paragraflar, bağlantı ve resim içeren HTML içerik"""
+    paragraflar = []
+    for _ in range(rastgele.randint(3, 7)):
+        cumleler = []
+        for _ in range(rastgele.randint(2, 4)):
+            cumle = " ".join(rastgele.choice(KELIMELER) for _ in range(rastgele.randint(8, 18)))
+            cumleler.append(cumle.capitalize() + ".")
+        paragraflar.append("<p>" + " ".join(cumleler) + "</p>")
+    return (f'<img src="https://cdn.ornek.example/resim/{no}.jpg" alt="" width="640" height="360"/>'
+            + "".join(paragraflar)
+            + f'<p><a href="https://ornek.example/haber/{no}?utm_source=rss&amp;utm_medium=feed">Devamı için tıklayın</a></p>')
+
+
+def eski_db_olustur(dosya, gunluk):
+    """Bir yıllık haberle eski düzende (içerik satırda) veritabanı oluşturur; haber sayısını döndürür"""
+    conn = sqlite3.connect(dosya)
+    for pragma in PRAGMALAR:
+        conn.execute(pragma)
+    conn.execute(f"CREATE TABLE haberler ({SUTUNLAR.format(icerik='icerik TEXT NOT NULL, ')})")
+    indeksleri_olustur(conn)
+    rastgele = random.Random(42)
+    no = 0
+    for gun in range(365, 0, -1):
+        satirlar = []
+        for _ in range(gunluk):
+            no += 1
+            tarih = SIMDI - timedelta(days=gun, seconds=rastgele.randrange(24 * 3600))
+            baslik = " ".join(rastgele.choice(KELIMELER) for _ in range(8)).capitalize()
+            satirlar.append((baslik, baslik + " özet cümlesi.", icerik_uret(rastgele, no), rastgele.choice(KATEGORILER),
+                             "Kaynak", f"https://ornek.example/haber/{no}", f"https://cdn.ornek.example/resim/{no}.jpg",
+                             str(tarih.replace(microsecond=0)), no))
+        conn.executemany('INSERT INTO haberler (baslik, ozet, icerik, kategori, kaynak, url, resim_url, tarih, kume_id) '
+                         'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', satirlar)
+        conn.commit()
+    conn.execute("ANALYZE")
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    conn.close()
+    return no
+
+
+def yeni_duzene_tasi(dosya):
+    """app_anaconda.icerik_sutununu_tasi ve veritabani_bakimi'nin arka plandaki dönüşümüyle aynı adımlar"""
+    havuz = BaglantiHavuzu(dosya)
+    icerikler = HaberIcerikleri(havuz.al)
+    icerikler.tablo_olustur()
+    son_id = 0
+    while True:
+        with havuz.yazma_islemi() as conn:
+            adet, son_id = icerikler.eski_sutunu_tasi(conn, son_id)
+        if not adet:
+            break
+    conn = havuz.al()
+    conn.execute('BEGIN IMMEDIATE')
+    conn.execute(f"CREATE TABLE haberler_yeni ({SUTUNLAR.format(icerik='')})")
+    sutunlar = ", ".join(row['name'] for row in conn.execute('PRAGMA table_info(haberler_yeni)'))
+    conn.execute(f'INSERT INTO haberler_yeni ({sutunlar}) SELECT {sutunlar} FROM haberler')
+    conn.execute('DROP TABLE haberler')
+    conn.execute('ALTER TABLE haberler_yeni RENAME TO haberler')
+    indeksleri_olustur(conn)
+    conn.commit()
+    conn.execute('PRAGMA auto_vacuum = INCREMENTAL')
+    conn.execute('VACUUM')
+    conn.execute("ANALYZE")
+    conn.close()
+    return havuz, icerikler
+
+
+def boyut_mb(dosya):
+    """Checkpoint sonrası veritabanı ve WAL dosyalarının toplam boyutu (MB)"""
+    conn = sqlite3.connect(dosya)
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    conn.close()
+    return sum(os.path.getsize(dosya + ek) for ek in ("", "-wal") if os.path.exists(dosya + ek)) / 1024 / 1024
+
+
+def baglan(dosya):
+    conn = sqlite3.connect(dosya)
+    conn.row_factory = sqlite3.Row
+    for pragma in PRAGMALAR:
+        conn.execute(pragma)
+    return conn
+
+
+def gecikmeler(dosya, tekrar, eski=False):
+    """Liste sorgularının medyan gecikmesi (ms); her ölçüm yeni bağlantıyla (soğuk sayfa önbelleği)"""
+    senaryolar = {
+        "ilk sayfa (kategori)": lambda conn, kategori: haberleri_listele(conn, kategori, SAYFA),
+        "ilk sayfa (tümü, tekil)": lambda conn, kategori: haberleri_listele(conn, None, SAYFA, tekil=True),
+        f"{DERIN_SAYFA} sayfa imleçle": derin_sayfa,
+        "ilk sayfa + icerik": eski_icerikli_sayfa if eski else lambda conn, kategori: haberleri_listele(
+            conn, kategori, SAYFA, alanlar=("id", "tarih", "baslik", "icerik")),
+    }
+    rastgele = random.Random(7)
+    sonuclar = {}
+    for ad, fonksiyon in senaryolar.items():
+        sureler = []
+        for _ in range(tekrar):
+            conn = baglan(dosya)
+            kategori = rastgele.choice(KATEGORILER)
+            baslangic = time.perf_counter()
+            fonksiyon(conn, kategori)
+            sureler.append((time.perf_counter() - baslangic) * 1000)
+            conn.close()
+        sonuclar[ad] = statistics.median(sureler)
+    return sonuclar
+
+
+def eski_icerikli_sayfa(conn, kategori):
+    # Eski düzende içerik aynı satırdan okunur
+    conn.execute('SELECT id, tarih, baslik, icerik FROM haberler WHERE kategori = ? ORDER BY tarih DESC, id DESC LIMIT ?',
+                 (kategori, SAYFA + 1)).fetchall()
+
+
+def derin_sayfa(conn, kategori):
+    imlec = None
+    for _ in range(DERIN_SAYFA):
+        _, imlec = haberleri_listele(conn, kategori, SAYFA, imlec)
+
+
+def main():
+    ayrac = argparse.ArgumentParser(description="Sıkıştırılmış içerik ve saklama politikası benchmark'ı")
+    ayrac.add_argument("--gunluk", type=int, default=250, help="Günlük haber sayısı (365 gün üretilir)")
+    ayrac.add_argument("--tekrar", type=int, default=30)
+    ayrac.add_argument("--saklama-gun", type=float, default=90)
+    ayrac.add_argument("--spor-gun", type=float, default=30)
+    argumanlar = ayrac.parse_args()
+
+    with tempfile.TemporaryDirectory() as klasor:
+        eski = os.path.join(klasor, "eski.db")
+        yeni = os.path.join(klasor, "yeni.db")
+
+        t0 = time.perf_counter()
+        toplam = eski_db_olustur(eski, argumanlar.gunluk)
+        print(f"{toplam} haber üretildi ({time.perf_counter() - t0:.1f} sn)", file=sys.stderr)
+        shutil.copy(eski, yeni)
+
+        t0 = time.perf_counter()
+        havuz, icerikler = yeni_duzene_tasi(yeni)
+        tasima_suresi = time.perf_counter() - t0
+        istatistik = icerikler.istatistikler()
+
+        olcumler = [("eski", toplam, boyut_mb(eski), gecikmeler(eski, argumanlar.tekrar, eski=True))]
+        olcumler.append(("yeni", toplam, boyut_mb(yeni), gecikmeler(yeni, argumanlar.tekrar)))
+
+        saklayici = HaberSaklayici(havuz, varsayilan_gun=argumanlar.saklama_gun,
+                                   kategori_gunleri={"spor": argumanlar.spor_gun},
+                                   arsiv_klasoru=os.path.join(klasor, "arsiv"), silme_kancalari=[icerikler.sil])
+        sonuc = saklayici.uygula(simdi=SIMDI)
+        arsiv_mb = sum(os.path.getsize(os.path.join(klasor, "arsiv", ad))
+                       for ad in os.listdir(os.path.join(klasor, "arsiv"))) / 1024 / 1024
+        kalan = toplam - sonuc["silinen"]
+        olcumler.append(("saklama", kalan, boyut_mb(yeni), gecikmeler(yeni, argumanlar.tekrar)))
+        havuz.kapat()
+
+        print(f"\nİçerik: {istatistik['ham_mb']} MB ham → {istatistik['sikistirilmis_mb']} MB zlib "
+              f"(oran {istatistik['oran']}), taşıma + VACUUM {tasima_suresi:.1f} sn")
+        print(f"Saklama ({argumanlar.saklama_gun:g} gün, spor {argumanlar.spor_gun:g} gün): {sonuc['silinen']} haber silindi "
+              f"ve arşivlendi ({arsiv_mb:.1f} MB .ndjson.gz), {sonuc['iade_edilen_sayfa']} sayfa iade edildi, "
+              f"{sonuc['sure_sn']} sn")
+        senaryo_adlari = list(olcumler[0][3])
+        print(f"\n{'düzen':<8} {'haber':>7} {'boyut (MB)':>11} " + " ".join(f"{ad:>24}" for ad in senaryo_adlari))
+        for ad, haber, boyut, sureler in olcumler:
+            print(f"{ad:<8} {haber:>7} {boyut:>11.1f} " + " ".join(f"{sureler[s]:>21.2f} ms" for s in senaryo_adlari))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Yakın Tekrar Kümeleme Benchmark'ı
+---------------------------------
+Tekrar oranı bilinen yapay bir haber kümesi üretir: her özgün haberin 0-4 arası kopyası
+farklı kaynaklarca, başlık değiştirilerek, kelimelerin bir kısmı değiştirilerek ve sonuna
+kaynak satırı eklenerek yayınlanır. Haberler 200'lük batch'ler halinde HaberKumeleyici'ye
+verilir ve şunlar ölçülür:
+  - kesinlik: bir kümeye bağlanan kopyalardan doğru habere bağlananların oranı
+  - duyarlılık: gerçek kopyalardan bir kümeye bağlananların oranı
+  - özetlenecek haber sayısı (küme temsilcileri) ile gereken en az sayı (özgün haberler)
+  - haber başına kümeleme süresi
+
+Kullanım:
+    cd backend
+    python benchmarks/kumeleme_benchmark.py [--ozgun 2000] [--degisim 0.08]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from haber_kumeleme import HaberKumeleyici  # noqa: E402
+from veritabani import BaglantiHavuzu  # noqa: E402
+
+KELIMELER = ("bakan açıklama yaptı ekonomi büyüme enflasyon merkez banka faiz karar toplantı meclis "
+             "seçim parti lider deprem afad bölge hasar yardım takım maç gol teknik direktör transfer "
+             "sezon lig kupa şirket yatırım ihracat ithalat döviz borsa endeks yükseliş düşüş hava "
+             "yağmur kar fırtına uyarı meteoroloji okul öğrenci sınav üniversite proje köprü yol trafik "
+             "hastane sağlık aşı doktor vali belediye başkan vatandaş il ilçe polis operasyon gözaltı "
+             "mahkeme dava karar savcı iddia rapor yüzde milyon milyar lira dolar avro yıl ay hafta gün").split()
+KAYNAK_SATIRLARI = ["Kaynak: AA", "Kaynak: DHA", "Kaynak: İHA", "Haberin devamı için tıklayınız",
+                    "Fotoğraf: Arşiv", ""]
+BATCH = 200
+
+
+def ozgun_haber(rastgele):
+    uzunluk = rastgele.randint(40, 120)
+    metin = " ".join(rastgele.choice(KELIMELER) for _ in range(uzunluk))
+    baslik = " ".join(rastgele.choice(KELIMELER) for _ in range(7)).capitalize()
+    return baslik, metin
+
+
+def kopya(rastgele, baslik, metin, degisim):
+    kelimeler = metin.split()
+    for i in range(len(kelimeler)):
+        if rastgele.random() < degisim:
+            kelimeler[i] = rastgele.choice(KELIMELER)
+    onek = rastgele.choice(["", "SON DAKİKA: ", "Flaş: ", "GÜNCELLEME: "])
+    return onek + baslik, "<p>" + " ".join(kelimeler) + "</p> " + rastgele.choice(KAYNAK_SATIRLARI)
+
+
+def main():
+    ayrac = argparse.ArgumentParser(description="Yakın tekrar kümeleme benchmark'ı")
+    ayrac.add_argument("--ozgun", type=int, default=2000, help="Özgün haber sayısı")
+    ayrac.add_argument("--degisim", type=float, default=0.08, help="Kopyalarda değiştirilen kelime oranı")
+    argumanlar = ayrac.parse_args()
+    rastgele = random.Random(11)
+
+    haberler = []  # (haber_id, baslik, icerik, gercek_hikaye)
+    for hikaye in range(argumanlar.ozgun):
+        baslik, metin = ozgun_haber(rastgele)
+        haberler.append((baslik, f"<p>{metin}</p>", hikaye))
+        for _ in range(rastgele.choice([0, 0, 1, 1, 2, 3, 4])):
+            haberler.append((*kopya(rastgele, baslik, metin, argumanlar.degisim), hikaye))
+    rastgele.shuffle(haberler)
+    haberler = [(i + 1, baslik, icerik, hikaye) for i, (baslik, icerik, hikaye) in enumerate(haberler)]
+    hikaye_of = {haber_id: hikaye for haber_id, _, _, hikaye in haberler}
+
+    with tempfile.TemporaryDirectory() as dizin:
+        havuz = BaglantiHavuzu(os.path.join(dizin, "kume.db"))
+        kumeleyici = HaberKumeleyici(havuz.al, lambda icerik: icerik.replace("<p>", " ").replace("</p>", " "))
+        kumeleyici.tablo_olustur()
+
+        kumeler = {}
+        t0 = time.perf_counter()
+        for baslangic in range(0, len(haberler), BATCH):
+            with havuz.yazma_islemi() as conn:
+                kumeler.update(kumeleyici.kumele(
+                    conn, [(haber_id, baslik, icerik) for haber_id, baslik, icerik, _ in haberler[baslangic:baslangic + BATCH]]
+                ))
+        sure = time.perf_counter() - t0
+        havuz.kapat()
+
+    # Bir hikayenin ilk görülen haberi gerçek temsilcidir; diğerleri gerçek kopyadır
+    ilk_gorulen = {}
+    for haber_id, _, _, hikaye in haberler:
+        ilk_gorulen.setdefault(hikaye, haber_id)
+    gercek_kopyalar = [haber_id for haber_id, _, _, hikaye in haberler if ilk_gorulen[hikaye] != haber_id]
+    baglananlar = [haber_id for haber_id, kume_id in kumeler.items() if kume_id != haber_id]
+    dogru_baglanan = sum(1 for haber_id in baglananlar if hikaye_of[kumeler[haber_id]] == hikaye_of[haber_id])
+    temsilciler = len(kumeler) - len(baglananlar)
+
+    print(f"{len(haberler)} haber, {argumanlar.ozgun} özgün hikaye, tekrar oranı %{len(gercek_kopyalar) / len(haberler) * 100:.1f}")
+    print(f"kesinlik:   %{dogru_baglanan / max(1, len(baglananlar)) * 100:.2f} ({dogru_baglanan}/{len(baglananlar)})")
+    print(f"duyarlılık: %{dogru_baglanan / max(1, len(gercek_kopyalar)) * 100:.2f} ({dogru_baglanan}/{len(gercek_kopyalar)})")
+    print(f"özetlenecek haber: {temsilciler} (kümelemesiz {len(haberler)}, en az {argumanlar.ozgun}) "
+          f"→ özetleme işi %{(1 - temsilciler / len(haberler)) * 100:.1f} azaldı")
+    print(f"kümeleme süresi: haber başına {sure / len(haberler) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Parçalı Özetleme Benchmark'ı
+----------------------------
+Girdi uzunluğu kovalarına göre, metni olduğu gibi pipeline'a verip girdi sınırında kesmek
+(eski davranış) ile ParcaliOzetleyici'nin map-reduce özetlemesini karşılaştırır. Her kova için
+haber başına süre, modelin işlediği token ve kapsam raporlanır. Kapsam, haberin cümlelerinden
+modele ulaşanların oranıdır: her cümlede benzersiz bir işaret kelimesi bulunur, sahte pipeline
+kesmeden sonra gördüğü işaretleri kaydeder. Bölüm kapsamı, haberin onda birlik dilimlerinden
+en az bir cümlesi modele ulaşanların oranıdır.
+
+Sahte pipeline toplu_ozetleme_benchmark.py'deki maliyet modelini kullanır (çağrı başına sabit
+maliyet, her üretim adımında padding dahil token sayısıyla orantılı maliyet) ve girdileri
+gerçek pipeline gibi --sinir token'da keser. transformers kuruluysa --model ile yerel bir model
+de denenebilir; bu durumda kapsam ölçülmez.
+
+Kullanım:
+    cd backend
+    python benchmarks/parcali_ozetleme_benchmark.py [--haber 8] [--sinir 1024] [--maks-token 4096] [--model <ad>]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from parcali_ozetleyici import ParcaliOzetleyici  # noqa: E402
+from toplu_ozetleyici import TopluOzetleyici  # noqa: E402
+
+KOVALAR = (256, 512, 1024, 2048, 4096, 8192, 16384)
+_ISARET = re.compile(r"i\d+h\d+x\d+")
+
+
+class _BoslukTokenizer:
+    """Sahte pipeline için kelime tabanlı tokenizer"""
+
+    def __init__(self, sinir):
+        self.model_max_length = sinir
+
+    def __call__(self, metinler, **kwargs):
+        return {"input_ids": [metin.split() for metin in metinler]}
+
+    def num_special_tokens_to_add(self):
+        return 2
+
+
+class SahtePipeline:
+    """transformers summarization pipeline'ının maliyet modelini ve girdi kesmesini taklit eder"""
+
+    def __init__(self, sinir, cagri_maliyeti=0.010, adim_maliyeti=0.002, token_maliyeti=0.000004, adim_sayisi=30):
+        self.tokenizer = _BoslukTokenizer(sinir)
+        self.sinir = sinir
+        self.cagri_maliyeti = cagri_maliyeti
+        self.adim_maliyeti = adim_maliyeti
+        self.token_maliyeti = token_maliyeti
+        self.adim_sayisi = adim_sayisi
+        self.islenen_token = 0
+        self.gorulen_isaretler = set()
+
+    def __call__(self, metinler, batch_size=1, max_length=60, **kwargs):
+        if isinstance(metinler, str):
+            metinler = [metinler]
+        ciktilar = []
+        for baslangic in range(0, len(metinler), batch_size):
+            # Gerçek pipeline gibi girdiler (özel tokenler dahil) model sınırında kesilir
+            batch = [m.split()[:self.sinir - 2] for m in metinler[baslangic:baslangic + batch_size]]
+            dolgulu = max(len(kelimeler) for kelimeler in batch) * len(batch)
+            self.islenen_token += sum(len(kelimeler) for kelimeler in batch)
+            for kelimeler in batch:
+                self.gorulen_isaretler.update(k for k in kelimeler if _ISARET.fullmatch(k))
+            adimlar = min(self.adim_sayisi, max_length)
+            time.sleep(self.cagri_maliyeti + adimlar * (self.adim_maliyeti + self.token_maliyeti * dolgulu))
+            # Özet, girdideki her cümlenin işaretini taşır; reduce adımında kapsam böylece izlenebilir
+            ciktilar.extend({"summary_text": " ".join(k for k in kelimeler if _ISARET.fullmatch(k))} for kelimeler in batch)
+        return ciktilar
+
+
+def metinler_olustur(adet, token, kova, tohum=5):
+    """Yaklaşık token kelimelik, her cümlesinde benzersiz bir işaret bulunan sentetik haberler üretir"""
+    rastgele = random.Random(tohum + token)
+    kelimeler = ("ekonomi faiz karar merkez bankası piyasa borsa endeks maç takım gol teknoloji "
+                 "yapay zeka telefon belediye ulaşım proje hava yağmur uyarı seçim meclis").split()
+    metinler = []
+    for h in range(adet):
+        cumleler = []
+        toplam = 0
+        while toplam < token:
+            uzunluk = rastgele.randint(8, 30)
+            cumleler.append(f"i{kova}h{h}x{len(cumleler)} " + " ".join(rastgele.choice(kelimeler) for _ in range(uzunluk - 1)) + ".")
+            toplam += uzunluk
+        metinler.append(" ".join(cumleler))
+    return metinler
+
+
+def olc(ozetle, summarizer, metinler):
+    """Özetleme süresini, haber başına işlenen token'ı, cümle ve bölüm kapsamını ölçer"""
+    sahte = isinstance(summarizer, SahtePipeline)
+    if sahte:
+        summarizer.islenen_token = 0
+        summarizer.gorulen_isaretler = set()
+    baslangic = time.perf_counter()
+    sonuclar = ozetle(metinler)
+    sure = time.perf_counter() - baslangic
+    assert all(s is not None for s in sonuclar)
+    if not sahte:
+        return sure, None, None, None
+    isaretler = [_ISARET.findall(metin) for metin in metinler]
+    bolumler = {(h, j * 10 // len(haber_isaretleri)) for h, haber_isaretleri in enumerate(isaretler)
+                for j, isaret in enumerate(haber_isaretleri) if isaret in summarizer.gorulen_isaretler}
+    return (sure, summarizer.islenen_token / len(metinler),
+            len(summarizer.gorulen_isaretler) / sum(len(haber_isaretleri) for haber_isaretleri in isaretler),
+            len(bolumler) / (10 * len(metinler)))
+
+
+def main():
+    ayrac = argparse.ArgumentParser(description="Parçalı özetleme benchmark'ı")
+    ayrac.add_argument("--haber", type=int, default=8, help="Her kovada özetlenecek haber sayısı")
+    ayrac.add_argument("--batch", type=int, default=8, help="Batch boyutu")
+    ayrac.add_argument("--sinir", type=int, default=1024, help="Sahte modelin girdi sınırı (token)")
+    ayrac.add_argument("--maks-token", type=int, default=4096, help="Haber başına token bütçesi (0: sınırsız)")
+    ayrac.add_argument("--model", default=None, help="Sahte pipeline yerine kullanılacak transformers modeli")
+    argumanlar = ayrac.parse_args()
+
+    parametreler = {"max_length": 150, "min_length": 30, "do_sample": False}
+    if argumanlar.model:
+        from transformers import pipeline
+        summarizer = pipeline("summarization", model=argumanlar.model, device=-1)
+        parametreler["num_beams"] = 4
+    else:
+        summarizer = SahtePipeline(argumanlar.sinir)
+
+    toplu = TopluOzetleyici(batch_boyutu=argumanlar.batch)
+    parcali = ParcaliOzetleyici(toplu, maks_token=argumanlar.maks_token)
+    yontemler = {
+        "kesme": lambda metinler: toplu.ozetle(summarizer, metinler, **parametreler),
+        "parçalı": lambda metinler: parcali.ozetle(summarizer, metinler, **parametreler),
+    }
+
+    print(f"Model: {argumanlar.model or 'sahte pipeline'}, kova başına {argumanlar.haber} haber, "
+          f"haber başına bütçe: {argumanlar.maks_token or 'sınırsız'} token")
+    print(f"{'kova':>6}  {'yöntem':<8} {'sn/haber':>9} {'token/haber':>12} {'kapsam':>7} {'bölüm':>7}")
+    for kova, token in enumerate(KOVALAR):
+        metinler = metinler_olustur(argumanlar.haber, token, kova)
+        for ad, ozetle in yontemler.items():
+            sure, islenen, kapsam, bolum_kapsami = olc(ozetle, summarizer, metinler)
+            satir = f"{token:>6}  {ad:<8} {sure / len(metinler):9.3f}"
+            if islenen is not None:
+                satir += f" {islenen:12.0f} {kapsam:7.1%} {bolum_kapsami:7.1%}"
+            print(satir)
+
+
+if __name__ == "__main__":
+    main()
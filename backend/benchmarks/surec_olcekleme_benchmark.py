@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Özetleme İşçisi Ölçekleme Benchmark'ı
+-------------------------------------
+Aynı haber kümesini 1, 2, 4 ve 8 işçiyle özetler ve iki işçi modunu karşılaştırır:
+  - thread: tüm işçiler tek süreçte, GIL'i paylaşır (OZET_ISCI_MODU=thread)
+  - process: model yüklendikten sonra fork edilen işçiler (OZET_ISCI_MODU=process); ağırlıklar
+    copy-on-write ile tek kopya olarak paylaşılır, her işçinin kendi iş parçacığı sayısı vardır
+Her koşu için haber/sn ve işçi başına bellek (RSS, PSS, USS) raporlanır. RSS paylaşılan sayfaları
+her işçide tekrar sayar; ağırlıklar gerçekten paylaşılıyorsa işçi başına USS küçük kalır ve
+toplam PSS, "her işçide ayrı model" durumunun (işçi sayısı x model boyutu) çok altında olur.
+
+Varsayılan olarak salt okunur, büyük bir ağırlık tamponu olan ve Python'da CPU'ya bağlı çalışan
+sahte bir model kullanılır (GIL altında thread'lerin ölçeklenmediği durumu gösterir).
+transformers kuruluysa --model ile gerçek bir model denenebilir.
+
+Kullanım:
+    cd backend
+    python benchmarks/surec_olcekleme_benchmark.py [--isciler 1,2,4,8] [--haber 64] [--agirlik-mb 256]
+        [--model <ad>] [--arka-uc fp32|int8|onnx] [--is-parcacigi 0]
+"""
+
+import argparse
+import gc
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bellek_olcumu import surec_bellegi  # noqa: E402
+from metin_temizleyici import temizle_metin  # noqa: E402
+from model_yukleyici import FP32, is_parcacigi_ayarla, ozetleyici_olustur  # noqa: E402
+from toplu_ozetleyici import TopluOzetleyici  # noqa: E402
+
+VERI_DOSYASI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "veri", "ozet_ornekleri.json")
+
+_MODEL = None           # Fork öncesi yüklenir, işçiler devralır
+_PARAMETRELER = {}
+_TOPLU = TopluOzetleyici()
+
+
+class _BoslukTokenizer:
+    def __call__(self, metinler, **kwargs):
+        return {"input_ids": [metin.split() for metin in metinler]}
+
+
+class SahteModel:
+    """Büyük, salt okunur ağırlıkları olan ve CPU'ya bağlı çalışan pipeline taklidi"""
+
+    def __init__(self, agirlik_mb, token_basina_adim=1600):
+        self.tokenizer = _BoslukTokenizer()
+        # Sayfaların gerçekten bellekte olması için tampon desenle doldurulur (sıfır sayfalar ayrılmaz)
+        self.agirliklar = memoryview(bytes(range(256)) * (agirlik_mb * 4096))
+        self.token_basina_adim = token_basina_adim
+
+    def __call__(self, metinler, batch_size=1, **kwargs):
+        if isinstance(metinler, str):
+            metinler = [metinler]
+        ciktilar = []
+        boyut = len(self.agirliklar)
+        for metin in metinler:
+            kelimeler = metin.split()
+            toplam = 0
+            konum = len(metin)
+            for _ in range(min(len(kelimeler), 512) * self.token_basina_adim):
+                konum = (konum * 1103515245 + 12345) % boyut
+                toplam += self.agirliklar[konum]
+            ciktilar.append({"summary_text": " ".join(kelimeler[:20]) + f" [{toplam % 97}]"})
+        return ciktilar
+
+
+def _surec_baslat(is_parcacigi):
+    if is_parcacigi:
+        is_parcacigi_ayarla(is_parcacigi)
+
+
+def _ozetle(girdiler):
+    return _TOPLU.ozetle(_MODEL, girdiler, **_PARAMETRELER)
+
+
+def haberleri_hazirla(adet):
+    with open(VERI_DOSYASI, encoding="utf-8") as dosya:
+        ornekler = [temizle_metin(ornek["icerik"]) for ornek in json.load(dosya)]
+    return [ornekler[i % len(ornekler)] + f" ({i})" for i in range(adet)]
+
+
+def kos(mod, isci_sayisi, haberler, argumanlar):
+    batchler = [haberler[i:i + argumanlar.batch] for i in range(0, len(haberler), argumanlar.batch)]
+    is_parcacigi = argumanlar.is_parcacigi or max(1, (os.cpu_count() or 1) // isci_sayisi)
+    if mod == "thread":
+        havuz = ThreadPoolExecutor(max_workers=isci_sayisi)
+    else:
+        gc.freeze()
+        try:
+            havuz = ProcessPoolExecutor(max_workers=isci_sayisi, mp_context=multiprocessing.get_context("fork"),
+                                        initializer=_surec_baslat, initargs=(is_parcacigi if argumanlar.model else 0,))
+            havuz.submit(os.getpid).result()  # İşçiler ölçüm dışında fork edilir
+        finally:
+            gc.unfreeze()
+
+    with havuz:
+        baslangic = time.perf_counter()
+        list(havuz.map(_ozetle, batchler))
+        sure = time.perf_counter() - baslangic
+        isciler = [surec_bellegi(surec.pid) for surec in multiprocessing.active_children()] if mod == "process" else []
+    isciler = [bellek for bellek in isciler if bellek]
+    ana = surec_bellegi() or {}
+
+    sonuc = {"mod": mod, "isci": isci_sayisi, "haber_sn": len(haberler) / sure, "ana_rss_mb": ana.get("rss_mb")}
+    if isciler:
+        sonuc["isci_rss_mb"] = sum(bellek["rss_mb"] for bellek in isciler) / len(isciler)
+        if isciler[0]["pss_mb"] is not None:
+            sonuc["isci_pss_mb"] = sum(bellek["pss_mb"] for bellek in isciler) / len(isciler)
+            sonuc["isci_uss_mb"] = sum(bellek["uss_mb"] for bellek in isciler) / len(isciler)
+            sonuc["toplam_pss_mb"] = (ana.get("pss_mb") or 0) + sum(bellek["pss_mb"] for bellek in isciler)
+    return sonuc
+
+
+def main():
+    global _MODEL, _PARAMETRELER
+    ayrac = argparse.ArgumentParser(description="Özetleme işçisi ölçekleme ve bellek paylaşımı ölçümü")
+    ayrac.add_argument("--isciler", default="1,2,4,8")
+    ayrac.add_argument("--haber", type=int, default=64)
+    ayrac.add_argument("--batch", type=int, default=4)
+    ayrac.add_argument("--agirlik-mb", type=int, default=256, help="Sahte modelin ağırlık boyutu")
+    ayrac.add_argument("--model", help="Gerçek model (transformers gerekir)")
+    ayrac.add_argument("--arka-uc", default=FP32)
+    ayrac.add_argument("--is-parcacigi", type=int, default=0, help="İşçi başına iş parçacığı (0: çekirdek / işçi)")
+    ayrac.add_argument("--modlar", default="thread,process")
+    argumanlar = ayrac.parse_args()
+
+    if "fork" not in multiprocessing.get_all_start_methods():
+        sys.exit("Bu benchmark fork destekleyen bir platform gerektirir")
+
+    if argumanlar.model:
+        _MODEL = ozetleyici_olustur(argumanlar.model, argumanlar.arka_uc)
+        _PARAMETRELER = {"max_length": 150, "min_length": 30, "do_sample": False, "num_beams": 4}
+        model_adi = f"{argumanlar.model} ({argumanlar.arka_uc})"
+    else:
+        _MODEL = SahteModel(argumanlar.agirlik_mb)
+        model_adi = f"sahte model ({argumanlar.agirlik_mb} MB ağırlık)"
+    haberler = haberleri_hazirla(argumanlar.haber)
+    model_bellegi = surec_bellegi() or {}
+
+    print(f"Model: {model_adi}, {len(haberler)} haber, batch {argumanlar.batch}, {os.cpu_count()} çekirdek; "
+          f"model yüklü ana süreç RSS {model_bellegi.get('rss_mb')} MB")
+    print(f"{'mod':<8} {'işçi':>4} {'haber/sn':>9} {'ölçek':>6} {'işçi RSS':>9} {'işçi PSS':>9} "
+          f"{'işçi USS':>9} {'toplam PSS':>11}")
+    for mod in argumanlar.modlar.split(","):
+        tekli = None
+        for isci_sayisi in (int(sayi) for sayi in argumanlar.isciler.split(",")):
+            sonuc = kos(mod, isci_sayisi, haberler, argumanlar)
+            tekli = tekli or sonuc["haber_sn"]
+
+            def mb(anahtar):
+                return f"{sonuc[anahtar]:.0f} MB" if sonuc.get(anahtar) is not None else "-"
+
+            print(f"{mod:<8} {isci_sayisi:>4} {sonuc['haber_sn']:>9.2f} {sonuc['haber_sn'] / tekli:>5.2f}x "
+                  f"{mb('isci_rss_mb'):>9} {mb('isci_pss_mb'):>9} {mb('isci_uss_mb'):>9} {mb('toplam_pss_mb'):>11}")
+
+
+if __name__ == "__main__":
+    main()
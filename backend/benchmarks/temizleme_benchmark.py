@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Metin Temizleme Benchmark'ı
+---------------------------
+metin_temizleyici modülünü eski ardışık re.sub zinciriyle (aşağıda birebir kopyası
+bulunan eski_temizle_html / eski_temizle_metin) karşılaştırır:
+  - benchmarks/veri/temizlik_altin.jsonl'daki altın korpusta çıktıların birebir aynı olduğunu,
+  - rastgele parçalardan üretilen zorlu girdilerde yeni ve eski çıktıların aynı olduğunu doğrular,
+  - feed açıklamalarına benzeyen girdilerle haber başına temizleme süresini, MetinTemizleyici
+    önbelleğinin tekrar eden çağrılardaki etkisini ölçer.
+
+Altın korpus eski temizleyiciyle üretilmiştir; girdiler --altin-yaz ile yeniden üretilebilir.
+
+Kullanım:
+    cd backend
+    python benchmarks/temizleme_benchmark.py [--haber 5000] [--altin-yaz]
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metin_temizleyici import MetinTemizleyici, temizle_html, temizle_metin  # noqa: E402
+
+VERI_DIZINI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "veri")
+ALTIN_DOSYA = os.path.join(VERI_DIZINI, "temizlik_altin.jsonl")
+ORNEK_FEED = os.path.join(VERI_DIZINI, "ornek_feed.xml")
+
+
+def eski_temizle_html(html_icerik):
+    """Eski temizleyici (karşılaştırma için birebir kopya)"""
+    from html import unescape
+    if not html_icerik:
+        return ""
+    if not isinstance(html_icerik, str):
+        try:
+            html_icerik = str(html_icerik)
+        except:  # noqa: E722
+            return ""
+    html_icerik = re.sub(r'<!\[CDATA\[(.*?)\]\]>', r'\1', html_icerik)
+    html_icerik = re.sub(r'<script.*?>.*?</script>', ' ', html_icerik, flags=re.DOTALL)
+    html_icerik = re.sub(r'<style.*?>.*?</style>', ' ', html_icerik, flags=re.DOTALL)
+    html_icerik = re.sub(r'<!--.*?-->', ' ', html_icerik, flags=re.DOTALL)
+    html_icerik = re.sub(r'<.*?>', ' ', html_icerik)
+    temiz_metin = unescape(html_icerik)
+    temiz_metin = re.sub(r'\s+', ' ', temiz_metin).strip()
+    temiz_metin = re.sub(r'https?://\S+', '', temiz_metin)
+    temiz_metin = re.sub(r'Devamı için tıklayınız.*', '', temiz_metin)
+    temiz_metin = re.sub(r'Haberin devamı için.*', '', temiz_metin)
+    temiz_metin = re.sub(r'Detaylar için tıklayınız.*', '', temiz_metin)
+    temiz_metin = re.sub(r'Ayrıntılar için tıklayınız.*', '', temiz_metin)
+    temiz_metin = re.sub(r'Devamını oku.*', '', temiz_metin)
+    temiz_metin = re.sub(r'\.{2,}', '.', temiz_metin)
+    temiz_metin = re.sub(r'\s+\.', '.', temiz_metin)
+    temiz_metin = temiz_metin.strip()
+    return temiz_metin
+
+
+def eski_temizle_metin(metin):
+    """Eski temizleyici (karşılaştırma için birebir kopya)"""
+    temiz_metin = eski_temizle_html(metin)
+    temiz_metin = re.sub(r'\s+', ' ', temiz_metin).strip()
+    temiz_metin = re.sub(r'\.{2,}', '.', temiz_metin)
+    temiz_metin = re.sub(r'\s+\.', '.', temiz_metin)
+    reklam_kaliplari = [
+        r'Bu haber\s+.+\s+tarafından hazırlanmıştır\.',
+        r'Kaynak:.+',
+        r'Sponsorlu İçerik',
+        r'Reklam',
+        r'İlgili Haberler:.*',
+        r'Devamı için tıklayınız.*',
+        r'Haberin devamı için.*',
+        r'Detaylar için tıklayınız.*',
+        r'Ayrıntılar için tıklayınız.*',
+        r'Devamını oku.*',
+        r'Daha fazlası için.*'
+    ]
+    for kalip in reklam_kaliplari:
+        temiz_metin = re.sub(kalip, '', temiz_metin, flags=re.IGNORECASE)
+    return temiz_metin.strip()
+
+
+# Gerçek RSS açıklamalarında görülen parçalar
+KELIMELER = ("bakan açıklama yaptı ekonomi büyüme enflasyon merkez bankası faiz kararı meclis seçim "
+             "deprem AFAD bölge hasar takım maç gol transfer şirket yatırım ihracat döviz borsa İstanbul "
+             "IŞIK ışık güneş öğrenci sınav üniversite hastane sağlık reklamcılık kaynakça").split()
+PARCALAR = [
+    "<p>", "</p>", "<br/>", "<br>", "<strong>", "</strong>", "<b>", "</b>", "\n", "\t", "\r\n", "  ",
+    '<img src="https://cdn.ornek.example/r/1.jpg" alt="foto" />',
+    '<a href="https://ornek.example/haber/123?utm_source=rss">', "</a>",
+    '<div class="haber-detay">', "</div>", '<span style="color:red">', "</span>",
+    '<script type="text/javascript">var a = "<b>" + 1;\nif (a < 2) { x(); }</script>',
+    "<script>document.write('<p>');</script>", "<style>.x { color: red; }\n</style>",
+    "<!-- reklam alanı -->", "<!--\nçok satırlı\nyorum -->", "<![CDATA[ CDATA içi <i>metin</i> ]]>",
+    "<![CDATA[<script>x()</script>]]>", "&amp;", "&nbsp;", "&quot;", "&#39;", "&lt;b&gt;", "&#8230;",
+    " ", " ", "​", "…", "...", "..", " . ", " .", "!", "?", ",",
+    "https://t.co/AbCdEf", "http://ornek.example/a b", "www.ornek.example",
+    "Devamı için tıklayınız", "DEVAMI İÇİN TIKLAYINIZ", "Haberin devamı için tıklayınız",
+    "haberin devamı için", "Detaylar için tıklayınız", "Ayrıntılar için tıklayınız", "Devamını oku",
+    "devamını okuyun", "Daha fazlası için", "Kaynak: AA", "KAYNAK:DHA", "Kaynak:", "Reklam", "REKLAM",
+    "reklamlar", "Sponsorlu İçerik", "sponsorlu içerik", "İlgili Haberler: Diğer haber",
+    "Bu haber AA tarafından hazırlanmıştır.", "Bu haber\nİHA muhabiri tarafından hazırlanmıştır.",
+    "a < b", "5 > 3", "<", ">", "<>", "< p>",
+]
+EL_YAZIMI = [
+    "", " ", "<p></p>", "<![CDATA[]]>", "<!---->", "<script></script>", "Düz metin.",
+    "<p>Birinci cümle... İkinci cümle .. Üçüncü .</p>",
+    "<p>Metin https://ornek.example/x . devam</p>",
+    "<!-- <script>x</script> --> yorum içinde script",
+    "<script><!-- eski tarz --></script> script içinde yorum",
+    "<script><![CDATA[ var a = 1; ]]></script> script içinde CDATA",
+    "Haberin devamı için tıklayınız",
+    "X Haberin devamı için tıklayınız",
+    "Kaynak:Reklam", "Reklam Kaynak: AA", "Bu haber x tarafından hazırlanmıştır. Kaynak: y",
+    "<p>Satır 1<br>\nSatır 2</p>\n<p>Devamı için tıklayınız: https://ornek.example</p>",
+    "<style>p{}</style><p>stil sonrası</p><style>\n.a{}\n</style>",
+    # İç içe bloklar: sonuç CDATA → script/style → yorum sırasına bağlıdır
+    "<![CDATA[ <script> ]]> foo </script> bar",
+    "<!-- <![CDATA[ --> x ]]> y",
+    "<script> <!-- </script> x --> y",
+    "<!-- <style> --> x </style> y",
+    "<![CDATA[ <!-- ]]> x --> y",
+]
+
+
+def rastgele_girdi(rastgele):
+    parcalar = []
+    for _ in range(rastgele.randint(5, 60)):
+        if rastgele.random() < 0.35:
+            parcalar.append(rastgele.choice(PARCALAR))
+        else:
+            parcalar.append(" ".join(rastgele.choice(KELIMELER) for _ in range(rastgele.randint(1, 12))))
+            parcalar.append(rastgele.choice([". ", " ", ", ", ".\n"]))
+    return "".join(parcalar)
+
+
+def rss_haberi(rastgele):
+    """Gerçek feed'lere benzer haber açıklaması: paragraflar, resim, bağlantı, ara sıra kaynak satırı"""
+    kelimeler = KELIMELER[:-2]
+    paragraflar = []
+    for _ in range(rastgele.randint(2, 6)):
+        cumleler = [" ".join(rastgele.choice(kelimeler) for _ in range(rastgele.randint(8, 18))).capitalize() + "."
+                    for _ in range(rastgele.randint(1, 4))]
+        paragraflar.append("<p>" + " ".join(cumleler).replace(" faiz ", " &quot;faiz&quot; ") + "</p>")
+    if rastgele.random() < 0.5:
+        paragraflar.insert(0, f'<img src="https://cdn.ornek.example/r/{rastgele.randint(1, 9999)}.jpg" />')
+    if rastgele.random() < 0.2:
+        paragraflar.append("<p>Kaynak: AA</p>")
+    if rastgele.random() < 0.2:
+        paragraflar.append('<p><a href="https://ornek.example/h/1">Haberin devamı için tıklayınız</a></p>')
+    return "\n".join(paragraflar)
+
+
+def feed_aciklamalari():
+    with open(ORNEK_FEED, encoding="utf-8") as f:
+        return re.findall(r"<description>(.*?)</description>", f.read(), flags=re.DOTALL)
+
+
+def altin_girdileri():
+    rastgele = random.Random(2024)
+    return EL_YAZIMI + feed_aciklamalari() + [rastgele_girdi(rastgele) for _ in range(400)]
+
+
+def altin_yaz():
+    with open(ALTIN_DOSYA, "w", encoding="utf-8") as f:
+        for girdi in altin_girdileri():
+            f.write(json.dumps({"girdi": girdi, "html": eski_temizle_html(girdi),
+                                "metin": eski_temizle_metin(girdi)}, ensure_ascii=False) + "\n")
+    print(f"Altın korpus yazıldı: {ALTIN_DOSYA}")
+
+
+def altin_dogrula():
+    with open(ALTIN_DOSYA, encoding="utf-8") as f:
+        kayitlar = [json.loads(satir) for satir in f]
+    hatalar = [k["girdi"] for k in kayitlar
+               if temizle_html(k["girdi"]) != k["html"] or temizle_metin(k["girdi"]) != k["metin"]]
+    print(f"altın korpus: {len(kayitlar) - len(hatalar)}/{len(kayitlar)} girdi birebir aynı")
+    for girdi in hatalar[:5]:
+        print(f"  FARKLI: {girdi!r}")
+    return not hatalar
+
+
+def sure_olc(fonksiyon, metinler, tekrar=3):
+    en_iyi = float("inf")
+    for _ in range(tekrar):
+        t0 = time.perf_counter()
+        for metin in metinler:
+            fonksiyon(metin)
+        en_iyi = min(en_iyi, time.perf_counter() - t0)
+    return en_iyi
+
+
+def main():
+    ayrac = argparse.ArgumentParser(description="Metin temizleme benchmark'ı")
+    ayrac.add_argument("--haber", type=int, default=5000, help="Ölçümde kullanılan haber sayısı")
+    ayrac.add_argument("--altin-yaz", action="store_true", help="Altın korpusu eski temizleyiciyle yeniden üret")
+    argumanlar = ayrac.parse_args()
+
+    if argumanlar.altin_yaz:
+        altin_yaz()
+        return
+    if not altin_dogrula():
+        sys.exit(1)
+
+    rastgele = random.Random(99)
+    zorlu = [rastgele_girdi(rastgele) for _ in range(argumanlar.haber)]
+    metinler = [rss_haberi(rastgele) for _ in range(argumanlar.haber)]
+    for ad, girdiler in (("rastgele parçalı girdiler", zorlu), ("feed benzeri girdiler", metinler)):
+        farkli = sum(1 for m in girdiler if temizle_metin(m) != eski_temizle_metin(m))
+        print(f"{ad}: {len(girdiler) - farkli}/{len(girdiler)} aynı")
+
+    ortalama = sum(len(m) for m in metinler) / len(metinler)
+    eski = sure_olc(eski_temizle_metin, metinler)
+    yeni = sure_olc(temizle_metin, metinler)
+    print(f"temizle_metin ({ortalama:.0f} karakter ortalama): eski {eski / len(metinler) * 1e6:.1f} µs, "
+          f"yeni {yeni / len(metinler) * 1e6:.1f} µs / haber → {eski / yeni:.1f}x")
+
+    # Toplama sırasında bir haber yedek özet, arama indeksi ve kümeleme için üç kez temizlenir
+    temizleyici = MetinTemizleyici(kapasite=len(metinler))
+    t0 = time.perf_counter()
+    for metin in metinler:
+        for _ in range(3):
+            temizleyici(metin)
+    onbellekli = time.perf_counter() - t0
+    print(f"haber başına 3 temizleme: eski {eski * 3 / len(metinler) * 1e6:.1f} µs, "
+          f"önbellekli {onbellekli / len(metinler) * 1e6:.1f} µs")
+
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Toplu Özetleme Benchmark'ı
+--------------------------
+batch=1 (eski davranış: her haber için ayrı pipeline çağrısı) ile TopluOzetleyici'nin
+uzunluğa göre sıralanmış batch'lerini karşılaştırır.
+
+Varsayılan olarak gerçek bir modelin maliyet yapısını taklit eden sahte bir pipeline kullanılır:
+her çağrının sabit bir maliyeti, her üretim adımının sabit bir maliyeti ve batch içindeki
+(padding dahil) token sayısıyla orantılı bir maliyeti vardır. transformers kuruluysa
+--model ile küçük bir yerel model de denenebilir (örn. sshleifer/distilbart-xsum-1-1).
+
+Kullanım:
+    cd backend
+    python benchmarks/toplu_ozetleme_benchmark.py [--haber 64] [--batch 8] [--model <ad>]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from toplu_ozetleyici import TopluOzetleyici  # noqa: E402
+
+
+class _BoslukTokenizer:
+    """Sahte pipeline için kelime tabanlı tokenizer"""
+
+    def __call__(self, metinler, **kwargs):
+        return {"input_ids": [metin.split() for metin in metinler]}
+
+
+class SahtePipeline:
+    """transformers summarization pipeline'ının maliyet modelini taklit eder"""
+
+    def __init__(self, cagri_maliyeti=0.010, adim_maliyeti=0.002, token_maliyeti=0.000004, adim_sayisi=30):
+        self.tokenizer = _BoslukTokenizer()
+        self.cagri_maliyeti = cagri_maliyeti
+        self.adim_maliyeti = adim_maliyeti
+        self.token_maliyeti = token_maliyeti
+        self.adim_sayisi = adim_sayisi
+        self.islenen_token = 0
+        self.padding_token = 0
+
+    def __call__(self, metinler, batch_size=1, **kwargs):
+        if isinstance(metinler, str):
+            metinler = [metinler]
+        ciktilar = []
+        for baslangic in range(0, len(metinler), batch_size):
+            batch = metinler[baslangic:baslangic + batch_size]
+            uzunluklar = [len(m.split()) for m in batch]
+            dolgulu = max(uzunluklar) * len(batch)
+            self.islenen_token += dolgulu
+            self.padding_token += dolgulu - sum(uzunluklar)
+            time.sleep(self.cagri_maliyeti + self.adim_sayisi * (self.adim_maliyeti + self.token_maliyeti * dolgulu))
+            ciktilar.extend({"summary_text": " ".join(m.split()[:20])} for m in batch)
+        return ciktilar
+
+
+def metinler_olustur(adet, tohum=3):
+    """50-600 kelime arası değişen uzunlukta sentetik haber metinleri üretir"""
+    rastgele = random.Random(tohum)
+    kelimeler = ("ekonomi faiz karar merkez bankası piyasa borsa endeks maç takım gol teknoloji "
+                 "yapay zeka telefon belediye ulaşım proje hava yağmur uyarı seçim meclis").split()
+    return [" ".join(rastgele.choice(kelimeler) for _ in range(rastgele.randint(50, 600))) for _ in range(adet)]
+
+
+def olc(ozetleyici, summarizer, metinler, **parametreler):
+    baslangic = time.perf_counter()
+    sonuclar = ozetleyici.ozetle(summarizer, metinler, **parametreler)
+    sure = time.perf_counter() - baslangic
+    assert all(s is not None for s in sonuclar)
+    return sure
+
+
+def main():
+    ayrac = argparse.ArgumentParser(description="Toplu özetleme benchmark'ı")
+    ayrac.add_argument("--haber", type=int, default=64, help="Özetlenecek haber sayısı")
+    ayrac.add_argument("--batch", type=int, default=8, help="Karşılaştırılacak batch boyutu")
+    ayrac.add_argument("--model", default=None, help="Sahte pipeline yerine kullanılacak transformers modeli")
+    argumanlar = ayrac.parse_args()
+
+    metinler = metinler_olustur(argumanlar.haber)
+    parametreler = {}
+    if argumanlar.model:
+        from transformers import pipeline
+        summarizer = pipeline("summarization", model=argumanlar.model, device=-1)
+        parametreler = {"max_length": 40, "min_length": 5, "do_sample": False, "num_beams": 4}
+    else:
+        summarizer = SahtePipeline()
+
+    print(f"Haber sayısı: {len(metinler)}, model: {argumanlar.model or 'sahte pipeline'}")
+    sonuclar = {}
+    for batch_boyutu in sorted({1, argumanlar.batch}):
+        if isinstance(summarizer, SahtePipeline):
+            summarizer.islenen_token = summarizer.padding_token = 0
+        sure = olc(TopluOzetleyici(batch_boyutu=batch_boyutu), summarizer, metinler, **parametreler)
+        sonuclar[batch_boyutu] = sure
+        satir = f"batch={batch_boyutu:<3} süre: {sure:6.2f} sn  {len(metinler) / sure:6.1f} haber/sn"
+        if isinstance(summarizer, SahtePipeline):
+            satir += f"  padding oranı: {summarizer.padding_token / max(summarizer.islenen_token, 1):.1%}"
+        print(satir)
+
+    if isinstance(summarizer, SahtePipeline) and argumanlar.batch > 1:
+        # Sıralamanın katkısını görmek için aynı batch'leri sıralamadan ölç
+        summarizer.islenen_token = summarizer.padding_token = 0
+        baslangic = time.perf_counter()
+        summarizer(metinler, batch_size=argumanlar.batch)
+        sure = time.perf_counter() - baslangic
+        print(f"batch={argumanlar.batch:<3} (sırasız) süre: {sure:6.2f} sn  "
+              f"padding oranı: {summarizer.padding_token / max(summarizer.islenen_token, 1):.1%}")
+
+    if argumanlar.batch > 1:
+        print(f"Hızlanma: {sonuclar[1] / sonuclar[argumanlar.batch]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Veritabanı Yazma/Okuma Çekişmesi Benchmark'ı
+--------------------------------------------
+Arka plandaki yazar haber eklerken API okuyucularının ne kadar beklediğini ölçer.
+
+  eski: her işlem için yeni sqlite3.connect, varsayılan günlük modu (DELETE),
+        haber başına bir INSERT ve IntegrityError yakalama
+  yeni: BaglantiHavuzu (WAL + pragmalar), tek işlemde executemany ile
+        INSERT ... ON CONFLICT(url) DO NOTHING
+
+Kullanım:
+    cd backend
+    python benchmarks/veritabani_benchmark.py [--okuyucu 4] [--batch 200] [--tur 30]
+"""
+
+import argparse
+import os
+import sqlite3
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from veritabani import BaglantiHavuzu  # noqa: E402
+
+SEMA = '''
+CREATE TABLE IF NOT EXISTS haberler (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    baslik TEXT NOT NULL,
+    ozet TEXT NOT NULL,
+    icerik TEXT NOT NULL,
+    kategori TEXT NOT NULL,
+    kaynak TEXT NOT NULL,
+    url TEXT NOT NULL UNIQUE,
+    resim_url TEXT,
+    tarih TIMESTAMP NOT NULL,
+    olusturulma_tarihi TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    ozet_durumu TEXT NOT NULL DEFAULT 'hazir'
+)
+'''
+# Okumalar sıralama maliyetini değil kilit beklemesini ölçsün diye her iki senaryoda da aynı indeks
+INDEKS = 'CREATE INDEX IF NOT EXISTS idx_haberler_tarih ON haberler(tarih)'
+KATEGORILER = ["gundem", "spor", "ekonomi", "teknoloji", "magazin"]
+ICERIK = "<p>" + "Örnek haber içeriği cümlesi. " * 120 + "</p>"
+
+
+def haberler_uret(baslangic, adet, tekrar_orani=0.5):
+    """Bir kısmı daha önce eklenmiş URL'lere sahip haber satırları üretir"""
+    satirlar = []
+    simdi = datetime.now()
+    for i in range(adet):
+        no = baslangic + i
+        if i < adet * tekrar_orani and no > adet:
+            no -= adet  # Önceki turdan tekrar eden haber
+        satirlar.append((f"Başlık {no}", "Özet", ICERIK, KATEGORILER[no % 5], "Kaynak",
+                         f"https://ornek.example/haber/{no}", None, simdi - timedelta(minutes=no)))
+    return satirlar
+
+
+def eski_yaz(dosya, satirlar):
+    conn = sqlite3.connect(dosya)
+    cursor = conn.cursor()
+    for satir in satirlar:
+        try:
+            cursor.execute('INSERT INTO haberler (baslik, ozet, icerik, kategori, kaynak, url, resim_url, tarih) '
+                           'VALUES (?, ?, ?, ?, ?, ?, ?, ?)', satir)
+        except sqlite3.IntegrityError:
+            continue
+    conn.commit()
+    conn.close()
+
+
+def yeni_yaz(havuz, satirlar):
+    with havuz.yazma_islemi() as conn:
+        conn.executemany('INSERT INTO haberler (baslik, ozet, icerik, kategori, kaynak, url, resim_url, tarih) '
+                         'VALUES (?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT(url) DO NOTHING', satirlar)
+
+
+def eski_oku(dosya):
+    conn = sqlite3.connect(dosya)
+    conn.row_factory = sqlite3.Row
+    [dict(row) for row in conn.execute('SELECT * FROM haberler ORDER BY tarih DESC LIMIT 50')]
+    conn.close()
+
+
+def yeni_oku(havuz):
+    conn = havuz.al()
+    [dict(row) for row in conn.execute('SELECT * FROM haberler ORDER BY tarih DESC LIMIT 50')]
+    conn.close()
+
+
+def senaryo(ad, yaz, oku, okuyucu_sayisi, batch, tur, on_yukleme):
+    # Okuyucular başlamadan önce tabloyu doldur, böylece her sorgu gerçekten 50 satır döndürür;
+    # bu aşama çekişmesiz yazma hızını da verir
+    t0 = time.perf_counter()
+    for baslangic in range(0, on_yukleme, 1000):
+        yaz(haberler_uret(-on_yukleme + baslangic, 1000, tekrar_orani=0))
+    yalniz_yazma = on_yukleme / max(time.perf_counter() - t0, 1e-9)
+
+    gecikmeler = []
+    hatalar = [0]
+    kilit = threading.Lock()
+    bitti = threading.Event()
+
+    def okuyucu():
+        while not bitti.is_set():
+            baslangic = time.perf_counter()
+            try:
+                oku()
+            except sqlite3.OperationalError:
+                with kilit:
+                    hatalar[0] += 1
+                continue
+            with kilit:
+                gecikmeler.append(time.perf_counter() - baslangic)
+
+    threadler = [threading.Thread(target=okuyucu) for _ in range(okuyucu_sayisi)]
+    for t in threadler:
+        t.start()
+
+    yazma_sureleri = []
+    baslangic = time.perf_counter()
+    for i in range(tur):
+        t0 = time.perf_counter()
+        yaz(haberler_uret(i * batch, batch))
+        yazma_sureleri.append(time.perf_counter() - t0)
+    toplam = time.perf_counter() - baslangic
+    bitti.set()
+    for t in threadler:
+        t.join()
+
+    gecikmeler.sort()
+    p = lambda oran: gecikmeler[min(len(gecikmeler) - 1, int(len(gecikmeler) * oran))] * 1000  # noqa: E731
+    print(f"[{ad}] okuyucusuz yazma: {yalniz_yazma:8.0f} satır/sn")
+    print(f"[{ad}] yazma: {tur * batch / toplam:8.0f} satır/sn (batch medyanı {statistics.median(yazma_sureleri) * 1000:.1f} ms)"
+          f" | okuma: {len(gecikmeler) / toplam:7.0f} sorgu/sn, p50 {p(0.5):.2f} ms, p95 {p(0.95):.2f} ms,"
+          f" p99 {p(0.99):.2f} ms, maks {gecikmeler[-1] * 1000:.1f} ms | kilit hatası: {hatalar[0]}")
+
+
+def main():
+    ayrac = argparse.ArgumentParser(description="Veritabanı çekişme benchmark'ı")
+    ayrac.add_argument("--okuyucu", type=int, default=4)
+    ayrac.add_argument("--batch", type=int, default=200)
+    ayrac.add_argument("--tur", type=int, default=30)
+    ayrac.add_argument("--on-yukleme", type=int, default=20000, help="Ölçümden önce eklenecek satır sayısı")
+    argumanlar = ayrac.parse_args()
+
+    with tempfile.TemporaryDirectory() as dizin:
+        eski_dosya = os.path.join(dizin, "eski.db")
+        conn = sqlite3.connect(eski_dosya)
+        conn.execute(SEMA)
+        conn.execute(INDEKS)
+        conn.close()
+        senaryo("eski", lambda s: eski_yaz(eski_dosya, s), lambda: eski_oku(eski_dosya),
+                argumanlar.okuyucu, argumanlar.batch, argumanlar.tur, argumanlar.on_yukleme)
+
+        havuz = BaglantiHavuzu(os.path.join(dizin, "yeni.db"))
+        conn = havuz.al()
+        conn.execute(SEMA)
+        conn.execute(INDEKS)
+        conn.commit()
+        conn.close()
+        senaryo("yeni", lambda s: yeni_yaz(havuz, s), lambda: yeni_oku(havuz),
+                argumanlar.okuyucu, argumanlar.batch, argumanlar.tur, argumanlar.on_yukleme)
+        havuz.kapat()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+"""
+Yerel RSS Sunucusu
+------------------
+Benchmark'lar için gerçek haber sitelerinin yerine geçen yerel HTTP sunucusu.
+Sabit RSS dosyalarını yapay gecikmeyle sunar, ETag ile koşullu GET'i (304) destekler
+ve açılan bağlantı sayısını sayar.
+
+Yol biçimi: /<dosya>?gecikme=<saniye>  (örn. /ornek_feed.xml?gecikme=0.3)
+Arıza senaryoları için ek parametreler:
+  durum=<kod>     gövdesiz olarak bu HTTP durum kodunu döndürür (örn. durum=503)
+  damla=<saniye>  gövdeyi her parça arasında bu kadar bekleyerek 64 baytlık parçalarla gönderir
+"""
+
+import hashlib
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+VERI_DIZINI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "veri")
+
+
+class _Isleyici(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive için
+
+    def setup(self):
+        super().setup()
+        with self.server.kilit:
+            self.server.baglanti_sayisi += 1
+
+    def do_GET(self):
+        parcalar = urlsplit(self.path)
+        parametreler = parse_qs(parcalar.query)
+        gecikme = float(parametreler.get("gecikme", ["0"])[0])
+        durum = int(parametreler.get("durum", ["0"])[0])
+        damla = float(parametreler.get("damla", ["0"])[0])
+        dosya = os.path.join(VERI_DIZINI, os.path.basename(parcalar.path))
+
+        with self.server.kilit:
+            self.server.istek_sayisi += 1
+
+        if gecikme:
+            time.sleep(gecikme)
+
+        if durum or not os.path.isfile(dosya):
+            self.send_response(durum or 404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        with open(dosya, "rb") as f:
+            govde = f.read()
+        etag = '"%s"' % hashlib.md5(govde).hexdigest()
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Type", "application/rss+xml; charset=utf-8")
+        self.send_header("Content-Length", str(len(govde)))
+        self.end_headers()
+        if not damla:
+            self.wfile.write(govde)
+            return
+        try:
+            for i in range(0, len(govde), 64):
+                self.wfile.write(govde[i:i + 64])
+                self.wfile.flush()
+                time.sleep(damla)
+        except OSError:
+            pass  # İstemci zaman aşımıyla bağlantıyı kesti
+
+    def log_message(self, format, *args):
+        pass  # Benchmark çıktısını kirletmesin
+
+
+class YerelRSSSunucusu:
+    """Arka planda çalışan yerel RSS sunucusu"""
+
+    def __init__(self, port=0):
+        self.sunucu = ThreadingHTTPServer(("127.0.0.1", port), _Isleyici)
+        self.sunucu.daemon_threads = True
+        self.sunucu.kilit = threading.Lock()
+        self.sunucu.baglanti_sayisi = 0
+        self.sunucu.istek_sayisi = 0
+        self._thread = threading.Thread(target=self.sunucu.serve_forever, daemon=True)
+
+    @property
+    def port(self):
+        return self.sunucu.server_address[1]
+
+    def url(self, dosya, gecikme=0.0, host="127.0.0.1", **ekler):
+        """Sunucudaki bir dosya için feed URL'si üretir"""
+        sorgu = "&".join([f"gecikme={gecikme}"] + [f"{k}={v}" for k, v in ekler.items()])
+        return f"http://{host}:{self.port}/{dosya}?{sorgu}"
+
+    def sayaclari_sifirla(self):
+        with self.sunucu.kilit:
+            self.sunucu.baglanti_sayisi = 0
+            self.sunucu.istek_sayisi = 0
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.sunucu.shutdown()
+        self.sunucu.server_close()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Özet Zamanlayıcı Benchmark'ı
+----------------------------
+Sanal zamanda birkaç yenileme döngüsünü simüle eder. Her döngüde farklı uzunlukta ve
+farklı sayıda kaynağın verdiği haberler gelir; model süresi token uzunluğuyla orantılıdır
+(gürültülü). İki strateji karşılaştırılır:
+  - fifo: eski davranış; tüm haberler geliş sırasıyla modele gider
+  - zamanlayici: OzetZamanlayici bütçesi; sığmayanlar ertelenir ve boşta yükseltilir
+Ölçülenler: döngü işlerinin pencere içinde bitip bitmediği, en önemli haberlerin (en çok
+kaynak) model özetine kavuşma süresi ve maliyet tahmininin gerçeğe yakınlığı.
+
+Kullanım:
+    cd backend
+    python benchmarks/zamanlayici_benchmark.py [--dongu 6] [--haber 400] [--butce 600] [--aralik 1800]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ozet_zamanlayici import OzetZamanlayici, oncelik_hesapla  # noqa: E402
+
+BATCH = 8
+
+
+def gercek_sure(rastgele, token_sayisi):
+    # Gerçek model: sabit üretim maliyeti + girdi uzunluğu (1024 tokende kesilir) + gürültü
+    return (0.6 + 0.004 * min(token_sayisi, 1024)) * rastgele.uniform(0.8, 1.25)
+
+
+def dongu_haberleri(rastgele, dongu_no, adet, aralik, sonraki_id):
+    haberler = []
+    for i in range(adet):
+        haberler.append({
+            "id": sonraki_id + i,
+            "tarih": dongu_no * aralik - rastgele.uniform(0, aralik),
+            "kaynak": rastgele.choice([1, 1, 1, 1, 2, 2, 3, 5]),
+            "token": int(rastgele.lognormvariate(5.6, 0.6)),
+        })
+    return haberler
+
+
+def simule_et(strateji, argumanlar):
+    rastgele = random.Random(3)
+    # Simülasyon saati gerçek zamandan bağımsızdır; bütçe döngüler arasında geçen gerçek süreye oranlanmaz
+    zamanlayici = OzetZamanlayici(butce_sn=argumanlar.butce, dongu_sn=0)
+    saat = 0.0
+    kuyruk = []       # (oncelik, haber) - yüksek öncelik önce
+    ertelenen = []
+    sonraki_id = 1
+    pencere_asimi = 0
+    onemli_bekleme = []
+    tahmin_hatalari = []
+
+    for dongu_no in range(1, argumanlar.dongu + 1):
+        baslangic = (dongu_no - 1) * argumanlar.aralik
+        saat = max(saat, baslangic)
+        haberler = dongu_haberleri(rastgele, dongu_no, argumanlar.haber, argumanlar.aralik, sonraki_id)
+        sonraki_id += len(haberler)
+
+        if strateji == "fifo":
+            kuyruk.extend(haberler)
+            plan = list(kuyruk)
+            kuyruk = []
+        else:
+            adaylar = [(h["id"], oncelik_hesapla(h["tarih"], h["kaynak"]), h["token"]) for h in haberler]
+            model_idleri, ertelenen_idleri = zamanlayici.planla(adaylar)
+            haritasi = {h["id"]: h for h in haberler}
+            # Önceki döngüden kalanlar yükseltmeye alınır
+            ertelenen = sorted(ertelenen + kuyruk + [haritasi[i] for i in ertelenen_idleri],
+                               key=lambda h: oncelik_hesapla(h["tarih"], h["kaynak"]), reverse=True)
+            plan = [haritasi[i] for i in model_idleri]
+            kuyruk = []
+
+        # Pencere içinde döngü işleri, sonra kalan sürede yükseltmeler işlenir
+        dongu_sonu = baslangic + argumanlar.aralik
+        dongu_idleri = {h["id"] for h in haberler}
+        bitis = None
+        while plan and saat < dongu_sonu:
+            batch, plan = plan[:BATCH], plan[BATCH:]
+            tahmini = sum(zamanlayici.tahmin(h["token"]) for h in batch)
+            sure = sum(gercek_sure(rastgele, h["token"]) for h in batch)
+            saat += sure
+            zamanlayici.gozlemle([h["token"] for h in batch], sure)
+            zamanlayici.islendi([h["id"] for h in batch], sure)
+            tahmin_hatalari.append(abs(tahmini - sure) / sure)
+            for h in batch:
+                if h["id"] in dongu_idleri and h["kaynak"] >= 3:
+                    onemli_bekleme.append(saat - baslangic)
+        if plan:
+            kuyruk = plan  # Döngü penceresinde bitmedi
+        bitis = saat - baslangic
+        if bitis > argumanlar.butce or plan:
+            pencere_asimi += 1
+        while ertelenen and saat < dongu_sonu:
+            batch, ertelenen = ertelenen[:BATCH], ertelenen[BATCH:]
+            sure = sum(gercek_sure(rastgele, h["token"]) for h in batch)
+            saat += sure
+            zamanlayici.islendi([h["id"] for h in batch], sure)
+
+    return {
+        "pencere_asimi": pencere_asimi,
+        "onemli_medyan": statistics.median(onemli_bekleme) if onemli_bekleme else float("nan"),
+        "tahmin_hatasi": statistics.median(tahmin_hatalari[len(tahmin_hatalari) // 2:]) if tahmin_hatalari else 0.0,
+        "bekleyen": len(kuyruk) + len(ertelenen),
+        "metrikler": zamanlayici.metrikler(),
+    }
+
+
+def main():
+    ayrac = argparse.ArgumentParser(description="Özet zamanlayıcı simülasyonu")
+    ayrac.add_argument("--dongu", type=int, default=6)
+    ayrac.add_argument("--haber", type=int, default=400, help="Döngü başına yeni haber")
+    ayrac.add_argument("--butce", type=float, default=600, help="Döngü başına model bütçesi (sn)")
+    ayrac.add_argument("--aralik", type=float, default=1800, help="Yenileme aralığı (sn)")
+    argumanlar = ayrac.parse_args()
+
+    for strateji in ("fifo", "zamanlayici"):
+        sonuc = simule_et(strateji, argumanlar)
+        print(f"{strateji:<12} bütçeyi aşan döngü: {sonuc['pencere_asimi']}/{argumanlar.dongu}, "
+              f"önemli haberlerin model özeti medyan {sonuc['onemli_medyan']:.0f} sn sonra, "
+              f"sonda bekleyen iş: {sonuc['bekleyen']}")
+        if strateji == "zamanlayici":
+            metrik = sonuc["metrikler"]
+            son = metrik["son_dongu"]
+            print(f"  son döngü: bütçe {son['butce_sn']:.0f} sn, planlanan {son['planlanan_sn']:.0f} sn, "
+                  f"harcanan {son['harcanan_sn']:.0f} sn (kullanım %{son['butce_kullanimi'] * 100:.0f}), "
+                  f"{son['model']} model / {son['ertelenen']} ertelenen")
+            print(f"  toplam: {metrik['toplam']}, tahmin hatası medyan %{sonuc['tahmin_hatasi'] * 100:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Feed Çekici
+-----------
+RSS feed'lerini eşzamanlı olarak indiren motor.
+Tüm kategorilerdeki feed'ler sınırlı bir iş parçacığı havuzunda aynı anda çekilir,
+her sunucu (host) için ayrı bir eşzamanlılık limiti ve keep-alive bağlantı havuzu kullanılır.
+Limiti dolu sunucuların feed'leri o sunucunun sırasında bekler ve ancak bir yer açılınca havuza
+verilir; böylece aynı sunucuyu bekleyen işler diğer sunucuların feed'lerinin önünü tıkamaz.
+İndirilen ham baytlar daha sonra feedparser'a verilir. Bir gövde işleyicisi verilirse başarılı
+yanıtların gövdesi belleğe alınmadan parça parça ona akıtılır; işleyici erken dönerse yanıt
+kapatılır ve gövdenin kalanı hiç indirilmez.
+Bağlantı ve okuma zaman aşımlarına ek olarak her isteğin bir toplam süre sınırı vardır; süre
+dolduğunda okumayı bekleyen soket kapatılır. Böylece veriyi çok yavaş damlatan bir sunucu
+(okuma zaman aşımına hiç takılmadan) çekimi süresiz bekletemez.
+"""
+
+import hashlib
+import socket
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+VARSAYILAN_ISCI_SAYISI = 16   # Aynı anda çekilebilecek toplam feed sayısı
+VARSAYILAN_HOST_LIMITI = 4    # Aynı sunucuya aynı anda açılabilecek bağlantı sayısı
+VARSAYILAN_ZAMAN_ASIMI = (10, 30)  # (bağlantı, okuma) saniye
+VARSAYILAN_TOPLAM_ZAMAN_ASIMI = 60  # Bir feed'in indirilmesi için en fazla süre (saniye)
+GOVDE_PARCASI = 64 * 1024     # Gövde işleyicisine akıtılan parça boyutu (bayt)
+KULLANICI_AJANI = "PRECURSOR/1.0 (+https://github.com/Abdulkadirklc/precursor)"
+
+
+class FeedYaniti:
+    """Tek bir feed isteğinin sonucunu tutar"""
+
+    __slots__ = ("url", "durum_kodu", "icerik", "basliklar", "sure", "ilk_bayt_sn", "hata", "degismedi",
+                 "islenmis", "okunan_bayt", "icerik_ozeti")
+
+    def __init__(self, url, durum_kodu=None, icerik=b"", basliklar=None, sure=0.0, hata=None, ilk_bayt_sn=None,
+                 islenmis=None, okunan_bayt=None, icerik_ozeti=None):
+        self.url = url
+        self.durum_kodu = durum_kodu
+        self.icerik = icerik
+        self.basliklar = basliklar or {}
+        self.sure = sure
+        self.ilk_bayt_sn = ilk_bayt_sn  # İstekten yanıt başlıklarının gelmesine kadar geçen süre
+        self.hata = hata
+        self.degismedi = False  # 304 döndüyse veya içerik önceki çekimle aynıysa True
+        # Gövde işleyicisiyle çekilen yanıtlarda icerik boştur; işleyicinin sonucu, okunan bayt sayısı ve
+        # gövdenin tamamı okunduysa SHA-256 özeti (erken durulduysa None) tutulur
+        self.islenmis = islenmis
+        self.okunan_bayt = len(icerik) if okunan_bayt is None else okunan_bayt
+        self.icerik_ozeti = icerik_ozeti
+
+    @property
+    def basarili(self):
+        return self.hata is None and self.durum_kodu is not None and 200 <= self.durum_kodu < 300
+
+
+def _soketi_kes(yanit):
+    """Gövdeyi okumakta olan isteğin soketini kapatır; bekleyen okuma hemen hata ile döner"""
+    baglanti = getattr(yanit.raw, "connection", None)
+    soket = getattr(baglanti, "sock", None)
+    try:
+        if soket is not None:
+            soket.shutdown(socket.SHUT_RDWR)
+        else:
+            # Bağlantıya erişilemiyorsa gövde akışı kapatılır
+            yanit.raw.close()
+    except OSError:
+        pass
+
+
+class FeedCekici:
+    """Feed'leri sunucu başına limitli, eşzamanlı olarak indirir"""
+
+    def __init__(self, isci_sayisi=VARSAYILAN_ISCI_SAYISI, host_limiti=VARSAYILAN_HOST_LIMITI,
+                 zaman_asimi=VARSAYILAN_ZAMAN_ASIMI, toplam_zaman_asimi=VARSAYILAN_TOPLAM_ZAMAN_ASIMI):
+        self.isci_sayisi = max(1, int(isci_sayisi))
+        self.host_limiti = max(1, int(host_limiti))
+        self.zaman_asimi = zaman_asimi
+        self.toplam_zaman_asimi = toplam_zaman_asimi
+        self._havuz = ThreadPoolExecutor(max_workers=self.isci_sayisi, thread_name_prefix="feed-cekici")
+        self._kilit = threading.Lock()
+        self._aktif = {}       # host -> havuzda çalışan istek sayısı (en fazla host_limiti)
+        self._siralar = {}     # host -> deque[(url, basliklar, isleyici, Future)]; limit dolunca bekleyenler
+        self._oturumlar = {}   # host -> requests.Session (keep-alive bağlantıları burada tutulur)
+
+    def _oturum(self, host):
+        """Sunucuya ait oturumu döndürür, yoksa oluşturur (kilit tutulurken çağrılır)"""
+        if host not in self._oturumlar:
+            oturum = requests.Session()
+            adaptor = HTTPAdapter(pool_connections=1, pool_maxsize=self.host_limiti, pool_block=True)
+            oturum.mount("http://", adaptor)
+            oturum.mount("https://", adaptor)
+            oturum.headers["User-Agent"] = KULLANICI_AJANI
+            self._oturumlar[host] = oturum
+            self._aktif[host] = 0
+            self._siralar[host] = deque()
+        return self._oturumlar[host]
+
+    def _sirala(self, url, basliklar=None, isleyici=None):
+        """Feed'i sunucusunda yer varsa havuza verir, yoksa sunucunun sırasına koyar; Future döndürür"""
+        host = urlsplit(url).netloc.lower()
+        gelecek = Future()
+        with self._kilit:
+            oturum = self._oturum(host)
+            if self._aktif[host] >= self.host_limiti:
+                self._siralar[host].append((url, basliklar, isleyici, gelecek))
+                return gelecek
+            self._aktif[host] += 1
+        self._havuza_ver(host, oturum, url, basliklar, isleyici, gelecek)
+        return gelecek
+
+    def _havuza_ver(self, host, oturum, url, basliklar, isleyici, gelecek):
+        try:
+            self._havuz.submit(self._calistir, host, oturum, url, basliklar, isleyici, gelecek)
+        except RuntimeError as e:  # Havuz kapatıldı
+            gelecek.set_result(FeedYaniti(url, hata=str(e)))
+            self._yer_ac(host)
+
+    def _calistir(self, host, oturum, url, basliklar, isleyici, gelecek):
+        """Feed'i indirir; biter bitmez sunucunun sırasındaki bir sonraki feed'i havuza verir"""
+        try:
+            gelecek.set_result(self._indir(oturum, url, basliklar, isleyici))
+        finally:
+            self._yer_ac(host)
+
+    def _yer_ac(self, host):
+        with self._kilit:
+            sira = self._siralar.get(host)
+            if not sira:
+                self._aktif[host] = max(0, self._aktif.get(host, 1) - 1)
+                return
+            url, basliklar, isleyici, gelecek = sira.popleft()
+            oturum = self._oturumlar[host]
+        # Sunucunun yeri sıradaki feed'e devredilir, aktif sayısı değişmez
+        self._havuza_ver(host, oturum, url, basliklar, isleyici, gelecek)
+
+    def cek(self, url, basliklar=None, isleyici=None):
+        """Tek bir feed'i sunucu limitine uyarak indirir ve FeedYaniti döndürür (hata fırlatmaz)"""
+        return self._sirala(url, basliklar, isleyici).result()
+
+    def _govde_parcalari(self, yanit, baslangic, durum):
+        """Gövdeyi parça parça verir; okunan baytları sayar, süre sınırını parçalar arasında denetler"""
+        ozet = hashlib.sha256()
+        for parca in yanit.iter_content(GOVDE_PARCASI):
+            if self.toplam_zaman_asimi and time.perf_counter() - baslangic >= self.toplam_zaman_asimi:
+                raise TimeoutError()
+            durum["okunan_bayt"] += len(parca)
+            ozet.update(parca)
+            yield parca
+        durum["icerik_ozeti"] = ozet.hexdigest()
+
+    def _indir(self, oturum, url, basliklar, isleyici=None):
+        """İsteği hemen gönderir; sunucu limiti çağıran tarafından sağlanır
+
+        isleyici(parcalar, basliklar): verilirse başarılı yanıtın gövdesi bayt parçalarının yineleyicisi
+        olarak ona verilir; dönüş değeri FeedYaniti.islenmis'e yazılır.
+        """
+        # Süreler sunucu sırası beklendikten sonra ölçülür
+        baslangic = time.perf_counter()
+        try:
+            with oturum.get(url, headers=basliklar, timeout=self.zaman_asimi, stream=True) as yanit:
+                ilk_bayt_sn = time.perf_counter() - baslangic
+                bekci = None
+                if self.toplam_zaman_asimi:
+                    kalan = max(0.0, self.toplam_zaman_asimi - (time.perf_counter() - baslangic))
+                    bekci = threading.Timer(kalan, _soketi_kes, args=(yanit,))
+                    bekci.daemon = True
+                    bekci.start()
+                # feedparser başlıkları küçük harfli anahtarlarla arar (content-type, content-location)
+                yanit_basliklari = {anahtar.lower(): deger for anahtar, deger in yanit.headers.items()}
+                icerik, islenmis = b"", None
+                akis = {"okunan_bayt": 0, "icerik_ozeti": None}
+                try:
+                    if isleyici is not None and 200 <= yanit.status_code < 300:
+                        # İşleyici erken dönerse gövdenin kalanı okunmaz; with bloğundan çıkınca
+                        # yanıt kapatılır ve bağlantı havuza dönmek yerine kapanır
+                        islenmis = isleyici(self._govde_parcalari(yanit, baslangic, akis), yanit_basliklari)
+                    else:
+                        icerik = yanit.content
+                        akis["okunan_bayt"] = len(icerik)
+                finally:
+                    if bekci is not None:
+                        bekci.cancel()
+                sure = time.perf_counter() - baslangic
+                if self.toplam_zaman_asimi and sure >= self.toplam_zaman_asimi:
+                    raise TimeoutError()
+                return FeedYaniti(
+                    url,
+                    durum_kodu=yanit.status_code,
+                    icerik=icerik,
+                    basliklar=yanit_basliklari,
+                    sure=sure,
+                    ilk_bayt_sn=ilk_bayt_sn,
+                    islenmis=islenmis,
+                    okunan_bayt=akis["okunan_bayt"],
+                    icerik_ozeti=akis["icerik_ozeti"]
+                )
+        except Exception as e:
+            sure = time.perf_counter() - baslangic
+            if self.toplam_zaman_asimi and sure >= self.toplam_zaman_asimi:
+                # Soket kesildiğinde gelen bağlantı hatası yerine asıl nedeni bildir
+                hata = f"Toplam zaman aşımı: {self.toplam_zaman_asimi:g} saniyede tamamlanmadı"
+            else:
+                hata = str(e) or type(e).__name__
+            return FeedYaniti(url, hata=hata, sure=sure)
+
+    def hepsini_cek(self, urller, url_basliklari=None, isleyici=None):
+        """Verilen tüm feed'leri eşzamanlı indirir, {url: FeedYaniti} döndürür
+
+        url_basliklari: isteğe bağlı {url: {başlık: değer}} sözlüğü (örn. koşullu GET başlıkları)
+        isleyici: isteğe bağlı gövde işleyicisi (bkz. _indir); başarılı yanıtlar indirilirken işlenir.
+        """
+        url_basliklari = url_basliklari or {}
+        benzersiz = list(dict.fromkeys(urller))
+        gelecekler = {url: self._sirala(url, url_basliklari.get(url), isleyici) for url in benzersiz}
+        return {url: gelecek.result() for url, gelecek in gelecekler.items()}
+
+    def kapat(self):
+        """İş parçacığı havuzunu ve açık bağlantıları kapatır"""
+        self._havuz.shutdown(wait=True)
+        with self._kilit:
+            for oturum in self._oturumlar.values():
+                oturum.close()
+            self._oturumlar.clear()
+            self._aktif.clear()
+            self._siralar.clear()
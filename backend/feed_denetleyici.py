@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Feed Denetleyici
+----------------
+Feed listesini eşzamanlı olarak doğrular. İstekler FeedCekici üzerinden, sunucu başına sınırlı
+sayıda eşzamanlı bağlantıyla gönderilir; feed'ler arasında sabit bekleme yoktur. Her feed için
+zamanlamalar (DNS, bağlantı, ilk bayt, indirme, ayrıştırma), HTTP durumu, haber sayısı, içerik
+uzunluğu istatistikleri ve feedparser'ın bozo hatası raporlanır. DNS ve TCP bağlantı süreleri
+sunucu başına bir kez, ayrı bir bağlantıyla ölçülür ve o sunucudaki tüm feed'lere yazılır.
+Sonuçlar JSON veya CSV olarak yazılabilir.
+"""
+
+import csv
+import json
+import socket
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import urlsplit
+
+import feedparser
+
+from feed_cekici import FeedCekici
+
+OK = "ok"
+UYARI = "uyari"   # Feed okunabildi ama bozo hatası var veya hiç haber yok
+HATA = "hata"     # İndirilemedi veya ayrıştırılamadı
+
+VARSAYILAN_HOST_LIMITI = 2
+VARSAYILAN_ISCI_SAYISI = 16
+VARSAYILAN_ZAMAN_ASIMI = 20.0
+
+CSV_ALANLARI = [
+    "url", "kategoriler", "durum", "http_durum", "hata", "bozo", "haber_sayisi",
+    "dns_sn", "baglanti_sn", "ilk_bayt_sn", "indirme_sn", "ayristirma_sn", "toplam_sn", "bayt",
+    "icerik_min", "icerik_ortalama", "icerik_maks", "baslik",
+]
+
+
+def _yuvarla(deger):
+    return round(deger, 4) if deger is not None else None
+
+
+def host_zamanlamalari(url, zaman_asimi):
+    """Sunucunun DNS çözümleme ve TCP bağlantı süreleri (saniye; ölçülemeyenler None)"""
+    parcalar = urlsplit(url)
+    port = parcalar.port or (443 if parcalar.scheme == "https" else 80)
+    zamanlamalar = {"dns_sn": None, "baglanti_sn": None}
+    try:
+        baslangic = time.perf_counter()
+        adresler = socket.getaddrinfo(parcalar.hostname, port, type=socket.SOCK_STREAM)
+        zamanlamalar["dns_sn"] = _yuvarla(time.perf_counter() - baslangic)
+        aile, tip, protokol, _, adres = adresler[0]
+        with socket.socket(aile, tip, protokol) as soket:
+            soket.settimeout(zaman_asimi)
+            baslangic = time.perf_counter()
+            soket.connect(adres)
+            zamanlamalar["baglanti_sn"] = _yuvarla(time.perf_counter() - baslangic)
+    except (OSError, UnicodeError):
+        pass
+    return zamanlamalar
+
+
+def icerik_uzunlugu(entry):
+    """Haberin içerik alanının (description, summary veya content) karakter uzunluğu"""
+    if hasattr(entry, "description"):
+        return len(entry.description)
+    if hasattr(entry, "summary"):
+        return len(entry.summary)
+    if hasattr(entry, "content") and entry.content:
+        return len(entry.content[0].value)
+    return 0
+
+
+def feed_sonucu(url, yanit, zamanlamalar=None):
+    """Feed yanıtını ayrıştırır; (rapor satırı, ayrıştırılmış feed veya None) döndürür"""
+    sonuc = {
+        "url": url, "durum": HATA, "http_durum": yanit.durum_kodu, "hata": None, "bozo": False,
+        "haber_sayisi": 0, "dns_sn": None, "baglanti_sn": None,
+        "ilk_bayt_sn": _yuvarla(yanit.ilk_bayt_sn),
+        "indirme_sn": _yuvarla(yanit.sure - yanit.ilk_bayt_sn) if yanit.ilk_bayt_sn is not None else None,
+        "ayristirma_sn": None, "toplam_sn": _yuvarla(yanit.sure), "bayt": len(yanit.icerik),
+        "icerik_min": None, "icerik_ortalama": None, "icerik_maks": None, "baslik": None,
+    }
+    sonuc.update(zamanlamalar or {})
+    if not yanit.basarili:
+        sonuc["hata"] = yanit.hata or f"HTTP {yanit.durum_kodu}"
+        return sonuc, None
+
+    baslangic = time.perf_counter()
+    feed = feedparser.parse(yanit.icerik, response_headers=yanit.basliklar)
+    sonuc["ayristirma_sn"] = _yuvarla(time.perf_counter() - baslangic)
+    sonuc["toplam_sn"] = _yuvarla(yanit.sure + sonuc["ayristirma_sn"])
+    sonuc["haber_sayisi"] = len(feed.entries)
+    sonuc["baslik"] = feed.feed.get("title")
+    if feed.bozo:
+        sonuc["bozo"] = True
+        sonuc["hata"] = str(feed.bozo_exception)
+    uzunluklar = [icerik_uzunlugu(entry) for entry in feed.entries]
+    if uzunluklar:
+        sonuc["icerik_min"] = min(uzunluklar)
+        sonuc["icerik_ortalama"] = round(statistics.mean(uzunluklar), 1)
+        sonuc["icerik_maks"] = max(uzunluklar)
+
+    if not feed.entries:
+        # Ayrıştırılamayan gövde (ör. RSS yerine hata sayfası) hata, boş ama geçerli feed uyarıdır
+        sonuc["durum"] = HATA if feed.bozo else UYARI
+        sonuc["hata"] = f"Ayrıştırılamadı: {sonuc['hata']}" if feed.bozo else "Feed'de haber yok"
+    else:
+        sonuc["durum"] = UYARI if feed.bozo else OK
+    return sonuc, feed
+
+
+def denetle(urller, host_limiti=VARSAYILAN_HOST_LIMITI, isci_sayisi=VARSAYILAN_ISCI_SAYISI,
+            zaman_asimi=VARSAYILAN_ZAMAN_ASIMI):
+    """Feed'leri eşzamanlı doğrular; {url: (rapor satırı, feed)} döndürür"""
+    urller = list(dict.fromkeys(urller))
+    hostlar = {}
+    for url in urller:
+        hostlar.setdefault(urlsplit(url).netloc.lower(), url)
+
+    cekici = FeedCekici(isci_sayisi=isci_sayisi, host_limiti=host_limiti,
+                        zaman_asimi=(min(zaman_asimi, 10), zaman_asimi), toplam_zaman_asimi=zaman_asimi)
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(isci_sayisi, len(hostlar)))) as havuz:
+            host_gelecekleri = {host: havuz.submit(host_zamanlamalari, url, zaman_asimi) for host, url in hostlar.items()}
+            yanitlar = cekici.hepsini_cek(urller)
+            host_sonuclari = {host: gelecek.result() for host, gelecek in host_gelecekleri.items()}
+    finally:
+        cekici.kapat()
+
+    return {url: feed_sonucu(url, yanitlar[url], host_sonuclari[urlsplit(url).netloc.lower()]) for url in urller}
+
+
+def ozet(sonuclar):
+    """Durumlara göre feed sayıları ve toplam süre istatistikleri"""
+    toplamlar = [sonuc["toplam_sn"] for sonuc in sonuclar if sonuc["toplam_sn"] is not None]
+    return {
+        "feed": len(sonuclar),
+        OK: sum(1 for sonuc in sonuclar if sonuc["durum"] == OK),
+        UYARI: sum(1 for sonuc in sonuclar if sonuc["durum"] == UYARI),
+        HATA: sum(1 for sonuc in sonuclar if sonuc["durum"] == HATA),
+        "haber": sum(sonuc["haber_sayisi"] for sonuc in sonuclar),
+        "toplam_sn_medyan": _yuvarla(statistics.median(toplamlar)) if toplamlar else None,
+        "toplam_sn_maks": _yuvarla(max(toplamlar)) if toplamlar else None,
+    }
+
+
+def json_yaz(dosya_yolu, sonuclar, sure_sn):
+    """Raporu özet bilgisiyle birlikte JSON olarak yazar"""
+    with open(dosya_yolu, "w", encoding="utf-8") as dosya:
+        json.dump({
+            "tarih": datetime.now().isoformat(timespec="seconds"),
+            "sure_sn": round(sure_sn, 3),
+            "ozet": ozet(sonuclar),
+            "feedler": sonuclar,
+        }, dosya, ensure_ascii=False, indent=2)
+
+
+def csv_yaz(dosya_yolu, sonuclar):
+    """Raporu feed başına bir satır olarak CSV'ye yazar"""
+    with open(dosya_yolu, "w", encoding="utf-8", newline="") as dosya:
+        yazici = csv.DictWriter(dosya, fieldnames=CSV_ALANLARI, extrasaction="ignore")
+        yazici.writeheader()
+        for sonuc in sonuclar:
+            satir = dict(sonuc)
+            satir["kategoriler"] = ";".join(sonuc.get("kategoriler", []))
+            yazici.writerow(satir)
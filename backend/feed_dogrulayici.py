@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Feed Doğrulayıcı Önbelleği
+--------------------------
+Her feed için ETag, Last-Modified ve içerik özetini (hash) SQLite'ta saklar.
+Sonraki isteklerde bu değerler koşullu GET başlıkları olarak gönderilir;
+304 yanıtı veya içeriği değişmemiş bir gövde gelirse feed ayrıştırılmadan atlanır.
+Gövdesi indirilirken işlenip erken bırakılan yanıtların özeti bilinmez; bunlar her zaman yeni sayılır.
+"""
+
+import hashlib
+import threading
+
+
+DEGISMEDI = "degismedi"   # Sunucu 304 döndürdü
+AYNI_ICERIK = "ayni"      # 200 geldi ama gövdenin hash'i aynı
+YENI_ICERIK = "yeni"      # İçerik değişmiş, işlenmeli
+
+
+def icerik_hash(icerik):
+    """Feed gövdesinin SHA-256 özetini döndürür"""
+    return hashlib.sha256(icerik or b"").hexdigest()
+
+
+def yanit_hash(yanit):
+    """Yanıt gövdesinin özeti; gövde işleyicisiyle çekilip tamamı okunmadıysa None"""
+    if yanit.islenmis is not None:
+        return yanit.icerik_ozeti
+    return icerik_hash(yanit.icerik)
+
+
+class FeedDogrulayiciOnbellegi:
+    """Feed başına koşullu GET doğrulayıcılarını tutan kalıcı önbellek"""
+
+    def __init__(self, baglanti_fabrikasi):
+        self._baglanti_fabrikasi = baglanti_fabrikasi
+        self._kilit = threading.Lock()
+        self._kayitlar = {}  # url -> {"etag", "son_degisiklik", "icerik_hash", "boyut"}
+
+    def tablo_olustur(self):
+        """Tabloyu oluşturur ve mevcut kayıtları belleğe yükler"""
+        conn = self._baglanti_fabrikasi()
+        conn.execute('''
+        CREATE TABLE IF NOT EXISTS feed_dogrulayicilar (
+            url TEXT PRIMARY KEY,
+            etag TEXT,
+            son_degisiklik TEXT,
+            icerik_hash TEXT,
+            boyut INTEGER NOT NULL DEFAULT 0,
+            guncelleme_tarihi TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''')
+        conn.commit()
+        satirlar = conn.execute(
+            'SELECT url, etag, son_degisiklik, icerik_hash, boyut FROM feed_dogrulayicilar'
+        ).fetchall()
+        conn.close()
+        with self._kilit:
+            self._kayitlar = {
+                satir[0]: {"etag": satir[1], "son_degisiklik": satir[2], "icerik_hash": satir[3], "boyut": satir[4]}
+                for satir in satirlar
+            }
+
+    def kosullu_basliklar(self, url):
+        """Feed için gönderilecek If-None-Match / If-Modified-Since başlıklarını döndürür"""
+        with self._kilit:
+            kayit = self._kayitlar.get(url)
+        if not kayit:
+            return {}
+        basliklar = {}
+        if kayit["etag"]:
+            basliklar["If-None-Match"] = kayit["etag"]
+        if kayit["son_degisiklik"]:
+            basliklar["If-Modified-Since"] = kayit["son_degisiklik"]
+        return basliklar
+
+    def karsilastir(self, url, yanit):
+        """Yanıtı önbellekle karşılaştırır: (DEGISMEDI | AYNI_ICERIK | YENI_ICERIK, kazanılan bayt)"""
+        with self._kilit:
+            kayit = self._kayitlar.get(url)
+        if kayit is None:
+            return YENI_ICERIK, 0
+        if yanit.durum_kodu == 304:
+            return DEGISMEDI, kayit["boyut"]
+        ozet = yanit_hash(yanit) if yanit.basarili else None
+        if ozet is not None and ozet == kayit["icerik_hash"]:
+            # Gövde aynı; sunucunun yeni doğrulayıcılarını yine de sakla
+            self.kaydet(url, yanit)
+            return AYNI_ICERIK, 0
+        return YENI_ICERIK, 0
+
+    def kaydet(self, url, yanit):
+        """Başarıyla işlenen bir yanıtın doğrulayıcılarını saklar"""
+        basliklar = {k.lower(): v for k, v in yanit.basliklar.items()}
+        kayit = {
+            "etag": basliklar.get("etag"),
+            "son_degisiklik": basliklar.get("last-modified"),
+            "icerik_hash": yanit_hash(yanit),
+            "boyut": yanit.okunan_bayt
+        }
+        conn = self._baglanti_fabrikasi()
+        conn.execute('''
+        INSERT INTO feed_dogrulayicilar (url, etag, son_degisiklik, icerik_hash, boyut, guncelleme_tarihi)
+        VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT(url) DO UPDATE SET
+            etag = excluded.etag,
+            son_degisiklik = excluded.son_degisiklik,
+            icerik_hash = excluded.icerik_hash,
+            boyut = excluded.boyut,
+            guncelleme_tarihi = excluded.guncelleme_tarihi
+        ''', (url, kayit["etag"], kayit["son_degisiklik"], kayit["icerik_hash"], kayit["boyut"]))
+        conn.commit()
+        conn.close()
+        with self._kilit:
+            self._kayitlar[url] = kayit
+
+    def temizle(self):
+        """Tüm doğrulayıcıları siler (veritabanı sıfırlandığında feed'lerin tamamı yeniden çekilmeli)"""
+        conn = self._baglanti_fabrikasi()
+        conn.execute('DELETE FROM feed_dogrulayicilar')
+        conn.commit()
+        conn.close()
+        with self._kilit:
+            self._kayitlar.clear()
@@ -0,0 +1,230 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Feed Sağlığı
+------------
+Her feed için çekim gecikmesini, hata sayılarını ve son başarılı çekimi SQLite'ta (feed_sagligi) tutar
+ve feed başına bir devre kesici uygular. Art arda hata_esigi kez başarısız olan feed'in devresi açılır
+ve bekleme süresi dolana kadar hiç istek gönderilmez. Süre dolunca devre yarı açık olur ve tek bir
+deneme isteğine izin verilir: deneme başarılıysa devre kapanır, başarısızsa bekleme süresi iki
+katına çıkarak (maks_bekleme_sn'ye kadar) devre yeniden açılır.
+Aynı tablo hem uygulama hem de rss_yonetici.py tarafından güncellenir: her güncelleme kaydı yazma
+işlemi içinde veritabanından yeniden okuyup değiştirir, raporlar veritabanından okunur. Böylece
+süreçler birbirinin sayaçlarını ve devre durumunu ezmez.
+"""
+
+import threading
+import time
+
+KAPALI = "kapali"          # Normal çalışma, istekler gönderilir
+ACIK = "acik"              # Feed bozuk sayılıyor, bekleme süresi boyunca istek gönderilmez
+YARI_ACIK = "yari_acik"    # Bekleme bitti, tek bir deneme isteği gönderilir
+
+VARSAYILAN_HATA_ESIGI = 3
+VARSAYILAN_BEKLEME_SN = 300.0
+VARSAYILAN_MAKS_BEKLEME_SN = 6 * 3600.0
+GECIKME_OGRENME_ORANI = 0.3
+MAKS_HATA_UZUNLUGU = 500
+
+
+class FeedSagligi:
+    """Feed başına kalıcı sağlık kaydı ve devre kesici"""
+
+    def __init__(self, baglanti_fabrikasi, hata_esigi=VARSAYILAN_HATA_ESIGI, bekleme_sn=VARSAYILAN_BEKLEME_SN,
+                 maks_bekleme_sn=VARSAYILAN_MAKS_BEKLEME_SN):
+        self._baglanti_fabrikasi = baglanti_fabrikasi
+        self.hata_esigi = max(1, int(hata_esigi))
+        self.bekleme_sn = float(bekleme_sn)
+        self.maks_bekleme_sn = max(self.bekleme_sn, float(maks_bekleme_sn))
+        self._kilit = threading.Lock()
+        self._kayitlar = {}   # url -> kayıt sözlüğü
+        self._denemeler = set()  # Yarı açık devrelerde deneme isteği sürmekte olan feed'ler
+
+    def tablo_olustur(self):
+        """Tabloyu oluşturur ve kayıtları belleğe yükler"""
+        conn = self._baglanti_fabrikasi()
+        conn.execute('''
+        CREATE TABLE IF NOT EXISTS feed_sagligi (
+            url TEXT PRIMARY KEY,
+            devre TEXT NOT NULL DEFAULT 'kapali',
+            ardisik_hata INTEGER NOT NULL DEFAULT 0,
+            cekim_sayisi INTEGER NOT NULL DEFAULT 0,
+            hata_sayisi INTEGER NOT NULL DEFAULT 0,
+            son_gecikme_sn REAL,
+            ortalama_gecikme_sn REAL,      -- Üstel ortalama
+            son_basari REAL,
+            son_hata_zamani REAL,
+            son_hata TEXT,
+            bekleme_sn REAL,               -- Devre açıkken geçerli bekleme süresi
+            yeniden_deneme REAL            -- Devre açıksa deneme isteğinin gönderilebileceği zaman
+        )
+        ''')
+        conn.commit()
+        conn.close()
+        self.yenile()
+
+    def yenile(self):
+        """Bellekteki kayıtları veritabanından yeniden yükler (başka süreçlerin yazdıkları dahil)"""
+        conn = self._baglanti_fabrikasi()
+        try:
+            satirlar = conn.execute('SELECT * FROM feed_sagligi').fetchall()
+        finally:
+            conn.close()
+        with self._kilit:
+            self._kayitlar = {satir["url"]: self._yarim_acik_koru(dict(satir)) for satir in satirlar}
+
+    def _yarim_acik_koru(self, kayit):
+        # Yarı açık durum yalnızca bellekte tutulur; deneme isteği sürerken okunan açık devre yarı açık kalır
+        if kayit["url"] in self._denemeler and kayit["devre"] == ACIK:
+            kayit["devre"] = YARI_ACIK
+        return kayit
+
+    def _guncelle(self, url, degistir):
+        """Kaydı yazma işlemi içinde veritabanından okur, degistir(kayit) ile değiştirip yazar
+
+        degistir kilit altında çağrılır ve dönüş değeri döndürülür; bellekteki kayıt yazma başarılı olunca güncellenir.
+        """
+        conn = self._baglanti_fabrikasi()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            satir = conn.execute('SELECT * FROM feed_sagligi WHERE url = ?', (url,)).fetchone()
+            with self._kilit:
+                if satir is None:
+                    kayit = {
+                        "url": url, "devre": KAPALI, "ardisik_hata": 0, "cekim_sayisi": 0, "hata_sayisi": 0,
+                        "son_gecikme_sn": None, "ortalama_gecikme_sn": None, "son_basari": None,
+                        "son_hata_zamani": None, "son_hata": None, "bekleme_sn": None, "yeniden_deneme": None,
+                    }
+                else:
+                    kayit = self._yarim_acik_koru(dict(satir))
+                self._denemeler.discard(url)
+                sonuc = degistir(kayit)
+            self._satir_yaz(conn, kayit)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+        with self._kilit:
+            self._kayitlar[url] = kayit
+        return sonuc
+
+    def _satir_yaz(self, conn, kayit):
+        conn.execute('''
+        INSERT INTO feed_sagligi (url, devre, ardisik_hata, cekim_sayisi, hata_sayisi, son_gecikme_sn,
+                                  ortalama_gecikme_sn, son_basari, son_hata_zamani, son_hata, bekleme_sn, yeniden_deneme)
+        VALUES (:url, :devre, :ardisik_hata, :cekim_sayisi, :hata_sayisi, :son_gecikme_sn,
+                :ortalama_gecikme_sn, :son_basari, :son_hata_zamani, :son_hata, :bekleme_sn, :yeniden_deneme)
+        ON CONFLICT(url) DO UPDATE SET
+            devre = excluded.devre, ardisik_hata = excluded.ardisik_hata, cekim_sayisi = excluded.cekim_sayisi,
+            hata_sayisi = excluded.hata_sayisi, son_gecikme_sn = excluded.son_gecikme_sn,
+            ortalama_gecikme_sn = excluded.ortalama_gecikme_sn, son_basari = excluded.son_basari,
+            son_hata_zamani = excluded.son_hata_zamani, son_hata = excluded.son_hata,
+            bekleme_sn = excluded.bekleme_sn, yeniden_deneme = excluded.yeniden_deneme
+        ''', kayit)
+
+    def bekleme_bitisi(self, url, simdi=None):
+        """Feed'e istek gönderilebiliyorsa None, devre açıksa deneme isteğinin mümkün olacağı zaman
+
+        Bekleme süresi dolmuş açık devre yarı açık olur ve tek bir çağırana izin verilir;
+        deneme sonuçlanana kadar diğer çağıranlar beklemeye devam eder.
+        """
+        simdi = time.time() if simdi is None else simdi
+        with self._kilit:
+            kayit = self._kayitlar.get(url)
+            if kayit is None or kayit["devre"] == KAPALI:
+                return None
+            if url in self._denemeler:
+                return simdi + (kayit["bekleme_sn"] or self.bekleme_sn)
+            if kayit["devre"] == ACIK and simdi < kayit["yeniden_deneme"]:
+                return kayit["yeniden_deneme"]
+            kayit["devre"] = YARI_ACIK
+            self._denemeler.add(url)
+            return None
+
+    def basari(self, url, gecikme_sn, simdi=None):
+        """Başarılı çekimi kaydeder; açık veya yarı açık devre kapanır"""
+        simdi = time.time() if simdi is None else simdi
+
+        def degistir(kayit):
+            kapandi = kayit["devre"] != KAPALI
+            kayit.update(devre=KAPALI, ardisik_hata=0, son_basari=simdi, bekleme_sn=None, yeniden_deneme=None)
+            kayit["cekim_sayisi"] += 1
+            self._gecikme_isle(kayit, gecikme_sn)
+            return kapandi
+        return self._guncelle(url, degistir)
+
+    def hata(self, url, hata, gecikme_sn=None, simdi=None):
+        """Başarısız çekimi kaydeder; eşik aşıldıysa veya deneme başarısızsa devre açılır
+
+        Devre bu çağrıyla açıldıysa True döner.
+        """
+        simdi = time.time() if simdi is None else simdi
+
+        def degistir(kayit):
+            kayit["cekim_sayisi"] += 1
+            kayit["ardisik_hata"] += 1
+            kayit["hata_sayisi"] += 1
+            kayit["son_hata_zamani"] = simdi
+            kayit["son_hata"] = str(hata)[:MAKS_HATA_UZUNLUGU]
+            if gecikme_sn is not None:
+                self._gecikme_isle(kayit, gecikme_sn)
+            acildi = False
+            if kayit["devre"] == YARI_ACIK:
+                # Deneme başarısız: bekleme süresi ikiye katlanarak devre yeniden açılır
+                kayit["bekleme_sn"] = min((kayit["bekleme_sn"] or self.bekleme_sn) * 2, self.maks_bekleme_sn)
+                acildi = True
+            elif kayit["devre"] == KAPALI and kayit["ardisik_hata"] >= self.hata_esigi:
+                kayit["bekleme_sn"] = self.bekleme_sn
+                acildi = True
+            if acildi:
+                kayit["devre"] = ACIK
+                kayit["yeniden_deneme"] = simdi + kayit["bekleme_sn"]
+            return acildi
+        return self._guncelle(url, degistir)
+
+    def _gecikme_isle(self, kayit, gecikme_sn):
+        kayit["son_gecikme_sn"] = round(gecikme_sn, 3)
+        ortalama = kayit["ortalama_gecikme_sn"]
+        ortalama = gecikme_sn if ortalama is None else ortalama + GECIKME_OGRENME_ORANI * (gecikme_sn - ortalama)
+        kayit["ortalama_gecikme_sn"] = round(ortalama, 3)
+
+    def kayit(self, url):
+        """Feed'in sağlık kaydının kopyası (hiç çekilmediyse None)"""
+        with self._kilit:
+            kayit = self._kayitlar.get(url)
+            return dict(kayit) if kayit else None
+
+    def rapor(self, urller=None):
+        """Feed'lerin sağlık kayıtları (urller verilirse yalnızca onlar, hiç çekilmemişler dahil)
+
+        Kayıtlar önce veritabanından yenilenir; rss_yonetici.py'nin işledikleri de rapora girer.
+        """
+        self.yenile()
+        with self._kilit:
+            if urller is None:
+                urller = list(self._kayitlar)
+            kayitlar = []
+            for url in urller:
+                kayit = dict(self._kayitlar.get(url) or {"url": url, "devre": KAPALI, "ardisik_hata": 0,
+                                                           "cekim_sayisi": 0, "hata_sayisi": 0})
+                kayit["hata_orani"] = round(kayit["hata_sayisi"] / kayit["cekim_sayisi"], 3) if kayit["cekim_sayisi"] else None
+                kayitlar.append(kayit)
+        return kayitlar
+
+    def esitle(self, urller):
+        """Yapılandırmada artık bulunmayan feed'lerin kayıtlarını siler"""
+        urller = set(urller)
+        with self._kilit:
+            silinen = [url for url in self._kayitlar if url not in urller]
+            for url in silinen:
+                del self._kayitlar[url]
+                self._denemeler.discard(url)
+        if not silinen:
+            return
+        conn = self._baglanti_fabrikasi()
+        conn.executemany('DELETE FROM feed_sagligi WHERE url = ?', [(url,) for url in silinen])
+        conn.commit()
+        conn.close()
@@ -0,0 +1,297 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Feed Zamanlayıcı
+----------------
+Her feed için bir sonraki çekim zamanını tutar; vadesi gelen feed'ler bir öncelik kuyruğundan
+(heap) alınır. Çekim aralığı feed'in gözlenen yayın hızına göre ayarlanır: her çekimde gelen
+yeni haber sayısı, önceki çekimden bu yana geçen süreye bölünerek üstel ortalamayla yayın hızı
+tahmin edilir ve aralık, yaklaşık HEDEF_YENI_HABER kadar yeni haber birikecek süreye ayarlanır.
+Yeni haber gelmeyen veya değişmeyen feed'lerde tahmin düştükçe aralık uzar; hata veren
+feed'lerde aralık ardışık hata sayısıyla üstel olarak büyür. Aralıklar alt ve üst sınırla kırpılır
+ve aynı anda vadesi gelen feed'ler yığılmasın diye rastgele sapma eklenir.
+Durum SQLite'ta (feed_takvimi) saklanır; yeniden başlatmada takvim kaldığı yerden devam eder.
+"""
+
+import calendar
+import heapq
+import random
+import statistics
+import threading
+import time
+from collections import deque
+
+VARSAYILAN_ARALIK_SN = 1800.0    # İlk çekimde ve yayın hızı bilinmeyen feed'lerde (eski sabit döngü)
+MIN_ARALIK_SN = 120.0
+MAKS_ARALIK_SN = 6 * 3600.0
+HEDEF_YENI_HABER = 1.0           # Bir çekimde beklenen yeni haber sayısı
+DOYMA_ESIGI = 5                  # Feed başına alınan en fazla haber; bu kadar geldiyse kaçırılan olabilir
+OGRENME_ORANI = 0.5
+SAPMA_ORANI = 0.1                # Aralığa eklenen ±%10 rastgele sapma
+METRIK_PENCERESI_SN = 3600.0
+ERKEN_CEKIM_SN = 30.0            # Vadesine bu kadar kalan feed'ler de aynı turda çekilir
+
+
+def yayin_zamani(entry):
+    """feedparser girdisinin yayın zamanı (UTC epoch) veya None"""
+    zaman = getattr(entry, "published_parsed", None) or getattr(entry, "updated_parsed", None)
+    if not zaman:
+        return None
+    try:
+        return float(calendar.timegm(zaman))
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+class FeedZamanlayici:
+    """Feed başına uyarlanan çekim aralıklarıyla çalışan kalıcı yenileme takvimi"""
+
+    def __init__(self, baglanti_fabrikasi, min_aralik_sn=MIN_ARALIK_SN, maks_aralik_sn=MAKS_ARALIK_SN,
+                 varsayilan_aralik_sn=VARSAYILAN_ARALIK_SN, rastgele=None):
+        self._baglanti_fabrikasi = baglanti_fabrikasi
+        self.min_aralik_sn = float(min_aralik_sn)
+        self.maks_aralik_sn = max(self.min_aralik_sn, float(maks_aralik_sn))
+        self.varsayilan_aralik_sn = min(max(float(varsayilan_aralik_sn), self.min_aralik_sn), self.maks_aralik_sn)
+        self._rastgele = rastgele or random.Random()
+        self._kosul = threading.Condition()
+        self._feedler = {}   # url -> durum sözlüğü
+        self._yigin = []     # (sonraki_zaman, url); eskimiş girdiler alınırken atlanır
+        self._alinanlar = set()      # Çekime verilmiş, sonucu henüz kaydedilmemiş feed'ler
+        self._cekimler = deque()     # (zaman, yeni haber geldi mi)
+        self._gecikmeler = deque()   # (zaman, yayından çekime geçen süre)
+
+    def tablo_olustur(self):
+        """Tabloyu oluşturur ve kayıtlı takvimi belleğe yükler"""
+        conn = self._baglanti_fabrikasi()
+        conn.execute('''
+        CREATE TABLE IF NOT EXISTS feed_takvimi (
+            url TEXT PRIMARY KEY,
+            sonraki_zaman REAL NOT NULL,
+            aralik_sn REAL NOT NULL,
+            yayin_hizi REAL,               -- Tahmini yeni haber / saniye (bilinmiyorsa NULL)
+            son_cekim REAL,
+            son_yeni_haber REAL,
+            ardisik_hata INTEGER NOT NULL DEFAULT 0,
+            ardisik_bos INTEGER NOT NULL DEFAULT 0,
+            cekim_sayisi INTEGER NOT NULL DEFAULT 0,
+            yeni_haber_sayisi INTEGER NOT NULL DEFAULT 0
+        )
+        ''')
+        conn.commit()
+        satirlar = conn.execute('SELECT * FROM feed_takvimi').fetchall()
+        conn.close()
+        with self._kosul:
+            self._feedler = {satir["url"]: dict(satir) for satir in satirlar}
+            self._yigin = [(durum["sonraki_zaman"], url) for url, durum in self._feedler.items()]
+            heapq.heapify(self._yigin)
+
+    def esitle(self, urller):
+        """Takvimi yapılandırmadaki feed listesine eşitler: yeni feed'ler hemen vadeye girer, silinenler çıkar"""
+        urller = set(urller)
+        simdi = time.time()
+        with self._kosul:
+            eklenen = [url for url in urller if url not in self._feedler]
+            silinen = [url for url in self._feedler if url not in urller]
+            for url in eklenen:
+                self._feedler[url] = {
+                    "url": url, "sonraki_zaman": simdi, "aralik_sn": self.varsayilan_aralik_sn, "yayin_hizi": None,
+                    "son_cekim": None, "son_yeni_haber": None, "ardisik_hata": 0, "ardisik_bos": 0,
+                    "cekim_sayisi": 0, "yeni_haber_sayisi": 0,
+                }
+                heapq.heappush(self._yigin, (simdi, url))
+            for url in silinen:
+                del self._feedler[url]
+            self._kosul.notify_all()
+        conn = self._baglanti_fabrikasi()
+        if silinen:
+            conn.executemany('DELETE FROM feed_takvimi WHERE url = ?', [(url,) for url in silinen])
+        for url in eklenen:
+            self._satir_yaz(conn, self._feedler[url])
+        conn.commit()
+        conn.close()
+
+    def _satir_yaz(self, conn, durum):
+        conn.execute('''
+        INSERT INTO feed_takvimi (url, sonraki_zaman, aralik_sn, yayin_hizi, son_cekim, son_yeni_haber,
+                                  ardisik_hata, ardisik_bos, cekim_sayisi, yeni_haber_sayisi)
+        VALUES (:url, :sonraki_zaman, :aralik_sn, :yayin_hizi, :son_cekim, :son_yeni_haber,
+                :ardisik_hata, :ardisik_bos, :cekim_sayisi, :yeni_haber_sayisi)
+        ON CONFLICT(url) DO UPDATE SET
+            sonraki_zaman = excluded.sonraki_zaman, aralik_sn = excluded.aralik_sn,
+            yayin_hizi = excluded.yayin_hizi, son_cekim = excluded.son_cekim,
+            son_yeni_haber = excluded.son_yeni_haber, ardisik_hata = excluded.ardisik_hata,
+            ardisik_bos = excluded.ardisik_bos, cekim_sayisi = excluded.cekim_sayisi,
+            yeni_haber_sayisi = excluded.yeni_haber_sayisi
+        ''', durum)
+
+    def siradakiler(self, zaman_asimi=None, erken_sn=ERKEN_CEKIM_SN):
+        """Vadesi gelen feed'leri döndürür; yoksa ilk vadeye kadar (en fazla zaman_asimi sn) bekler
+
+        Bir feed'in vadesi geldiğinde, vadesine erken_sn'den az kalanlar da aynı turda döner.
+        Dönen feed'ler çekim sonucu kaydedilene kadar takvimden düşer; aynı feed iki kez alınmaz.
+        """
+        bitis = None if zaman_asimi is None else time.monotonic() + zaman_asimi
+        with self._kosul:
+            while True:
+                simdi = time.time()
+                vadesi_gelenler = []
+                sinir = simdi + erken_sn if self._yigin and self._yigin[0][0] <= simdi else simdi
+                while self._yigin and self._yigin[0][0] <= sinir:
+                    zaman, url = heapq.heappop(self._yigin)
+                    durum = self._feedler.get(url)
+                    # Silinmiş feed'lerin veya yeniden planlanmış eski girdilerin kalıntıları atlanır
+                    if durum is not None and durum["sonraki_zaman"] == zaman:
+                        vadesi_gelenler.append(url)
+                if vadesi_gelenler:
+                    self._alinanlar.update(vadesi_gelenler)
+                    return vadesi_gelenler
+                bekleme = self._yigin[0][0] - simdi if self._yigin else None
+                if bitis is not None:
+                    kalan = bitis - time.monotonic()
+                    if kalan <= 0:
+                        return []
+                    bekleme = kalan if bekleme is None else min(bekleme, kalan)
+                self._kosul.wait(bekleme)
+
+    def _kirp(self, aralik):
+        return min(max(aralik, self.min_aralik_sn), self.maks_aralik_sn)
+
+    def kaydet(self, url, yayin_zamanlari=None, hata=False, simdi=None):
+        """Bir çekimin sonucunu işler ve feed'in bir sonraki çekim zamanını belirler
+
+        yayin_zamanlari: bu çekimde gelen yeni haberlerin yayın zamanları (UTC epoch, bilinmeyenler None);
+        değişmeyen veya yeni haber içermeyen feed için boş liste.
+        """
+        simdi = time.time() if simdi is None else simdi
+        yayin_zamanlari = list(yayin_zamanlari or [])
+        with self._kosul:
+            durum = self._feedler.get(url)
+            if durum is None:
+                return None
+            self._alinanlar.discard(url)
+            durum["cekim_sayisi"] += 1
+            if hata:
+                durum["ardisik_hata"] += 1
+                # Hata veren feed: alt sınırdan başlayıp her ardışık hatada iki katına çıkan bekleme
+                aralik = self._kirp(self.min_aralik_sn * 2 ** min(durum["ardisik_hata"], 16))
+            else:
+                durum["ardisik_hata"] = 0
+                aralik = self._yeni_aralik(durum, yayin_zamanlari, simdi)
+                durum["aralik_sn"] = aralik
+                durum["son_cekim"] = simdi
+                self._cekimler.append((simdi, bool(yayin_zamanlari)))
+                for zaman in yayin_zamanlari:
+                    if zaman is not None:
+                        self._gecikmeler.append((simdi, max(0.0, simdi - zaman)))
+                self._pencereyi_kirp(simdi)
+
+            sapma = 1 + self._rastgele.uniform(-SAPMA_ORANI, SAPMA_ORANI)
+            durum["sonraki_zaman"] = simdi + aralik * sapma
+            heapq.heappush(self._yigin, (durum["sonraki_zaman"], url))
+            kopya = dict(durum)
+            self._kosul.notify_all()
+
+        conn = self._baglanti_fabrikasi()
+        self._satir_yaz(conn, kopya)
+        conn.commit()
+        conn.close()
+        return kopya
+
+    def _yeni_aralik(self, durum, yayin_zamanlari, simdi):
+        yeni = len(yayin_zamanlari)
+        if yeni:
+            durum["son_yeni_haber"] = simdi
+            durum["yeni_haber_sayisi"] += yeni
+            durum["ardisik_bos"] = 0
+        else:
+            durum["ardisik_bos"] += 1
+
+        if durum["son_cekim"] is not None:
+            gozlem = yeni / max(simdi - durum["son_cekim"], 1.0)
+        else:
+            # İlk çekim: gelen haberlerin yayın zamanlarının yayılımından hız tahmini
+            bilinen = sorted(zaman for zaman in yayin_zamanlari if zaman is not None)
+            if len(bilinen) < 2 or bilinen[-1] <= bilinen[0]:
+                return durum["aralik_sn"]
+            gozlem = (len(bilinen) - 1) / (bilinen[-1] - bilinen[0])
+
+        hiz = durum["yayin_hizi"]
+        hiz = gozlem if hiz is None else hiz + OGRENME_ORANI * (gozlem - hiz)
+        durum["yayin_hizi"] = hiz
+        aralik = HEDEF_YENI_HABER / hiz if hiz > 0 else self.maks_aralik_sn
+        if yeni >= DOYMA_ESIGI:
+            # Feed başına alınabilecek haber sınırı doldu; arada kaçırılan haber olabilir
+            aralik = min(aralik, durum["aralik_sn"] / 2)
+        return self._kirp(aralik)
+
+    def _pencereyi_kirp(self, simdi):
+        sinir = simdi - METRIK_PENCERESI_SN
+        while self._cekimler and self._cekimler[0][0] < sinir:
+            self._cekimler.popleft()
+        while self._gecikmeler and self._gecikmeler[0][0] < sinir:
+            self._gecikmeler.popleft()
+
+    def ertele(self, url, zaman):
+        """Feed'i çekim yapılmadan verilen zamana erteler (ör. devresi açık feed)"""
+        with self._kosul:
+            durum = self._feedler.get(url)
+            if durum is None:
+                return
+            self._alinanlar.discard(url)
+            durum["sonraki_zaman"] = zaman
+            heapq.heappush(self._yigin, (zaman, url))
+            kopya = dict(durum)
+            self._kosul.notify_all()
+        conn = self._baglanti_fabrikasi()
+        self._satir_yaz(conn, kopya)
+        conn.commit()
+        conn.close()
+
+    def sonuclanmayanlari_ertele(self, urller):
+        """Çekime verilip sonucu kaydedilmeyen feed'leri hatalı sayarak takvime geri koyar"""
+        with self._kosul:
+            eksikler = [url for url in urller if url in self._alinanlar]
+        for url in eksikler:
+            self.kaydet(url, hata=True)
+        return len(eksikler)
+
+    def hepsini_vadeye_al(self):
+        """Tüm feed'leri hemen çekilecek şekilde işaretler (ör. veritabanı sıfırlandığında)"""
+        simdi = time.time()
+        with self._kosul:
+            for url, durum in self._feedler.items():
+                durum["sonraki_zaman"] = simdi
+                heapq.heappush(self._yigin, (simdi, url))
+            self._kosul.notify_all()
+        conn = self._baglanti_fabrikasi()
+        conn.execute('UPDATE feed_takvimi SET sonraki_zaman = ?', (simdi,))
+        conn.commit()
+        conn.close()
+
+    def metrikler(self):
+        """Son bir saatteki çekim sayısı, boşa çekim oranı, tazelik gecikmesi ve feed takvimi"""
+        simdi = time.time()
+        with self._kosul:
+            self._pencereyi_kirp(simdi)
+            cekimler = list(self._cekimler)
+            gecikmeler = sorted(gecikme for _, gecikme in self._gecikmeler)
+            feedler = sorted((dict(durum) for durum in self._feedler.values()), key=lambda durum: durum["sonraki_zaman"])
+        bos = sum(1 for _, yeni_var in cekimler if not yeni_var)
+        return {
+            "saatlik_cekim": len(cekimler),
+            "bos_cekim_orani": round(bos / len(cekimler), 3) if cekimler else None,
+            "tazelik_gecikmesi_sn": {
+                "p50": round(statistics.median(gecikmeler), 1) if gecikmeler else None,
+                "p95": round(gecikmeler[min(len(gecikmeler) - 1, int(0.95 * len(gecikmeler)))], 1) if gecikmeler else None,
+                "haber": len(gecikmeler),
+            },
+            "feedler": [{
+                "url": durum["url"],
+                "sonraki_cekim_sn": round(max(0.0, durum["sonraki_zaman"] - simdi), 1),
+                "aralik_sn": round(durum["aralik_sn"], 1),
+                "saatlik_yayin": round(durum["yayin_hizi"] * 3600, 2) if durum["yayin_hizi"] is not None else None,
+                "ardisik_hata": durum["ardisik_hata"],
+                "ardisik_bos": durum["ardisik_bos"],
+            } for durum in feedler],
+        }
@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Haber Akışı
+-----------
+/api/akis uç noktasının Server-Sent Events dağıtıcısı. Haber toplama ve özetleme yazmaları commit
+edildikten sonra olaylar (yeni haber, özet yükseltmesi) buraya yayınlanır; her olay bir kez JSON'a
+çevrilir ve tüm abonelerin tamponuna eklenir. Son olaylar sınırlı bir geçmişte tutulur; yeniden
+bağlanan istemci Last-Event-ID ile kaldığı yerden devam eder. Geçmişin dışında kalan (veya sunucu
+yeniden başladığı için tanınmayan) bir id ile gelen istemciye listeyi yeniden yüklemesi söylenir.
+
+Abone tamponları sınırlıdır: yavaş bir istemcinin tamponu dolarsa bağlantısı kapatılır; tarayıcı
+otomatik olarak yeniden bağlanır ve eksik olayları geçmişten alır. Böylece yavaş istemciler ne
+yayıncıyı bekletir ne de sınırsız bellek tüketir.
+"""
+
+import json
+import threading
+import time
+import uuid
+from collections import deque
+
+HABER = "haber"                  # Yeni kaydedilen haber
+OZET = "ozet"                    # Haberin özeti model özetine yükseltildi
+YENIDEN_YUKLE = "yeniden_yukle"  # İstemci eksik olayları alamaz, listeyi baştan yüklemeli
+
+VARSAYILAN_GECMIS_KAPASITESI = 1000
+VARSAYILAN_TAMPON_BOYUTU = 256
+VARSAYILAN_MAKS_ABONE = 100
+KALP_ATISI_SN = 15.0
+
+
+class AkisOlayi:
+    """Tek bir olayın id'si, türü, kategorisi ve SSE biçiminde hazırlanmış metni"""
+
+    __slots__ = ("sira", "tur", "kategori", "metin")
+
+    def __init__(self, oturum, sira, tur, veri):
+        self.sira = sira
+        self.tur = tur
+        self.kategori = veri.get("kategori")
+        govde = json.dumps(veri, ensure_ascii=False, default=str)
+        self.metin = f"id: {oturum}-{sira}\nevent: {tur}\ndata: {govde}\n\n"
+
+
+class Abone:
+    """Bir /api/akis bağlantısının sınırlı olay tamponu"""
+
+    def __init__(self, tampon_boyutu, kategori=None):
+        self.tampon_boyutu = tampon_boyutu
+        self.kategori = kategori
+        self.tasti = False   # Tampon doldu; bağlantı kapatılacak
+        self._olaylar = deque()
+        self._kosul = threading.Condition()
+
+    def ilgili_mi(self, olay):
+        return self.kategori is None or olay.kategori is None or olay.kategori == self.kategori
+
+    def ekle(self, metinler):
+        """Olay metinlerini tampona ekler; tampon taşarsa False döner"""
+        with self._kosul:
+            if self.tasti:
+                return False
+            if len(self._olaylar) + len(metinler) > self.tampon_boyutu:
+                self.tasti = True
+                self._olaylar.clear()
+            else:
+                self._olaylar.extend(metinler)
+            self._kosul.notify()
+            return not self.tasti
+
+    def parcalar(self, kalp_atisi_sn=KALP_ATISI_SN):
+        """Tampondaki olayları gönderilecek metinler olarak üretir; boşta kalınca yorum satırı gönderir
+
+        Kalp atışı kopmuş bağlantıların fark edilmesini sağlar. Tampon taşınca üretim biter.
+        """
+        while True:
+            with self._kosul:
+                if not self._olaylar and not self.tasti:
+                    self._kosul.wait(kalp_atisi_sn)
+                if self.tasti:
+                    return
+                metinler = list(self._olaylar)
+                self._olaylar.clear()
+            yield "".join(metinler) if metinler else ": kalp atisi\n\n"
+
+
+class HaberAkisi:
+    """Süreç içi olay dağıtıcısı: yayıncılardan gelen olayları tüm abonelere kopyalar"""
+
+    def __init__(self, gecmis_kapasitesi=VARSAYILAN_GECMIS_KAPASITESI, tampon_boyutu=VARSAYILAN_TAMPON_BOYUTU,
+                 maks_abone=VARSAYILAN_MAKS_ABONE):
+        self.tampon_boyutu = max(1, int(tampon_boyutu))
+        self.maks_abone = max(1, int(maks_abone))
+        # Sunucu her başladığında yeni bir oturum; eski oturumun id'leri tanınmaz
+        self.oturum = uuid.uuid4().hex[:8]
+        self._kilit = threading.Lock()
+        self._sira = 0
+        self._gecmis = deque(maxlen=max(1, int(gecmis_kapasitesi)))
+        self._aboneler = set()
+        self.yayinlanan = 0
+        self.tasan_abone = 0
+        self.son_yayin = None
+
+    def yayinla(self, tur, veriler):
+        """Olayları (her biri bir sözlük) geçmişe ve abonelerin tamponlarına ekler"""
+        if not veriler:
+            return
+        with self._kilit:
+            olaylar = []
+            for veri in veriler:
+                self._sira += 1
+                olaylar.append(AkisOlayi(self.oturum, self._sira, tur, veri))
+            self._gecmis.extend(olaylar)
+            self.yayinlanan += len(olaylar)
+            self.son_yayin = time.time()
+            for abone in list(self._aboneler):
+                metinler = [olay.metin for olay in olaylar if abone.ilgili_mi(olay)]
+                if metinler and not abone.ekle(metinler):
+                    self._aboneler.discard(abone)
+                    self.tasan_abone += 1
+
+    def abone_ol(self, son_olay_id=None, kategori=None):
+        """Yeni abone oluşturur; son_olay_id (Last-Event-ID) verilirse sonraki olaylar tampona konur
+
+        Abone sayısı sınırdaysa None döner.
+        """
+        abone = Abone(self.tampon_boyutu, kategori)
+        with self._kilit:
+            if len(self._aboneler) >= self.maks_abone:
+                return None
+            if son_olay_id:
+                metinler = self._kacirilanlar(son_olay_id, abone)
+                if len(metinler) > self.tampon_boyutu:
+                    metinler = [self._yeniden_yukle_metni()]
+                if metinler:
+                    abone.ekle(metinler)
+            self._aboneler.add(abone)
+        return abone
+
+    def _kacirilanlar(self, son_olay_id, abone):
+        oturum, _, sira = son_olay_id.partition("-")
+        try:
+            sira = int(sira)
+        except ValueError:
+            sira = None
+        ilk_sira = self._gecmis[0].sira if self._gecmis else self._sira + 1
+        if oturum != self.oturum or sira is None or sira > self._sira or sira < ilk_sira - 1:
+            return [self._yeniden_yukle_metni()]
+        return [olay.metin for olay in self._gecmis if olay.sira > sira and abone.ilgili_mi(olay)]
+
+    def _yeniden_yukle_metni(self):
+        # Son olayın id'siyle gönderilir; listeyi yeniden yükleyen istemci buradan devam eder
+        return f"id: {self.oturum}-{self._sira}\nevent: {YENIDEN_YUKLE}\ndata: {{}}\n\n"
+
+    def abonelikten_cik(self, abone):
+        with self._kilit:
+            self._aboneler.discard(abone)
+
+    def durum(self):
+        """Abone sayısı ve yayın istatistikleri"""
+        with self._kilit:
+            return {
+                "oturum": self.oturum,
+                "abone": len(self._aboneler),
+                "maks_abone": self.maks_abone,
+                "son_olay_id": f"{self.oturum}-{self._sira}" if self._sira else None,
+                "gecmis": len(self._gecmis),
+                "yayinlanan": self.yayinlanan,
+                "tasan_abone": self.tasan_abone,
+                "son_yayin": self.son_yayin,
+            }
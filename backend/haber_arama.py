@@ -0,0 +1,261 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Haber Arama
+-----------
+Başlık, özet ve temizlenmiş içerik üzerinde SQLite FTS5 ile tam metin arama.
+FTS5'in unicode61 tokenizer'ı Türkçe'deki noktasız ı/İ ayrımını bilmediği için metinler
+indekslenmeden önce (ve sorgular çalıştırılmadan önce) Türkçe kurallarıyla küçük harfe
+çevrilip aksanlarından arındırılır: "IŞIK", "ışık" ve "isik" aynı terime düşer.
+Türkçe eklemeli bir dil olduğundan kelimeler ilk 5 harflerine kısaltılarak indekslenir
+("ekonomide", "ekonomiye" → "ekono"); böylece ekli hallerin hepsi tek bir terimle, önek
+genişletmesine gerek kalmadan bulunur. Katlama karakter başına birebir olduğu için alıntılar
+(snippet) eşleşmeler orijinal metinde aranarak orijinal Türkçe metinden üretilir.
+İndeks, haber toplama yolunda her kayıt işlemiyle birlikte artımlı olarak güncellenir. Mevcut bir
+veritabanındaki haberler arka planda parça parça indekslenir; indeks tamamlanana kadar arama,
+başlık ve özette katlanmış metin üzerinde LIKE ile yapılır.
+"""
+
+import html
+import logging
+import re
+
+from haber_icerikleri import icerikleri_getir
+from veritabani import parcala
+
+logger = logging.getLogger(__name__)
+
+# Türkçe büyük/küçük harf ve aksan katlaması; her karakter tek bir karaktere eşlenir
+_KATLAMA = str.maketrans({
+    "I": "i", "İ": "i", "ı": "i", "î": "i", "Î": "i",
+    "Ğ": "g", "ğ": "g", "Ü": "u", "ü": "u", "û": "u", "Û": "u",
+    "Ş": "s", "ş": "s", "Ö": "o", "ö": "o", "Ç": "c", "ç": "c",
+    "Â": "a", "â": "a",
+})
+_KELIME = re.compile(r"\w+")
+
+KOK_UZUNLUGU = 5  # Kelimelerin indekslenen önek uzunluğu
+
+ALINTI_UZUNLUGU = 160
+YENIDEN_INDEKSLEME_PARCASI = 2000
+
+
+def arama_metni(metin):
+    """Metni indeks ve sorgu için Türkçe kurallarıyla katlar (uzunluk değişmez)"""
+    if not metin:
+        return ""
+    katlanmis = metin.translate(_KATLAMA)
+    kucuk = katlanmis.lower()
+    if len(kucuk) != len(katlanmis):
+        # Bazı nadir karakterlerin küçük hali birden fazla karakterdir; birebirliği koru
+        kucuk = "".join(c.lower() if len(c.lower()) == 1 else c for c in katlanmis)
+    return kucuk
+
+
+def indeks_metni(metin):
+    """Metni katlayıp her kelimeyi KOK_UZUNLUGU harfe kısaltır"""
+    return " ".join(kelime[:KOK_UZUNLUGU] for kelime in _KELIME.findall(arama_metni(metin)))
+
+
+def sorgu_terimleri(sorgu):
+    """Kullanıcı sorgusundan katlanmış ve kısaltılmış arama terimlerini çıkarır"""
+    return list(dict.fromkeys(kelime[:KOK_UZUNLUGU] for kelime in _KELIME.findall(arama_metni(sorgu or ""))))
+
+
+def fts_sorgusu(terimler):
+    """Terimleri FTS5 MATCH ifadesine çevirir
+
+    Kök uzunluğundaki terimler tam eşleşir; daha kısa terimler ("maç" → "maçta") önek olarak aranır.
+    """
+    return " ".join(f'"{terim}"' if len(terim) >= KOK_UZUNLUGU else f'"{terim}"*' for terim in terimler)
+
+
+def alinti_olustur(metin, terimler, uzunluk=ALINTI_UZUNLUGU):
+    """Terimlerin ilk geçtiği yer etrafından HTML güvenli, <mark> ile vurgulanmış alıntı üretir"""
+    if not metin:
+        return ""
+    katlanmis = arama_metni(metin)
+    desen = re.compile(r"\b(?:" + "|".join(re.escape(terim) for terim in terimler) + r")\w*") if terimler else None
+
+    ilk = desen.search(katlanmis) if desen else None
+    baslangic = 0
+    if ilk:
+        baslangic = max(0, ilk.start() - uzunluk // 3)
+        # Kelimenin ortasından başlamamak için bir sonraki boşluğa kay
+        if baslangic:
+            bosluk = metin.find(" ", baslangic, ilk.start())
+            baslangic = bosluk + 1 if bosluk != -1 else baslangic
+    bitis = min(len(metin), baslangic + uzunluk)
+
+    parcalar = []
+    konum = baslangic
+    if desen:
+        for eslesme in desen.finditer(katlanmis, baslangic, bitis):
+            parcalar.append(html.escape(metin[konum:eslesme.start()]))
+            parcalar.append("<mark>" + html.escape(metin[eslesme.start():eslesme.end()]) + "</mark>")
+            konum = eslesme.end()
+    parcalar.append(html.escape(metin[konum:bitis]))
+
+    alinti = "".join(parcalar)
+    if baslangic > 0:
+        alinti = "…" + alinti
+    if bitis < len(metin):
+        alinti += "…"
+    return alinti
+
+
+class HaberAramaIndeksi:
+    """haberler tablosuyla eşlenen FTS5 indeksi
+
+    metin_temizleyici: HTML içeriği düz metne çeviren fonksiyon (indekslenen ve alıntı
+    üretilen içerik bu fonksiyondan geçer).
+    """
+
+    def __init__(self, baglanti_fabrikasi, metin_temizleyici):
+        self._baglanti_fabrikasi = baglanti_fabrikasi
+        self._metin_temizleyici = metin_temizleyici
+        # Mevcut haberlerin hepsi indekslenene kadar False; bu sürede arama LIKE ile yapılır
+        self.hazir = False
+
+    def tablo_olustur(self):
+        """FTS tablosunu oluşturur; indekste eksik haber varsa eksikleri_indeksle ile tamamlanana kadar hazır değildir"""
+        conn = self._baglanti_fabrikasi()
+        try:
+            conn.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS haberler_fts USING fts5(
+                baslik, ozet, icerik,
+                tokenize = "unicode61 remove_diacritics 2",
+                prefix = "3 4"  -- Kökten kısa sorgu terimleri ("maç", "müze") önek indeksinden okunur
+            )
+            ''')
+            # Başlık eşleşmeleri özetten, özet eşleşmeleri içerikten daha değerli
+            conn.execute("INSERT INTO haberler_fts(haberler_fts, rank) VALUES('rank', 'bm25(10.0, 4.0, 1.0)')")
+            conn.commit()
+
+            # Yeni haberler kayıtla aynı işlemde indekslenir; sayılar yalnızca ilk açılışta veya yarım
+            # kalmış bir indekslemeden sonra farklıdır
+            haber_sayisi = conn.execute('SELECT COUNT(*) FROM haberler').fetchone()[0]
+            indeksli = conn.execute('SELECT COUNT(*) FROM haberler_fts').fetchone()[0]
+            self.hazir = indeksli >= haber_sayisi
+        finally:
+            conn.close()
+
+    def eksikleri_indeksle(self, conn, son_id=0):
+        """id'si son_id'den büyük bir parça haberden indekste olmayanları indeksler
+
+        Çağıranın işlemi içinde çalışır; mevcut haberler ayrı kısa işlemlerde indekslenebilsin diye
+        (bakılan satır sayısı, indekslenen satır sayısı, son id) döndürür. Bakılacak satır kalmadıysa
+        bakılan satır sayısı 0 olur.
+        """
+        satirlar = conn.execute('SELECT id, baslik, ozet FROM haberler WHERE id > ? ORDER BY id LIMIT ?',
+                                (son_id, YENIDEN_INDEKSLEME_PARCASI)).fetchall()
+        if not satirlar:
+            return 0, 0, son_id
+        indeksli = {satir[0] for satir in conn.execute('SELECT rowid FROM haberler_fts WHERE rowid BETWEEN ? AND ?',
+                                                       (satirlar[0][0], satirlar[-1][0]))}
+        eksikler = [satir for satir in satirlar if satir[0] not in indeksli]
+        if eksikler:
+            icerikler = icerikleri_getir(conn, [satir[0] for satir in eksikler])
+            self.indeksle(conn, [(haber_id, baslik, ozet, icerikler.get(haber_id, ""))
+                                 for haber_id, baslik, ozet in eksikler])
+        return len(satirlar), len(eksikler), satirlar[-1][0]
+
+    def indeksle(self, conn, satirlar):
+        """(id, baslik, ozet, icerik) satırlarını indekse ekler veya günceller
+
+        Çağıranın işlemi içinde çalışır; commit çağırana aittir.
+        """
+        conn.executemany('INSERT OR REPLACE INTO haberler_fts(rowid, baslik, ozet, icerik) VALUES (?, ?, ?, ?)', [
+            (haber_id, indeks_metni(baslik), indeks_metni(ozet), indeks_metni(self._metin_temizleyici(icerik)))
+            for haber_id, baslik, ozet, icerik in satirlar
+        ])
+
+    def ozetleri_guncelle(self, conn, ozetler):
+        """[(id, ozet)] listesindeki haberlerin özet sütununu günceller"""
+        conn.executemany('UPDATE haberler_fts SET ozet = ? WHERE rowid = ?',
+                         [(indeks_metni(ozet), haber_id) for haber_id, ozet in ozetler])
+
+    def sil(self, conn, haber_idleri):
+        """Haberleri indeksten siler (çağıranın işlemi içinde)"""
+        for parca in parcala(list(haber_idleri)):
+            conn.execute(f'DELETE FROM haberler_fts WHERE rowid IN ({",".join("?" * len(parca))})', parca)
+
+    def temizle(self):
+        """İndeksi boşaltır"""
+        conn = self._baglanti_fabrikasi()
+        conn.execute('DELETE FROM haberler_fts')
+        conn.commit()
+        conn.close()
+
+    def ara(self, sorgu, kategori=None, limit=20, sayfa=1):
+        """Sorguya en uygun haberleri BM25 sırasıyla döndürür
+
+        Puanlama tüm eşleşmeler arasında yapılır; sayfalama sonuna kadar ilerleyebilir.
+        İndeks hazır değilse başlık ve özette LIKE ile aranır, sonuçlar en yeniden eskiye sıralanır ve
+        `skor` boş döner. Dönüş: (haberler, sonraki_sayfa_var_mi). Her haberde `alinti` alanı bulunur.
+        """
+        terimler = sorgu_terimleri(sorgu)
+        offset = (sayfa - 1) * limit
+        if not terimler:
+            return [], False
+
+        conn = self._baglanti_fabrikasi()
+        try:
+            if self.hazir:
+                satirlar = self._fts_ile_bul(conn, terimler, kategori, limit, offset)
+            else:
+                satirlar = self._like_ile_bul(conn, terimler, kategori, limit, offset)
+            # Özet eşleşmiyorsa alıntı içerikten alınır; yalnızca bu haberlerin içeriği açılır
+            icerik_idleri = [satir["id"] for satir in satirlar[:limit]
+                             if not any(terim in arama_metni(satir["ozet"]) for terim in terimler)]
+            icerikler = icerikleri_getir(conn, icerik_idleri)
+        finally:
+            conn.close()
+
+        haberler = []
+        for satir in satirlar[:limit]:
+            haber = dict(satir)
+            kaynak_metin = haber["ozet"]
+            if haber["id"] in icerikler:
+                kaynak_metin = self._metin_temizleyici(icerikler[haber["id"]]) or kaynak_metin
+            haber["alinti"] = alinti_olustur(kaynak_metin, terimler)
+            haberler.append(haber)
+        return haberler, len(satirlar) > limit
+
+    def _fts_ile_bul(self, conn, terimler, kategori, limit, offset):
+        """Tüm FTS eşleşmelerini BM25 ile sıralayıp istenen sayfanın limit + 1 satırını döndürür"""
+        kategori_kosulu = "AND h.kategori = ?" if kategori else ""
+        parametreler = [fts_sorgusu(terimler)] + ([kategori] if kategori else []) + [limit + 1, offset]
+        # ORDER BY rank LIMIT'i FTS5 kendisi karşılar: eşleşmelerin hepsi puanlanır, yalnızca sayfanın
+        # satırları sıralı tutulur. bm25 negatif döner; büyük olan daha alakalı olsun diye işareti çevrilir
+        return conn.execute(f'''
+        SELECT h.id, h.baslik, h.ozet, h.kategori, h.kaynak, h.url, h.resim_url, h.tarih,
+               h.ozet_durumu, -haberler_fts.rank AS skor
+        FROM haberler_fts
+        JOIN haberler h ON h.id = haberler_fts.rowid
+        WHERE haberler_fts MATCH ? {kategori_kosulu}
+        ORDER BY haberler_fts.rank
+        LIMIT ? OFFSET ?
+        ''', parametreler).fetchall()
+
+    def _like_ile_bul(self, conn, terimler, kategori, limit, offset):
+        """İndeks hazır olana kadar başlık ve özetin katlanmış halinde her terimi LIKE ile arar
+
+        Haberler en yeniden geriye taranır; tarama istenen sayfa dolunca durur.
+        """
+        conn.create_function("arama_metni", 1, arama_metni)
+        kosullar = ["arama_metni(h.baslik || ' ' || h.ozet) LIKE ? ESCAPE '\\'"] * len(terimler)
+        # Terimler \w+ olduğundan LIKE'ta özel anlamı olan tek karakter _'dir
+        parametreler = ["%" + terim.replace("_", "\\_") + "%" for terim in terimler]
+        if kategori:
+            kosullar.append("h.kategori = ?")
+            parametreler.append(kategori)
+        return conn.execute(f'''
+        SELECT h.id, h.baslik, h.ozet, h.kategori, h.kaynak, h.url, h.resim_url, h.tarih,
+               h.ozet_durumu, NULL AS skor
+        FROM haberler h
+        WHERE {" AND ".join(kosullar)}
+        ORDER BY h.id DESC
+        LIMIT ? OFFSET ?
+        ''', parametreler + [limit + 1, offset]).fetchall()
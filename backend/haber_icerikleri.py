@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Haber İçerikleri
+----------------
+Haberlerin ham feed HTML'i (icerik) liste alanlarıyla aynı satırda değil, ayrı bir tabloda
+sıkıştırılmış olarak tutulur. Liste sorguları yalnızca küçük `haberler` satırlarını okur; sayfa
+önbelleği büyük içeriklerle dolmaz. İçerik yalnızca özetleme, kümeleme, arama alıntısı veya
+açıkça istendiğinde (alanlar=icerik) id ile okunup açılır.
+
+Her satır kendi sıkıştırma biçimini taşır: varsayılan zlib, `zstandard` paketi kuruluysa zstd.
+Biçim değiştirildiğinde eski satırlar okunmaya devam eder.
+"""
+
+import logging
+import zlib
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from veritabani import parcala
+
+logger = logging.getLogger(__name__)
+
+ZLIB = "zlib"
+ZSTD = "zstd"
+BICIMLER = (ZLIB, ZSTD)
+
+VARSAYILAN_SEVIYE = {ZLIB: 6, ZSTD: 10}
+TASIMA_PARCASI = 1000
+
+
+def sikistir(metin, bicim=ZLIB, seviye=None):
+    """Metni UTF-8 olarak sıkıştırır"""
+    ham = (metin or "").encode("utf-8")
+    seviye = VARSAYILAN_SEVIYE[bicim] if seviye is None else seviye
+    if bicim == ZSTD:
+        return zstandard.ZstdCompressor(level=seviye).compress(ham)
+    return zlib.compress(ham, seviye)
+
+
+def ac(veri, bicim=ZLIB):
+    """sikistir() ile sıkıştırılmış veriyi metne çevirir"""
+    if bicim == ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstd ile sıkıştırılmış içerik için zstandard paketi gerekli")
+        return zstandard.ZstdDecompressor().decompress(veri).decode("utf-8")
+    return zlib.decompress(veri).decode("utf-8")
+
+
+def icerikleri_getir(conn, haber_idleri):
+    """Haberlerin açılmış içeriklerini {id: icerik} olarak döndürür (içeriği olmayanlar yer almaz)"""
+    icerikler = {}
+    for parca in parcala(list(haber_idleri)):
+        yer_tutucular = ",".join("?" * len(parca))
+        for haber_id, bicim, veri in conn.execute(
+                f'SELECT haber_id, bicim, veri FROM haber_icerikleri WHERE haber_id IN ({yer_tutucular})', parca):
+            icerikler[haber_id] = ac(veri, bicim)
+    return icerikler
+
+
+class HaberIcerikleri:
+    """haber_icerikleri tablosu: haber id'si başına sıkıştırılmış içerik"""
+
+    def __init__(self, baglanti_fabrikasi, bicim=ZLIB, seviye=None):
+        if bicim not in BICIMLER:
+            raise ValueError(f"Geçersiz sıkıştırma biçimi: {bicim} ({', '.join(BICIMLER)})")
+        if bicim == ZSTD and zstandard is None:
+            logger.warning("zstandard paketi kurulu değil, içerikler zlib ile sıkıştırılacak.")
+            bicim = ZLIB
+            seviye = None
+        self._baglanti_fabrikasi = baglanti_fabrikasi
+        self.bicim = bicim
+        self.seviye = seviye
+
+    def tablo_olustur(self):
+        """İçerik tablosunu oluşturur"""
+        conn = self._baglanti_fabrikasi()
+        conn.execute('''
+        CREATE TABLE IF NOT EXISTS haber_icerikleri (
+            haber_id INTEGER PRIMARY KEY,
+            bicim TEXT NOT NULL,
+            boyut INTEGER NOT NULL,  -- Sıkıştırılmamış UTF-8 boyutu (bayt)
+            veri BLOB NOT NULL
+        )
+        ''')
+        conn.commit()
+        conn.close()
+
+    def kaydet(self, conn, icerikler):
+        """[(haber_id, icerik)] listesini sıkıştırıp yazar (varsa üzerine yazar)
+
+        Çağıranın işlemi içinde çalışır; commit çağırana aittir.
+        """
+        conn.executemany('INSERT OR REPLACE INTO haber_icerikleri (haber_id, bicim, boyut, veri) VALUES (?, ?, ?, ?)', [
+            (haber_id, self.bicim, len((icerik or "").encode("utf-8")), sikistir(icerik, self.bicim, self.seviye))
+            for haber_id, icerik in icerikler
+        ])
+
+    def eski_sutunu_tasi(self, conn, son_id=0):
+        """Eski şemadaki haberler.icerik sütunundan id'si son_id'den büyük bir parçayı bu tabloya taşır
+
+        Taşınan içerikler sütunda boşaltılır. Çağıranın işlemi içinde çalışır; parçalar ayrı kısa işlemlerde
+        taşınabilsin diye (taşınan satır sayısı, son id) döndürür. Taşınacak satır kalmadıysa sayı 0 olur.
+        """
+        satirlar = conn.execute("SELECT id, icerik FROM haberler WHERE id > ? AND icerik != '' ORDER BY id LIMIT ?",
+                                (son_id, TASIMA_PARCASI)).fetchall()
+        if not satirlar:
+            return 0, son_id
+        self.kaydet(conn, [(satir[0], satir[1]) for satir in satirlar])
+        conn.executemany("UPDATE haberler SET icerik = '' WHERE id = ?", [(satir[0],) for satir in satirlar])
+        return len(satirlar), satirlar[-1][0]
+
+    def sil(self, conn, haber_idleri):
+        """Haberlerin içeriklerini siler (çağıranın işlemi içinde)"""
+        for parca in parcala(list(haber_idleri)):
+            conn.execute(f'DELETE FROM haber_icerikleri WHERE haber_id IN ({",".join("?" * len(parca))})', parca)
+
+    def temizle(self):
+        """Tüm içerikleri siler"""
+        conn = self._baglanti_fabrikasi()
+        conn.execute('DELETE FROM haber_icerikleri')
+        conn.commit()
+        conn.close()
+
+    def istatistikler(self):
+        """Satır sayısı, toplam ham ve sıkıştırılmış boyut"""
+        conn = self._baglanti_fabrikasi()
+        try:
+            adet, ham, sikistirilmis = conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(boyut), 0), COALESCE(SUM(LENGTH(veri)), 0) FROM haber_icerikleri'
+            ).fetchone()
+        finally:
+            conn.close()
+        return {
+            "bicim": self.bicim,
+            "adet": adet,
+            "ham_mb": round(ham / 1024 / 1024, 2),
+            "sikistirilmis_mb": round(sikistirilmis / 1024 / 1024, 2),
+            "oran": round(sikistirilmis / ham, 3) if ham else None,
+        }
@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Haber Kümeleme
+--------------
+Farklı kaynakların aynı ajans haberini farklı URL'lerle yayınlamasından doğan tekrarları bulur.
+Her haberin başlık + temizlenmiş içeriğinden kelime ikililerinin (shingle) MinHash imzası çıkarılır;
+imza bantlara bölünüp LSH indeksine yazılır. Yeni bir haber, en az bir bandı çakışan haberlerle
+karşılaştırılır ve tahmini Jaccard benzerliği eşiği geçerse onların kümesine katılır.
+Kümenin ilk haberi temsilcidir (kume_id = id); özet yalnızca temsilci için üretilir.
+İmzalar ve bantlar SQLite'ta saklanır, bu yüzden uygulama yeniden başlasa da kümeler sürer.
+Yalnızca son `pencere_gun` gündeki haberler aday olarak tutulur; eski bantlar silinir.
+"""
+
+import logging
+import random
+import time
+import zlib
+from array import array
+from hashlib import blake2b
+
+from haber_arama import arama_metni
+from veritabani import parcala
+
+logger = logging.getLogger(__name__)
+
+BANT_SAYISI = 30
+BANT_SATIRI = 4
+IMZA_BOYUTU = BANT_SAYISI * BANT_SATIRI  # Adaylar yaklaşık (1/30)^(1/4) ≈ 0.43 benzerlikten itibaren bulunur
+SHINGLE_UZUNLUGU = 2  # Kelime ikilileri; üçlüler küçük düzenlemelerde benzerliği çok hızlı düşürür
+VARSAYILAN_ESIK = 0.5
+VARSAYILAN_PENCERE_GUN = 3
+
+_MERSENNE = (1 << 61) - 1
+_MASKE = (1 << 32) - 1
+# Permütasyon katsayıları sabit tohumla üretilir; imzalar yeniden başlatmalar arasında karşılaştırılabilir kalır
+_rastgele = random.Random(1453)
+_KATSAYILAR = [(_rastgele.randrange(1, _MERSENNE), _rastgele.randrange(0, _MERSENNE)) for _ in range(IMZA_BOYUTU)]
+
+
+def shingle_olustur(metin, uzunluk=SHINGLE_UZUNLUGU):
+    """Katlanmış metinden kelime n'lilerinin kümesini döndürür"""
+    kelimeler = arama_metni(metin).split()
+    if len(kelimeler) <= uzunluk:
+        return {" ".join(kelimeler)} if kelimeler else set()
+    return {" ".join(kelimeler[i:i + uzunluk]) for i in range(len(kelimeler) - uzunluk + 1)}
+
+
+def imza_olustur(shingleler):
+    """Shingle kümesinin MinHash imzasını (IMZA_BOYUTU adet 32 bit değer) döndürür"""
+    hashler = [zlib.crc32(s.encode("utf-8")) for s in shingleler] or [0]
+    return array("I", [min(((a * h + b) % _MERSENNE) & _MASKE for h in hashler) for a, b in _KATSAYILAR])
+
+
+def benzerlik(imza1, imza2):
+    """İki imzadan tahmini Jaccard benzerliği"""
+    return sum(1 for x, y in zip(imza1, imza2) if x == y) / IMZA_BOYUTU
+
+
+def bant_anahtarlari(imza):
+    """İmzanın her bandı için işaretli 64 bit anahtar üretir (bant numarası dahil)"""
+    anahtarlar = []
+    for bant in range(BANT_SAYISI):
+        parca = imza[bant * BANT_SATIRI:(bant + 1) * BANT_SATIRI].tobytes()
+        ozet = blake2b(parca, digest_size=8, person=bant.to_bytes(2, "little")).digest()
+        anahtarlar.append(int.from_bytes(ozet, "little", signed=True))
+    return anahtarlar
+
+
+class HaberKumeleyici:
+    """MinHash/LSH ile yakın tekrar haberleri kümeler
+
+    metin_temizleyici: HTML içeriği düz metne çeviren fonksiyon.
+    temsilci_kancasi: temsilcisi silinen kümelerin yeni temsilcileriyle, aynı yazma işlemi içinde
+    çağrılan fonksiyon (conn, idler); tekrarlar özetlenmediği için yeni temsilcinin özeti buradan istenir.
+    """
+
+    def __init__(self, baglanti_fabrikasi, metin_temizleyici, esik=VARSAYILAN_ESIK,
+                 pencere_gun=VARSAYILAN_PENCERE_GUN, temsilci_kancasi=None):
+        self._baglanti_fabrikasi = baglanti_fabrikasi
+        self._metin_temizleyici = metin_temizleyici
+        self.temsilci_kancasi = temsilci_kancasi
+        self.esik = esik
+        self.pencere_saniye = pencere_gun * 24 * 3600
+        self._son_budama = 0.0
+
+    def tablo_olustur(self):
+        """İmza ve LSH bant tablolarını oluşturur"""
+        conn = self._baglanti_fabrikasi()
+        conn.execute('''
+        CREATE TABLE IF NOT EXISTS haber_imzalari (
+            haber_id INTEGER PRIMARY KEY,
+            kume_id INTEGER NOT NULL,
+            imza BLOB NOT NULL,
+            olusturulma REAL NOT NULL
+        )
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_haber_imzalari_olusturulma ON haber_imzalari(olusturulma)')
+        conn.execute('''
+        CREATE TABLE IF NOT EXISTS lsh_bantlari (
+            anahtar INTEGER NOT NULL,
+            haber_id INTEGER NOT NULL
+        )
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_lsh_bantlari_anahtar ON lsh_bantlari(anahtar)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_lsh_bantlari_haber ON lsh_bantlari(haber_id)')
+        conn.commit()
+        conn.close()
+
+    def _imza(self, baslik, icerik):
+        return imza_olustur(shingle_olustur(f"{baslik} {self._metin_temizleyici(icerik)}"))
+
+    def kumele(self, conn, haberler):
+        """[(id, baslik, icerik)] haberlerini kümelere atar, {id: kume_id} döndürür
+
+        Çağıranın yazma işlemi içinde çalışır; imzalar ve bantlar aynı işlemde kaydedilir.
+        Aynı batch içindeki tekrarlar da birbirine bağlanır.
+        """
+        simdi = time.time()
+        if simdi - self._son_budama > 3600:
+            self.eskileri_sil(conn, simdi)
+
+        kumeler = {}
+        batch_imzalari = {}   # haber_id -> (imza, kume_id)
+        batch_bantlari = {}   # anahtar -> [haber_id]
+        imza_satirlari = []
+        bant_satirlari = []
+        for haber_id, baslik, icerik in haberler:
+            imza = self._imza(baslik, icerik)
+            anahtarlar = bant_anahtarlari(imza)
+
+            adaylar = {}
+            yer_tutucular = ",".join("?" * len(anahtarlar))
+            for aday_id, aday_kume, aday_imza in conn.execute(f'''
+                SELECT i.haber_id, i.kume_id, i.imza FROM haber_imzalari i
+                WHERE i.haber_id IN (SELECT haber_id FROM lsh_bantlari WHERE anahtar IN ({yer_tutucular}))
+            ''', anahtarlar):
+                adaylar[aday_id] = (array("I", aday_imza), aday_kume)
+            for anahtar in anahtarlar:
+                for aday_id in batch_bantlari.get(anahtar, ()):
+                    adaylar[aday_id] = batch_imzalari[aday_id]
+
+            # En benzer aday eşiği geçiyorsa onun kümesine katıl
+            kume_id = haber_id
+            en_iyi = self.esik
+            for aday_id, (aday_imza, aday_kume) in adaylar.items():
+                if aday_id == haber_id:
+                    continue
+                skor = benzerlik(imza, aday_imza)
+                if skor >= en_iyi:
+                    en_iyi = skor
+                    kume_id = aday_kume
+
+            kumeler[haber_id] = kume_id
+            batch_imzalari[haber_id] = (imza, kume_id)
+            for anahtar in anahtarlar:
+                batch_bantlari.setdefault(anahtar, []).append(haber_id)
+                bant_satirlari.append((anahtar, haber_id))
+            imza_satirlari.append((haber_id, kume_id, imza.tobytes(), simdi))
+
+        conn.executemany('INSERT OR REPLACE INTO haber_imzalari (haber_id, kume_id, imza, olusturulma) VALUES (?, ?, ?, ?)',
+                         imza_satirlari)
+        conn.executemany('INSERT INTO lsh_bantlari (anahtar, haber_id) VALUES (?, ?)', bant_satirlari)
+        return kumeler
+
+    def eskileri_sil(self, conn, simdi=None):
+        """Pencere dışında kalan imzaları ve bantları siler"""
+        sinir = (simdi or time.time()) - self.pencere_saniye
+        conn.execute('DELETE FROM lsh_bantlari WHERE haber_id IN (SELECT haber_id FROM haber_imzalari WHERE olusturulma < ?)',
+                     (sinir,))
+        silinen = conn.execute('DELETE FROM haber_imzalari WHERE olusturulma < ?', (sinir,)).rowcount
+        self._son_budama = simdi or time.time()
+        if silinen:
+            logger.debug(f"Kümeleme penceresi dışındaki {silinen} imza silindi.")
+
+    def sil(self, conn, haber_idleri):
+        """Silinen haberlerin imzalarını ve bantlarını siler (çağıranın işlemi içinde)
+
+        Haberler tablodan silindikten sonra çağrılır: temsilcisi silinen kümelerde kalan en eski
+        üye yeni temsilci olur ve temsilci_kancasi'na verilir.
+        """
+        for parca in parcala(list(haber_idleri)):
+            yer_tutucular = ",".join("?" * len(parca))
+            tasimalar = conn.execute(f'SELECT MIN(id), kume_id FROM haberler WHERE kume_id IN ({yer_tutucular}) GROUP BY kume_id',
+                                     parca).fetchall()
+            conn.executemany('UPDATE haberler SET kume_id = ? WHERE kume_id = ?', tasimalar)
+            conn.executemany('UPDATE haber_imzalari SET kume_id = ? WHERE kume_id = ?', tasimalar)
+            if tasimalar and self.temsilci_kancasi is not None:
+                self.temsilci_kancasi(conn, [yeni_temsilci for yeni_temsilci, _ in tasimalar])
+            conn.execute(f'DELETE FROM lsh_bantlari WHERE haber_id IN ({yer_tutucular})', parca)
+            conn.execute(f'DELETE FROM haber_imzalari WHERE haber_id IN ({yer_tutucular})', parca)
+
+    def temizle(self):
+        """Tüm imzaları ve bantları siler"""
+        conn = self._baglanti_fabrikasi()
+        conn.execute('DELETE FROM lsh_bantlari')
+        conn.execute('DELETE FROM haber_imzalari')
+        conn.commit()
+        conn.close()
@@ -0,0 +1,259 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Haber Saklama
+-------------
+Veritabanının sınırsız büyümesini önleyen saklama politikası. Kategorisinin yaş sınırını aşan
+haberler ve toplam satır sınırını aşan en eski haberler, istenirse aylık sıkıştırılmış NDJSON arşiv
+dosyalarına (haberler-YYYY-AA.ndjson.gz) eklenir ve silinir. Arşiv satırları önce geçici dosyalara
+yazılır, silme işlemi onaylandıktan sonra arşive eklenir; işlem geri alınırsa arşiv değişmez. Haberin içeriği, arama indeksi,
+kümeleme imzaları ve özetleme işi silme kancalarıyla aynı işlemde silinir.
+
+Silme kısa yazma işlemlerine bölünür; aralarda haber toplama ve özetleme yazmaları araya girebilir,
+WAL sayesinde okuyucular hiç beklemez. Boşalan sayfalar auto_vacuum=INCREMENTAL veritabanında
+`PRAGMA incremental_vacuum` ile küçük adımlarla dosyaya iade edilir; tam VACUUM gibi tüm dosya
+yeniden yazılmaz.
+"""
+
+import gzip
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from haber_icerikleri import icerikleri_getir
+
+logger = logging.getLogger(__name__)
+
+ARTIMLI = 2  # PRAGMA auto_vacuum değeri: INCREMENTAL
+
+VARSAYILAN_PARCA_BOYUTU = 500    # Bir yazma işleminde silinen haber sayısı
+VARSAYILAN_VACUUM_ADIMI = 1024   # Bir yazma işleminde dosyaya iade edilen sayfa sayısı
+
+
+def kategori_gunlerini_coz(metin):
+    """"spor=30,gundem=90" biçimindeki kategori saklama sürelerini {kategori: gün} sözlüğüne çevirir"""
+    gunler = {}
+    for parca in (metin or "").split(","):
+        if not parca.strip():
+            continue
+        kategori, ayrac, gun = parca.partition("=")
+        if not ayrac or not kategori.strip():
+            raise ValueError(f"Geçersiz kategori saklama süresi: {parca!r} (ör. spor=30)")
+        gunler[kategori.strip()] = float(gun)
+    return gunler
+
+
+class HaberSaklayici:
+    """Yaş ve satır sınırlarını uygulayıp eski haberleri arşivler, siler ve dosyayı küçültür
+
+    varsayilan_gun / kategori_gunleri: haberin yayın tarihine göre saklama süresi (0: sınırsız).
+    maks_haber: tabloda tutulacak en fazla haber (0: sınırsız); fazlası en eskiden başlayarak silinir.
+    silme_kancalari: silinen haber id'leriyle, aynı yazma işlemi içinde çağrılan fonksiyonlar (conn, idler).
+    """
+
+    def __init__(self, veritabani, varsayilan_gun=0, kategori_gunleri=None, maks_haber=0, arsiv_klasoru=None,
+                 silme_kancalari=(), parca_boyutu=VARSAYILAN_PARCA_BOYUTU, vacuum_adimi=VARSAYILAN_VACUUM_ADIMI):
+        self._veritabani = veritabani
+        self.varsayilan_gun = varsayilan_gun
+        self.kategori_gunleri = dict(kategori_gunleri or {})
+        self.maks_haber = maks_haber
+        self.arsiv_klasoru = arsiv_klasoru or None
+        self.silme_kancalari = list(silme_kancalari)
+        self.parca_boyutu = max(1, int(parca_boyutu))
+        self.vacuum_adimi = max(1, int(vacuum_adimi))
+        self._kilit = threading.Lock()  # Politika aynı anda tek kez uygulanır
+        self.son_calisma = None
+
+    @property
+    def etkin(self):
+        return bool(self.varsayilan_gun or any(self.kategori_gunleri.values()) or self.maks_haber)
+
+    def sinir_tarihi(self, kategori, simdi=None):
+        """Kategorinin bu tarihten eski haberleri saklanmaz; sınır yoksa None"""
+        gun = self.kategori_gunleri.get(kategori, self.varsayilan_gun)
+        if not gun:
+            return None
+        return (simdi or datetime.now()) - timedelta(days=gun)
+
+    def _eski_haberler(self, conn, kategoriler, simdi):
+        """Yaş sınırını aşan en eski haberlerden en fazla bir parçalık id listesi"""
+        idler = []
+        for kategori in kategoriler:
+            sinir = self.sinir_tarihi(kategori, simdi)
+            if sinir is None:
+                continue
+            idler.extend(row[0] for row in conn.execute(
+                'SELECT id FROM haberler WHERE kategori = ? AND tarih < ? ORDER BY tarih LIMIT ?',
+                (kategori, str(sinir), self.parca_boyutu - len(idler))))
+            if len(idler) >= self.parca_boyutu:
+                break
+        return idler
+
+    def _fazla_haberler(self, conn):
+        """Satır sınırını aşan en eski haberlerden en fazla bir parçalık id listesi"""
+        if not self.maks_haber:
+            return []
+        fazla = conn.execute('SELECT COUNT(*) FROM haberler').fetchone()[0] - self.maks_haber
+        if fazla <= 0:
+            return []
+        return [row[0] for row in conn.execute('SELECT id FROM haberler ORDER BY tarih, id LIMIT ?',
+                                               (min(fazla, self.parca_boyutu),))]
+
+    def _arsivle(self, conn, idler):
+        """Haberleri (içerikleriyle) yayın ayına göre sıkıştırılmış geçici NDJSON dosyalarına yazar
+
+        Arşivlenen haber sayısını ve {arşiv dosyası: geçici dosya} sözlüğünü döndürür; geçici dosyalar
+        silme işlemi onaylanınca _arsive_ekle ile arşive eklenir.
+        """
+        yer_tutucular = ",".join("?" * len(idler))
+        satirlar = conn.execute(f'SELECT * FROM haberler WHERE id IN ({yer_tutucular})', idler).fetchall()
+        icerikler = icerikleri_getir(conn, idler)
+        aylar = defaultdict(list)
+        for satir in satirlar:
+            haber = dict(satir)
+            haber['icerik'] = icerikler.get(haber['id'])
+            aylar[str(haber['tarih'])[:7]].append(json.dumps(haber, ensure_ascii=False, default=str))
+        os.makedirs(self.arsiv_klasoru, exist_ok=True)
+        geciciler = {}
+        try:
+            for ay, ay_satirlari in aylar.items():
+                tanimlayici, gecici = tempfile.mkstemp(prefix=f"haberler-{ay}.", suffix=".tmp", dir=self.arsiv_klasoru)
+                os.close(tanimlayici)
+                geciciler[os.path.join(self.arsiv_klasoru, f"haberler-{ay}.ndjson.gz")] = gecici
+                with gzip.open(gecici, "wt", encoding="utf-8") as dosya:
+                    dosya.write("\n".join(ay_satirlari) + "\n")
+        except Exception:
+            self._gecicileri_sil(geciciler)
+            raise
+        return len(satirlar), geciciler
+
+    @staticmethod
+    def _arsive_ekle(geciciler):
+        """Geçici dosyaları arşiv dosyalarının sonuna ekler ve siler
+
+        Her geçici dosya tek bir gzip üyesidir; gzip okuyucuları art arda eklenen üyeleri sırayla okur.
+        """
+        for hedef, gecici in geciciler.items():
+            try:
+                with open(gecici, "rb") as kaynak, open(hedef, "ab") as dosya:
+                    shutil.copyfileobj(kaynak, dosya)
+            except OSError as e:
+                # Haberler silinmiştir; geçici dosya elle eklenebilmesi için bırakılır
+                logger.error(f"Arşiv {hedef} dosyasına eklenemedi, satırlar {gecici} dosyasında: {e}")
+                continue
+            os.remove(gecici)
+
+    @staticmethod
+    def _gecicileri_sil(geciciler):
+        for gecici in geciciler.values():
+            try:
+                os.remove(gecici)
+            except OSError:
+                pass
+
+    def uygula(self, simdi=None):
+        """Politikayı bir kez uygular; silinen ve arşivlenen haber, iade edilen sayfa sayılarını döndürür
+
+        Politika zaten uygulanıyorsa None döner.
+        """
+        if not self._kilit.acquire(blocking=False):
+            return None
+        try:
+            simdi = simdi or datetime.now()
+            baslangic = time.perf_counter()
+            sonuc = {"silinen": 0, "arsivlenen": 0, "iade_edilen_sayfa": 0}
+            conn = self._veritabani.al()
+            try:
+                kategoriler = [row[0] for row in conn.execute('SELECT DISTINCT kategori FROM haberler')]
+            finally:
+                conn.close()
+
+            while True:
+                arsivlenen, geciciler = 0, {}
+                try:
+                    with self._veritabani.yazma_islemi() as conn:
+                        idler = self._eski_haberler(conn, kategoriler, simdi) or self._fazla_haberler(conn)
+                        if not idler:
+                            break
+                        # Arşiv satırları geçici dosyalara yazılır; yazılamazsa işlem geri alınır ve haberler silinmez
+                        if self.arsiv_klasoru:
+                            arsivlenen, geciciler = self._arsivle(conn, idler)
+                        conn.execute(f'DELETE FROM haberler WHERE id IN ({",".join("?" * len(idler))})', idler)
+                        for kanca in self.silme_kancalari:
+                            kanca(conn, idler)
+                except Exception:
+                    # Silme veya bir kanca hata verdiyse haberler yerinde kalır; arşive de eklenmez,
+                    # böylece bir sonraki çalıştırma aynı haberleri ikinci kez arşivlemez
+                    self._gecicileri_sil(geciciler)
+                    raise
+                # Arşiv yalnızca işlem onaylandıktan sonra büyür
+                self._arsive_ekle(geciciler)
+                sonuc["arsivlenen"] += arsivlenen
+                sonuc["silinen"] += len(idler)
+
+            sonuc["iade_edilen_sayfa"] = self.vacuum()
+            sonuc["sure_sn"] = round(time.perf_counter() - baslangic, 2)
+            sonuc["tarih"] = simdi.isoformat(timespec="seconds")
+            self.son_calisma = sonuc
+            if sonuc["silinen"]:
+                logger.info(f"Saklama politikası: {sonuc['silinen']} haber silindi ({sonuc['arsivlenen']} tanesi arşivlendi), "
+                            f"{sonuc['iade_edilen_sayfa']} sayfa dosyaya iade edildi ({sonuc['sure_sn']} sn).")
+            return sonuc
+        finally:
+            self._kilit.release()
+
+    def vacuum(self):
+        """Boş sayfaları küçük adımlarla dosyaya iade eder, iade edilen sayfa sayısını döndürür
+
+        Yalnızca auto_vacuum=INCREMENTAL veritabanlarında çalışır. Her adım ayrı bir kısa yazma işlemidir.
+        """
+        conn = self._veritabani.al()
+        try:
+            if conn.execute('PRAGMA auto_vacuum').fetchone()[0] != ARTIMLI:
+                return 0
+            toplam = 0
+            while True:
+                bos = conn.execute('PRAGMA freelist_count').fetchone()[0]
+                if not bos:
+                    break
+                adim = min(bos, self.vacuum_adimi)
+                # execute() pragmayı tek adım çalıştırır (tek sayfa); executescript sonuna kadar çalıştırır
+                conn.executescript(f'PRAGMA incremental_vacuum({adim});')
+                toplam += adim
+            if toplam:
+                # Küçülme, WAL'daki sayfalar ana dosyaya aktarılınca görünür; PASSIVE kimseyi beklemez
+                conn.execute('PRAGMA wal_checkpoint(PASSIVE)').fetchall()
+        finally:
+            conn.close()
+        return toplam
+
+    def durum(self):
+        """Politika ayarları, son çalıştırmanın sonucu ve veritabanı dosyasının durumu"""
+        conn = self._veritabani.al()
+        try:
+            sayfa_boyutu = conn.execute('PRAGMA page_size').fetchone()[0]
+            sayfa_sayisi = conn.execute('PRAGMA page_count').fetchone()[0]
+            bos_sayfa = conn.execute('PRAGMA freelist_count').fetchone()[0]
+            auto_vacuum = conn.execute('PRAGMA auto_vacuum').fetchone()[0]
+            haber_sayisi = conn.execute('SELECT COUNT(*) FROM haberler').fetchone()[0]
+        finally:
+            conn.close()
+        return {
+            "etkin": self.etkin,
+            "varsayilan_gun": self.varsayilan_gun,
+            "kategori_gunleri": self.kategori_gunleri,
+            "maks_haber": self.maks_haber,
+            "arsiv_klasoru": self.arsiv_klasoru,
+            "haber_sayisi": haber_sayisi,
+            "veritabani_mb": round(sayfa_boyutu * sayfa_sayisi / 1024 / 1024, 2),
+            "bos_mb": round(sayfa_boyutu * bos_sayfa / 1024 / 1024, 2),
+            "artimli_vacuum": auto_vacuum == ARTIMLI,
+            "son_calisma": self.son_calisma,
+        }
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Haber Sorguları
+---------------
+/api/haberler uç noktalarının kullandığı liste sorguları. Sayfalama OFFSET yerine
+(tarih, id) anahtarına dayalı imleçle yapılır; sorgular (kategori, tarih) ve (tarih)
+indekslerini sırayla tarar, böylece tablo büyüdükçe gecikme artmaz. Liste görünümleri
+varsayılan olarak büyük `icerik` alanını döndürmez; istenirse sıkıştırılmış içerik tablosundan
+yalnızca sayfadaki haberler için okunur.
+"""
+
+import base64
+import binascii
+
+from haber_icerikleri import icerikleri_getir
+
+# Sorgularda seçilebilecek sütunlar
+TUM_ALANLAR = ("id", "baslik", "ozet", "icerik", "kategori", "kaynak", "url", "resim_url",
+               "tarih", "olusturulma_tarihi", "ozet_durumu", "kume_id")
+# Liste görünümünde varsayılan olarak döndürülen sütunlar (icerik hariç)
+LISTE_ALANLARI = tuple(alan for alan in TUM_ALANLAR if alan != "icerik")
+
+MAKS_LIMIT = 200
+
+INDEKSLER = (
+    "CREATE INDEX IF NOT EXISTS idx_haberler_kategori_tarih ON haberler(kategori, tarih)",
+    "CREATE INDEX IF NOT EXISTS idx_haberler_tarih ON haberler(tarih)",
+    "CREATE INDEX IF NOT EXISTS idx_haberler_kume ON haberler(kume_id)",
+)
+
+
+class GecersizSorgu(ValueError):
+    """İstemciden gelen sayfalama veya alan parametresi geçersiz"""
+
+
+def indeksleri_olustur(conn):
+    """Liste sorgularının kullandığı indeksleri oluşturur"""
+    for sql in INDEKSLER:
+        conn.execute(sql)
+
+
+def imlec_olustur(tarih, haber_id):
+    """Son döndürülen haberden bir sonraki sayfa için opak imleç üretir"""
+    ham = f"{tarih}|{haber_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(ham).decode("ascii").rstrip("=")
+
+
+def imlec_coz(imlec):
+    """İmleci (tarih, id) ikilisine çözer"""
+    try:
+        ham = base64.urlsafe_b64decode(imlec + "=" * (-len(imlec) % 4)).decode("utf-8")
+        tarih, haber_id = ham.rsplit("|", 1)
+        return tarih, int(haber_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise GecersizSorgu("Geçersiz imleç")
+
+
+def alanlari_coz(alanlar):
+    """Virgülle ayrılmış alan listesini doğrular; boşsa liste alanlarını döndürür"""
+    if not alanlar:
+        return LISTE_ALANLARI
+    secilenler = [alan.strip() for alan in alanlar.split(",") if alan.strip()]
+    bilinmeyenler = [alan for alan in secilenler if alan not in TUM_ALANLAR]
+    if bilinmeyenler:
+        raise GecersizSorgu(f"Bilinmeyen alan: {', '.join(bilinmeyenler)}")
+    # İmleç üretmek için tarih ve id her zaman okunur
+    return tuple(dict.fromkeys(["id", "tarih"] + secilenler))
+
+
+def limiti_coz(limit, varsayilan):
+    """limit parametresini doğrular ve [1, MAKS_LIMIT] aralığına sınırlar"""
+    if limit in (None, ""):
+        return varsayilan
+    try:
+        limit = int(limit)
+    except (TypeError, ValueError):
+        raise GecersizSorgu("limit bir sayı olmalı")
+    return max(1, min(limit, MAKS_LIMIT))
+
+
+def haberleri_listele(conn, kategori=None, limit=50, imlec=None, alanlar=LISTE_ALANLARI, tekil=False):
+    """En yeni haberleri (tarih, id) sırasıyla döndürür
+
+    tekil=True ise her haber kümesinden yalnızca temsilci döner ve `kume_boyutu` alanı eklenir.
+    Dönüş: (haberler, sonraki_imlec). Son sayfada sonraki_imlec None olur.
+    """
+    kosullar = []
+    parametreler = []
+    icerik_istendi = "icerik" in alanlar
+    secilenler = [alan for alan in alanlar if alan != "icerik"]
+    if kategori is not None:
+        kosullar.append("kategori = ?")
+        parametreler.append(kategori)
+    if tekil:
+        secilenler.append("(SELECT COUNT(*) FROM haberler k WHERE k.kume_id = haberler.kume_id) AS kume_boyutu")
+        if kategori is None:
+            kosullar.append("kume_id = id")
+        else:
+            # Küme başka kategorilere de yayılmış olabilir; bu kategorideki ilk üye gösterilir
+            kosullar.append("id = (SELECT MIN(k.id) FROM haberler k WHERE k.kume_id = haberler.kume_id AND k.kategori = haberler.kategori)")
+    if imlec:
+        tarih, haber_id = imlec_coz(imlec)
+        kosullar.append("(tarih, id) < (?, ?)")
+        parametreler.extend([tarih, haber_id])
+
+    where = f"WHERE {' AND '.join(kosullar)}" if kosullar else ""
+    # Bir fazla satır okunur; varsa sonraki sayfa vardır
+    satirlar = conn.execute(
+        f"SELECT {', '.join(secilenler)} FROM haberler {where} ORDER BY tarih DESC, id DESC LIMIT ?",
+        parametreler + [limit + 1]
+    ).fetchall()
+
+    haberler = [dict(satir) for satir in satirlar[:limit]]
+    if icerik_istendi:
+        icerikler = icerikleri_getir(conn, [haber["id"] for haber in haberler])
+        for haber in haberler:
+            haber["icerik"] = icerikler.get(haber["id"], "")
+    sonraki_imlec = None
+    if len(satirlar) > limit:
+        son = haberler[-1]
+        sonraki_imlec = imlec_olustur(son["tarih"], son["id"])
+    return haberler, sonraki_imlec
@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Metin Temizleyici
+-----------------
+RSS içeriğini özetleme, arama indeksi ve kümeleme için düz metne çevirir.
+Tüm kalıplar modül yüklenirken bir kez derlenir ve her adım yalnızca metinde ilgili
+karakterler varsa çalışır (ör. '<' yoksa etiket taraması, 'http' yoksa URL taraması yapılmaz).
+Temizlik tek bir birleşik taramada yapılmaz: CDATA, script, style ve yorum blokları eski sırayla
+ayrı taramalarda kaldırılır, çünkü iç içe bloklarda (ör. CDATA içinde açılıp dışarıda kapanan
+script) sonuç bu sıraya bağlıdır.
+Sabit ifadeyle başlayıp satır sonuna kadar silen kalıplar ("Devamı için tıklayınız.*")
+regex yerine str.find ile kesilir; büyük/küçük harf duyarsız reklam kalıplarından yalnızca
+sabit başlangıcı metnin katlanmış kopyasında geçenler çalıştırılır. Çıktı eski ardışık re.sub zinciriyle birebir aynıdır
+(benchmarks/veri/temizlik_altin.jsonl).
+
+MetinTemizleyici, aynı içeriğin yedek özet, arama indeksi, kümeleme ve model özeti için
+tekrar tekrar temizlenmemesi için sonuçları LRU'da tutar. Süreç havuzu kullanılmaz; RSS
+boyutundaki metinlerde süreçler arası aktarım temizlemenin kendisinden pahalıdır.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from html import unescape
+
+VARSAYILAN_KAPASITE = 2048   # Önbellekte tutulacak temizlenmiş metin sayısı
+
+# CDATA içeriği korunur; ardından script, style ve yorumlar boşlukla değişir (sırası önemli)
+_CDATA = re.compile(r'<!\[CDATA\[(.*?)\]\]>')
+_BLOKLAR = (
+    ('<script', re.compile(r'<script.*?>.*?</script>', re.DOTALL)),
+    ('<style', re.compile(r'<style.*?>.*?</style>', re.DOTALL)),
+    ('<!--', re.compile(r'<!--.*?-->', re.DOTALL)),
+)
+_ETIKET = re.compile(r'<.*?>')
+_URL = re.compile(r'https?://\S+')
+_NOKTALAR = re.compile(r'\.{2,}')
+_BOSLUK_NOKTA = re.compile(r'\s+\.')
+
+# Satır sonuna kadar silinen yönlendirme ifadeleri (büyük/küçük harf duyarlı, sırası önemli)
+_DEVAMI_IFADELERI = (
+    'Devamı için tıklayınız',
+    'Haberin devamı için',
+    'Detaylar için tıklayınız',
+    'Ayrıntılar için tıklayınız',
+    'Devamını oku',
+)
+
+# Reklam ve yönlendirme kalıpları (büyük/küçük harf duyarsız, sırayla uygulanır):
+# (sabit başlangıç, kalıp, satır sonuna kadar kesiyor mu)
+_REKLAM_KALIPLARI = tuple((baslangic, re.compile(kalip, re.IGNORECASE), kesen) for baslangic, kalip, kesen in (
+    ('Bu haber', r'Bu haber\s+.+\s+tarafından hazırlanmıştır\.', False),
+    ('Kaynak:', r'Kaynak:.+', True),
+    ('Sponsorlu İçerik', r'Sponsorlu İçerik', False),
+    ('Reklam', r'Reklam', False),
+    ('İlgili Haberler:', r'İlgili Haberler:.*', True),
+    ('Devamı için tıklayınız', r'Devamı için tıklayınız.*', True),
+    ('Haberin devamı için', r'Haberin devamı için.*', True),
+    ('Detaylar için tıklayınız', r'Detaylar için tıklayınız.*', True),
+    ('Ayrıntılar için tıklayınız', r'Ayrıntılar için tıklayınız.*', True),
+    ('Devamını oku', r'Devamını oku.*', True),
+    ('Daha fazlası için', r'Daha fazlası için.*', True),
+))
+
+
+def _katla(metin):
+    """re.IGNORECASE'in eşit saydığı harfleri (I/ı/İ/i, S/ſ/s) aynı küçük harfe indirger
+
+    Yalnızca ön süzgeç içindir: kalıp bir yerde eşleşiyorsa sabit başlangıcının katlanmış hali
+    katlanmış metinde mutlaka geçer (tersi gerekmez).
+    """
+    return metin.lower().replace('\u0307', '').replace('ı', 'i').replace('ſ', 's')
+
+
+_KATLANMIS_BASLANGICLAR = tuple(_katla(baslangic) for baslangic, _, _ in _REKLAM_KALIPLARI)
+
+
+def _noktalari_duzelt(metin):
+    # Metinde boşluk olarak yalnızca ' ' kaldığı için ' .' araması \s+\. için yeterlidir
+    if '..' in metin:
+        metin = _NOKTALAR.sub('.', metin)
+    if ' .' in metin:
+        metin = _BOSLUK_NOKTA.sub('.', metin)
+    return metin
+
+
+def temizle_html(html_icerik):
+    """HTML içeriğini temizler ve düz metne dönüştürür"""
+    if not html_icerik:
+        return ""
+    if not isinstance(html_icerik, str):
+        try:
+            html_icerik = str(html_icerik)
+        except Exception:
+            return ""
+
+    if '<![CDATA[' in html_icerik:
+        html_icerik = _CDATA.sub(r'\1', html_icerik)
+    for baslangic, kalip in _BLOKLAR:
+        if baslangic in html_icerik:
+            html_icerik = kalip.sub(' ', html_icerik)
+    if '<' in html_icerik:
+        html_icerik = _ETIKET.sub(' ', html_icerik)
+
+    # split() ile \s aynı karakter kümesini kullanır; sonuç re.sub(r'\s+', ' ').strip() ile aynıdır
+    temiz_metin = ' '.join(unescape(html_icerik).split())
+    if 'http' in temiz_metin:
+        temiz_metin = _URL.sub('', temiz_metin)
+    # Metinde satır sonu kalmadığından "ifade.*" silmek ilk geçtiği yerden kesmekle aynıdır
+    for ifade in _DEVAMI_IFADELERI:
+        konum = temiz_metin.find(ifade)
+        if konum != -1:
+            temiz_metin = temiz_metin[:konum]
+    return _noktalari_duzelt(temiz_metin).strip()
+
+
+def temizle_metin(metin):
+    """Metni özetleme için hazırlar"""
+    temiz_metin = temizle_html(metin)
+    # URL silinen yerlerde kalan çift boşluklar
+    if '  ' in temiz_metin:
+        temiz_metin = ' '.join(temiz_metin.split())
+    temiz_metin = _noktalari_duzelt(temiz_metin)
+
+    # Kalıplar yalnızca sabit başlangıçları katlanmış metinde geçiyorsa çalıştırılır
+    katlanmis = _katla(temiz_metin)
+    bulunanlar = [baslangic in katlanmis for baslangic in _KATLANMIS_BASLANGICLAR]
+    if any(bulunanlar):
+        # Ortadan silen bir kalıp yeni bir eşleşme oluşturabilir; o noktadan sonra tüm kalıplar denenir
+        hepsi = False
+        for bulundu, (_, kalip, kesen) in zip(bulunanlar, _REKLAM_KALIPLARI):
+            if hepsi or bulundu:
+                temiz_metin, adet = kalip.subn('', temiz_metin)
+                hepsi = hepsi or (adet > 0 and not kesen)
+    return temiz_metin.strip()
+
+
+class MetinTemizleyici:
+    """temizle_metin sonuçlarını önbellekleyen temizleyici
+
+    Çağrılabilir nesnedir: temizleyici(metin) temizle_metin(metin) ile aynı sonucu döndürür.
+    """
+
+    def __init__(self, kapasite=VARSAYILAN_KAPASITE):
+        self.kapasite = max(1, int(kapasite))
+        self._kilit = threading.Lock()
+        self._bellek = OrderedDict()  # ham metin -> temizlenmiş metin
+        self.isabet = 0
+        self.iskalama = 0
+
+    def _bellege_koy(self, metin, temiz_metin):
+        self._bellek[metin] = temiz_metin
+        self._bellek.move_to_end(metin)
+        while len(self._bellek) > self.kapasite:
+            self._bellek.popitem(last=False)
+
+    def __call__(self, metin):
+        if not isinstance(metin, str):
+            return temizle_metin(metin)
+        with self._kilit:
+            temiz_metin = self._bellek.get(metin)
+            if temiz_metin is not None:
+                self._bellek.move_to_end(metin)
+                self.isabet += 1
+                return temiz_metin
+            self.iskalama += 1
+        temiz_metin = temizle_metin(metin)
+        with self._kilit:
+            self._bellege_koy(metin, temiz_metin)
+        return temiz_metin
+
+    def toplu(self, metinler):
+        """Metin listesini temizler; sonuçlar aynı sırayla döner ve önbelleğe yazılır"""
+        sonuclar = [None] * len(metinler)
+        eksikler = {}  # metin -> [indeksler]
+        with self._kilit:
+            for i, metin in enumerate(metinler):
+                if not isinstance(metin, str):
+                    sonuclar[i] = temizle_metin(metin)
+                    continue
+                temiz_metin = self._bellek.get(metin)
+                if temiz_metin is not None:
+                    self._bellek.move_to_end(metin)
+                    sonuclar[i] = temiz_metin
+                else:
+                    eksikler.setdefault(metin, []).append(i)
+            self.iskalama += len(eksikler)
+            self.isabet += sum(1 for metin in metinler if isinstance(metin, str)) - len(eksikler)
+        if not eksikler:
+            return sonuclar
+
+        ham_metinler = list(eksikler)
+        temizler = [temizle_metin(metin) for metin in ham_metinler]
+
+        with self._kilit:
+            for metin, temiz_metin in zip(ham_metinler, temizler):
+                for i in eksikler[metin]:
+                    sonuclar[i] = temiz_metin
+                self._bellege_koy(metin, temiz_metin)
+        return sonuclar
+
+    def istatistikler(self):
+        """Önbellek isabet/ıskalama sayıları"""
+        with self._kilit:
+            return {"kayit": len(self._bellek), "kapasite": self.kapasite,
+                    "isabet": self.isabet, "iskalama": self.iskalama}
@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Metrikler
+---------
+Haber toplama hattının aşamaları (çekme, ayrıştırma, temizleme, özetleme, kaydetme) için
+Prometheus uyumlu sayaç, gösterge ve histogramlar. Kayıt işlemi bir kilit altında birkaç toplama
+işleminden ibarettir; metin biçimine dönüştürme yalnızca /api/metrics istendiğinde yapılır.
+Zaten kendi sayaçlarını tutan bileşenlerin (önbellekler, kuyruk) değerleri kopyalanmaz,
+toplayıcı fonksiyonlarla istek anında okunur.
+"""
+
+import math
+import threading
+import time
+from bisect import bisect_left
+
+SAYAC = "counter"
+GOSTERGE = "gauge"
+HISTOGRAM = "histogram"
+
+ICERIK_TIPI = "text/plain; version=0.0.4; charset=utf-8"
+VARSAYILAN_SINIRLAR = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+def _etiket_degeri(deger):
+    return str(deger).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _etiketler_metni(adlar, degerler, ek=()):
+    ciftler = [f'{ad}="{_etiket_degeri(deger)}"' for ad, deger in zip(adlar, degerler)]
+    ciftler.extend(f'{ad}="{_etiket_degeri(deger)}"' for ad, deger in ek)
+    return "{" + ",".join(ciftler) + "}" if ciftler else ""
+
+
+def _sayi(deger):
+    if deger == math.inf:
+        return "+Inf"
+    if deger == -math.inf:
+        return "-Inf"
+    if isinstance(deger, float) and deger.is_integer():
+        return str(int(deger))
+    return repr(deger) if isinstance(deger, float) else str(deger)
+
+
+class _Metrik:
+    tip = None
+
+    def __init__(self, ad, aciklama, etiketler=()):
+        self.ad = ad
+        self.aciklama = aciklama
+        self.etiket_adlari = tuple(etiketler)
+        self._kilit = threading.Lock()
+        self._degerler = {}  # etiket değerleri demeti -> değer
+
+    def _anahtar(self, etiketler):
+        if len(etiketler) != len(self.etiket_adlari):
+            raise ValueError(f"{self.ad} metriği {self.etiket_adlari} etiketlerini bekliyor")
+        return tuple(str(etiketler[ad]) for ad in self.etiket_adlari)
+
+    def basliklar(self):
+        aciklama = self.aciklama.replace("\\", "\\\\").replace("\n", "\\n")
+        return [f"# HELP {self.ad} {aciklama}", f"# TYPE {self.ad} {self.tip}"]
+
+
+class Sayac(_Metrik):
+    """Yalnızca artan sayaç"""
+
+    tip = SAYAC
+
+    def artir(self, miktar=1, **etiketler):
+        anahtar = self._anahtar(etiketler)
+        with self._kilit:
+            self._degerler[anahtar] = self._degerler.get(anahtar, 0) + miktar
+
+    def satirlar(self):
+        with self._kilit:
+            degerler = sorted(self._degerler.items())
+        return [f"{self.ad}{_etiketler_metni(self.etiket_adlari, anahtar)} {_sayi(deger)}" for anahtar, deger in degerler]
+
+
+class Gosterge(_Metrik):
+    """Anlık değer; ayarla() ile yazılır"""
+
+    tip = GOSTERGE
+
+    def ayarla(self, deger, **etiketler):
+        anahtar = self._anahtar(etiketler)
+        with self._kilit:
+            self._degerler[anahtar] = deger
+
+    satirlar = Sayac.satirlar
+
+
+class _Zamanlayici:
+    __slots__ = ("_histogram", "_etiketler", "_baslangic")
+
+    def __init__(self, histogram, etiketler):
+        self._histogram = histogram
+        self._etiketler = etiketler
+
+    def __enter__(self):
+        self._baslangic = time.perf_counter()
+        return self
+
+    def __exit__(self, *_):
+        self._histogram.gozlemle(time.perf_counter() - self._baslangic, **self._etiketler)
+        return False
+
+
+class Histogram(_Metrik):
+    """Sabit kova sınırlı histogram (sınırlar saniye cinsinden süreler için ayarlanmıştır)"""
+
+    tip = HISTOGRAM
+
+    def __init__(self, ad, aciklama, etiketler=(), sinirlar=VARSAYILAN_SINIRLAR):
+        super().__init__(ad, aciklama, etiketler)
+        self.sinirlar = tuple(sorted(sinirlar))
+
+    def gozlemle(self, deger, **etiketler):
+        anahtar = self._anahtar(etiketler)
+        kova = bisect_left(self.sinirlar, deger)
+        with self._kilit:
+            kayit = self._degerler.get(anahtar)
+            if kayit is None:
+                # [kova sayıları (+Inf dahil), toplam, adet]
+                kayit = self._degerler[anahtar] = [[0] * (len(self.sinirlar) + 1), 0.0, 0]
+            kayit[0][kova] += 1
+            kayit[1] += deger
+            kayit[2] += 1
+
+    def zamanla(self, **etiketler):
+        """with bloğunun süresini gözlemleyen bağlam yöneticisi"""
+        return _Zamanlayici(self, etiketler)
+
+    def satirlar(self):
+        with self._kilit:
+            degerler = sorted((anahtar, (list(kovalar), toplam, adet))
+                              for anahtar, (kovalar, toplam, adet) in self._degerler.items())
+        satirlar = []
+        for anahtar, (kovalar, toplam, adet) in degerler:
+            birikimli = 0
+            for sinir, sayi in zip(self.sinirlar + (math.inf,), kovalar):
+                birikimli += sayi
+                etiketler = _etiketler_metni(self.etiket_adlari, anahtar, [("le", _sayi(float(sinir)))])
+                satirlar.append(f"{self.ad}_bucket{etiketler} {birikimli}")
+            etiketler = _etiketler_metni(self.etiket_adlari, anahtar)
+            satirlar.append(f"{self.ad}_sum{etiketler} {_sayi(toplam)}")
+            satirlar.append(f"{self.ad}_count{etiketler} {adet}")
+        return satirlar
+
+
+class MetrikKaydi:
+    """Metriklerin ve toplayıcıların kaydı; Prometheus metin biçiminde çıktı üretir"""
+
+    def __init__(self, onek=""):
+        self.onek = onek
+        self._metrikler = []
+        self._toplayicilar = []
+
+    def _ekle(self, metrik):
+        self._metrikler.append(metrik)
+        return metrik
+
+    def sayac(self, ad, aciklama, etiketler=()):
+        return self._ekle(Sayac(self.onek + ad, aciklama, etiketler))
+
+    def gosterge(self, ad, aciklama, etiketler=()):
+        return self._ekle(Gosterge(self.onek + ad, aciklama, etiketler))
+
+    def histogram(self, ad, aciklama, etiketler=(), sinirlar=VARSAYILAN_SINIRLAR):
+        return self._ekle(Histogram(self.onek + ad, aciklama, etiketler, sinirlar))
+
+    def toplayici(self, ad, tip, aciklama, etiketler, fonksiyon):
+        """İstek anında okunan metrik; fonksiyon [(etiket değerleri demeti, değer), ...] döndürür"""
+        self._toplayicilar.append((self.onek + ad, tip, aciklama, tuple(etiketler), fonksiyon))
+
+    def metin(self):
+        """Tüm metriklerin Prometheus metin biçimi (0.0.4)"""
+        satirlar = []
+        for metrik in self._metrikler:
+            satirlar.extend(metrik.basliklar())
+            satirlar.extend(metrik.satirlar())
+        for ad, tip, aciklama, etiket_adlari, fonksiyon in self._toplayicilar:
+            satirlar.append(f"# HELP {ad} {aciklama}")
+            satirlar.append(f"# TYPE {ad} {tip}")
+            for degerler, deger in fonksiyon():
+                if deger is not None:
+                    satirlar.append(f"{ad}{_etiketler_metni(etiket_adlari, degerler)} {_sayi(deger)}")
+        return "\n".join(satirlar) + "\n"
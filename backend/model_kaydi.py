@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Model Kaydı
+-----------
+Yüklenmiş özetleme modellerini bellekte tutar. Etkin olmayan modeller LRU sırasıyla, kayıt sayısı
+veya toplam tahmini boyut sınırı aşıldığında bellekten çıkarılır; daha önce kullanılmış bir modele
+geri dönmek diskten yeniden yükleme gerektirmez.
+
+Yeni modeller arka plan thread'inde yüklenir ve kısa bir ısınma çıkarımından sonra etkin model
+tek bir atamayla değiştirilir. Yükleme sürerken istekler eski modelle karşılanır; o sırada eski
+modelle çalışan özetleme işleri elindeki referansla bitirir (bellekten çıkarılan model, son
+referansı bırakıldığında serbest kalır).
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+logger = logging.getLogger(__name__)
+
+HAZIR = "hazir"
+YUKLENIYOR = "yukleniyor"
+
+VARSAYILAN_KAPASITE = 2
+
+KayitliModel = namedtuple("KayitliModel", "ad ozetleyici arka_uc boyut_mb yukleme_sn")
+
+
+def _tensor_bayti(deger):
+    if isinstance(deger, (tuple, list)):
+        return sum(_tensor_bayti(parca) for parca in deger)
+    if hasattr(deger, "element_size") and hasattr(deger, "numel"):
+        return deger.numel() * deger.element_size()
+    return 0
+
+
+def model_boyutu_mb(ozetleyici):
+    """Pipeline'daki modelin ağırlıklarının tahmini bellek boyutu (MB)
+
+    PyTorch modellerinde state_dict tensörleri (nicemlenmiş katmanların paketli ağırlıkları dahil)
+    sayılır; ONNX Runtime modellerinde model dosyalarının boyutu kullanılır.
+    """
+    model = getattr(ozetleyici, "model", None)
+    if model is None:
+        return 0.0
+    toplam = 0
+    try:
+        toplam = sum(_tensor_bayti(deger) for deger in model.state_dict().values())
+    except Exception:
+        klasor = getattr(model, "model_save_dir", None)
+        if klasor and os.path.isdir(klasor):
+            for kok, _, dosyalar in os.walk(klasor):
+                toplam += sum(os.path.getsize(os.path.join(kok, dosya)) for dosya in dosyalar if dosya.endswith(".onnx"))
+    return toplam / 1024 / 1024
+
+
+class ModelKaydi:
+    """Bellekteki modellerin LRU kaydı; arka planda yükler ve etkin modeli atomik olarak değiştirir
+
+    yukleyici(ad): (ozetleyici, arka_uc) döndürür, hata durumunda istisna yükseltir.
+    isinma(ad, ozetleyici): etkinleştirmeden önce yapılan deneme çıkarımı; hata verirse model kullanılmaz.
+    etkinlestirildi(kayit): etkin model değiştiğinde kayıt kilidi altında çağrılır.
+    bellek_butcesi_mb: bellekteki modellerin toplam tahmini boyut sınırı (0: sınırsız).
+    """
+
+    def __init__(self, yukleyici, kapasite=VARSAYILAN_KAPASITE, bellek_butcesi_mb=0, isinma=None, etkinlestirildi=None):
+        self.yukleyici = yukleyici
+        self.kapasite = max(1, int(kapasite))
+        self.bellek_butcesi_mb = float(bellek_butcesi_mb)
+        self.isinma = isinma
+        self.etkinlestirildi = etkinlestirildi
+        self._kilit = threading.Lock()
+        self._modeller = OrderedDict()  # ad -> KayitliModel, en son kullanılan sonda
+        self._sabitler = {}             # Yüklenmeyen özetleyiciler; sınırlara sayılmaz, çıkarılmaz
+        self._yuklemeler = {}           # ad -> threading.Event (yükleme bitince set edilir)
+        self._hatalar = {}              # ad -> son yükleme hatası
+        self._etkin = None
+        self._hedef = None              # En son seçilen model; geç biten eski yüklemeler etkinleşmez
+
+    def etkin(self):
+        """Etkin modelin kaydı (henüz yoksa None)"""
+        return self._etkin
+
+    def _etkinlestir(self, kayit):
+        if kayit.ad in self._modeller:
+            self._modeller.move_to_end(kayit.ad)
+        self._etkin = kayit
+        if self.etkinlestirildi is not None:
+            self.etkinlestirildi(kayit)
+
+    def _tahliye_et(self):
+        """Sınırlar aşıldıysa en uzun süredir kullanılmayan, etkin olmayan modelleri çıkarır"""
+        while True:
+            toplam_mb = sum(kayit.boyut_mb for kayit in self._modeller.values())
+            if len(self._modeller) <= self.kapasite and not (self.bellek_butcesi_mb and toplam_mb > self.bellek_butcesi_mb):
+                return
+            aday = next((ad for ad in self._modeller if self._etkin is None or ad != self._etkin.ad), None)
+            if aday is None:
+                return
+            kayit = self._modeller.pop(aday)
+            logger.info(f"Model bellekten çıkarıldı: {aday} ({kayit.boyut_mb:.0f} MB)")
+
+    def kaydet(self, ad, ozetleyici, arka_uc=None):
+        """Yüklemesi gerekmeyen bir özetleyiciyi (ör. basit özetleyici) kaydeder ve etkinleştirir"""
+        with self._kilit:
+            self._hedef = ad
+            kayit = self._sabitler[ad] = KayitliModel(ad, ozetleyici, arka_uc, 0.0, 0.0)
+            self._etkinlestir(kayit)
+        return kayit
+
+    def sec(self, ad, bekle=False):
+        """ad modelini etkin model yapar
+
+        Model bellekteyse hemen geçilir. Değilse arka planda yüklenir ve ısınma çıkarımından sonra,
+        bu arada başka bir model seçilmediyse etkinleştirilir. bekle=True ise yükleme bitene kadar
+        beklenir ve yükleme hatası istisna olarak yükseltilir.
+        Dönüş: HAZIR veya YUKLENIYOR.
+        """
+        with self._kilit:
+            self._hedef = ad
+            kayit = self._modeller.get(ad) or self._sabitler.get(ad)
+            if kayit is not None:
+                self._etkinlestir(kayit)
+                return HAZIR
+            olay = self._yuklemeler.get(ad)
+            if olay is None:
+                olay = self._yuklemeler[ad] = threading.Event()
+                self._hatalar.pop(ad, None)
+                threading.Thread(target=self._yukle, args=(ad, olay), name="model-yukleme", daemon=True).start()
+        if not bekle:
+            return YUKLENIYOR
+        olay.wait()
+        with self._kilit:
+            if ad in self._hatalar:
+                raise RuntimeError(self._hatalar[ad])
+        return HAZIR
+
+    def _yukle(self, ad, olay):
+        baslangic = time.perf_counter()
+        try:
+            ozetleyici, arka_uc = self.yukleyici(ad)
+            if self.isinma is not None:
+                self.isinma(ad, ozetleyici)
+            kayit = KayitliModel(ad, ozetleyici, arka_uc, model_boyutu_mb(ozetleyici), round(time.perf_counter() - baslangic, 2))
+        except Exception as e:
+            logger.error(f"Model yüklenemedi ({ad}): {e}")
+            with self._kilit:
+                self._hatalar[ad] = str(e)
+                self._yuklemeler.pop(ad, None)
+            olay.set()
+            return
+
+        with self._kilit:
+            self._modeller[ad] = kayit
+            self._yuklemeler.pop(ad, None)
+            if self._hedef == ad:
+                self._etkinlestir(kayit)
+            self._tahliye_et()
+        logger.info(f"Model yüklendi ve ısındı: {ad} ({arka_uc}, {kayit.boyut_mb:.0f} MB, {kayit.yukleme_sn:.1f} sn)")
+        olay.set()
+
+    def durum(self):
+        """Etkin model, bellekteki modeller, süren yüklemeler ve hatalar"""
+        with self._kilit:
+            return {
+                "etkin": self._etkin.ad if self._etkin else None,
+                "bellekte": [{"ad": kayit.ad, "arka_uc": kayit.arka_uc, "boyut_mb": round(kayit.boyut_mb, 1),
+                              "yukleme_sn": kayit.yukleme_sn} for kayit in reversed(self._modeller.values())],
+                "yukleniyor": list(self._yuklemeler),
+                "hatalar": dict(self._hatalar),
+                "kapasite": self.kapasite,
+                "bellek_butcesi_mb": self.bellek_butcesi_mb,
+            }
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Model Yükleyici
+---------------
+Özetleme modelini seçilen çıkarım arka ucuyla bir transformers summarization pipeline'ı olarak yükler:
+  - fp32: PyTorch modeli olduğu gibi çalışır (eski davranış)
+  - int8: nn.Linear katmanları dinamik int8 nicemlemeyle (torch.quantization.quantize_dynamic)
+    sıkıştırılır; yalnızca CPU'da çalışır
+  - onnx: model optimum ile ONNX'e aktarılır ve ONNX Runtime ile çalıştırılır
+Dönüştürülen modeller model adı ve arka uca göre ayrı klasörlerde diske yazılır; sonraki açılışlarda
+dönüştürme tekrarlanmaz. Yarım kalan dönüştürmeler geçici klasörde kalır, hazır klasörü bozmaz.
+optimum ve onnxruntime yalnızca onnx arka ucu seçildiğinde içe aktarılır.
+"""
+
+import json
+import logging
+import os
+import shutil
+
+logger = logging.getLogger(__name__)
+
+FP32 = "fp32"
+INT8 = "int8"
+ONNX = "onnx"
+ARKA_UCLAR = (FP32, INT8, ONNX)
+
+VARSAYILAN_KLASOR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "modeller")
+_INT8_DOSYASI = "model.pt"
+_BILGI_DOSYASI = "donusum.json"
+
+
+def model_siniflari(model_adi):
+    """Model adına göre (model sınıfı, tokenizer sınıfı) döndürür"""
+    import transformers
+    ad = model_adi.lower()
+    if "bert2bert" in ad:
+        return transformers.EncoderDecoderModel, transformers.BertTokenizer
+    if "t5" in ad:
+        return transformers.T5ForConditionalGeneration, transformers.T5Tokenizer
+    if "mbart" in ad:
+        return transformers.MBartForConditionalGeneration, transformers.MBart50TokenizerFast
+    return transformers.AutoModelForSeq2SeqLM, transformers.AutoTokenizer
+
+
+def _hf_yukle(sinif, model_adi):
+    """Önce yerel Hugging Face önbelleğinden (offline), olmazsa Hub'dan yükler"""
+    try:
+        return sinif.from_pretrained(model_adi, local_files_only=True)
+    except Exception as e:
+        logger.warning(f"Offline yüklenemedi, online deneniyor ({model_adi}): {e}")
+        return sinif.from_pretrained(model_adi)
+
+
+def artefakt_klasoru(model_adi, arka_uc, klasor=None):
+    """Dönüştürülmüş modelin saklandığı klasör"""
+    return os.path.join(klasor or VARSAYILAN_KLASOR, model_adi.replace("/", "__"), arka_uc)
+
+
+def is_parcacigi_ayarla(sayi):
+    """torch'un çıkarımda kullandığı iş parçacığı sayısını ayarlar (0: kütüphane varsayılanı)"""
+    if sayi and sayi > 0:
+        import torch
+        torch.set_num_threads(sayi)
+
+
+def _bilgi_oku(hedef):
+    try:
+        with open(os.path.join(hedef, _BILGI_DOSYASI), encoding="utf-8") as dosya:
+            return json.load(dosya)
+    except (OSError, ValueError):
+        return None
+
+
+def _klasoru_yayinla(gecici, hedef, bilgi):
+    """Geçici klasörde hazırlanan dönüştürmeyi tek adımda hedef klasöre taşır"""
+    with open(os.path.join(gecici, _BILGI_DOSYASI), "w", encoding="utf-8") as dosya:
+        json.dump(bilgi, dosya, ensure_ascii=False)
+    if os.path.isdir(hedef):
+        shutil.rmtree(hedef)
+    os.replace(gecici, hedef)
+
+
+def _gecici_klasor(hedef):
+    gecici = f"{hedef}.tmp-{os.getpid()}"
+    shutil.rmtree(gecici, ignore_errors=True)
+    os.makedirs(gecici)
+    return gecici
+
+
+def _int8_yukle(model_adi, hedef):
+    """Dinamik int8 nicemlenmiş modeli diskten yükler, yoksa fp32 modelden üretip kaydeder"""
+    import torch
+    model_sinifi, tokenizer_sinifi = model_siniflari(model_adi)
+
+    bilgi = _bilgi_oku(hedef)
+    # Nicemlenmiş modül pickle'ı torch sürümüne bağlıdır; sürüm değiştiyse yeniden üretilir
+    if bilgi and bilgi.get("torch") == torch.__version__:
+        try:
+            model = torch.load(os.path.join(hedef, _INT8_DOSYASI), weights_only=False)
+        except TypeError:  # weights_only parametresi olmayan eski torch sürümleri
+            model = torch.load(os.path.join(hedef, _INT8_DOSYASI))
+        tokenizer = tokenizer_sinifi.from_pretrained(hedef)
+        logger.info(f"int8 model diskten yüklendi: {hedef}")
+        return model, tokenizer
+
+    tokenizer = _hf_yukle(tokenizer_sinifi, model_adi)
+    model = _hf_yukle(model_sinifi, model_adi)
+    model.eval()
+    model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+    gecici = _gecici_klasor(hedef)
+    torch.save(model, os.path.join(gecici, _INT8_DOSYASI))
+    tokenizer.save_pretrained(gecici)
+    _klasoru_yayinla(gecici, hedef, {"model": model_adi, "arka_uc": INT8, "torch": torch.__version__})
+    logger.info(f"Model int8'e nicemlendi ve kaydedildi: {hedef}")
+    return model, tokenizer
+
+
+def _onnx_yukle(model_adi, hedef, is_parcacigi):
+    """ONNX modelini diskten yükler, yoksa optimum ile dışa aktarıp kaydeder"""
+    import onnxruntime
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM
+    _, tokenizer_sinifi = model_siniflari(model_adi)
+
+    oturum = onnxruntime.SessionOptions()
+    oturum.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+    if is_parcacigi and is_parcacigi > 0:
+        oturum.intra_op_num_threads = is_parcacigi
+        oturum.inter_op_num_threads = 1
+
+    if _bilgi_oku(hedef):
+        model = ORTModelForSeq2SeqLM.from_pretrained(hedef, session_options=oturum)
+        tokenizer = tokenizer_sinifi.from_pretrained(hedef)
+        logger.info(f"ONNX model diskten yüklendi: {hedef}")
+        return model, tokenizer
+
+    tokenizer = _hf_yukle(tokenizer_sinifi, model_adi)
+    gecici = _gecici_klasor(hedef)
+    ORTModelForSeq2SeqLM.from_pretrained(model_adi, export=True).save_pretrained(gecici)
+    tokenizer.save_pretrained(gecici)
+    _klasoru_yayinla(gecici, hedef, {"model": model_adi, "arka_uc": ONNX, "onnxruntime": onnxruntime.__version__})
+    logger.info(f"Model ONNX'e aktarıldı ve kaydedildi: {hedef}")
+    model = ORTModelForSeq2SeqLM.from_pretrained(hedef, session_options=oturum)
+    return model, tokenizer
+
+
+def ozetleyici_olustur(model_adi, arka_uc=FP32, cihaz=-1, is_parcacigi=0, klasor=None):
+    """Modeli seçilen arka uçla yükler ve summarization pipeline'ı döndürür
+
+    cihaz: pipeline device parametresi (-1: CPU); int8 ve onnx arka uçları her zaman CPU'da çalışır.
+    is_parcacigi: çıkarım iş parçacığı sayısı (0: kütüphane varsayılanı).
+    Hata durumunda istisna yükseltilir; yedek arka uca geçmek çağıranın kararıdır.
+    """
+    if arka_uc not in ARKA_UCLAR:
+        raise ValueError(f"Bilinmeyen çıkarım arka ucu: {arka_uc}")
+    from transformers import pipeline
+    is_parcacigi_ayarla(is_parcacigi)
+
+    if arka_uc == FP32:
+        model_sinifi, tokenizer_sinifi = model_siniflari(model_adi)
+        tokenizer = _hf_yukle(tokenizer_sinifi, model_adi)
+        model = _hf_yukle(model_sinifi, model_adi)
+        return pipeline("summarization", model=model, tokenizer=tokenizer, device=cihaz)
+
+    hedef = artefakt_klasoru(model_adi, arka_uc, klasor)
+    if arka_uc == INT8:
+        model, tokenizer = _int8_yukle(model_adi, hedef)
+    else:
+        model, tokenizer = _onnx_yukle(model_adi, hedef, is_parcacigi)
+    return pipeline("summarization", model=model, tokenizer=tokenizer, device=-1)
@@ -0,0 +1,276 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Özet Kuyruğu
+------------
+Haber toplama ile özetlemeyi birbirinden ayırır. Toplama aşaması haberleri yedek bir özetle
+hemen kaydeder ve özetleme işlerini SQLite'taki kalıcı kuyruğa ekler. Ayrı bir işçi havuzu
+kuyruğu boşaltır ve model özetleri hazır oldukça haberleri günceller.
+Uygulama çökerse yarıda kalan işler bir sonraki açılışta kuyruğa geri döner.
+İşler öncelik sırasıyla alınır; "ertelendi" durumundaki işler (döngü bütçesine sığmayan
+yükseltmeler) yalnızca bekleyen iş kalmadığında işlenir.
+Başarısız işler üstel artan bir beklemeden sonra yeniden denenir; deneme sınırını aşan işler
+hatalı kalır ve bir sonraki döngüde yeniden kuyruğa alınır.
+"""
+
+import logging
+import threading
+import time
+
+from veritabani import parcala
+
+logger = logging.getLogger(__name__)
+
+BEKLEMEDE = "beklemede"
+ISLENIYOR = "isleniyor"
+TAMAMLANDI = "tamamlandi"
+HATALI = "hatali"
+ERTELENDI = "ertelendi"
+
+VARSAYILAN_MAKS_DENEME = 3
+VARSAYILAN_TEKRAR_GECIKMESI = 15.0  # saniye; n. denemeden sonra gecikme * 2**n beklenir
+
+
+class OzetKuyrugu:
+    """SQLite destekli kalıcı özetleme iş kuyruğu"""
+
+    def __init__(self, baglanti_fabrikasi, maks_deneme=VARSAYILAN_MAKS_DENEME,
+                 tekrar_gecikmesi=VARSAYILAN_TEKRAR_GECIKMESI):
+        self._baglanti_fabrikasi = baglanti_fabrikasi
+        self.maks_deneme = maks_deneme
+        self.tekrar_gecikmesi = tekrar_gecikmesi
+        self._kilit = threading.Lock()  # Aynı süreçteki işçiler işleri sırayla sahiplenir
+
+    def tablo_olustur(self):
+        """Kuyruk tablosunu oluşturur ve yarıda kalmış işleri kuyruğa geri alır"""
+        conn = self._baglanti_fabrikasi()
+        conn.execute('''
+        CREATE TABLE IF NOT EXISTS ozet_isleri (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            haber_id INTEGER NOT NULL UNIQUE,
+            durum TEXT NOT NULL DEFAULT 'beklemede',
+            deneme INTEGER NOT NULL DEFAULT 0,
+            hata TEXT,
+            olusturulma REAL NOT NULL,
+            guncelleme REAL NOT NULL,
+            oncelik REAL NOT NULL DEFAULT 0,
+            tekrar_zamani REAL NOT NULL DEFAULT 0
+        )
+        ''')
+        # Eski kuyruk tablolarına öncelik ve tekrar zamanı sütunlarını ekle
+        sutunlar = {row[1] for row in conn.execute('PRAGMA table_info(ozet_isleri)')}
+        if 'oncelik' not in sutunlar:
+            conn.execute('ALTER TABLE ozet_isleri ADD COLUMN oncelik REAL NOT NULL DEFAULT 0')
+        if 'tekrar_zamani' not in sutunlar:
+            conn.execute('ALTER TABLE ozet_isleri ADD COLUMN tekrar_zamani REAL NOT NULL DEFAULT 0')
+        conn.execute('DROP INDEX IF EXISTS idx_ozet_isleri_durum')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_ozet_isleri_durum_oncelik ON ozet_isleri(durum, oncelik DESC, id)')
+        kurtarilan = conn.execute('UPDATE ozet_isleri SET durum = ? WHERE durum = ?', (BEKLEMEDE, ISLENIYOR)).rowcount
+        conn.commit()
+        conn.close()
+        if kurtarilan:
+            logger.info(f"Yarıda kalan {kurtarilan} özetleme işi kuyruğa geri alındı.")
+
+    def ekle(self, haber_idleri, oncelikler=None, durum=BEKLEMEDE, conn=None):
+        """Haberler için özetleme işi ekler (zaten kuyrukta olanlar yeniden beklemeye alınır)
+
+        oncelikler: {haber_id: oncelik}; büyük öncelikli işler önce alınır.
+        durum: BEKLEMEDE veya boşta işlenecek yükseltmeler için ERTELENDI.
+        conn: verilirse işler çağıranın işlemi içinde eklenir (onaylamak çağırana kalır).
+        """
+        if not haber_idleri:
+            return
+        oncelikler = oncelikler or {}
+        simdi = time.time()
+        kendi_baglantisi = conn is None
+        if kendi_baglantisi:
+            conn = self._baglanti_fabrikasi()
+        conn.executemany('''
+        INSERT INTO ozet_isleri (haber_id, durum, deneme, olusturulma, guncelleme, oncelik, tekrar_zamani)
+        VALUES (?, ?, 0, ?, ?, ?, 0)
+        ON CONFLICT(haber_id) DO UPDATE SET durum = excluded.durum, deneme = 0, guncelleme = excluded.guncelleme,
+            oncelik = excluded.oncelik, tekrar_zamani = 0
+        ''', [(haber_id, durum, simdi, simdi, oncelikler.get(haber_id, 0)) for haber_id in haber_idleri])
+        if kendi_baglantisi:
+            conn.commit()
+            conn.close()
+
+    def bekleyenleri_ertele(self):
+        """Henüz alınmamış bekleyen işleri ertelenmiş duruma çeker, sayısını döndürür
+
+        Yeni bir döngü başlarken önceki döngüden kalan işlerin yeni işlerin önüne geçmemesi için kullanılır.
+        """
+        conn = self._baglanti_fabrikasi()
+        ertelenen = conn.execute('UPDATE ozet_isleri SET durum = ?, guncelleme = ? WHERE durum = ?',
+                                 (ERTELENDI, time.time(), BEKLEMEDE)).rowcount
+        conn.commit()
+        conn.close()
+        return ertelenen
+
+    def hatalilari_ertele(self):
+        """Deneme sınırını aşmış işleri sıfır denemeyle ertelenmiş duruma geri alır, sayısını döndürür
+
+        Model geçici olarak özet üretemediyse (bellek yetersizliği, model değişimi) haberler beklemede kalır;
+        yeni döngü başlarken bu işler boşta yeniden denenmek üzere kuyruğa döner.
+        """
+        conn = self._baglanti_fabrikasi()
+        geri_alinan = conn.execute('UPDATE ozet_isleri SET durum = ?, deneme = 0, tekrar_zamani = 0, guncelleme = ? '
+                                   'WHERE durum = ?', (ERTELENDI, time.time(), HATALI)).rowcount
+        conn.commit()
+        conn.close()
+        return geri_alinan
+
+    def al(self, adet):
+        """En öncelikli bekleyen işlerden en fazla `adet` tanesini sahiplenir, [(is_id, haber_id)] döndürür
+
+        Bekleyen iş yoksa ertelenmiş işler alınır. Tekrar zamanı gelmemiş başarısız işler atlanır.
+        """
+        with self._kilit:
+            conn = self._baglanti_fabrikasi()
+            try:
+                conn.execute('BEGIN IMMEDIATE')
+                isler = []
+                simdi = time.time()
+                for durum in (BEKLEMEDE, ERTELENDI):
+                    isler = [(row[0], row[1]) for row in conn.execute(
+                        'SELECT id, haber_id FROM ozet_isleri WHERE durum = ? AND tekrar_zamani <= ? '
+                        'ORDER BY oncelik DESC, id LIMIT ?',
+                        (durum, simdi, adet)
+                    )]
+                    if isler:
+                        break
+                if isler:
+                    conn.executemany('UPDATE ozet_isleri SET durum = ?, deneme = deneme + 1, guncelleme = ? WHERE id = ?',
+                                     [(ISLENIYOR, simdi, is_id) for is_id, _ in isler])
+                conn.commit()
+                return isler
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                conn.close()
+
+    def tamamla(self, is_idleri):
+        """İşleri tamamlandı olarak işaretler"""
+        if not is_idleri:
+            return
+        conn = self._baglanti_fabrikasi()
+        conn.executemany('UPDATE ozet_isleri SET durum = ?, hata = NULL, guncelleme = ? WHERE id = ?',
+                         [(TAMAMLANDI, time.time(), is_id) for is_id in is_idleri])
+        conn.commit()
+        conn.close()
+
+    def basarisiz(self, is_idleri, hata):
+        """İşleri üstel artan bir beklemeden sonra tekrar denenmek üzere kuyruğa döndürür
+
+        Deneme sınırı aşıldıysa işler hatalı olarak bırakılır ve id'leri döndürülür; bunlar bir sonraki
+        döngüde hatalilari_ertele() ile yeniden kuyruğa alınır.
+        """
+        if not is_idleri:
+            return []
+        simdi = time.time()
+        conn = self._baglanti_fabrikasi()
+        try:
+            # deneme, al() tarafından artırılmıştır: ilk başarısızlıktan sonra 2 * gecikme, sonra 4 * gecikme...
+            conn.executemany('''
+            UPDATE ozet_isleri
+            SET durum = CASE WHEN deneme >= ? THEN ? ELSE ? END, hata = ?, guncelleme = ?,
+                tekrar_zamani = ? + ? * (1 << MIN(deneme, 16))
+            WHERE id = ?
+            ''', [(self.maks_deneme, HATALI, BEKLEMEDE, str(hata)[:500], simdi, simdi, self.tekrar_gecikmesi, is_id)
+                  for is_id in is_idleri])
+            hatalilar = []
+            for parca in parcala(list(is_idleri)):
+                hatalilar.extend(row[0] for row in conn.execute(
+                    f'SELECT id FROM ozet_isleri WHERE id IN ({",".join("?" * len(parca))}) AND durum = ?', parca + [HATALI]))
+            conn.commit()
+        finally:
+            conn.close()
+        return hatalilar
+
+    def sil(self, conn, haber_idleri):
+        """Silinen haberlerin işlerini kuyruktan çıkarır (çağıranın işlemi içinde)"""
+        for parca in parcala(list(haber_idleri)):
+            conn.execute(f'DELETE FROM ozet_isleri WHERE haber_id IN ({",".join("?" * len(parca))})', parca)
+
+    def temizle(self):
+        """Kuyruktaki tüm işleri siler"""
+        conn = self._baglanti_fabrikasi()
+        conn.execute('DELETE FROM ozet_isleri')
+        conn.commit()
+        conn.close()
+
+    def durum_sayilari(self):
+        """Durumlara göre iş sayılarını döndürür"""
+        conn = self._baglanti_fabrikasi()
+        sayilar = {row[0]: row[1] for row in conn.execute('SELECT durum, COUNT(*) FROM ozet_isleri GROUP BY durum')}
+        conn.close()
+        return {durum: sayilar.get(durum, 0) for durum in (BEKLEMEDE, ERTELENDI, ISLENIYOR, TAMAMLANDI, HATALI)}
+
+    def derinlik(self):
+        """Bekleyen, ertelenmiş ve işlenmekte olan iş sayısını döndürür"""
+        sayilar = self.durum_sayilari()
+        return sayilar[BEKLEMEDE] + sayilar[ERTELENDI] + sayilar[ISLENIYOR]
+
+
+class OzetIsciHavuzu:
+    """Kuyruğu boşaltan özetleme işçileri
+
+    isleyici: [(is_id, haber_id)] listesi alan ve özetleri veritabanına yazan fonksiyon. Bazı işleri
+    kendisi basarisiz() ile kuyruğa döndürdüyse bu işlerin id'lerini döndürür; onlar tamamlanmış sayılmaz.
+    hazir_mi: isteğe bağlı; False döndürdüğü sürece (örn. model yüklenirken) işler alınmaz.
+    """
+
+    def __init__(self, kuyruk, isleyici, isci_sayisi=1, batch_boyutu=8, bekleme_suresi=5.0, hazir_mi=None):
+        self.kuyruk = kuyruk
+        self.isleyici = isleyici
+        self.isci_sayisi = max(1, int(isci_sayisi))
+        self.batch_boyutu = max(1, int(batch_boyutu))
+        self.bekleme_suresi = bekleme_suresi
+        self.hazir_mi = hazir_mi or (lambda: True)
+        self._olay = threading.Event()
+        self._durdur = threading.Event()
+        self._threadler = []
+
+    def baslat(self):
+        """İşçi thread'lerini başlatır"""
+        for i in range(self.isci_sayisi):
+            thread = threading.Thread(target=self._dongu, name=f"ozet-iscisi-{i + 1}", daemon=True)
+            thread.start()
+            self._threadler.append(thread)
+        logger.info(f"{self.isci_sayisi} özetleme işçisi başlatıldı.")
+
+    def uyandir(self):
+        """Yeni iş eklendiğini işçilere bildirir"""
+        self._olay.set()
+
+    def durdur(self):
+        """İşçilerin mevcut batch'ten sonra durmasını sağlar"""
+        self._durdur.set()
+        self._olay.set()
+
+    def _dongu(self):
+        while not self._durdur.is_set():
+            # Olay, kuyruğa bakmadan önce temizlenir; böylece arada gelen uyandırma kaybolmaz
+            self._olay.clear()
+            if not self.hazir_mi():
+                self._durdur.wait(0.5)
+                continue
+            try:
+                isler = self.kuyruk.al(self.batch_boyutu)
+            except Exception as e:
+                logger.error(f"Özetleme işi alınamadı: {e}")
+                isler = []
+
+            if not isler:
+                self._olay.wait(self.bekleme_suresi)
+                continue
+
+            is_idleri = [is_id for is_id, _ in isler]
+            try:
+                dondurulenler = set(self.isleyici(isler) or ())
+                self.kuyruk.tamamla([is_id for is_id in is_idleri if is_id not in dondurulenler])
+            except Exception as e:
+                logger.error(f"Özetleme işi başarısız ({len(isler)} haber): {e}")
+                self.kuyruk.basarisiz(is_idleri, e)
@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Özet Önbelleği
+--------------
+Temizlenmiş metin + model + özet modu + üretim parametrelerinden türetilen bir anahtarla
+özetleri saklar. Aynı haber farklı URL'lerle veya sonraki yenilemelerde tekrar geldiğinde
+model hiç çalıştırılmaz. Önde bellekte bir LRU, arkada boyut sınırlı bir SQLite tablosu vardır.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+
+VARSAYILAN_BELLEK_KAPASITESI = 2048         # Bellekte tutulacak özet sayısı
+VARSAYILAN_MAKS_BAYT = 64 * 1024 * 1024     # SQLite tablosunun üst sınırı
+TAHLIYE_ORANI = 0.9                         # Sınır aşılınca boyut bu orana kadar düşürülür
+TAHLIYE_PARCASI = 500                       # Tahliyede bir sorguda okunan en eski kayıt sayısı
+
+
+def anahtar_olustur(temiz_metin, model, ozet_modu, parametreler):
+    """Özet için içerik adresli anahtar üretir"""
+    ham = json.dumps([temiz_metin, model, ozet_modu, parametreler], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(ham.encode("utf-8")).hexdigest()
+
+
+class OzetOnbellegi:
+    """Bellek içi LRU + SQLite destekli özet önbelleği"""
+
+    def __init__(self, baglanti_fabrikasi, bellek_kapasitesi=VARSAYILAN_BELLEK_KAPASITESI,
+                 maks_bayt=VARSAYILAN_MAKS_BAYT):
+        self._baglanti_fabrikasi = baglanti_fabrikasi
+        self.bellek_kapasitesi = max(1, int(bellek_kapasitesi))
+        self.maks_bayt = max(1, int(maks_bayt))
+        self._kilit = threading.Lock()
+        self._yazma_kilidi = threading.Lock()  # Toplam boyut hesabı ve tahliye tek yazarla yapılır
+        self._bellek = OrderedDict()  # anahtar -> özet
+        self._toplam_bayt = 0
+        self.isabet = 0
+        self.iskalama = 0
+
+    def tablo_olustur(self):
+        """Önbellek tablosunu oluşturur ve toplam boyutu yükler"""
+        conn = self._baglanti_fabrikasi()
+        conn.execute('''
+        CREATE TABLE IF NOT EXISTS ozet_onbellegi (
+            anahtar TEXT PRIMARY KEY,
+            ozet TEXT NOT NULL,
+            boyut INTEGER NOT NULL,
+            son_erisim REAL NOT NULL
+        )
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_ozet_onbellegi_son_erisim ON ozet_onbellegi(son_erisim)')
+        conn.commit()
+        self._toplam_bayt = conn.execute('SELECT COALESCE(SUM(boyut), 0) FROM ozet_onbellegi').fetchone()[0]
+        conn.close()
+
+    def _bellege_koy(self, anahtar, ozet):
+        self._bellek[anahtar] = ozet
+        self._bellek.move_to_end(anahtar)
+        while len(self._bellek) > self.bellek_kapasitesi:
+            self._bellek.popitem(last=False)
+
+    def getir_coklu(self, anahtarlar):
+        """Önbellekte bulunan anahtarlar için {anahtar: özet} döndürür"""
+        sonuc = {}
+        eksikler = []
+        with self._kilit:
+            for anahtar in anahtarlar:
+                if anahtar in self._bellek:
+                    self._bellek.move_to_end(anahtar)
+                    sonuc[anahtar] = self._bellek[anahtar]
+                else:
+                    eksikler.append(anahtar)
+
+        if eksikler:
+            conn = self._baglanti_fabrikasi()
+            for baslangic in range(0, len(eksikler), 500):  # SQLite parametre sınırı
+                parca = eksikler[baslangic:baslangic + 500]
+                yer_tutucular = ",".join("?" * len(parca))
+                for satir in conn.execute(
+                    f'SELECT anahtar, ozet FROM ozet_onbellegi WHERE anahtar IN ({yer_tutucular})', parca
+                ):
+                    sonuc[satir[0]] = satir[1]
+            bulunanlar = [a for a in eksikler if a in sonuc]
+            if bulunanlar:
+                simdi = time.time()
+                conn.executemany('UPDATE ozet_onbellegi SET son_erisim = ? WHERE anahtar = ?',
+                                 [(simdi, a) for a in bulunanlar])
+                conn.commit()
+            conn.close()
+            with self._kilit:
+                for anahtar in bulunanlar:
+                    self._bellege_koy(anahtar, sonuc[anahtar])
+
+        with self._kilit:
+            self.isabet += len(sonuc)
+            self.iskalama += len(set(anahtarlar)) - len(sonuc)
+        return sonuc
+
+    def kaydet_coklu(self, ozetler):
+        """{anahtar: özet} sözlüğünü önbelleğe yazar, gerekirse eski kayıtları tahliye eder"""
+        if not ozetler:
+            return
+        with self._yazma_kilidi:
+            simdi = time.time()
+            satirlar = [(anahtar, ozet, len(ozet.encode("utf-8")), simdi) for anahtar, ozet in ozetler.items()]
+            conn = self._baglanti_fabrikasi()
+            eski_boyut = 0
+            for baslangic in range(0, len(satirlar), 500):
+                parca = [s[0] for s in satirlar[baslangic:baslangic + 500]]
+                yer_tutucular = ",".join("?" * len(parca))
+                eski_boyut += conn.execute(
+                    f'SELECT COALESCE(SUM(boyut), 0) FROM ozet_onbellegi WHERE anahtar IN ({yer_tutucular})', parca
+                ).fetchone()[0]
+            conn.executemany('INSERT OR REPLACE INTO ozet_onbellegi (anahtar, ozet, boyut, son_erisim) VALUES (?, ?, ?, ?)',
+                             satirlar)
+            conn.commit()
+            self._toplam_bayt += sum(s[2] for s in satirlar) - eski_boyut
+
+            if self._toplam_bayt > self.maks_bayt:
+                self._tahliye_et(conn)
+            conn.close()
+
+        with self._kilit:
+            for anahtar, ozet in ozetler.items():
+                self._bellege_koy(anahtar, ozet)
+
+    def _tahliye_et(self, conn):
+        """En uzun süredir erişilmeyen kayıtları boyut sınırının altına inene kadar siler"""
+        hedef = int(self.maks_bayt * TAHLIYE_ORANI)
+        silinecekler = []
+        # Tablonun tamamı okunmaz; son_erisim indeksinden en eski kayıtlar parça parça alınır
+        while self._toplam_bayt > hedef:
+            parca = conn.execute('SELECT anahtar, boyut FROM ozet_onbellegi ORDER BY son_erisim LIMIT ?',
+                                 (TAHLIYE_PARCASI,)).fetchall()
+            if not parca:
+                break
+            parca_silinecekleri = []
+            for anahtar, boyut in parca:
+                if self._toplam_bayt <= hedef:
+                    break
+                parca_silinecekleri.append((anahtar,))
+                self._toplam_bayt -= boyut
+            conn.executemany('DELETE FROM ozet_onbellegi WHERE anahtar = ?', parca_silinecekleri)
+            silinecekler.extend(parca_silinecekleri)
+        conn.commit()
+        with self._kilit:
+            for (anahtar,) in silinecekler:
+                self._bellek.pop(anahtar, None)
+
+    def istatistikler(self):
+        """Önbellek isabet/ıskalama ve boyut bilgilerini döndürür"""
+        with self._kilit:
+            return {
+                "isabet": self.isabet,
+                "iskalama": self.iskalama,
+                "bellekteki_kayit": len(self._bellek),
+                "toplam_bayt": self._toplam_bayt,
+                "maks_bayt": self.maks_bayt
+            }
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Özet Zamanlayıcı
+----------------
+Her yenileme döngüsünün model özetleri için bir süre bütçesi vardır. Döngüde gelen haberlerin
+model maliyeti token uzunluklarından tahmin edilir; bütçe en yeni ve en çok kaynağın verdiği
+haberlerden başlayarak dağıtılır. Bütçeye sığmayan haberler toplama sırasında üretilen
+kurala dayalı (çıkarımsal) özetle kalır ve "ertelendi" olarak kuyruğa girer; işçiler döngü
+işleri bittiğinde, boşta kaldıkları sürede bunları model özetine yükseltir.
+Tahmin modeli, gerçekleşen batch sürelerinden öğrenilen token başına süreyle güncellenir.
+Feed'ler kendi takvimleriyle çekildiğinde döngüler kısa ve sık olur; bu durumda her döngünün
+bütçesi, önceki döngüden bu yana geçen sürenin dongu_sn'ye oranıyla küçültülür.
+"""
+
+import threading
+import time
+
+VARSAYILAN_BUTCE_SN = 600.0
+VARSAYILAN_DONGU_SN = 1800.0         # butce_sn'nin karşılık geldiği yenileme süresi
+VARSAYILAN_SN_BASINA_TOKEN = 0.005   # CPU'da distilbart boyutunda bir model için başlangıç tahmini
+SABIT_TOKEN = 64                     # Girdi uzunluğundan bağımsız üretim (decoder) maliyetinin token karşılığı
+MAKS_GIRDI_TOKENI = 1024             # Model girdisi bu uzunlukta kesilir; maliyet daha fazla artmaz
+OGRENME_ORANI = 0.3
+GUVENLIK_PAYI = 0.9                  # Tahmin hatası pencereyi taşırmasın diye bütçenin bu kadarı planlanır
+KAYNAK_ONEMI_SN = 3600.0             # Haberi veren her ek kaynak, haberi bu kadar daha yeni sayar
+
+
+def oncelik_hesapla(tarih_damgasi, kume_boyutu=1):
+    """Haberin model kapasitesi sırasını belirleyen puan (büyük olan önce)
+
+    Temel puan yayın zamanıdır; aynı haberi veren her ek kaynak KAYNAK_ONEMI_SN ekler.
+    """
+    return tarih_damgasi + KAYNAK_ONEMI_SN * max(0, kume_boyutu - 1)
+
+
+class OzetZamanlayici:
+    """Döngü bütçesine göre model ve çıkarımsal özet arasında seçim yapar
+
+    butce_sn: bir yenileme döngüsünde model özetlerine ayrılan süre (işçi başına).
+    isci_sayisi: paralel çalışan özetleme işçisi sayısı; toplam kapasite butce_sn * isci_sayisi.
+    dongu_sn: butce_sn'nin ait olduğu süre; daha sık gelen döngülere bütçe orantılı verilir.
+    maks_girdi_tokeni: bir haber için modelin işleyeceği en fazla token (None: sınırsız); uzun haberler
+    parçalı özetlendiğinde maliyet tek girdinin sınırında değil, parçalı özetleyicinin bütçesinde durur.
+    """
+
+    def __init__(self, butce_sn=VARSAYILAN_BUTCE_SN, isci_sayisi=1, sn_basina_token=VARSAYILAN_SN_BASINA_TOKEN,
+                 dongu_sn=VARSAYILAN_DONGU_SN, maks_girdi_tokeni=MAKS_GIRDI_TOKENI):
+        self.butce_sn = float(butce_sn)
+        self.dongu_sn = float(dongu_sn)
+        self.isci_sayisi = max(1, int(isci_sayisi))
+        self.sn_basina_token = float(sn_basina_token)
+        self.maks_girdi_tokeni = maks_girdi_tokeni
+        self._kilit = threading.Lock()
+        self._dongu = None
+        self._dongu_idleri = set()
+        self.toplam = {"dongu": 0, "model": 0, "ertelenen": 0, "yukseltilen": 0}
+
+    def tahmin(self, token_sayisi):
+        """Bir haberin model özetinin tahmini süresi (saniye)"""
+        return self.sn_basina_token * (self._etkin_token(token_sayisi) + SABIT_TOKEN)
+
+    def _etkin_token(self, token_sayisi):
+        """Modelin bir haber için gerçekte işleyeceği token sayısı"""
+        return token_sayisi if self.maks_girdi_tokeni is None else min(token_sayisi, self.maks_girdi_tokeni)
+
+    def planla(self, adaylar):
+        """Yeni döngü başlatır ve [(haber_id, oncelik, token_sayisi)] adaylarını ikiye ayırır
+
+        Dönüş: (model_idleri, ertelenen_idleri). Model listesi öncelik sırasındadır ve tahmini
+        toplam süresi döngü kapasitesini aşmaz; kalanlar boşta kalındığında yükseltilir.
+        """
+        simdi = time.time()
+        model_idleri = []
+        ertelenen_idleri = []
+        with self._kilit:
+            oran = 1.0
+            if self._dongu is not None and self.dongu_sn > 0:
+                oran = min(1.0, (simdi - self._dongu["baslangic"]) / self.dongu_sn)
+            kapasite = self.butce_sn * oran * self.isci_sayisi
+            planlanabilir = kapasite * GUVENLIK_PAYI
+            planlanan = 0.0
+            for haber_id, _, token_sayisi in sorted(adaylar, key=lambda aday: aday[1], reverse=True):
+                maliyet = self.tahmin(token_sayisi)
+                if planlanan + maliyet <= planlanabilir:
+                    planlanan += maliyet
+                    model_idleri.append(haber_id)
+                else:
+                    ertelenen_idleri.append(haber_id)
+
+            self._dongu_idleri = set(model_idleri)
+            self._dongu = {
+                "baslangic": simdi,
+                "butce_sn": round(kapasite, 2),
+                "planlanan_sn": round(planlanan, 2),
+                "harcanan_sn": 0.0,
+                "model": len(model_idleri),
+                "ertelenen": len(ertelenen_idleri),
+                "tamamlanan": 0,
+                "bitis_sn": None,   # Planlanan işlerin tamamının bitmesi döngü başından kaç saniye sürdü
+            }
+            self.toplam["dongu"] += 1
+            self.toplam["model"] += len(model_idleri)
+            self.toplam["ertelenen"] += len(ertelenen_idleri)
+        return model_idleri, ertelenen_idleri
+
+    def gozlemle(self, token_uzunluklari, sure):
+        """Modelin gerçek süresiyle token başına süre tahminini günceller"""
+        etkin_token = sum(self._etkin_token(uzunluk) + SABIT_TOKEN for uzunluk in token_uzunluklari)
+        if etkin_token <= 0 or sure <= 0:
+            return
+        with self._kilit:
+            self.sn_basina_token += OGRENME_ORANI * (sure / etkin_token - self.sn_basina_token)
+
+    def islendi(self, haber_idleri, sure):
+        """Tamamlanan bir batch'in süresini döngü bütçesine veya yükseltmelere işler"""
+        with self._kilit:
+            donguden = [haber_id for haber_id in haber_idleri if haber_id in self._dongu_idleri]
+            self.toplam["yukseltilen"] += len(haber_idleri) - len(donguden)
+            if not donguden or self._dongu is None:
+                return
+            self._dongu_idleri.difference_update(donguden)
+            self._dongu["harcanan_sn"] = round(self._dongu["harcanan_sn"] + sure * len(donguden) / len(haber_idleri), 2)
+            self._dongu["tamamlanan"] += len(donguden)
+            if not self._dongu_idleri:
+                self._dongu["bitis_sn"] = round(time.time() - self._dongu["baslangic"], 2)
+
+    def metrikler(self):
+        """Son döngünün bütçe kullanımı, toplam sayılar ve güncel maliyet tahmini"""
+        with self._kilit:
+            dongu = dict(self._dongu) if self._dongu else None
+            if dongu:
+                dongu["butce_kullanimi"] = round(dongu["harcanan_sn"] / dongu["butce_sn"], 3) if dongu["butce_sn"] else None
+                # Planlanan işler pencere içinde bitmediyse (veya hâlâ bitmemişse) döngü süresini aşmıştır
+                gecen = dongu["bitis_sn"] if dongu["bitis_sn"] is not None else time.time() - dongu["baslangic"]
+                dongu["kalan"] = dongu["model"] - dongu["tamamlanan"]
+                dongu["sure_asimi"] = gecen > dongu["butce_sn"] / self.isci_sayisi and (dongu["bitis_sn"] is not None or dongu["kalan"] > 0)
+            return {
+                "son_dongu": dongu,
+                "toplam": dict(self.toplam),
+                "sn_basina_token": round(self.sn_basina_token, 6),
+                "butce_sn": self.butce_sn,
+            }
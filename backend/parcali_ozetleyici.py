@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Parçalı Özetleyici
+------------------
+Modelin girdi sınırını aşan uzun haberleri sessizce kesmek yerine map-reduce ile özetler.
+Metin, yüklü modelin tokenizer'ıyla ölçülerek cümle sınırlarında girdi sınırına sığan parçalara
+bölünür; tüm haberlerin parçaları tek bir toplu çağrıda özetlenir (map), ardından her haberin
+parça özetleri birleştirilip bir kez daha özetlenir (reduce). Parça özetlerinin uzunluğu, birleşimi
+girdi sınırına sığacak şekilde ayarlanır; böylece reduce adımı her zaman tek geçiştir.
+Haber başına işlenen token sayısı sınırlıdır: sınırı aşan haberlerde parçalar gruplanır ve her
+parçanın baştaki cümleleri seçilir. Haberin hiçbir bölümü atlanmaz, gecikme ise metnin
+uzunluğundan bağımsız olarak (maks_token + girdi sınırı) ile sınırlı kalır.
+"""
+
+import logging
+import math
+import re
+
+from toplu_ozetleyici import token_uzunluklari
+
+logger = logging.getLogger(__name__)
+
+VARSAYILAN_MAKS_TOKEN = 4096    # Bir haber için map adımında işlenecek en fazla token
+VARSAYILAN_GIRDI_SINIRI = 1024  # Tokenizer modelin sınırını bildirmiyorsa kullanılır
+EN_KISA_PARCA_OZETI = 16        # Map adımında parça özetine verilen en az token
+
+_CUMLE = re.compile(r'[^.!?]+(?:[.!?]+|$)')
+
+
+def cumlelere_ayir(metin, en_kisa=0):
+    """Metni noktalama işaretlerine göre cümlelere ayırır (noktalama cümlede kalır)
+
+    Noktalama hariç en_kisa karakterden kısa olan parçalar atlanır.
+    """
+    cumleler = (cumle.strip() for cumle in _CUMLE.findall(metin or ""))
+    return [cumle for cumle in cumleler if len(cumle.rstrip(".!?").strip()) > en_kisa]
+
+
+def girdi_siniri(summarizer):
+    """Modelin bir girdide kabul ettiği token sayısı (özel tokenler hariç)"""
+    tokenizer = getattr(summarizer, "tokenizer", None)
+    sinir = getattr(tokenizer, "model_max_length", None)
+    if not isinstance(sinir, int) or sinir > 100000:
+        # Sınır tanımlanmamış tokenizer'lar çok büyük bir değer döndürür; model ayarına bakılır
+        ayarlar = getattr(getattr(summarizer, "model", None), "config", None)
+        sinir = getattr(ayarlar, "max_position_embeddings", None)
+        if not isinstance(sinir, int) or sinir > 100000:
+            sinir = VARSAYILAN_GIRDI_SINIRI
+    try:
+        ozel = tokenizer.num_special_tokens_to_add()
+    except Exception:
+        ozel = 2
+    return max(1, sinir - ozel)
+
+
+def _kelimelerle_kes(cumle, uzunluk, hedef):
+    """uzunluk token'lık cümleyi kelime sınırlarında en fazla hedef token'lık parçalara böler"""
+    kelimeler = cumle.split()
+    adet = math.ceil(uzunluk / hedef)
+    boyut = max(1, len(kelimeler) // adet)
+    return [" ".join(kelimeler[i:i + boyut]) for i in range(0, len(kelimeler), boyut)]
+
+
+def _bastan_sec(cumleler, uzunluklar, pay):
+    """Cümlelerin baştan pay token'a sığanları; ilk cümle sığmazsa baştaki kelimeleri"""
+    secilenler = []
+    toplam = 0
+    for cumle, uzunluk in zip(cumleler, uzunluklar):
+        if toplam + uzunluk > pay:
+            if not secilenler:
+                kelimeler = cumle.split()
+                secilenler.append(" ".join(kelimeler[:max(1, len(kelimeler) * pay // max(uzunluk, 1))]))
+            break
+        secilenler.append(cumle)
+        toplam += uzunluk
+    return " ".join(secilenler)
+
+
+class ParcaliOzetleyici:
+    """Uzun metinleri parçalayıp map-reduce ile, kısa metinleri doğrudan toplu özetler
+
+    toplu_ozetleyici: batch'leri çalıştıran TopluOzetleyici.
+    parca_tokeni: bir parçanın en fazla token sayısı (0: modelin girdi sınırı).
+    maks_token: bir haber için map adımında işlenecek en fazla token (0: sınırsız).
+    """
+
+    def __init__(self, toplu_ozetleyici, parca_tokeni=0, maks_token=VARSAYILAN_MAKS_TOKEN):
+        self.toplu_ozetleyici = toplu_ozetleyici
+        self.parca_tokeni = max(0, int(parca_tokeni))
+        self.maks_token = max(0, int(maks_token))
+
+    @property
+    def maks_islenen_token(self):
+        """Bir haber için modelin işleyeceği en fazla token (map + reduce); sınırsızsa None"""
+        if not self.maks_token:
+            return None
+        sinir = self.parca_tokeni or VARSAYILAN_GIRDI_SINIRI
+        return max(self.maks_token, sinir) + sinir
+
+    def parcala(self, summarizer, metin, sinir=None):
+        """Metni cümle sınırlarında, her biri en fazla sinir token'lık parçalara böler
+
+        Toplamı maks_token'ı aşan parçalar gruplanır ve her parçanın baştaki cümleleri seçilir.
+        """
+        sinir = sinir or self.parca_tokeni or girdi_siniri(summarizer)
+        cumleler = []
+        uzunluklar = []
+        ham_cumleler = cumlelere_ayir(metin)
+        for cumle, uzunluk in zip(ham_cumleler, token_uzunluklari(summarizer, ham_cumleler) if ham_cumleler else []):
+            if uzunluk > sinir:
+                # Noktalamasız çok uzun bir "cümle" (liste, tablo) kelime sınırlarında bölünür
+                parcalar = _kelimelerle_kes(cumle, uzunluk, sinir)
+                cumleler.extend(parcalar)
+                uzunluklar.extend(token_uzunluklari(summarizer, parcalar))
+            else:
+                cumleler.append(cumle)
+                uzunluklar.append(uzunluk)
+
+        # Cümleler sırayla, sınırı aşmadan parçalara doldurulur: [(cümleler, uzunluklar)]
+        parcalar = []
+        toplam = sinir + 1
+        for cumle, uzunluk in zip(cumleler, uzunluklar):
+            if toplam + uzunluk > sinir:
+                parcalar.append(([], []))
+                toplam = 0
+            parcalar[-1][0].append(cumle)
+            parcalar[-1][1].append(uzunluk)
+            toplam += uzunluk
+
+        yuva = max(1, self.maks_token // sinir) if self.maks_token else len(parcalar)
+        if len(parcalar) <= yuva:
+            return [" ".join(parca_cumleleri) for parca_cumleleri, _ in parcalar]
+
+        # Bütçe aşıldı: ardışık parçalar yuva sayısı kadar gruba toplanır, grup içinde her
+        # parçaya eşit pay düşer ve payın içine parçanın baştaki cümleleri alınır
+        gruplar = []
+        for i in range(yuva):
+            grup = parcalar[i * len(parcalar) // yuva:(i + 1) * len(parcalar) // yuva]
+            pay = max(1, sinir // len(grup))
+            gruplar.append(" ".join(_bastan_sec(parca_cumleleri, parca_uzunluklari, pay)
+                                    for parca_cumleleri, parca_uzunluklari in grup))
+        return gruplar
+
+    def ozetle(self, summarizer, metinler, girdi=None, **uretim_parametreleri):
+        """Metinleri özetler, orijinal sırada bir liste döndürür
+
+        girdi: parça ve birleşik özet metnini modele verilecek girdiye çeviren fonksiyon (ör. prompt).
+        Map veya reduce adımı başarısız olan metinler için None döner.
+        """
+        girdi = girdi or (lambda metin: metin)
+        metinler = list(metinler)
+        if not metinler:
+            return []
+        if getattr(summarizer, "tokenizer", None) is None:
+            # Token ölçülemiyorsa (kurala dayalı özetleyici) parçalama yapılmaz
+            return self.toplu_ozetleyici.ozetle(summarizer, [girdi(metin) for metin in metinler], **uretim_parametreleri)
+
+        sinir = self.parca_tokeni or girdi_siniri(summarizer)
+        # Prompt gibi girdiye eklenen sabit metin de sınırdan düşülür
+        sinir = max(1, sinir - token_uzunluklari(summarizer, [girdi("")])[0])
+        uzunluklar = token_uzunluklari(summarizer, metinler)
+
+        # Haber indeksi -> parçalar; sınıra sığan haberler tek parça olarak doğrudan özetlenir
+        parcalar = {}
+        for i, (metin, uzunluk) in enumerate(zip(metinler, uzunluklar)):
+            if uzunluk > sinir:
+                haber_parcalari = self.parcala(summarizer, metin, sinir)
+                if len(haber_parcalari) > 1:
+                    parcalar[i] = haber_parcalari
+                elif haber_parcalari:
+                    metinler[i] = haber_parcalari[0]
+
+        parca_ozetleri = {}
+        if parcalar:
+            # Parça özetlerinin birleşimi girdi sınırına sığsın diye özet uzunluğu parça sayısına bölünür
+            en_cok_parca = max(len(haber_parcalari) for haber_parcalari in parcalar.values())
+            map_parametreleri = dict(uretim_parametreleri)
+            if "max_length" in map_parametreleri:
+                map_parametreleri["max_length"] = max(EN_KISA_PARCA_OZETI,
+                                                      min(map_parametreleri["max_length"], sinir // en_cok_parca))
+                map_parametreleri["min_length"] = min(map_parametreleri.get("min_length", 0),
+                                                      map_parametreleri["max_length"] // 2)
+            sira = [(i, j) for i, haber_parcalari in parcalar.items() for j in range(len(haber_parcalari))]
+            ozetler = self.toplu_ozetleyici.ozetle(summarizer, [girdi(parcalar[i][j]) for i, j in sira],
+                                                   **map_parametreleri)
+            for (i, _), ozet in zip(sira, ozetler):
+                parca_ozetleri.setdefault(i, []).append(ozet)
+            logger.debug(f"{len(parcalar)} uzun metin {len(sira)} parçaya bölünerek özetlendi.")
+
+        # Reduce: parça özetleri birleştirilir; kısa metinlerle aynı parametrelerle tek çağrıda özetlenir
+        son_girdiler = {}
+        for i, metin in enumerate(metinler):
+            if i not in parcalar:
+                son_girdiler[i] = girdi(metin)
+            elif all(ozet is not None for ozet in parca_ozetleri[i]):
+                son_girdiler[i] = girdi(" ".join(parca_ozetleri[i]))
+        sonuclar = [None] * len(metinler)
+        ozetler = self.toplu_ozetleyici.ozetle(summarizer, list(son_girdiler.values()), **uretim_parametreleri)
+        for i, ozet in zip(son_girdiler, ozetler):
+            sonuclar[i] = ozet
+        return sonuclar
@@ -0,0 +1,253 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Profilleyici
+------------
+Uygulamayı yeniden başlatmadan, istendiğinde sonraki N haber toplama döngüsünü, özetleme batch'ini
+veya API isteğini profiller. İki yöntem vardır:
+  - cprofile: profillenen iş parçacığındaki her fonksiyon çağrısı sayılır (.pstats raporu)
+  - ornekleme: ayrı bir iş parçacığı belirli aralıklarla tüm Python iş parçacıklarının yığınını
+    okur (.folded, flamegraph.pl / speedscope ile açılabilen daraltılmış yığın biçimi). Özetleme
+    işçileri ve torch çağrıları da görünür; native torch iş parçacıklarında geçen süre, onları çağıran
+    Python satırına yazılır ve raporda süreç CPU süresi ile duvar saati süresi ayrıca verilir.
+Model yüklemeleri çevresinde RSS tepe değeri her zaman, tracemalloc ile Python bellek ayırmaları
+ise yalnızca açıkça istendiğinde ölçülür.
+
+Profil istenmediğinde kanca başına maliyet tek bir sözlük okumasıdır.
+"""
+
+import contextlib
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+
+from bellek_olcumu import surec_bellegi
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+CPROFILE = "cprofile"
+ORNEKLEME = "ornekleme"
+YONTEMLER = (CPROFILE, ORNEKLEME)
+
+DONGU = "dongu"   # Haber toplama döngüsü (çekme, ayrıştırma, temizleme, kaydetme)
+OZET = "ozet"     # Özetleme işçisinin bir batch'i
+ISTEK = "istek"   # API isteği
+TURLER = (DONGU, OZET, ISTEK)
+
+VARSAYILAN_ORNEKLEME_ARALIGI_SN = 0.005
+RAPOR_SATIR_SAYISI = 40
+MAKS_RAPOR_KAYDI = 50
+
+
+def _tepe_rss_mb():
+    """Sürecin şimdiye kadarki en yüksek RSS değeri (MB); ölçülemiyorsa None"""
+    if resource is None:
+        return None
+    tepe = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(tepe / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _cerceve_adi(cerceve):
+    kod = cerceve.f_code
+    return f"{kod.co_name} ({os.path.basename(kod.co_filename)}:{kod.co_firstlineno})"
+
+
+class _Ornekleyici(threading.Thread):
+    """Tüm iş parçacıklarının yığınlarını düzenli aralıklarla sayar"""
+
+    def __init__(self, aralik_sn):
+        super().__init__(name="profil-ornekleyici", daemon=True)
+        self.aralik_sn = aralik_sn
+        self.yiginlar = Counter()
+        self.ornek_sayisi = 0
+        self._dur = threading.Event()
+
+    def run(self):
+        kendi = threading.get_ident()
+        while not self._dur.wait(self.aralik_sn):
+            adlar = {is_parcacigi.ident: is_parcacigi.name for is_parcacigi in threading.enumerate()}
+            for kimlik, cerceve in sys._current_frames().items():
+                if kimlik == kendi:
+                    continue
+                yigin = []
+                while cerceve is not None:
+                    yigin.append(_cerceve_adi(cerceve))
+                    cerceve = cerceve.f_back
+                yigin.append(adlar.get(kimlik, str(kimlik)))
+                self.yiginlar[";".join(reversed(yigin))] += 1
+            self.ornek_sayisi += 1
+
+    def durdur(self):
+        self._dur.set()
+        self.join()
+
+
+class Profilleyici:
+    """İstenen sayıda döngü/batch/isteği profilleyip raporları klasöre yazar"""
+
+    def __init__(self, klasor, ornekleme_araligi_sn=VARSAYILAN_ORNEKLEME_ARALIGI_SN, model_tracemalloc=False):
+        self.klasor = klasor
+        self.ornekleme_araligi_sn = ornekleme_araligi_sn
+        self.model_tracemalloc = model_tracemalloc
+        self._kilit = threading.Lock()
+        self._bekleyen = {}       # tür -> (kalan adet, yöntem)
+        self._calisiyor = False   # Aynı anda tek profil oturumu
+        self.raporlar = []        # Son yazılan raporların özetleri
+        self.model_bellekleri = []
+
+    def iste(self, tur, adet=1, yontem=ORNEKLEME):
+        """Sonraki `adet` işin profillenmesini ister"""
+        if tur not in TURLER:
+            raise ValueError(f"Geçersiz profil türü: {tur} ({', '.join(TURLER)})")
+        if yontem not in YONTEMLER:
+            raise ValueError(f"Geçersiz profil yöntemi: {yontem} ({', '.join(YONTEMLER)})")
+        with self._kilit:
+            if adet > 0:
+                self._bekleyen[tur] = (int(adet), yontem)
+            else:
+                self._bekleyen.pop(tur, None)
+
+    def bekliyor_mu(self, tur):
+        return tur in self._bekleyen
+
+    def _sira_al(self, tur):
+        """Profil isteniyorsa ve başka oturum yoksa yöntemi döndürür, bekleyen adedi bir azaltır"""
+        with self._kilit:
+            bekleyen = self._bekleyen.get(tur)
+            if bekleyen is None or self._calisiyor:
+                return None
+            kalan, yontem = bekleyen
+            if kalan <= 1:
+                del self._bekleyen[tur]
+            else:
+                self._bekleyen[tur] = (kalan - 1, yontem)
+            self._calisiyor = True
+            return yontem
+
+    def profille(self, tur, ad):
+        """İşi saran bağlam yöneticisi; profil istenmemişse hiçbir şey yapmaz"""
+        if tur not in self._bekleyen:
+            return contextlib.nullcontext()
+        return self._oturum(tur, ad)
+
+    @contextlib.contextmanager
+    def _oturum(self, tur, ad):
+        yontem = self._sira_al(tur)
+        if yontem is None:
+            yield
+            return
+        profil = ornekleyici = None
+        bellek_once = surec_bellegi() or {}
+        duvar = time.perf_counter()
+        surec_cpu = time.process_time()
+        is_parcacigi_cpu = time.thread_time()
+        try:
+            if yontem == CPROFILE:
+                profil = cProfile.Profile()
+                profil.enable()
+            else:
+                ornekleyici = _Ornekleyici(self.ornekleme_araligi_sn)
+                ornekleyici.start()
+            yield
+        finally:
+            if profil is not None:
+                profil.disable()
+            if ornekleyici is not None:
+                ornekleyici.durdur()
+            olcumler = {
+                "tur": tur, "ad": ad, "yontem": yontem,
+                "tarih": datetime.now().isoformat(timespec="seconds"),
+                "duvar_sn": round(time.perf_counter() - duvar, 4),
+                # Süreç CPU süresi native (torch) iş parçacıklarını da içerir
+                "surec_cpu_sn": round(time.process_time() - surec_cpu, 4),
+                "is_parcacigi_cpu_sn": round(time.thread_time() - is_parcacigi_cpu, 4),
+                "rss_once_mb": bellek_once.get("rss_mb"),
+                "rss_sonra_mb": (surec_bellegi() or {}).get("rss_mb"),
+                "tepe_rss_mb": _tepe_rss_mb(),
+            }
+            try:
+                self._rapor_yaz(olcumler, profil, ornekleyici)
+            finally:
+                with self._kilit:
+                    self._calisiyor = False
+
+    def _rapor_yaz(self, olcumler, profil, ornekleyici):
+        os.makedirs(self.klasor, exist_ok=True)
+        temel = os.path.join(self.klasor, f"{datetime.now():%Y%m%d_%H%M%S_%f}_{olcumler['tur']}")
+        ozet = io.StringIO()
+        ozet.write(json.dumps(olcumler, ensure_ascii=False, indent=2) + "\n\n")
+        if profil is not None:
+            olcumler["dosya"] = temel + ".pstats"
+            profil.dump_stats(olcumler["dosya"])
+            istatistik = pstats.Stats(profil, stream=ozet)
+            istatistik.sort_stats("cumulative").print_stats(RAPOR_SATIR_SAYISI)
+        else:
+            olcumler["dosya"] = temel + ".folded"
+            olcumler["ornek_sayisi"] = ornekleyici.ornek_sayisi
+            with open(olcumler["dosya"], "w", encoding="utf-8") as dosya:
+                for yigin, sayi in ornekleyici.yiginlar.most_common():
+                    dosya.write(f"{yigin} {sayi}\n")
+            ozet.write(f"En sık görülen {RAPOR_SATIR_SAYISI} yığın ({ornekleyici.ornek_sayisi} örnek):\n")
+            for yigin, sayi in ornekleyici.yiginlar.most_common(RAPOR_SATIR_SAYISI):
+                ozet.write(f"{sayi:6d}  {yigin}\n")
+        with open(temel + ".txt", "w", encoding="utf-8") as dosya:
+            dosya.write(ozet.getvalue())
+        with self._kilit:
+            self.raporlar.append(olcumler)
+            del self.raporlar[:-MAKS_RAPOR_KAYDI]
+
+    @contextlib.contextmanager
+    def bellek_izle(self, ad):
+        """Model yüklemesi gibi bir işin RSS ve (istenmişse) tracemalloc bellek ölçümü"""
+        izle = self.model_tracemalloc and not tracemalloc.is_tracing()
+        if izle:
+            tracemalloc.start()
+        bellek_once = surec_bellegi() or {}
+        tepe_once = _tepe_rss_mb()
+        baslangic = time.perf_counter()
+        try:
+            yield
+        finally:
+            olcum = {
+                "ad": ad,
+                "tarih": datetime.now().isoformat(timespec="seconds"),
+                "sure_sn": round(time.perf_counter() - baslangic, 2),
+                "rss_once_mb": bellek_once.get("rss_mb"),
+                "rss_sonra_mb": (surec_bellegi() or {}).get("rss_mb"),
+                "tepe_rss_once_mb": tepe_once,
+                "tepe_rss_mb": _tepe_rss_mb(),
+            }
+            if izle:
+                guncel, tepe = tracemalloc.get_traced_memory()
+                en_buyukler = tracemalloc.take_snapshot().statistics("lineno")[:10]
+                tracemalloc.stop()
+                olcum["python_bellegi_mb"] = round(guncel / 1024 / 1024, 1)
+                olcum["python_tepe_mb"] = round(tepe / 1024 / 1024, 1)
+                olcum["en_buyuk_ayirmalar"] = [{"yer": str(istatistik.traceback), "mb": round(istatistik.size / 1024 / 1024, 2)}
+                                              for istatistik in en_buyukler]
+            with self._kilit:
+                self.model_bellekleri.append(olcum)
+                del self.model_bellekleri[:-MAKS_RAPOR_KAYDI]
+
+    def durum(self):
+        """Bekleyen profil istekleri, son raporlar ve model yüklemelerinin bellek ölçümleri"""
+        with self._kilit:
+            return {
+                "klasor": self.klasor,
+                "bekleyen": {tur: {"adet": adet, "yontem": yontem} for tur, (adet, yontem) in self._bekleyen.items()},
+                "calisiyor": self._calisiyor,
+                "raporlar": list(self.raporlar),
+                "model_bellekleri": list(self.model_bellekleri),
+            }
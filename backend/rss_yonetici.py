@@ -8,16 +8,31 @@ Bu script, haber özet platformu için RSS feed'lerini yönetmeye yardımcı olu
 Yeni feed'ler ekleyebilir, mevcut feed'leri test edebilir ve feed'leri kategorilere göre düzenleyebilirsiniz.
 """
 
-import feedparser
+import argparse
 import json
 import os
+import sqlite3
 import sys
 import time
 from datetime import datetime
 
+from feed_denetleyici import HATA, OK, UYARI, csv_yaz, denetle, json_yaz, ozet
+from feed_sagligi import ACIK, FeedSagligi
+from haber_saklama import ARTIMLI as ARTIMLI_VACUUM
+from veritabani import BaglantiHavuzu
+
 
 # RSS feed'leri için yapılandırma dosyası
 CONFIG_FILE = 'backend/rss_feeds.json'
+# Feed sağlık kayıtları uygulamanın veritabanında tutulur (/api/feeds/health ile aynı tablo)
+DB_FILE = os.getenv("DB_DOSYASI") or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'haber_ozet.db')
+HOST_LIMITI = 2  # Aynı sunucuya aynı anda gönderilen test isteği sayısı
+ZAMAN_ASIMI = 20  # Bir feed testinin en fazla süresi (saniye)
+
+# test-all çıkış kodları (cron / CI kontrolleri için)
+CIKIS_BASARILI = 0
+CIKIS_HATALI_FEED = 1      # En az bir feed indirilemedi/ayrıştırılamadı (--kati ile uyarılar da)
+CIKIS_KULLANIM = 2         # Geçersiz argüman veya yapılandırma
 
 def load_feeds():
     """Yapılandırma dosyasından RSS feed'lerini yükler"""
@@ -39,10 +54,14 @@ def test_feed(url):
     """Bir RSS feed'ini test eder ve sonuçları gösterir"""
     print(f"Feed test ediliyor: {url}")
     try:
-        feed = feedparser.parse(url)
+        sonuc, feed = denetle([url], host_limiti=HOST_LIMITI, zaman_asimi=ZAMAN_ASIMI)[url]
+        if sonuc["durum"] == HATA:
+            print(f"HATA: {sonuc['hata']}")
+            return False
         if feed.bozo:
             print(f"UYARI: Feed'de sorun olabilir: {feed.bozo_exception}")
         
+        print(f"Süre: {sonuc['toplam_sn']:.2f} sn (ilk bayt {sonuc['ilk_bayt_sn']:.2f} sn), {sonuc['bayt']} bayt")
         print(f"Başlık: {feed.feed.title if hasattr(feed.feed, 'title') else 'Başlık bulunamadı'}")
         print(f"Açıklama: {feed.feed.description if hasattr(feed.feed, 'description') else 'Açıklama bulunamadı'}")
         print(f"Haber sayısı: {len(feed.entries)}")
@@ -108,18 +127,137 @@ def list_feeds():
             print(f"{i}. {url}")
     print("\n====================")
 
-def test_all_feeds():
-    """Tüm RSS feed'lerini test eder"""
+def _zaman(zaman_damgasi):
+    return datetime.fromtimestamp(zaman_damgasi).strftime('%Y-%m-%d %H:%M') if zaman_damgasi else '-'
+
+def _sn(deger):
+    return f"{deger:.2f}" if deger is not None else "-"
+
+def test_all_feeds(json_dosyasi=None, csv_dosyasi=None, kati=False, host_limiti=HOST_LIMITI,
+                   zaman_asimi=ZAMAN_ASIMI, saglik_kaydi=True, sessiz=False):
+    """Tüm RSS feed'lerini eşzamanlı test eder, raporları yazar ve çıkış kodunu döndürür
+
+    Sonuçlar uygulamanın feed sağlık kayıtlarına da işlenir (saglik_kaydi=False ile kapatılır).
+    """
     feeds = load_feeds()
-    
-    print("\n=== Tüm Feed'leri Test Etme ===")
+    kategoriler = {}
     for category, urls in feeds.items():
-        print(f"\n## {category.upper()} ##")
         for url in urls:
-            print(f"\nTest ediliyor: {url}")
-            test_feed(url)
-            time.sleep(1)  # Sunucuları çok hızlı isteklerle yüklememek için
-    print("\n===============================")
+            kategoriler.setdefault(url, []).append(category)
+    
+    if not sessiz:
+        print(f"\n=== Tüm Feed'leri Test Etme ({len(kategoriler)} feed) ===")
+    baslangic = time.perf_counter()
+    # Sunucu başına eşzamanlılık limiti, feed'ler arasındaki sabit beklemenin yerini alır
+    denetimler = denetle(list(kategoriler), host_limiti=host_limiti, zaman_asimi=zaman_asimi)
+    sure = time.perf_counter() - baslangic
+    sonuclar = []
+    for url, (sonuc, _) in denetimler.items():
+        sonuc["kategoriler"] = kategoriler[url]
+        sonuclar.append(sonuc)
+    
+    saglik = None
+    if saglik_kaydi:
+        havuz = BaglantiHavuzu(DB_FILE, boyut=2)
+        saglik = FeedSagligi(havuz.al)
+        saglik.tablo_olustur()
+        for sonuc in sonuclar:
+            if sonuc["durum"] == HATA:
+                saglik.hata(sonuc["url"], sonuc["hata"], sonuc["toplam_sn"])
+            else:
+                saglik.basari(sonuc["url"], sonuc["toplam_sn"])
+        for sonuc in sonuclar:
+            kayit = saglik.kayit(sonuc["url"])
+            sonuc.update(devre=kayit["devre"], son_basari=kayit["son_basari"],
+                         hata_sayisi=kayit["hata_sayisi"], cekim_sayisi=kayit["cekim_sayisi"])
+        havuz.kapat()
+    
+    if not sessiz:
+        etiketler = {OK: "OK   ", UYARI: "UYARI", HATA: "HATA "}
+        for category, urls in feeds.items():
+            print(f"\n## {category.upper()} ##")
+            for url in urls:
+                sonuc = denetimler[url][0]
+                print(f"[{etiketler[sonuc['durum']]}] {url}")
+                print(f"        {sonuc['haber_sayisi']} haber, {sonuc['bayt']} bayt, içerik uzunluğu "
+                      f"{sonuc['icerik_min'] or '-'}/{sonuc['icerik_ortalama'] or '-'}/{sonuc['icerik_maks'] or '-'} (min/ort/maks)")
+                print(f"        dns {_sn(sonuc['dns_sn'])}, bağlantı {_sn(sonuc['baglanti_sn'])}, ilk bayt {_sn(sonuc['ilk_bayt_sn'])}, "
+                      f"indirme {_sn(sonuc['indirme_sn'])}, ayrıştırma {_sn(sonuc['ayristirma_sn'])}, toplam {_sn(sonuc['toplam_sn'])} sn")
+                if saglik is not None:
+                    print(f"        devre: {sonuc['devre']}, hata: {sonuc['hata_sayisi']}/{sonuc['cekim_sayisi']} çekim, "
+                          f"son başarı: {_zaman(sonuc['son_basari'])}")
+                if sonuc["hata"]:
+                    print(f"        {sonuc['hata']}")
+    
+    if json_dosyasi:
+        json_yaz(json_dosyasi, sonuclar, sure)
+    if csv_dosyasi:
+        csv_yaz(csv_dosyasi, sonuclar)
+    
+    sayilar = ozet(sonuclar)
+    if not sessiz:
+        acik = sum(1 for sonuc in sonuclar if sonuc.get("devre") == ACIK)
+        print(f"\n{sayilar['feed']} feed {sure:.1f} saniyede test edildi: {sayilar[OK]} başarılı, "
+              f"{sayilar[UYARI]} uyarılı, {sayilar[HATA]} hatalı" + (f", devresi açık {acik} feed." if saglik else "."))
+        for dosya in (json_dosyasi, csv_dosyasi):
+            if dosya:
+                print(f"Rapor yazıldı: {dosya}")
+        print("===============================")
+    
+    basarisiz = sayilar[HATA] + (sayilar[UYARI] if kati else 0)
+    return CIKIS_HATALI_FEED if basarisiz else CIKIS_BASARILI
+
+def test_all_main(argumanlar):
+    """test-all komutunun argümanlarını ayrıştırır ve çıkış kodunu döndürür"""
+    ayrac = argparse.ArgumentParser(prog="rss_yonetici.py test-all", description="Tüm feed'leri eşzamanlı test eder")
+    ayrac.add_argument("--json", help="JSON raporunun yazılacağı dosya")
+    ayrac.add_argument("--csv", help="CSV raporunun yazılacağı dosya")
+    ayrac.add_argument("--kati", action="store_true", help="Uyarılı feed'leri (bozo, boş feed) de hatalı say")
+    ayrac.add_argument("--host-limiti", type=int, default=HOST_LIMITI, help="Aynı sunucuya aynı anda gönderilen istek sayısı")
+    ayrac.add_argument("--zaman-asimi", type=float, default=ZAMAN_ASIMI, help="Feed başına en fazla süre (sn)")
+    ayrac.add_argument("--saglik-kaydetme", action="store_true", help="Sonuçları feed sağlık kayıtlarına işleme")
+    ayrac.add_argument("--sessiz", action="store_true", help="Yalnızca raporları yaz ve çıkış kodunu döndür")
+    try:
+        secenekler = ayrac.parse_args(argumanlar)
+    except SystemExit as e:
+        return CIKIS_BASARILI if e.code == 0 else CIKIS_KULLANIM
+    try:
+        return test_all_feeds(json_dosyasi=secenekler.json, csv_dosyasi=secenekler.csv, kati=secenekler.kati,
+                              host_limiti=secenekler.host_limiti, zaman_asimi=secenekler.zaman_asimi,
+                              saglik_kaydi=not secenekler.saglik_kaydetme, sessiz=secenekler.sessiz)
+    except (OSError, ValueError) as e:
+        print(f"HATA: {e}", file=sys.stderr)
+        return CIKIS_KULLANIM
+
+def vacuum_main():
+    """Veritabanını artımlı auto_vacuum kipine geçirir (sunucu kapalıyken çalıştırılmalı)
+
+    Kip yalnızca tam VACUUM ile değişir; VACUUM tüm dosyayı yeniden yazar ve bu sürede yazma kilidini tutar.
+    Sonrasında sunucu boşalan sayfaları `PRAGMA incremental_vacuum` ile küçük adımlarla iade eder.
+    """
+    if not os.path.exists(DB_FILE):
+        print(f"HATA: Veritabanı bulunamadı: {DB_FILE}", file=sys.stderr)
+        return CIKIS_KULLANIM
+    havuz = BaglantiHavuzu(DB_FILE, boyut=1)
+    conn = havuz.al()
+    try:
+        if conn.execute('PRAGMA auto_vacuum').fetchone()[0] == ARTIMLI_VACUUM:
+            print("Veritabanı zaten artımlı auto_vacuum kipinde.")
+            return CIKIS_BASARILI
+        onceki = os.path.getsize(DB_FILE)
+        baslangic = time.perf_counter()
+        conn.execute('PRAGMA auto_vacuum = INCREMENTAL')
+        conn.execute('VACUUM')
+        conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+    except sqlite3.OperationalError as e:
+        print(f"HATA: VACUUM yapılamadı (sunucu çalışıyor olabilir): {e}", file=sys.stderr)
+        return CIKIS_HATALI_FEED
+    finally:
+        conn.close()
+        havuz.kapat()
+    print(f"Veritabanı artımlı auto_vacuum kipine geçirildi: {onceki / 1e6:.1f} MB -> "
+          f"{os.path.getsize(DB_FILE) / 1e6:.1f} MB ({time.perf_counter() - baslangic:.1f} sn)")
+    return CIKIS_BASARILI
 
 def show_help():
     """Yardım mesajını gösterir"""
@@ -128,9 +266,15 @@ RSS Feed Yöneticisi - Kullanım:
 -------------------------------
 python rss_yonetici.py list                       - Tüm feed'leri listele
 python rss_yonetici.py test <url>                 - Belirli bir feed'i test et
-python rss_yonetici.py test-all                   - Tüm feed'leri test et
+python rss_yonetici.py test-all [seçenekler]      - Tüm feed'leri eşzamanlı test et
+    --json <dosya> / --csv <dosya>                  Makine tarafından okunabilir rapor yaz
+    --kati                                          Uyarılı feed'leri de hatalı say
+    --host-limiti <n>, --zaman-asimi <sn>, --sessiz, --saglik-kaydetme
+    Çıkış kodu: 0 tüm feed'ler sağlam, 1 hatalı feed var, 2 kullanım/yapılandırma hatası
 python rss_yonetici.py add <kategori> <url>       - Yeni bir feed ekle
 python rss_yonetici.py remove <kategori> <url>    - Bir feed'i kaldır
+python rss_yonetici.py vacuum                     - Eski veritabanını artımlı auto_vacuum kipine geçir
+                                                    (tek seferlik tam VACUUM; sunucu kapalıyken çalıştırın)
 python rss_yonetici.py help                       - Bu yardım mesajını göster
     """)
 
@@ -147,11 +291,13 @@ def main():
     elif command == "test" and len(sys.argv) >= 3:
         test_feed(sys.argv[2])
     elif command == "test-all":
-        test_all_feeds()
+        sys.exit(test_all_main(sys.argv[2:]))
     elif command == "add" and len(sys.argv) >= 4:
         add_feed(sys.argv[2], sys.argv[3])
     elif command == "remove" and len(sys.argv) >= 4:
         remove_feed(sys.argv[2], sys.argv[3])
+    elif command == "vacuum":
+        sys.exit(vacuum_main())
     elif command == "help":
         show_help()
     else:
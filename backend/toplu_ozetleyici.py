@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Toplu Özetleyici
+----------------
+Bir yenileme döngüsünde toplanan metinleri transformers pipeline'ına toplu (batch) halde verir.
+Metinler önce token uzunluğuna göre sıralanır; böylece aynı batch'e benzer uzunlukta metinler düşer
+ve padding için harcanan hesaplama azalır. Sonuçlar orijinal sıraya geri eşlenir.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+VARSAYILAN_BATCH_BOYUTU = 8
+
+
+def token_uzunluklari(summarizer, metinler):
+    """Metinlerin token uzunluklarını döndürür (tokenizer yoksa kelime sayısı kullanılır)"""
+    tokenizer = getattr(summarizer, "tokenizer", None)
+    if tokenizer is not None:
+        try:
+            kodlanmis = tokenizer(list(metinler), add_special_tokens=False, truncation=False)
+            return [len(ids) for ids in kodlanmis["input_ids"]]
+        except Exception as e:
+            logger.debug(f"Token uzunluğu hesaplanamadı, kelime sayısı kullanılacak: {e}")
+    return [len(metin.split()) for metin in metinler]
+
+
+class TopluOzetleyici:
+    """Metinleri uzunluğa göre sıralayıp batch'ler halinde özetler"""
+
+    def __init__(self, batch_boyutu=VARSAYILAN_BATCH_BOYUTU):
+        self.batch_boyutu = max(1, int(batch_boyutu))
+
+    def ozetle(self, summarizer, metinler, **uretim_parametreleri):
+        """Metinleri özetler, orijinal sırada bir liste döndürür
+
+        Hata veren batch'lerdeki metinler için None döner; çağıran taraf yedek özet üretir.
+        """
+        metinler = list(metinler)
+        sonuclar = [None] * len(metinler)
+        if not metinler:
+            return sonuclar
+
+        uzunluklar = token_uzunluklari(summarizer, metinler)
+        sira = sorted(range(len(metinler)), key=lambda i: uzunluklar[i])
+
+        for baslangic in range(0, len(sira), self.batch_boyutu):
+            indeksler = sira[baslangic:baslangic + self.batch_boyutu]
+            batch = [metinler[i] for i in indeksler]
+            try:
+                ciktilar = summarizer(batch, batch_size=len(batch), truncation=True, **uretim_parametreleri)
+            except Exception as e:
+                logger.error(f"Toplu özetleme hatası ({len(batch)} metin): {e}")
+                continue
+            for i, cikti in zip(indeksler, ciktilar):
+                # Pipeline bazı sürümlerde her girdi için liste döndürür
+                if isinstance(cikti, list):
+                    cikti = cikti[0]
+                sonuclar[i] = cikti["summary_text"]
+
+        return sonuclar
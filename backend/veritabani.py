@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Veritabanı Katmanı
+------------------
+Tüm route'ların, arka plan thread'lerinin ve yardımcı modüllerin kullandığı SQLite bağlantı havuzu.
+Bağlantılar WAL günlükleme ve ayarlanmış pragmalarla açılır; böylece okuyucular yazarı,
+yazar da okuyucuları bloklamaz. Havuzdan alınan bağlantının close() çağrısı bağlantıyı
+kapatmaz, havuza iade eder.
+"""
+
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+
+VARSAYILAN_HAVUZ_BOYUTU = 8
+
+# Her yeni bağlantıda uygulanan ayarlar
+PRAGMALAR = (
+    "PRAGMA auto_vacuum = INCREMENTAL",  # Yalnızca yeni dosyada etkili; WAL'dan önce gelmeli (eskiler: rss_yonetici.py vacuum)
+    "PRAGMA journal_mode = WAL",       # Okuyucular ve yazar birbirini beklemez
+    "PRAGMA synchronous = NORMAL",     # WAL ile güvenli, her commit'te fsync gerekmez
+    "PRAGMA busy_timeout = 5000",      # Kilitli veritabanında hemen hata vermek yerine bekle
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -20000",      # ~20 MB sayfa önbelleği
+    "PRAGMA foreign_keys = ON",
+)
+
+
+class HavuzBaglantisi:
+    """Havuzdan alınmış bir sqlite3 bağlantısını sarar; close() bağlantıyı havuza iade eder"""
+
+    def __init__(self, havuz, baglanti):
+        self._havuz = havuz
+        self._baglanti = baglanti
+
+    def __getattr__(self, ad):
+        if self._baglanti is None:
+            raise sqlite3.ProgrammingError("Bağlantı havuza iade edilmiş")
+        return getattr(self._baglanti, ad)
+
+    def __enter__(self):
+        return self._baglanti.__enter__()
+
+    def __exit__(self, *args):
+        return self._baglanti.__exit__(*args)
+
+    def close(self):
+        if self._baglanti is not None:
+            self._havuz.iade_et(self._baglanti)
+            self._baglanti = None
+
+
+class BaglantiHavuzu:
+    """Aynı veritabanı dosyası için yeniden kullanılan bağlantıları tutar"""
+
+    def __init__(self, dosya, boyut=VARSAYILAN_HAVUZ_BOYUTU):
+        self.dosya = dosya
+        self.boyut = max(1, int(boyut))
+        self._bos = queue.LifoQueue()  # En son kullanılan (sıcak) bağlantı önce verilir
+        self._kilit = threading.Lock()
+        self._kapali = False
+
+    def _yeni_baglanti(self):
+        conn = sqlite3.connect(self.dosya, check_same_thread=False, timeout=5.0)
+        conn.row_factory = sqlite3.Row
+        for pragma in PRAGMALAR:
+            conn.execute(pragma)
+        return conn
+
+    def al(self):
+        """Havuzdan bir bağlantı alır, boşsa yenisini açar"""
+        try:
+            conn = self._bos.get_nowait()
+        except queue.Empty:
+            conn = self._yeni_baglanti()
+        return HavuzBaglantisi(self, conn)
+
+    def iade_et(self, conn):
+        """Bağlantıyı havuza geri koyar; yarıda kalmış işlem geri alınır, havuz doluysa kapatılır"""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            conn.close()
+            return
+        with self._kilit:
+            if self._kapali or self._bos.qsize() >= self.boyut:
+                conn.close()
+                return
+        self._bos.put(conn)
+
+    @contextmanager
+    def yazma_islemi(self):
+        """Tek bir yazma işlemi (BEGIN IMMEDIATE ... COMMIT) açar; hata olursa geri alınır"""
+        conn = self.al()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def kapat(self):
+        """Havuzdaki boştaki bağlantıları kapatır"""
+        with self._kilit:
+            self._kapali = True
+        while True:
+            try:
+                self._bos.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+def parcala(ogeler, boyut=500):
+    """SQLite parametre sınırını aşmamak için listeyi parçalara böler"""
+    for baslangic in range(0, len(ogeler), boyut):
+        yield ogeler[baslangic:baslangic + boyut]
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Yanıt Önbelleği
+---------------
+Haber listesi uç noktalarının JSON yanıtlarını serileştirilmiş (ve gerekirse gzip ile
+sıkıştırılmış) bayt olarak saklar. Veri yalnızca haber toplama veya özetleme işlemi bir
+yazmayı commit ettiğinde değişir; bu yüzden girişler kategori bazında geçersiz kılınır.
+Her girişin bir ETag'i vardır; istemcinin If-None-Match başlığı eşleşirse 304 döndürülür.
+"""
+
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+VARSAYILAN_KAPASITE = 256
+SIKISTIRMA_ESIGI = 1024  # Bu boyutun altındaki yanıtlar sıkıştırılmaz
+TUM_KATEGORILER = None   # /api/haberler gibi kategori bağımsız yanıtların anahtarı
+
+
+class OnbellekGirdisi:
+    """Tek bir yanıtın gövdesi, sıkıştırılmış hali, ETag'i ve ek başlıkları"""
+
+    __slots__ = ("govde", "gzip_govde", "etag", "basliklar")
+
+    def __init__(self, govde, basliklar=None):
+        self.govde = govde
+        self.etag = '"' + hashlib.blake2b(govde, digest_size=12).hexdigest() + '"'
+        self.gzip_govde = gzip.compress(govde, compresslevel=6) if len(govde) >= SIKISTIRMA_ESIGI else None
+        self.basliklar = dict(basliklar or {})
+
+    def eslesiyor_mu(self, if_none_match):
+        """İstemcinin If-None-Match başlığı bu girdinin ETag'ini içeriyor mu"""
+        if not if_none_match:
+            return False
+        etiketler = {etiket.strip() for etiket in if_none_match.split(",")}
+        etiketler |= {etiket[2:] for etiket in etiketler if etiket.startswith("W/")}
+        return "*" in etiketler or self.etag in etiketler
+
+
+class YanitOnbellegi:
+    """Kategori bazında geçersiz kılınan LRU yanıt önbelleği"""
+
+    def __init__(self, kapasite=VARSAYILAN_KAPASITE):
+        self.kapasite = max(1, int(kapasite))
+        self._kilit = threading.Lock()
+        self._girdiler = OrderedDict()  # (kategori, ...) -> OnbellekGirdisi
+        self._surumler = {}             # kategori -> sürüm; her geçersiz kılmada artar
+        self._genel_surum = 0           # Tüm önbellek temizlendiğinde artar
+        self.isabet = 0
+        self.iskalama = 0
+
+    def surum(self, kategori):
+        """Yanıt üretmeden önce alınır; kaydederken verinin arada değişip değişmediği anlaşılır"""
+        with self._kilit:
+            return self._genel_surum, self._surumler.get(kategori, 0)
+
+    def getir(self, anahtar):
+        """Anahtar için önbellekteki girdiyi döndürür, yoksa None"""
+        with self._kilit:
+            girdi = self._girdiler.get(anahtar)
+            if girdi is None:
+                self.iskalama += 1
+                return None
+            self._girdiler.move_to_end(anahtar)
+            self.isabet += 1
+            return girdi
+
+    def kaydet(self, anahtar, surum, govde, basliklar=None):
+        """Yanıtı önbelleğe koyar ve girdiyi döndürür
+
+        Yanıt üretilirken ilgili kategori geçersiz kılındıysa girdi saklanmaz, yalnızca döndürülür.
+        """
+        girdi = OnbellekGirdisi(govde, basliklar)
+        kategori = anahtar[0]
+        with self._kilit:
+            if (self._genel_surum, self._surumler.get(kategori, 0)) != surum:
+                return girdi
+            self._girdiler[anahtar] = girdi
+            self._girdiler.move_to_end(anahtar)
+            while len(self._girdiler) > self.kapasite:
+                self._girdiler.popitem(last=False)
+        return girdi
+
+    def gecersiz_kil(self, kategoriler=None):
+        """Verilen kategorilerin ve tüm haberler listesinin girdilerini siler; None ise hepsini"""
+        with self._kilit:
+            if kategoriler is None:
+                self._genel_surum += 1
+                self._girdiler.clear()
+                return
+            hedefler = set(kategoriler) | {TUM_KATEGORILER}
+            for kategori in hedefler:
+                self._surumler[kategori] = self._surumler.get(kategori, 0) + 1
+            for anahtar in [a for a in self._girdiler if a[0] in hedefler]:
+                del self._girdiler[anahtar]
+
+    def istatistikler(self):
+        """İsabet/ıskalama ve girdi sayısını döndürür"""
+        with self._kilit:
+            return {"isabet": self.isabet, "iskalama": self.iskalama, "girdi": len(self._girdiler)}
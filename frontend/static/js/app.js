@@ -49,6 +49,9 @@ document.addEventListener('DOMContentLoaded', () => {
 
     // Model durumunu kontrol et
     modelDurumunuKontrolEt();
+
+    // Yeni haberleri ve özet güncellemelerini sunucudan dinle
+    haberAkisiniBaslat();
 });
 
 // Kategorileri API'den çek ve menüyü oluştur
@@ -93,8 +96,8 @@ async function haberleriYukle(kategori = 'tum') {
 
     try {
         const url = kategori === 'tum' 
-            ? `/api/haberler?ozet_modu=${ozetModu}`
-            : `/api/haberler/${kategori}?ozet_modu=${ozetModu}`;
+            ? `/api/haberler?ozet_modu=${ozetModu}&tekil=1`
+            : `/api/haberler/${kategori}?ozet_modu=${ozetModu}&tekil=1`;
             
         const response = await fetch(url);
         const haberler = await response.json();
@@ -115,6 +118,39 @@ async function haberleriYukle(kategori = 'tum') {
     }
 }
 
+// Sunucunun gönderdiği yeni haberleri ve özet yükseltmelerini sayfaya işler (yeniden bağlanma tarayıcıdadır)
+function haberAkisiniBaslat() {
+    const akis = new EventSource('/api/akis');
+
+    akis.addEventListener('haber', (e) => {
+        const haber = JSON.parse(e.data);
+        // Listede aynı haberin yalnızca küme temsilcisi gösterilir
+        if (haber.kume_id !== haber.id) return;
+        if (aktifKategori !== 'tum' && haber.kategori !== aktifKategori) return;
+        if (haberKarti(haber.id)) return;
+
+        const container = document.getElementById('haber-container');
+        const bosMesaj = container.querySelector('.no-news');
+        if (bosMesaj) bosMesaj.remove();
+        container.insertAdjacentHTML('afterbegin', createHaberCard(haber));
+    });
+
+    akis.addEventListener('ozet', (e) => {
+        const haber = JSON.parse(e.data);
+        const kart = haberKarti(haber.id);
+        if (kart) kart.querySelector('.haber-ozet').textContent = haber.ozet;
+    });
+
+    // Kaçırılan olaylar sunucuda artık yoksa liste baştan yüklenir
+    akis.addEventListener('yeniden_yukle', () => {
+        haberleriYukle(aktifKategori);
+    });
+}
+
+function haberKarti(haberId) {
+    return document.querySelector(`.haber-kart[data-id="${haberId}"]`);
+}
+
 // Kategori ismini düzenle (ilk harf büyük, diğerleri küçük)
 function kategoriIsmiDuzenle(kategori) {
     return kategori.charAt(0).toUpperCase() + kategori.slice(1).toLowerCase();
@@ -153,6 +189,7 @@ async function modelleriYukle() {
 // Model değişikliğini dinle
 document.getElementById('model-select').addEventListener('change', function() {
     const modelDurum = document.getElementById('model-durum');
+    const secilenModel = this.value;
     modelDurum.textContent = 'Model değiştiriliyor...';
     modelDurum.className = 'model-durum yukleniyor';
 
@@ -167,7 +204,11 @@ document.getElementById('model-select').addEventListener('change', function() {
     })
     .then(response => response.json())
     .then(data => {
-        if (data.success) {
+        if (data.success && data.durum === 'yukleniyor') {
+            // Model arka planda yükleniyor, o sırada özetler mevcut modelle üretilir
+            modelDurum.textContent = 'Model yükleniyor...';
+            modelYuklemesiniIzle(secilenModel);
+        } else if (data.success) {
             modelDurum.textContent = 'Model hazır';
             modelDurum.className = 'model-durum hazir';
             loadNews(); // Haberleri yeni modelle yükle
@@ -183,6 +224,31 @@ document.getElementById('model-select').addEventListener('change', function() {
     });
 });
 
+// Arka planda yüklenen model etkinleşene veya yükleme hata verene kadar model durumunu sorgular
+function modelYuklemesiniIzle(model) {
+    const modelDurum = document.getElementById('model-durum');
+    fetch('/api/model_status')
+        .then(response => response.json())
+        .then(data => {
+            const kayit = data.registry || {};
+            if (data.current_model === model) {
+                modelDurum.textContent = 'Model hazır';
+                modelDurum.className = 'model-durum hazir';
+                loadNews();
+            } else if (kayit.hatalar && kayit.hatalar[model]) {
+                modelDurum.textContent = 'Hata: ' + kayit.hatalar[model];
+                modelDurum.className = 'model-durum hata';
+            } else {
+                setTimeout(() => modelYuklemesiniIzle(model), 2000);
+            }
+        })
+        .catch(error => {
+            modelDurum.textContent = 'Hata oluştu';
+            modelDurum.className = 'model-durum hata';
+            console.error('Model durumu kontrolü hatası:', error);
+        });
+}
+
 // Özet modu değişikliğini dinle
 document.querySelectorAll('.ozet-modu .btn').forEach(button => {
     button.addEventListener('click', function() {
@@ -252,7 +318,7 @@ function getDuyguIkonu(duygu) {
 // Haber kartı oluştur
 function createHaberCard(haber) {
     return `
-        <div class="haber-kart">
+        <div class="haber-kart" data-id="${haber.id}">
             ${haber.resim_url ? `<div class="haber-resim" style="background-image: url(${haber.resim_url})"></div>` : ''}
             <div class="haber-icerik">
                 <span class="haber-kategori ${haber.kategori}">${kategoriIsmiDuzenle(haber.kategori)}</span>
@@ -262,7 +328,7 @@ function createHaberCard(haber) {
                 </h2>
                 <p class="haber-ozet">${haber.ozet}</p>
                 <div class="haber-kaynak">
-                    <span>Kaynak: ${haber.kaynak}</span>
+                    <span>Kaynak: ${haber.kaynak}${haber.kume_boyutu > 1 ? ` ve ${haber.kume_boyutu - 1} kaynak daha` : ''}</span>
                     <a href="${haber.url}" target="_blank" class="haber-link">Habere Git</a>
                 </div>
             </div>